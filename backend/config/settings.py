@@ -402,6 +402,21 @@ class AppSettings(BaseSettings):
         description="Disable heavy monitoring and non-essential features for cleaner development"
     )
 
+    # Startup / router loading
+    lazy_routers: bool = Field(
+        default=False,
+        description="Defer importing manifest routers until their prefix is first requested",
+    )
+    router_warmup: bool = Field(
+        default=True,
+        description="Load deferred routers in the background after startup",
+    )
+    startup_import_budget_ms: Optional[float] = Field(
+        default=5000.0,
+        ge=0,
+        description="Warn when the app factory takes longer than this (ms)",
+    )
+
     @validator("debug", pre=True)
     def validate_debug(cls, v, values):
         env = values.get("environment", Environment.DEVELOPMENT)
@@ -75,6 +75,7 @@ def create_app() -> FastAPI:
     """
     # Ensure logger is accessible in function scope
     global logger
+    factory_start = time.perf_counter()
     
     logger.info("Creating A1Betting canonical app...")
     # Check lean mode early
@@ -92,6 +93,39 @@ def create_app() -> FastAPI:
         description="A1Betting Sports Analysis Platform - Canonical Entry Point"
     )
 
+    # --- Router Manifest (deferred router imports) ---
+    # Routers registered through the manifest are imported on first request to
+    # their prefix (APP_LAZY_ROUTERS=true) or immediately otherwise.
+    from backend.core.router_manifest import RouterManifest
+
+    # Settings may be partially populated (or mocked in tests); fall back to
+    # eager imports and no budget unless the values have the expected types
+    lazy_routers = getattr(settings.app, "lazy_routers", False)
+    startup_budget_ms = getattr(settings.app, "startup_import_budget_ms", None)
+    router_manifest = RouterManifest(
+        _app,
+        lazy=lazy_routers if isinstance(lazy_routers, bool) else False,
+        budget_ms=(
+            startup_budget_ms
+            if isinstance(startup_budget_ms, (int, float)) and not isinstance(startup_budget_ms, bool)
+            else None
+        ),
+    )
+    _app.state.router_manifest = router_manifest
+
+    if router_manifest.lazy:
+        @_app.middleware("http")
+        async def _lazy_router_loader(request: Request, call_next):
+            router_manifest.ensure_routed(request.scope)
+            return await call_next(request)
+
+        if getattr(settings.app, "router_warmup", True):
+            @_app.on_event("startup")
+            async def _schedule_router_warmup():
+                import asyncio
+
+                _app.state.router_warmup_task = asyncio.create_task(router_manifest.warmup())
+
     # --- CORS Middleware (FIRST in middleware stack) ---
     # CORS config (dev only) for clean preflight handling
     origins = [
@@ -401,15 +435,7 @@ def create_app() -> FastAPI:
         }
 
     # --- Include MLB extras router for test and compatibility
-    try:
-        from backend.routes import mlb_extras
-
-        _app.include_router(mlb_extras.router, prefix="/mlb")
-        logger.info("MLB extras routes included in canonical app")
-    except ImportError as e:
-        logger.warning(f"Could not import mlb_extras router: {e}")
-    except Exception as e:
-        logger.error(f"Error including mlb_extras router: {e}")
+    router_manifest.register("mlb_extras", "backend.routes.mlb_extras", prefix="/mlb")
 
     # --- Startup Initialization Hook ---
     try:
@@ -496,6 +522,12 @@ def create_app() -> FastAPI:
             "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
         })
 
+    # --- Startup Import Report ---
+    @_app.get("/performance/startup")
+    async def performance_startup():
+        """Per-router import time/memory and app factory time vs budget"""
+        return ok(router_manifest.report())
+
     # --- Metrics Endpoints ---
     @_app.get("/metrics")
     async def get_metrics():
@@ -800,75 +832,25 @@ def create_app() -> FastAPI:
         logger.error(f"ERROR: Failed to register diagnostics routes: {e}")
     
     # Import and mount meta cache router (PR6: Cache Stats & Observability)
-    try:
-        from backend.routes.meta_cache import router as meta_cache_router
-        _app.include_router(meta_cache_router, prefix="/api/v2/meta", tags=["Cache Observability"])
-        logger.info("SUCCESS: Meta cache routes included (/api/v2/meta/cache-stats, /api/v2/meta/cache-health)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import meta cache routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register meta cache routes: {e}")
+    router_manifest.register("meta_cache", "backend.routes.meta_cache", prefix="/api/v2/meta", tags=["Cache Observability"])
     
     # Import and mount legacy meta router (PR7: Legacy Endpoint Telemetry)
-    try:
-        from backend.routes.meta_legacy import router as meta_legacy_router
-        _app.include_router(meta_legacy_router, prefix="/api/v2/meta", tags=["Legacy Telemetry"])
-        logger.info("SUCCESS: Legacy meta routes included (/api/v2/meta/legacy-usage, /api/v2/meta/migration-readiness)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import legacy meta routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register legacy meta routes: {e}")
+    router_manifest.register("meta_legacy", "backend.routes.meta_legacy", prefix="/api/v2/meta", tags=["Legacy Telemetry"])
     
     # Import and mount security routes (Step 6: Security Headers)
-    try:
-        from backend.routes.csp_report import router as csp_report_router
-        # Mount CSP routes with canonical /csp/report endpoint + alias for compatibility
-        _app.include_router(csp_report_router)
-        logger.info("SUCCESS: CSP report routes included (/csp/report + /api/security/csp-report alias)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import CSP report routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register CSP report routes: {e}")
+    router_manifest.register("csp_report", "backend.routes.csp_report", paths=("/csp", "/csp-report", "/api/security/csp-report"))
     
     # Import and mount trace test routes (PR8: Request Correlation Testing)
-    try:
-        from backend.routes.trace_test_routes import router as trace_test_router
-        _app.include_router(trace_test_router, tags=["Request Correlation"])
-        logger.info("SUCCESS: Trace test routes included (/api/trace/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import trace test routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register trace test routes: {e}")
+    router_manifest.register("trace_test", "backend.routes.trace_test_routes", tags=["Request Correlation"], paths=("/api/trace",))
     
     # Import and mount model inference routes (PR9: Model Inference Observability)
-    try:
-        from backend.routes.models_inference import router as models_inference_router
-        _app.include_router(models_inference_router, tags=["Model Inference"])
-        logger.info("SUCCESS: Model inference routes included (/api/v2/models/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import model inference routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register model inference routes: {e}")
+    router_manifest.register("models_inference", "backend.routes.models_inference", tags=["Model Inference"], paths=("/api/v2/models",))
 
     # Import and mount observability events routes (PR11: WebSocket Correlation & Observability Event Bus)
-    try:
-        from backend.routes.observability_events import router as observability_events_router
-        _app.include_router(observability_events_router, tags=["Observability Events"])
-        logger.info("SUCCESS: Observability events routes included (/api/v2/observability/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import observability events routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register observability events routes: {e}")
+    router_manifest.register("observability_events", "backend.routes.observability_events", tags=["Observability Events"], paths=("/api/v2/observability",))
 
     # Import and mount admin control routes (Admin Control PR: Runtime Shadow Mode Control)
-    try:
-        from backend.routes.admin_control import router as admin_control_router
-        _app.include_router(admin_control_router, tags=["Admin Control"])
-        logger.info("SUCCESS: Admin control routes included (/api/v2/models/shadow/* and /api/v2/models/admin/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import admin control routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register admin control routes: {e}")
+    router_manifest.register("admin_control", "backend.routes.admin_control", tags=["Admin Control"], paths=("/api/v2/models/shadow", "/api/v2/models/admin"))
     
     # Enhanced WebSocket Routes with Room-based Subscriptions
     try:
@@ -881,34 +863,13 @@ def create_app() -> FastAPI:
         logger.error(f"ERROR: Failed to register enhanced WebSocket routes: {e}")
     
     # WebSocket Logging Routes (NEW)
-    try:
-        from backend.routes.websocket_logging_routes import router as ws_logging_router
-        _app.include_router(ws_logging_router, tags=["WebSocket Logging"])
-        logger.info("SUCCESS: WebSocket logging routes included (/api/websocket/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import WebSocket logging routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register WebSocket logging routes: {e}")
+    router_manifest.register("websocket_logging", "backend.routes.websocket_logging_routes", tags=["WebSocket Logging"], paths=("/api/websocket",))
     
     # Version & Compatibility Routes (NEW)
-    try:
-        from backend.routes.version_routes import router as version_router
-        _app.include_router(version_router, tags=["Version & Compatibility"])
-        logger.info("SUCCESS: Version routes included (/api/version/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import version routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register version routes: {e}")
+    router_manifest.register("version", "backend.routes.version_routes", tags=["Version & Compatibility"], paths=("/api/version",))
     
     # WebVitals Pipeline Routes (NEW)
-    try:
-        from backend.services.webvitals_pipeline import router as webvitals_router
-        _app.include_router(webvitals_router)
-        logger.info("SUCCESS: WebVitals pipeline routes included (/api/metrics/v1/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import WebVitals pipeline routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register WebVitals pipeline routes: {e}")
+    router_manifest.register("webvitals", "backend.services.webvitals_pipeline", paths=("/api/metrics/v1",))
     
     # Enhanced ML Routes with SHAP Explainability, Batch Optimization, Performance Logging
     try:
@@ -1254,44 +1215,16 @@ def create_app() -> FastAPI:
 
     # --- PHASE 5 CONSOLIDATED ROUTES ---
     # Consolidated PrizePicks API (replaces 3 legacy route files)
-    try:
-        from backend.routes.consolidated_prizepicks import router as consolidated_prizepicks_router
-        _app.include_router(consolidated_prizepicks_router, prefix="/api/v2/prizepicks", tags=["PrizePicks API"])
-        logger.info("SUCCESS: Consolidated PrizePicks routes included (/api/v2/prizepicks/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import consolidated PrizePicks routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register consolidated PrizePicks routes: {e}")
+    router_manifest.register("consolidated_prizepicks", "backend.routes.consolidated_prizepicks", prefix="/api/v2/prizepicks", tags=["PrizePicks API"])
 
     # Consolidated ML API (replaces enhanced_ml_routes.py and modern_ml_routes.py)
-    try:
-        from backend.routes.consolidated_ml import router as consolidated_ml_router
-        _app.include_router(consolidated_ml_router, prefix="/api/v2/ml", tags=["Machine Learning"])
-        logger.info("SUCCESS: Consolidated ML routes included (/api/v2/ml/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import consolidated ML routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register consolidated ML routes: {e}")
+    router_manifest.register("consolidated_ml", "backend.routes.consolidated_ml", prefix="/api/v2/ml", tags=["Machine Learning"])
 
     # Consolidated Admin API (replaces admin.py, health.py, security_routes.py, auth.py)
-    try:
-        from backend.routes.consolidated_admin import router as consolidated_admin_router
-        _app.include_router(consolidated_admin_router, prefix="/api/v2/admin", tags=["Admin & Security"])
-        logger.info("SUCCESS: Consolidated Admin routes included (/api/v2/admin/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import consolidated Admin routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register consolidated Admin routes: {e}")
+    router_manifest.register("consolidated_admin", "backend.routes.consolidated_admin", prefix="/api/v2/admin", tags=["Admin & Security"])
 
     # Odds & Line Movement API (PropFinder parity - odds comparison and line tracking)
-    try:
-        from backend.routes.odds_routes import router as odds_router
-        _app.include_router(odds_router, prefix="/v1/odds", tags=["Odds & Line Movement"])
-        logger.info("SUCCESS: Odds & Line Movement routes included (/v1/odds/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import Odds routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register Odds routes: {e}")
+    router_manifest.register("odds", "backend.routes.odds_routes", prefix="/v1/odds", tags=["Odds & Line Movement"])
 
     # --- Advanced Kelly Compatibility Routes (lightweight) ---
     try:
@@ -1404,94 +1337,31 @@ def create_app() -> FastAPI:
         logger.warning(f"WARNING: Could not mount advanced-kelly compatibility router: {_e}")
 
     # Risk Management and Personalization API (Risk Management Engine, User Personalization, Alerting Foundation)
-    try:
-        from backend.routes.risk_personalization import router as risk_personalization_router
-        _app.include_router(risk_personalization_router, tags=["Risk Management", "Personalization", "Alerting"])
-        logger.info("SUCCESS: Risk Management & Personalization routes included (/api/risk-personalization/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import Risk Management & Personalization routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register Risk Management & Personalization routes: {e}")
+    router_manifest.register("risk_personalization", "backend.routes.risk_personalization", tags=["Risk Management", "Personalization", "Alerting"], paths=("/api/risk-personalization",))
 
     # Dependencies Health API (Dependency Index Health Monitoring and Integrity Verification)
-    try:
-        from backend.routes.dependencies import router as dependencies_router
-        _app.include_router(dependencies_router, prefix="/api", tags=["Dependencies"])
-        logger.info("SUCCESS: Dependencies Health routes included (/api/dependencies/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import Dependencies Health routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register Dependencies Health routes: {e}")
+    router_manifest.register("dependencies", "backend.routes.dependencies", prefix="/api", tags=["Dependencies"], paths=("/api/dependencies",))
 
     # Provider Resilience API (Circuit Breaker, SLA Metrics, Reliability Monitoring)
-    try:
-        from backend.routes.provider_resilience_routes import router as provider_resilience_router
-        _app.include_router(provider_resilience_router, prefix="/api/provider-resilience", tags=["Provider Resilience", "Circuit Breaker"])
-        logger.info("SUCCESS: Provider Resilience routes included (/api/provider-resilience/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import Provider Resilience routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register Provider Resilience routes: {e}")
+    router_manifest.register("provider_resilience", "backend.routes.provider_resilience_routes", prefix="/api/provider-resilience", tags=["Provider Resilience", "Circuit Breaker"])
 
     # System Capabilities Matrix API (Service Registry & Health Tracking)
-    try:
-        from backend.routes.system_capabilities import router as system_capabilities_router
-        _app.include_router(system_capabilities_router, tags=["System Capabilities"])
-        logger.info("SUCCESS: System capabilities routes included (/api/system/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import system capabilities routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register system capabilities routes: {e}")
+    router_manifest.register("system_capabilities", "backend.routes.system_capabilities", tags=["System Capabilities"], paths=("/api/system",))
 
     # Real-Time Market Streaming API (Multi-provider ingestion, LLM rationales)
-    try:
-        from backend.routes.streaming.streaming_api import router as streaming_router
-        _app.include_router(streaming_router, tags=["Market Streaming", "Real-Time Data"])
-        logger.info("SUCCESS: Real-time market streaming routes included (/streaming/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import streaming routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register streaming routes: {e}")
+    router_manifest.register("streaming", "backend.routes.streaming.streaming_api", tags=["Market Streaming", "Real-Time Data"], paths=("/streaming",))
 
     # Unified Sports API (Multi-sport data aggregation, lazy loading, odds comparison)
-    try:
-        from backend.routes.unified_sports_routes import router as unified_sports_router
-        _app.include_router(unified_sports_router, tags=["Unified Sports API"])
-        logger.info("SUCCESS: Unified sports routes included (/sports/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import unified sports routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register unified sports routes: {e}")
+    router_manifest.register("unified_sports", "backend.routes.unified_sports_routes", tags=["Unified Sports API"], paths=("/sports",))
 
     # --- Security Enhancement Routes (Epic 5) ---
-    try:
-        from backend.routes.security_head_endpoints import router as head_endpoints_router
-        _app.include_router(head_endpoints_router, tags=["Security", "HEAD Endpoints"])
-        logger.info("SUCCESS: Security HEAD endpoints included (/api/* HEAD endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import security HEAD endpoints: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register security HEAD endpoints: {e}")
+    router_manifest.register("security_head_endpoints", "backend.routes.security_head_endpoints", tags=["Security", "HEAD Endpoints"], paths=("/api/games", "/api/mlb/comprehensive-props", "/api/users", "/api/models", "/api/system/capabilities"))
 
     # --- ML Model Registry (Epic 6) ---
-    try:
-        from backend.routes.model_registry_simple import router as model_registry_router
-        _app.include_router(model_registry_router, tags=["ML Model Registry"])
-        logger.info("SUCCESS: ML Model Registry routes included (/api/models/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import ML Model Registry routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register ML Model Registry routes: {e}")
+    router_manifest.register("model_registry", "backend.routes.model_registry_simple", tags=["ML Model Registry"], paths=("/api/models",))
 
     # --- Data Ingestion Routes (NEW) ---
-    try:
-        from backend.ingestion.routes import router as ingestion_router
-        _app.include_router(ingestion_router, tags=["Data Ingestion"])
-        logger.info("SUCCESS: Data ingestion routes included (/api/v1/ingestion/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import data ingestion routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register data ingestion routes: {e}")
+    router_manifest.register("ingestion", "backend.ingestion.routes", tags=["Data Ingestion"], paths=("/api/v1/ingestion",))
 
     # --- Enterprise Model Registry Routes (NEW) ---
     try:
@@ -1539,24 +1409,10 @@ def create_app() -> FastAPI:
         logger.error(f"Failed to register enterprise model registry routes: {e}")
 
     # --- Alert Engine Routes (NEW) - PropFinder Parity Alert System ---
-    try:
-        from backend.routes.alert_engine_routes import router as alert_engine_router
-        _app.include_router(alert_engine_router, prefix="/api/alert-engine", tags=["Alert Engine"])
-        logger.info("SUCCESS: Alert engine routes included (/api/alert-engine/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import alert engine routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register alert engine routes: {e}")
+    router_manifest.register("alert_engine", "backend.routes.alert_engine_routes", prefix="/api/alert-engine", tags=["Alert Engine"])
 
     # --- PropFinder Routes (NEW) - Real Data Integration for PropFinder Dashboard ---
-    try:
-        from backend.routes.propfinder_routes import router as propfinder_router
-        _app.include_router(propfinder_router, prefix="/api/propfinder", tags=["PropFinder"])
-        logger.info("SUCCESS: PropFinder routes included (/api/propfinder/* endpoints)")
-    except ImportError as e:
-        logger.warning(f"WARNING: Could not import PropFinder routes: {e}")
-    except Exception as e:
-        logger.error(f"ERROR: Failed to register PropFinder routes: {e}")
+    router_manifest.register("propfinder", "backend.routes.propfinder_routes", prefix="/api/propfinder", tags=["PropFinder"])
 
     # --- Multiple Sportsbook Routes (compatibility fallback) ---
     try:
@@ -1879,6 +1735,20 @@ def create_app() -> FastAPI:
     
     # Log normalized health endpoints at startup
     logger.info("Health endpoints normalized: /api/health, /health, /api/v2/health -> identical envelope format")
+
+    # Background health prober: health endpoints serve its latest snapshot
+    try:
+        from backend.services.health.health_collector import get_health_collector
+
+        @_app.on_event("startup")
+        async def _start_health_prober():
+            get_health_collector().start()
+
+        @_app.on_event("shutdown")
+        async def _stop_health_prober():
+            await get_health_collector().stop()
+    except Exception as e:
+        logger.warning(f"Health prober not configured: {e}")
     # Dev helper: ensure a seeded dev user exists in the in-memory auth service
     try:
         from backend.services.auth_service import get_auth_service
@@ -1912,6 +1782,10 @@ def create_app() -> FastAPI:
     # The app still seeds a dev user on startup (see _seed_dev_user above).
 
     logger.info("A1Betting canonical app created successfully")
+    try:
+        router_manifest.record_startup((time.perf_counter() - factory_start) * 1000)
+    except Exception as e:
+        logger.warning(f"Failed to record app startup time: {e}")
     return _app
 
 
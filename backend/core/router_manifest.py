@@ -0,0 +1,278 @@
+"""
+Router Manifest - deferred router registration for the canonical app.
+
+``create_app`` used to import every router module eagerly, which pulls the
+ML, SHAP, Sportradar and PrizePicks stacks into every worker before the first
+request. Routers registered through the manifest are either included
+immediately (eager mode, the default) or kept as lightweight stubs: the
+router module is only imported when a request first hits one of its URL
+prefixes, when an unrouted path is requested, or when the warmup phase runs.
+
+Every load records import time, resident memory delta and the number of
+newly imported modules, and the factory reports its total startup time
+against ``APP_STARTUP_IMPORT_BUDGET_MS``.
+"""
+
+import asyncio
+import importlib
+import logging
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from starlette.routing import Match
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil is a runtime dependency
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """Where a router lives and how it is mounted"""
+
+    name: str
+    module: str
+    attr: str = "router"
+    prefix: str = ""
+    tags: Optional[Tuple[str, ...]] = None
+    # URL prefixes served by the router (mount prefix + router prefix). Used
+    # to decide which deferred routers a request needs; defaults to ``prefix``.
+    paths: Tuple[str, ...] = ()
+
+    def match_prefixes(self) -> Tuple[str, ...]:
+        if self.paths:
+            return self.paths
+        return (self.prefix,) if self.prefix else ()
+
+
+@dataclass
+class RouterLoadRecord:
+    """Outcome of importing and mounting one router"""
+
+    name: str
+    module: str
+    status: str = "pending"  # pending | loaded | failed
+    trigger: Optional[str] = None  # eager | request | warmup
+    import_ms: float = 0.0
+    rss_delta_bytes: Optional[int] = None
+    new_modules: int = 0
+    routes_added: int = 0
+    error: Optional[str] = None
+
+
+def _current_rss() -> Optional[int]:
+    if psutil is None:
+        return None
+    try:
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+@dataclass
+class RouterManifest:
+    """Registry of routers mounted on ``app``, eagerly or on first use"""
+
+    app: Any
+    lazy: bool = False
+    budget_ms: Optional[float] = None
+    specs: Dict[str, RouterSpec] = field(default_factory=dict)
+    records: Dict[str, RouterLoadRecord] = field(default_factory=dict)
+    startup_ms: Optional[float] = None
+
+    def __post_init__(self):
+        self._pending: List[str] = []
+        self._lock = threading.RLock()
+
+    # -- registration -----------------------------------------------------
+
+    def register(
+        self,
+        name: str,
+        module: str,
+        attr: str = "router",
+        prefix: str = "",
+        tags: Optional[Sequence[str]] = None,
+        paths: Sequence[str] = (),
+    ) -> None:
+        """Add a router to the manifest, loading it now unless lazy"""
+        spec = RouterSpec(
+            name=name,
+            module=module,
+            attr=attr,
+            prefix=prefix,
+            tags=tuple(tags) if tags else None,
+            paths=tuple(paths),
+        )
+        self.specs[name] = spec
+        self.records[name] = RouterLoadRecord(name=name, module=module)
+        if self.lazy:
+            self._pending.append(name)
+        else:
+            self.load(name, trigger="eager")
+
+    @property
+    def pending(self) -> List[str]:
+        return list(self._pending)
+
+    # -- loading ----------------------------------------------------------
+
+    def load(self, name: str, trigger: str = "request") -> bool:
+        """Import the router module for ``name`` and include it in the app"""
+        with self._lock:
+            record = self.records[name]
+            if record.status != "pending":
+                return record.status == "loaded"
+            if name in self._pending:
+                self._pending.remove(name)
+
+            spec = self.specs[name]
+            rss_before = _current_rss()
+            modules_before = len(sys.modules)
+            routes_before = len(self.app.router.routes)
+            start = time.perf_counter()
+            try:
+                router = getattr(importlib.import_module(spec.module), spec.attr)
+                kwargs: Dict[str, Any] = {}
+                if spec.prefix:
+                    kwargs["prefix"] = spec.prefix
+                if spec.tags:
+                    kwargs["tags"] = list(spec.tags)
+                self.app.include_router(router, **kwargs)
+                record.status = "loaded"
+            except ImportError as e:
+                record.status = "failed"
+                record.error = str(e)
+                logger.warning(f"WARNING: Could not import {name} routes: {e}")
+            except Exception as e:
+                record.status = "failed"
+                record.error = str(e)
+                logger.error(f"ERROR: Failed to register {name} routes: {e}")
+
+            record.trigger = trigger
+            record.import_ms = (time.perf_counter() - start) * 1000
+            rss_after = _current_rss()
+            if rss_before is not None and rss_after is not None:
+                record.rss_delta_bytes = rss_after - rss_before
+            record.new_modules = len(sys.modules) - modules_before
+            record.routes_added = len(self.app.router.routes) - routes_before
+
+        if record.status == "loaded":
+            if trigger != "eager":
+                # Routes changed after the schema may have been generated
+                self.app.openapi_schema = None
+            logger.info(
+                f"SUCCESS: {name} routes included "
+                f"({spec.match_prefixes() or spec.module}, {trigger}, "
+                f"{record.import_ms:.1f}ms, {record.new_modules} modules)"
+            )
+        return record.status == "loaded"
+
+    def names_for_path(self, path: str) -> List[str]:
+        """Deferred routers whose URL prefixes cover ``path``"""
+        names = []
+        for name in self._pending:
+            for prefix in self.specs[name].match_prefixes():
+                if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                    names.append(name)
+                    break
+        return names
+
+    def _is_routed(self, scope: Dict[str, Any]) -> bool:
+        for route in self.app.router.routes:
+            try:
+                match, _ = route.matches(scope)
+            except Exception:
+                continue
+            if match != Match.NONE:
+                return True
+        return False
+
+    def ensure_routed(self, scope: Dict[str, Any]) -> None:
+        """Load whatever deferred routers a request needs before routing.
+
+        Routers are matched by URL prefix first. Paths no mounted route can
+        serve (and the OpenAPI schema) load everything still pending, so a
+        missing prefix hint degrades to a one-off full warmup rather than a 404.
+        """
+        if not self._pending:
+            return
+        path = scope.get("path", "")
+        names = self.names_for_path(path)
+        if not names and (
+            path == getattr(self.app, "openapi_url", None) or not self._is_routed(scope)
+        ):
+            names = self.pending
+        for name in names:
+            self.load(name, trigger="request")
+
+    async def warmup(self) -> None:
+        """Load every deferred router, yielding to the event loop in between"""
+        while self._pending:
+            self.load(self._pending[0], trigger="warmup")
+            await asyncio.sleep(0)
+        logger.info(
+            f"Router warmup complete: {self.loaded_count} loaded, "
+            f"{self.failed_count} failed, {self.total_import_ms:.1f}ms importing"
+        )
+
+    # -- reporting --------------------------------------------------------
+
+    @property
+    def loaded_count(self) -> int:
+        return sum(1 for r in self.records.values() if r.status == "loaded")
+
+    @property
+    def failed_count(self) -> int:
+        return sum(1 for r in self.records.values() if r.status == "failed")
+
+    @property
+    def total_import_ms(self) -> float:
+        return sum(r.import_ms for r in self.records.values())
+
+    def slowest(self, limit: int = 5) -> List[RouterLoadRecord]:
+        loaded = [r for r in self.records.values() if r.status != "pending"]
+        return sorted(loaded, key=lambda r: r.import_ms, reverse=True)[:limit]
+
+    def record_startup(self, elapsed_ms: float) -> bool:
+        """Record factory time and warn when it exceeds the budget.
+
+        Returns True when startup stayed within budget (or no budget is set).
+        """
+        self.startup_ms = elapsed_ms
+        if self.budget_ms is None or elapsed_ms <= self.budget_ms:
+            logger.info(
+                f"App factory finished in {elapsed_ms:.1f}ms "
+                f"({len(self._pending)} routers deferred)"
+            )
+            return True
+        slowest = ", ".join(f"{r.name}={r.import_ms:.0f}ms" for r in self.slowest())
+        logger.warning(
+            f"Startup budget exceeded: app factory took {elapsed_ms:.1f}ms "
+            f"(budget {self.budget_ms:.0f}ms); slowest router imports: "
+            f"{slowest or 'none'}"
+        )
+        return False
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "lazy": self.lazy,
+            "budget_ms": self.budget_ms,
+            "startup_ms": self.startup_ms,
+            "within_budget": (
+                None
+                if self.budget_ms is None or self.startup_ms is None
+                else self.startup_ms <= self.budget_ms
+            ),
+            "total_import_ms": self.total_import_ms,
+            "loaded": self.loaded_count,
+            "failed": self.failed_count,
+            "pending": self.pending,
+            "routers": [asdict(r) for r in self.records.values()],
+        }
@@ -1046,14 +1046,14 @@ How can I help you make smarter betting decisions today?
             # --- PERSONALIZATION INTEGRATION ---
             # Record user interest signal for this prop analysis
             try:
-                from backend.services.personalization.interest_model import InterestModelService
+                from backend.services.personalization.interest_model import interest_model_service
                 from backend.models.risk_personalization import InterestSignalType
                 
                 # Extract user ID from context if available
                 user_id = context.get('user_id') or context.get('session', {}).get('user_id')
                 
                 if user_id:
-                    interest_service = InterestModelService()
+                    interest_service = interest_model_service
                     
                     # Record interest signal (synchronous method)
                     interest_service.record_signal(
@@ -3,13 +3,15 @@ Intelligent model selection, dynamic weighting, and meta-learning for optimal pr
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import math
 import os
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
@@ -73,6 +75,7 @@ class ModelType(str, Enum):
     PROPHET = "prophet"
     ARIMA = "arima"
     LSTM = "lstm"
+    ENSEMBLE = "ensemble"
 
 
 class PredictionContext(str, Enum):
@@ -132,6 +135,7 @@ class PredictionOutput:
     metadata: Dict[str, Any]
     processing_time: float
     timestamp: datetime
+    lime_values: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -154,7 +158,12 @@ class EnsembleConfiguration:
 class ModelRegistry:
     """Advanced model registry with version control and metadata"""
 
-    def __init__(self, models_directory: str):
+    def __init__(
+        self,
+        models_directory: str,
+        cache_budget_mb: Optional[float] = None,
+        mmap_models: bool = True,
+    ):
         self.models_directory = Path(models_directory)
         # model_name -> model metadata dict
         self.models: Dict[str, Dict[str, Any]] = {}
@@ -163,8 +172,22 @@ class ModelRegistry:
         self.model_lineage: Dict[str, List[str]] = {}
         # dynamically size executor based on CPU cores
         self.executor = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2)
-        # cache for loaded models to avoid repeated disk I/O
-        self._model_cache: Dict[str, Any] = {}
+        # LRU cache of loaded models, bounded by a byte budget (file size is
+        # the per-model cost). Array-heavy models are joblib-loaded with
+        # mmap_mode="r" so worker processes share their pages via the OS page
+        # cache instead of each holding a private copy.
+        self._model_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._model_cache_bytes: Dict[str, int] = {}
+        if cache_budget_mb is None:
+            cache_budget_mb = float(os.getenv("A1_MODEL_CACHE_BUDGET_MB", "2048"))
+        self.cache_budget_bytes = int(cache_budget_mb * 1024 * 1024)
+        self.mmap_models = mmap_models
+        self.cache_evictions = 0
+        # The most recently loaded model that is larger than the whole budget,
+        # held outside the LRU so it is not re-read on every call
+        self._oversized: Optional[Tuple[str, Any]] = None
+        # single-flight: model_name -> in-progress load
+        self._loading: Dict[str, "asyncio.Task[Any]"] = {}
         # schedule periodic hyperparameter tuning
         try:
             loop = asyncio.get_event_loop()
@@ -203,6 +226,8 @@ class ModelRegistry:
             }
 
             self.models[model_name] = model_info
+            # A cached copy of a previous registration is stale now
+            self.evict_model(model_name)
 
             # Initialize metrics
             self.model_metrics[model_name] = ModelMetrics(
@@ -234,41 +259,139 @@ class ModelRegistry:
             logger.error("Error registering model {model_name}: {e!s}")
             raise
 
+    @property
+    def cached_bytes(self) -> int:
+        """Bytes currently charged against the model cache budget"""
+        return sum(self._model_cache_bytes.values())
+
     async def load_model(self, model_name: str) -> Any:
-        """Load model with caching and error handling"""
+        """Load model with caching and error handling
+
+        Cached models are returned without touching disk. Concurrent loads of
+        the same model share a single read.
+        """
         try:
             # Instrument and return cached model if already loaded
             if model_name in self._model_cache:
                 model_load_counter.labels(model_name=model_name).inc()
+                self._model_cache.move_to_end(model_name)
                 return self._model_cache[model_name]
+            if self._oversized is not None and self._oversized[0] == model_name:
+                model_load_counter.labels(model_name=model_name).inc()
+                return self._oversized[1]
+
+            load_task = self._loading.get(model_name)
+            if load_task is None:
+                load_task = asyncio.ensure_future(self._load_from_disk(model_name))
+                self._loading[model_name] = load_task
+                load_task.add_done_callback(
+                    lambda _, name=model_name: self._loading.pop(name, None)
+                )
+            return await asyncio.shield(load_task)
 
-            if model_name not in self.models:
-                raise ValueError(f"Model {model_name} not registered")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(f"Error loading model {model_name}: {e!s}")
+            raise
 
-            model_info = self.models[model_name]
-            model_path = self.models_directory / model_info["path"]
+    async def _load_from_disk(self, model_name: str) -> Any:
+        """Read a model file and admit it to the bounded cache"""
+        if model_name not in self.models:
+            raise ValueError(f"Model {model_name} not registered")
 
-            if not model_path.exists():
-                raise FileNotFoundError(f"Model file not found: {model_path}")
+        model_info = self.models[model_name]
+        model_path = self.models_directory / model_info["path"]
 
-            # Load model based on type
-            # Increment load counter and measure latency
-            with model_load_latency.labels(model_name=model_name).time():
-                model_load_counter.labels(model_name=model_name).inc()
-                loop = asyncio.get_event_loop()
+        if not model_path.exists():
+            raise FileNotFoundError(f"Model file not found: {model_path}")
+
+        # Increment load counter and measure latency
+        with model_load_latency.labels(model_name=model_name).time():
+            model_load_counter.labels(model_name=model_name).inc()
+            loop = asyncio.get_event_loop()
+            # Use joblib for all model loading for safety; numpy arrays in
+            # uncompressed dumps come back as read-only memory maps
+            mmap_mode = "r" if model_info.get("mmap", self.mmap_models) else None
+            model = await loop.run_in_executor(
+                self.executor,
+                lambda: joblib.load(str(model_path), mmap_mode=mmap_mode),
+            )
+
+        # Only cache it if the model was not re-registered while loading
+        if self.models.get(model_name) is model_info:
+            self._admit(model_name, model, model_path.stat().st_size)
+        return model
 
-                # Use joblib for all model loading for safety
-                model = await loop.run_in_executor(
-                    self.executor, joblib.load, str(model_path)
+    def _admit(self, model_name: str, model: Any, nbytes: int) -> None:
+        """Insert a model and evict least recently used ones to fit the budget"""
+        if nbytes > self.cache_budget_bytes:
+            if self._oversized is None or self._oversized[0] != model_name:
+                logger.warning(
+                    f"Model {model_name} ({nbytes} bytes) exceeds the model cache "
+                    f"budget ({self.cache_budget_bytes} bytes); keeping it pinned "
+                    f"outside the cache until another oversized model is loaded"
                 )
+            self._oversized = (model_name, model)
+            return
+
+        while self._model_cache and self.cached_bytes + nbytes > self.cache_budget_bytes:
+            evicted, _ = self._model_cache.popitem(last=False)
+            self._model_cache_bytes.pop(evicted, None)
+            self.cache_evictions += 1
+            logger.info(f"Evicted model {evicted} from cache to stay within budget")
+
+        self._model_cache[model_name] = model
+        self._model_cache_bytes[model_name] = nbytes
+
+    def evict_model(self, model_name: str) -> bool:
+        """Drop a model from the cache, e.g. after a new version is registered"""
+        pinned = self._oversized is not None and self._oversized[0] == model_name
+        if pinned:
+            self._oversized = None
+        self._model_cache_bytes.pop(model_name, None)
+        return self._model_cache.pop(model_name, None) is not None or pinned
+
+    def is_loaded(self, model_name: str) -> bool:
+        """Whether a model is currently held in memory (cached or pinned oversized)"""
+        return model_name in self._model_cache or (
+            self._oversized is not None and self._oversized[0] == model_name
+        )
 
-            # cache and return the loaded model
-            self._model_cache[model_name] = model
-            return model
+    async def prewarm(self, manifest_path: str) -> Dict[str, bool]:
+        """Load the models named in a manifest, in manifest order
 
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            logger.error("Error loading model {model_name}: {e!s}")
-            raise
+        The manifest is JSON: either a list of model names or an object with
+        a "models" list. Models that would not fit the budget are skipped
+        rather than evicting earlier (higher priority) entries.
+        """
+        try:
+            with open(manifest_path, encoding="utf-8") as handle:
+                manifest = json.load(handle)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read model prewarm manifest {manifest_path}: {e!s}")
+            return {}
+
+        names = manifest.get("models", []) if isinstance(manifest, dict) else manifest
+        results: Dict[str, bool] = {}
+        for model_name in names:
+            info = self.models.get(model_name)
+            if info is None:
+                results[model_name] = False
+                continue
+            model_path = self.models_directory / info["path"]
+            size = model_path.stat().st_size if model_path.exists() else 0
+            if self.cached_bytes + size > self.cache_budget_bytes:
+                results[model_name] = False
+                continue
+            try:
+                await self.load_model(model_name)
+                results[model_name] = self.is_loaded(model_name)
+            except Exception:  # pylint: disable=broad-exception-caught
+                results[model_name] = False
+
+        logger.info(
+            f"Prewarmed {sum(results.values())}/{len(results)} models from {manifest_path}"
+        )
+        return results
 
     async def _hyperparameter_tuning_loop(self):
         """Periodically run hyperparameter tuning for registered models"""
@@ -827,16 +950,30 @@ class UltraAdvancedEnsembleEngine:
     """Ultra-advanced ensemble engine with intelligent model selection and weighting"""
 
     def __init__(self):
-        self.model_registry = ModelRegistry(config_manager.config.model_path)
+        self.model_registry = ModelRegistry(
+            config_manager.config.model_path,
+            cache_budget_mb=config_manager.get("model_cache_budget_mb", None),
+            mmap_models=config_manager.get("model_mmap_enabled", True),
+        )
         self.model_selector = IntelligentModelSelector(self.model_registry)
         self.weighting_engine = DynamicWeightingEngine()
         self.meta_learner = MetaLearningEngine()
         self.feature_engineer = FeatureEngineering()
-        self.loaded_models: Dict[str, Any] = {}
+        # Shared view of the registry's bounded cache (no second copy)
+        self.loaded_models = self.model_registry._model_cache
         self.prediction_cache = deque(maxlen=1000)
         # TTL cache for ensemble predictions
         ttl_seconds = config_manager.get("prediction_cache_ttl_seconds", 300)
         self.prediction_result_cache = TTLCache(maxsize=1000, ttl=ttl_seconds)
+        # SHAP/LIME results per (model, version, feature row), and the
+        # (models, features, weights) behind each explanation_key handed out
+        # by predict_batch so explanations can be computed on demand
+        explanation_ttl = config_manager.get("explanation_cache_ttl_seconds", 3600)
+        explanation_size = config_manager.get("explanation_cache_size", 2048)
+        self._explanation_cache = TTLCache(maxsize=explanation_size, ttl=explanation_ttl)
+        self._explanation_requests = TTLCache(
+            maxsize=explanation_size * 8, ttl=explanation_ttl
+        )
         # Limit concurrent predictions
         self._predict_semaphore = asyncio.Semaphore(
             config_manager.get("max_concurrent_predictions", 10)
@@ -869,11 +1006,7 @@ class UltraAdvancedEnsembleEngine:
 
     async def _get_or_load_model(self, model_name: str) -> Any:
         """Helper to retrieve loaded model from cache or load it via registry"""
-        if model_name in self.loaded_models:
-            return self.loaded_models[model_name]
-        model = await self.model_registry.load_model(model_name)
-        self.loaded_models[model_name] = model
-        return model
+        return await self.model_registry.load_model(model_name)
 
     async def initialize(self):
         """Initialize the ensemble engine"""
@@ -1070,26 +1203,24 @@ class UltraAdvancedEnsembleEngine:
         features: Dict[str, float],
         context: PredictionContext,
     ) -> List[PredictionOutput]:
-        """Generate predictions from selected models"""
-        predictions = []
+        """Generate predictions from selected models concurrently"""
 
-        for model_name in model_names:
+        async def predict_one(model_name: str) -> Optional[PredictionOutput]:
             try:
                 model = await self._get_or_load_model(model_name)
                 if model is None:
-                    continue
+                    return None
 
-                prediction = await self._predict_single_model(
+                return await self._predict_single_model(
                     model, model_name, features, context
                 )
-                if prediction:
-                    predictions.append(prediction)
 
             except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.warning("Model {model_name} prediction failed: {e!s}")
-                continue
+                logger.warning(f"Model {model_name} prediction failed: {e!s}")
+                return None
 
-        return predictions
+        results = await asyncio.gather(*(predict_one(name) for name in model_names))
+        return [prediction for prediction in results if prediction]
 
     async def _predict_single_model(
         self,
@@ -1127,13 +1258,9 @@ class UltraAdvancedEnsembleEngine:
                     zip(feature_names, model.feature_importances_)
                 )
 
-            # SHAP values
-            shap_values = await self._calculate_shap_values(
-                model, feature_array, feature_names
-            )
-            # LIME values
-            lime_values = await self._calculate_lime_values(
-                model, feature_array, feature_names
+            # SHAP and LIME values, cached per model version and feature row
+            shap_values, lime_values = await self._explain_model(
+                model, model_name, feature_array, feature_names
             )
 
             return PredictionOutput(
@@ -1160,6 +1287,289 @@ class UltraAdvancedEnsembleEngine:
             logger.error("Single model prediction failed for {model_name}: {e!s}")
             return None
 
+    async def predict_batch(
+        self,
+        feature_rows: List[Dict[str, float]],
+        context: PredictionContext = PredictionContext.PRE_GAME,
+        ensemble_config: Optional[EnsembleConfiguration] = None,
+        explain_rows: Optional[List[int]] = None,
+    ) -> List[PredictionOutput]:
+        """Generate ensemble predictions for a slate of feature rows
+
+        Models are selected once for the slate and each runs a single predict
+        over the whole feature matrix; models execute concurrently on the
+        registry executor and are combined with one weighted matrix product.
+        SHAP/LIME explanations are only computed for ``explain_rows``; every
+        output carries an ``explanation_key`` in its metadata that ``explain``
+        resolves on demand.
+        """
+        if not feature_rows:
+            return []
+        try:
+            async with self._predict_semaphore:
+                if self.metrics_enabled:
+                    prediction_counter.labels(context=context.value).inc(
+                        len(feature_rows)
+                    )
+                with prediction_latency.labels(context=context.value).time():
+                    start_ts = time.time()
+                    config = ensemble_config or self.default_config
+                    # Feature preprocessing
+                    engineered = [
+                        self.feature_engineer.preprocess_features(features)
+                        for features in feature_rows
+                    ]
+                    processed = [
+                        e.get("features", features)
+                        for e, features in zip(engineered, feature_rows)
+                    ]
+                    # Model selection over the union of slate features
+                    slate_features: Dict[str, float] = {}
+                    for row in processed:
+                        slate_features.update(row)
+                    selected = await self.model_selector.select_models(
+                        context, slate_features, config
+                    )
+                    if not selected:
+                        raise ValueError("No models available for prediction")
+
+                    model_outputs = await self._generate_batch_model_predictions(
+                        selected, processed
+                    )
+                    if not model_outputs:
+                        raise ValueError("All selected models failed")
+                    model_names = list(model_outputs)
+                    # (models, rows) matrices
+                    values = np.vstack([model_outputs[m][0] for m in model_names])
+                    confidences = np.vstack([model_outputs[m][1] for m in model_names])
+
+                    # Weight calculation and vectorized aggregation
+                    recent = list(self.prediction_cache)[-50:]
+                    weights = await self.weighting_engine.calculate_weights(
+                        model_names, context, recent
+                    )
+                    weight_vector = np.array([weights.get(m, 1.0) for m in model_names])
+                    ensemble_values = weight_vector @ values
+                    ensemble_confidence = (weight_vector @ confidences) / max(
+                        float(weight_vector.sum()), 1e-12
+                    )
+                    stds = (
+                        values.std(axis=0)
+                        if len(model_names) > 1
+                        else np.zeros(values.shape[1])
+                    )
+                    processing_time = time.time() - start_ts
+
+                    outputs: List[PredictionOutput] = []
+                    for row, features in enumerate(processed):
+                        ensemble_val = float(ensemble_values[row])
+                        std = float(stds[row])
+                        explanation_key = self._make_explanation_key(model_names, features)
+                        self._explanation_requests[explanation_key] = (
+                            tuple(model_names),
+                            features,
+                            weights,
+                        )
+                        outputs.append(
+                            PredictionOutput(
+                                model_name="ensemble",
+                                model_type=ModelType.ENSEMBLE,
+                                predicted_value=ensemble_val,
+                                confidence_interval=(
+                                    ensemble_val - 1.96 * std,
+                                    ensemble_val + 1.96 * std,
+                                ),
+                                prediction_probability=float(ensemble_confidence[row]),
+                                feature_importance=engineered[row].get(
+                                    "feature_importance", {}
+                                ),
+                                shap_values={},
+                                uncertainty_metrics={"std_dev": std},
+                                model_agreement=1 - std,
+                                prediction_context=context,
+                                metadata={
+                                    "selected_models": model_names,
+                                    "model_weights": weights,
+                                    "model_predictions": {
+                                        m: float(values[i, row])
+                                        for i, m in enumerate(model_names)
+                                    },
+                                    "explanation_key": explanation_key,
+                                    "batch_size": len(processed),
+                                },
+                                processing_time=processing_time,
+                                timestamp=datetime.now(timezone.utc),
+                            )
+                        )
+                        self.prediction_cache.append(
+                            {
+                                "features": features,
+                                "model_predictions": [
+                                    {
+                                        "model_name": m,
+                                        "predicted_value": float(values[i, row]),
+                                        "confidence": float(confidences[i, row]),
+                                    }
+                                    for i, m in enumerate(model_names)
+                                ],
+                                "ensemble": ensemble_val,
+                            }
+                        )
+
+            # Explanations only for the rows that asked for them
+            for row in explain_rows or ():
+                explanation = await self.explain(
+                    outputs[row].metadata["explanation_key"]
+                )
+                if explanation:
+                    outputs[row].shap_values = explanation["shap_values"]
+                    outputs[row].lime_values = explanation["lime_values"]
+            return outputs
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error(f"Batch ensemble prediction failed: {e}")
+            raise
+
+    async def _generate_batch_model_predictions(
+        self,
+        model_names: List[str],
+        feature_rows: List[Dict[str, float]],
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Run each model once over the feature matrix, all models concurrently
+
+        Returns model_name -> (predicted values, confidences), one entry per row.
+        """
+        loop = asyncio.get_running_loop()
+
+        async def run(model_name: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+            model = await self._get_or_load_model(model_name)
+            if model is None:
+                return None
+            model_info = self.model_registry.models[model_name]
+            feature_matrix = self._feature_matrix(
+                feature_rows, model_info.get("feature_names", [])
+            )
+            return await loop.run_in_executor(
+                self.model_registry.executor,
+                self._predict_matrix,
+                model,
+                feature_matrix,
+                model_info["type"],
+            )
+
+        results = await asyncio.gather(
+            *(run(name) for name in model_names), return_exceptions=True
+        )
+        outputs: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for model_name, result in zip(model_names, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Model {model_name} batch prediction failed: {result!s}")
+            elif result is not None:
+                outputs[model_name] = result
+        return outputs
+
+    @staticmethod
+    def _feature_matrix(
+        feature_rows: List[Dict[str, float]], feature_names: List[str]
+    ) -> np.ndarray:
+        """Stack feature dicts into a (rows, features) array in model order"""
+        if feature_names:
+            return np.array(
+                [[row.get(name, 0.0) for name in feature_names] for row in feature_rows],
+                dtype=float,
+            )
+        return np.array([list(row.values()) for row in feature_rows], dtype=float)
+
+    @staticmethod
+    def _predict_matrix(
+        model: Any, feature_matrix: np.ndarray, model_type: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Predicted values and per-row confidence (batch calculate_confidence)"""
+        values = np.asarray(model.predict(feature_matrix), dtype=float).reshape(-1)
+        try:
+            if model_type == "random_forest" and hasattr(model, "estimators_"):
+                per_tree = np.stack(
+                    [tree.predict(feature_matrix) for tree in model.estimators_]
+                )
+                variance = per_tree.var(axis=0)
+                confidences = np.maximum(0.1, 1.0 - np.minimum(variance, 1.0))
+            elif model_type in ["xgboost", "lightgbm"]:
+                confidences = np.full(len(values), 0.8)
+            else:
+                confidences = np.full(len(values), 0.7)
+        except Exception:  # pylint: disable=broad-exception-caught
+            confidences = np.full(len(values), 0.5)
+        return values, confidences
+
+    def _make_explanation_key(
+        self, model_names: List[str], features: Dict[str, float]
+    ) -> str:
+        """Stable key for the explanation of one feature row under a model set"""
+        payload = repr((tuple(model_names), tuple(sorted(features.items()))))
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    async def _explain_model(
+        self,
+        model: Any,
+        model_name: str,
+        feature_array: np.ndarray,
+        feature_names: List[str],
+    ) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """SHAP and LIME values for one model and row, cached by model version"""
+        version = self.model_registry.models.get(model_name, {}).get("version")
+        key = (model_name, version, feature_array.tobytes())
+        cached = self._explanation_cache.get(key)
+        if cached is not None:
+            return cached
+
+        shap_values = await self._calculate_shap_values(
+            model, feature_array, feature_names
+        )
+        lime_values = await self._calculate_lime_values(
+            model, feature_array, feature_names
+        )
+        self._explanation_cache[key] = (shap_values, lime_values)
+        return shap_values, lime_values
+
+    async def explain(self, explanation_key: str) -> Optional[Dict[str, Any]]:
+        """Compute (or fetch cached) explanations for a predict_batch row
+
+        Returns weight-aggregated SHAP and LIME values plus the per-model
+        breakdown, or None when the key is unknown or has expired.
+        """
+        request = self._explanation_requests.get(explanation_key)
+        if request is None:
+            return None
+        model_names, features, weights = request
+
+        per_model: Dict[str, Dict[str, Dict[str, float]]] = {}
+        shap_values: "defaultdict[str, float]" = defaultdict(float)
+        lime_values: "defaultdict[str, float]" = defaultdict(float)
+        for model_name in model_names:
+            try:
+                model = await self._get_or_load_model(model_name)
+                feature_names = self.model_registry.models[model_name].get(
+                    "feature_names", []
+                )
+                feature_array = self._feature_matrix([features], feature_names)
+                model_shap, model_lime = await self._explain_model(
+                    model, model_name, feature_array, feature_names
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(f"Explanation for model {model_name} failed: {e!s}")
+                continue
+            per_model[model_name] = {"shap_values": model_shap, "lime_values": model_lime}
+            weight = weights.get(model_name, 0.0)
+            for feature, value in model_shap.items():
+                shap_values[feature] += weight * value
+            for feature, value in model_lime.items():
+                lime_values[feature] += weight * value
+
+        return {
+            "shap_values": dict(shap_values),
+            "lime_values": dict(lime_values),
+            "models": per_model,
+        }
+
     async def _calculate_ensemble_prediction(
         self,
         model_predictions: List[PredictionOutput],
@@ -1387,15 +1797,26 @@ class UltraAdvancedEnsembleEngine:
             logger.error("Model discovery failed: {e}")
 
     async def _load_initial_models(self):
-        """Pre-load models into memory for faster first predictions"""
+        """Pre-load models into memory for faster first predictions
+
+        With a ``model_prewarm_manifest`` configured only the listed models are
+        loaded; otherwise every active model is loaded, bounded by the model
+        cache budget.
+        """
         try:
+            manifest = config_manager.get(
+                "model_prewarm_manifest", os.getenv("A1_MODEL_PREWARM_MANIFEST")
+            )
+            if manifest:
+                await self.model_registry.prewarm(manifest)
+                return
             active = self.model_registry.get_active_models()
             tasks = [self._get_or_load_model(name) for name in active]
             results = await asyncio.gather(*tasks, return_exceptions=True)
             loaded = sum(1 for r in results if not isinstance(r, Exception))
-            logger.info("Loaded initial {loaded}/{len(active)} models into cache")
+            logger.info(f"Loaded initial {loaded}/{len(active)} models into cache")
         except Exception as e:  # pylint: disable=broad-exception-caught
-            logger.error("Initial model loading failed: {e}")
+            logger.error(f"Initial model loading failed: {e}")
 
 
 class UltraEnsembleEngine:
@@ -290,7 +290,7 @@ async def create_draft_ticket(request: TicketDraftRequest):
     """
     try:
         # Create draft ticket
-        ticket_dto = ticket_service.create_draft_ticket(
+        ticket_dto = await ticket_service.create_draft_ticket_async(
             user_id=request.user_id,
             stake=request.stake,
             edge_ids=request.edge_ids
@@ -357,7 +357,7 @@ async def submit_ticket(ticket_id: int, request: TicketSubmitRequest):
     """
     try:
         # Submit ticket
-        ticket_dto = ticket_service.submit_ticket(ticket_id)
+        ticket_dto = await ticket_service.submit_ticket_async(ticket_id)
         
         # Convert DTO to response model
         return TicketResponse(**ticket_dto.__dict__)
@@ -411,7 +411,7 @@ async def get_ticket(ticket_id: int):
     """
     try:
         # Get ticket
-        ticket_dto = ticket_service.get_ticket(ticket_id)
+        ticket_dto = await ticket_service.get_ticket_async(ticket_id)
         
         # Convert DTO to response model
         return TicketResponse(**ticket_dto.__dict__)
@@ -466,7 +466,7 @@ async def recalc_ticket(ticket_id: int):
     """
     try:
         # Recalculate ticket
-        ticket_dto = ticket_service.recalc_ticket(ticket_id)
+        ticket_dto = await ticket_service.recalc_ticket_async(ticket_id)
         
         # Convert DTO to response model
         return TicketResponse(**ticket_dto.__dict__)
@@ -117,7 +117,6 @@ async def get_comprehensive_health(response: Response):
 
             raw = health_status.dict() if hasattr(health_status, "dict") else dict(health_status)
 
-            from fastapi.responses import JSONResponse
             resp = JSONResponse(content=raw, status_code=200)
             resp.headers["Cache-Control"] = "no-store"
             resp.headers["X-Health-Version"] = "v2"
@@ -127,7 +126,7 @@ async def get_comprehensive_health(response: Response):
             # Fall through to the heavier collector fallback below
 
     try:
-        # Collect comprehensive health information
+        # Serve the latest background-probed health snapshot
         health_collector = get_health_collector()
         health_data = await health_collector.collect_health()
 
@@ -139,7 +138,7 @@ async def get_comprehensive_health(response: Response):
 
         # Serialize to JSONResponse to ensure headers and consistent shape
         try:
-            body = health_data.dict() if hasattr(health_data, "dict") else dict(health_data)
+            body = health_data.model_dump(mode="json") if hasattr(health_data, "model_dump") else dict(health_data)
         except Exception:
             # Fall back to raw representation
             try:
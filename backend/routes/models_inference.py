@@ -143,11 +143,17 @@ async def predict(request: Request, prediction_request: PredictionRequest):
             }
         )
         
-        # Run inference
-        result = await inference_service.run_inference(
-            model_version=active_model_version,
-            features=prediction_request.features
-        )
+        # Run inference, coalescing concurrent requests through the micro-batcher
+        if inference_service.batching_enabled:
+            result = await inference_service.submit_inference(
+                model_version=active_model_version,
+                features=prediction_request.features
+            )
+        else:
+            result = await inference_service.run_inference(
+                model_version=active_model_version,
+                features=prediction_request.features
+            )
         
         # Build response
         response = PredictionResponse(
@@ -257,7 +257,7 @@ async def update_subscription_filters(connection_id: str, filter_data: Dict[str,
         )
         
         # Add to existing filters
-        connection.subscription_filters.append(new_filter)
+        notification_service.add_subscription_filter(connection_id, new_filter)
         
         # Send confirmation using envelope pattern
         await send_websocket_message(connection.websocket, "subscription_updated")
@@ -282,10 +282,10 @@ async def remove_subscription_filters(connection_id: str, filter_types: List[str
         
         # Remove filters that match the types
         original_count = len(connection.subscription_filters)
-        connection.subscription_filters = [
+        notification_service.set_subscription_filters(connection_id, [
             f for f in connection.subscription_filters
             if not any(nt in types_to_remove for nt in f.notification_types)
-        ]
+        ])
         
         removed_count = original_count - len(connection.subscription_filters)
         
@@ -15,7 +15,7 @@ from backend.services.unified_error_handler import unified_error_handler
 from backend.services.risk.bankroll_strategy import BankrollStrategyService, StakeResult
 from backend.services.risk.exposure_tracker import ExposureTrackerService
 from backend.services.risk.risk_constraints import RiskConstraintsService
-from backend.services.personalization.interest_model import InterestModelService
+from backend.services.personalization.interest_model import InterestModelService, interest_model_service
 from backend.services.personalization.watchlist_service import WatchlistService
 from backend.services.alerting.rule_evaluator import AlertRuleEvaluator
 from backend.services.alerting.alert_dispatcher import AlertDispatcher
@@ -113,8 +113,8 @@ def get_risk_service() -> RiskConstraintsService:
     return RiskConstraintsService()
 
 def get_interest_service() -> InterestModelService:
-    """Get interest model service instance"""
-    return InterestModelService()
+    """Get interest model service instance (shared, so live profiles persist)"""
+    return interest_model_service
 
 def get_watchlist_service() -> WatchlistService:
     """Get watchlist service instance"""
@@ -11,6 +11,8 @@ import logging
 import time
 import numpy as np
 import pandas as pd
+from scipy.linalg import cho_solve, cholesky
+from scipy.stats import norm
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, field
@@ -98,6 +100,9 @@ class RiskManagementSettings:
     kelly_fraction_cap: float = 0.25  # Cap Kelly at 25%
     drawdown_stop_loss: float = 0.2   # Stop betting at 20% drawdown
     correlation_limit: float = 0.7    # Limit correlated bets
+    max_portfolio_kelly: float = 0.5  # Maximum 50% of bankroll across a portfolio
+    portfolio_scenarios: int = 2000   # Outcome scenarios for log-utility sizing
+    portfolio_scenario_seed: int = 7  # Fixed seed keeps re-solves comparable
     volatility_adjustment: bool = True
     dynamic_sizing: bool = True
 
@@ -115,6 +120,7 @@ class AdvancedKellyEngine:
         self.risk_settings = RiskManagementSettings()
         self.performance_metrics: Dict = {}
         self.correlation_matrix: Optional[np.ndarray] = None
+        self._portfolio_warm_start: Dict[str, float] = {}
         
         # Dynamic parameters that adjust based on performance
         self.volatility_estimate = 0.2
@@ -166,49 +172,52 @@ class AdvancedKellyEngine:
         return base_kelly * max(0.1, min(1.0, total_adjustment))
     
     def calculate_portfolio_kelly(self, opportunities: List[BettingOpportunity]) -> Dict[str, float]:
-        """Calculate optimal Kelly fractions for portfolio of bets"""
+        """Calculate growth-optimal Kelly fractions for a portfolio of bets
+
+        Maximizes expected log-wealth over correlated outcome scenarios subject
+        to per-bet and total exposure caps. The previous solution is reused as a
+        warm start, so re-solving after a single leg moves converges quickly.
+        """
         if not opportunities:
             return {}
-        
-        # Build expected returns vector
-        expected_returns = []
-        for opp in opportunities:
-            edge = (opp.true_probability * opp.offered_odds) - 1
-            expected_returns.append(edge)
-        
-        expected_returns = np.array(expected_returns)
-        
-        # Build covariance matrix (simplified)
+
         n = len(opportunities)
+        probabilities = np.array([opp.true_probability for opp in opportunities], dtype=float)
+        odds = np.array([opp.offered_odds for opp in opportunities], dtype=float)
+        expected_returns = probabilities * odds - 1
+
         if self.correlation_matrix is None or self.correlation_matrix.shape[0] != n:
-            # Simple correlation model based on sport and market type
+            # Simple correlation model based on sport, market, book and game
             corr_matrix = self._build_correlation_matrix(opportunities)
         else:
             corr_matrix = self.correlation_matrix
-        
-        # Estimate variances (simplified)
-        variances = np.array([self._estimate_bet_variance(opp) for opp in opportunities])
-        cov_matrix = np.outer(np.sqrt(variances), np.sqrt(variances)) * corr_matrix
-        
-        # Portfolio Kelly optimization: f = C^-1 * μ
+
         try:
-            inv_cov = np.linalg.inv(cov_matrix)
-            kelly_fractions = inv_cov @ expected_returns
-            
-            # Apply constraints
-            kelly_fractions = np.maximum(0, kelly_fractions)  # No shorting
-            total_kelly = np.sum(kelly_fractions)
-            
-            # Scale down if total Kelly is too high
-            max_total_kelly = 0.5  # Maximum 50% of bankroll
-            if total_kelly > max_total_kelly:
-                kelly_fractions = kelly_fractions * (max_total_kelly / total_kelly)
-            
-            return {
-                opp.opportunity_id: float(kelly_fractions[i]) 
+            corr_factor = self._cholesky_with_jitter(corr_matrix)
+            std = np.sqrt([
+                max(self._estimate_bet_variance(opp), 1e-12) for opp in opportunities
+            ])
+
+            # Mean-variance Kelly (f = C^-1 * mu) via Cholesky solves, used to
+            # seed legs that have no previous solution
+            cov_factor = std[:, None] * corr_factor
+            mv_kelly = cho_solve((cov_factor, True), expected_returns)
+
+            caps = np.array([self._exposure_cap(opp) for opp in opportunities])
+            max_total = self.risk_settings.max_portfolio_kelly
+            initial = np.array([
+                self._portfolio_warm_start.get(opp.opportunity_id, mv_kelly[i])
                 for i, opp in enumerate(opportunities)
-            }
-        except np.linalg.LinAlgError:
+            ])
+            initial = self._project_capped_simplex(initial, caps, max_total)
+
+            scenario_returns = self._simulate_scenario_returns(
+                probabilities, odds, corr_factor
+            )
+            kelly_fractions = self._solve_log_utility(
+                scenario_returns, initial, caps, max_total
+            )
+        except (np.linalg.LinAlgError, ValueError):
             # Fallback to individual Kelly calculations
             return {
                 opp.opportunity_id: self.calculate_adaptive_kelly(
@@ -216,32 +225,140 @@ class AdvancedKellyEngine:
                     opp
                 ) for opp in opportunities
             }
-    
+
+        self._portfolio_warm_start = {
+            opp.opportunity_id: float(kelly_fractions[i])
+            for i, opp in enumerate(opportunities)
+        }
+        return dict(self._portfolio_warm_start)
+
+    def _exposure_cap(self, opportunity: BettingOpportunity) -> float:
+        """Maximum bankroll fraction allowed on a single opportunity"""
+        cap = self.risk_settings.max_bet_percentage
+        if self.current_bankroll > 0 and opportunity.max_bet_limit is not None:
+            cap = min(cap, opportunity.max_bet_limit / self.current_bankroll)
+        return max(0.0, cap)
+
+    @staticmethod
+    def _cholesky_with_jitter(matrix: np.ndarray, max_attempts: int = 6) -> np.ndarray:
+        """Lower Cholesky factor of a correlation matrix
+
+        The additive correlation model is not guaranteed to be positive
+        definite; if factorization fails, negative eigenvalues are clipped and
+        the unit diagonal restored before retrying with growing diagonal jitter.
+        """
+        try:
+            return cholesky(matrix, lower=True)
+        except np.linalg.LinAlgError:
+            pass
+        eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+        repaired = (eigenvectors * np.maximum(eigenvalues, 1e-6)) @ eigenvectors.T
+        scale = np.sqrt(np.diag(repaired))
+        repaired = repaired / np.outer(scale, scale)
+        identity = np.eye(matrix.shape[0])
+        jitter = 1e-10
+        for _ in range(max_attempts):
+            try:
+                return cholesky(repaired + jitter * identity, lower=True)
+            except np.linalg.LinAlgError:
+                jitter *= 10
+        raise np.linalg.LinAlgError("Correlation matrix is not positive definite")
+
+    def _simulate_scenario_returns(
+        self, probabilities: np.ndarray, odds: np.ndarray, corr_factor: np.ndarray
+    ) -> np.ndarray:
+        """Per-scenario net returns (S x n) for correlated win/loss outcomes
+
+        Outcomes come from a Gaussian copula: correlated normals via the
+        Cholesky factor are thresholded at each bet's win probability.
+        """
+        n = len(probabilities)
+        rng = np.random.default_rng(self.risk_settings.portfolio_scenario_seed)
+        normals = rng.standard_normal((self.risk_settings.portfolio_scenarios, n))
+        latent = normals @ corr_factor.T
+        thresholds = norm.ppf(np.clip(probabilities, 1e-9, 1 - 1e-9))
+        wins = latent < thresholds
+        return np.where(wins, odds - 1, -1.0)
+
+    @staticmethod
+    def _project_capped_simplex(
+        values: np.ndarray, caps: np.ndarray, total: float
+    ) -> np.ndarray:
+        """Euclidean projection onto {0 <= f <= caps, sum(f) <= total}"""
+        clipped = np.clip(values, 0.0, caps)
+        if clipped.sum() <= total:
+            return clipped
+        # Find the shift lam so that sum(clip(values - lam, 0, caps)) == total
+        lo, hi = 0.0, float(np.max(values))
+        for _ in range(60):
+            lam = 0.5 * (lo + hi)
+            if np.clip(values - lam, 0.0, caps).sum() > total:
+                lo = lam
+            else:
+                hi = lam
+        return np.clip(values - hi, 0.0, caps)
+
+    def _solve_log_utility(
+        self,
+        scenario_returns: np.ndarray,
+        initial: np.ndarray,
+        caps: np.ndarray,
+        max_total: float,
+        max_iter: int = 200,
+        tol: float = 1e-7,
+    ) -> np.ndarray:
+        """Projected gradient ascent on mean(log(1 + R f)) with backtracking"""
+
+        def objective(f: np.ndarray) -> float:
+            return float(np.mean(np.log1p(scenario_returns @ f)))
+
+        fractions = initial
+        value = objective(fractions)
+        step = 1.0
+        for _ in range(max_iter):
+            wealth = 1.0 + scenario_returns @ fractions
+            gradient = (scenario_returns / wealth[:, None]).mean(axis=0)
+            while True:
+                candidate = self._project_capped_simplex(
+                    fractions + step * gradient, caps, max_total
+                )
+                candidate_value = objective(candidate)
+                if candidate_value >= value or step < 1e-8:
+                    break
+                step *= 0.5
+            converged = np.max(np.abs(candidate - fractions)) < tol
+            fractions, value = candidate, candidate_value
+            if converged:
+                break
+            step = min(step * 2.0, 1.0)
+        return fractions
+
     def _build_correlation_matrix(self, opportunities: List[BettingOpportunity]) -> np.ndarray:
-        """Build correlation matrix for betting opportunities"""
+        """Build correlation matrix for betting opportunities
+
+        Pairwise factors come from categorical equality masks over sport,
+        market type, sportsbook and game, so no Python-level pair loop is needed.
+        """
         n = len(opportunities)
-        corr_matrix = np.eye(n)  # Start with identity matrix
-        
-        for i in range(n):
-            for j in range(i + 1, n):
-                opp1, opp2 = opportunities[i], opportunities[j]
-                
-                # Correlation factors
-                sport_corr = 0.3 if opp1.sport == opp2.sport else 0.1
-                market_corr = 0.2 if opp1.market_type == opp2.market_type else 0.05
-                sportsbook_corr = 0.1 if opp1.sportsbook == opp2.sportsbook else 0.0
-                
-                # Time correlation (same game)
-                time_corr = 0.0
-                if hasattr(opp1, 'game_id') and hasattr(opp2, 'game_id'):
-                    if opp1.metadata.get('game_id') == opp2.metadata.get('game_id'):
-                        time_corr = 0.8  # High correlation for same game
-                
-                total_corr = min(0.9, sport_corr + market_corr + sportsbook_corr + time_corr)
-                corr_matrix[i, j] = corr_matrix[j, i] = total_corr
-        
+
+        def same(values: List[Any]) -> np.ndarray:
+            _, codes = np.unique(np.array(values, dtype=object).astype(str), return_inverse=True)
+            return codes[:, None] == codes[None, :]
+
+        sport_corr = np.where(same([opp.sport for opp in opportunities]), 0.3, 0.1)
+        market_corr = np.where(same([opp.market_type for opp in opportunities]), 0.2, 0.05)
+        sportsbook_corr = np.where(same([opp.sportsbook for opp in opportunities]), 0.1, 0.0)
+
+        # Time correlation (same game); legs without a game_id never match
+        game_ids = [opp.metadata.get('game_id') for opp in opportunities]
+        has_game = np.array([game_id is not None for game_id in game_ids])
+        same_game = same(game_ids) & has_game[:, None] & has_game[None, :]
+        time_corr = np.where(same_game, 0.8, 0.0)
+
+        corr_matrix = np.minimum(0.9, sport_corr + market_corr + sportsbook_corr + time_corr)
+        np.fill_diagonal(corr_matrix, 1.0)
         return corr_matrix
-    
+
     def _estimate_bet_variance(self, opportunity: BettingOpportunity) -> float:
         """Estimate variance for a betting opportunity"""
         # Simplified variance estimation
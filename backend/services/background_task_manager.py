@@ -6,8 +6,11 @@ Implements 2024-2025 best practices for background processing and task queues.
 from __future__ import annotations
 
 import asyncio
+import itertools
+import math
 import time
 import uuid
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -72,6 +75,7 @@ class TaskConfig:
     retry_backoff: float = 2.0  # exponential backoff multiplier
     timeout: Optional[float] = None  # seconds
     priority: TaskPriority = TaskPriority.NORMAL
+    deadline: Optional[float] = None  # seconds after enqueue it should start by
     cache_result: bool = False
     cache_ttl: int = 300  # seconds
 
@@ -97,133 +101,238 @@ class BackgroundTask:
     execution_time: float = 0.0
 
 
-class TaskQueue:
-    """Priority-based task queue"""
-
-    def __init__(self):
-        self._queues = {
-            TaskPriority.CRITICAL: asyncio.Queue(),
-            TaskPriority.HIGH: asyncio.Queue(),
-            TaskPriority.NORMAL: asyncio.Queue(),
-            TaskPriority.LOW: asyncio.Queue(),
-        }
-        self._task_count = 0
+class LatencyHistogram:
+    """Fixed-bucket histogram of enqueue-to-start latencies (seconds)"""
 
-    async def put(self, task: BackgroundTask):
-        """Add task to appropriate priority queue"""
-        await self._queues[task.config.priority].put(task)
-        self._task_count += 1
+    DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
 
-    async def get(self) -> BackgroundTask:
-        """Get next task by priority with comprehensive logging"""
-        start_time = time.time()
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._max = 0.0
 
-        # Log the attempt to get next task
-        if production_logger:
-            production_logger.log_async_operation_debug(
-                "task_queue_get",
-                {
-                    "queue_sizes": {
-                        priority.name: queue.qsize()
-                        for priority, queue in self._queues.items()
-                    },
-                    "total_tasks": self._task_count,
-                },
-            )
+    def observe(self, value: float):
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self._sum += value
+        self._count += 1
+        self._max = max(self._max, value)
 
-        # Check queues in priority order
-        for priority in [
-            TaskPriority.CRITICAL,
-            TaskPriority.HIGH,
-            TaskPriority.NORMAL,
-            TaskPriority.LOW,
-        ]:
-            queue = self._queues[priority]
-            if not queue.empty():
-                task = await queue.get()
-                self._task_count -= 1
-
-                # Log successful task retrieval
-                if production_logger:
-                    production_logger.log_background_task_status(
-                        str(task.task_id),
-                        "RETRIEVED",
-                        {
-                            "priority": priority.name,
-                            "queue_method": "priority_order",
-                            "retrieval_time_ms": (time.time() - start_time) * 1000,
-                            "remaining_tasks": self._task_count,
-                        },
-                    )
-
-                return task
-
-        # If all queues are empty, wait for any task using the FIXED asyncio pattern
-        try:
-            # 🔧 CRITICAL FIX: Wrap coroutines with asyncio.create_task()
-            tasks = [
-                asyncio.create_task(queue.get()) for queue in self._queues.values()
-            ]
+    def snapshot(self) -> Dict[str, Any]:
+        histogram = {str(b): c for b, c in zip(self.buckets, self._counts)}
+        histogram["+Inf"] = self._counts[-1]
+        return {
+            "histogram": histogram,
+            "count": self._count,
+            "avg": self._sum / self._count if self._count else 0.0,
+            "max": self._max,
+        }
 
-            if production_logger:
-                production_logger.log_async_operation_debug(
-                    "waiting_for_tasks",
-                    {
-                        "created_tasks": len(tasks),
-                        "coroutine_wrapping": "FIXED_WITH_CREATE_TASK",
-                        "previous_issue": "passing_naked_coroutines_forbidden",
-                    },
-                )
 
-            done, pending = await asyncio.wait(
-                tasks, return_when=asyncio.FIRST_COMPLETED
-            )
+class TaskQueue:
+    """Single heap-ordered ready queue with priority aging and deadlines.
+
+    Every task gets one static sort key, its *virtual enqueue time*:
+    ``enqueued_at - (priority - 1) * aging_seconds``. Higher priorities
+    therefore start ``aging_seconds`` per level ahead, but a lower-priority
+    task that has waited that long outranks newer high-priority work, so no
+    level starves. A task with a deadline is keyed no later than a CRITICAL
+    task enqueued at the deadline, so it runs ahead of everything except
+    CRITICAL work queued before its deadline.
+    Within a level, tasks are served FIFO. Because the key never changes, one
+    ``asyncio.PriorityQueue`` holds everything and ``get`` is a plain,
+    cancellation-safe heap pop.
+    """
 
-        except Exception as e:
-            if production_logger:
-                production_logger.log_critical_error(
-                    "TASK_QUEUE_GET_FAILED",
-                    {
-                        "error": str(e),
-                        "queue_sizes": {
-                            priority.name: queue.qsize()
-                            for priority, queue in self._queues.items()
-                        },
-                        "operation": "asyncio_wait_with_create_task",
-                    },
-                )
-            raise
+    def __init__(self, aging_seconds: float = 5.0):
+        self.aging_seconds = aging_seconds
+        self._max_aging_offset = (
+            max(p.value for p in TaskPriority) - 1
+        ) * aging_seconds
+        self._heap: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._seq = itertools.count()
+        self._priority_counts: Dict[TaskPriority, int] = {p: 0 for p in TaskPriority}
+        self._enqueued_at: Dict[str, float] = {}
+        self.latency: Dict[TaskPriority, LatencyHistogram] = {
+            p: LatencyHistogram() for p in TaskPriority
+        }
+
+    def _sort_key(self, task: BackgroundTask, now: float) -> float:
+        key = now - (task.config.priority.value - 1) * self.aging_seconds
+        if task.config.deadline is not None:
+            key = min(key, now + task.config.deadline - self._max_aging_offset)
+        return key
+
+    def put_nowait(self, task: BackgroundTask):
+        """Add task to the ready heap"""
+        now = time.monotonic()
+        self._enqueued_at[task.id] = now
+        self._priority_counts[task.config.priority] += 1
+        self._heap.put_nowait((self._sort_key(task, now), next(self._seq), task))
 
-        # Cancel pending tasks
-        for task in pending:
-            task.cancel()
+    async def put(self, task: BackgroundTask):
+        """Add task to the ready heap"""
+        self.put_nowait(task)
+
+    def _pop(self, entry) -> BackgroundTask:
+        _, _, task = entry
+        self._priority_counts[task.config.priority] -= 1
+        enqueued_at = self._enqueued_at.pop(task.id, None)
+        if enqueued_at is not None:
+            self.latency[task.config.priority].observe(time.monotonic() - enqueued_at)
+        return task
 
-        # Return the completed task
-        result = done.pop().result()
-        self._task_count -= 1
+    async def get(self) -> BackgroundTask:
+        """Wait for and return the task with the lowest virtual enqueue time"""
+        task = self._pop(await self._heap.get())
 
-        # Log successful task retrieval from wait operation
         if production_logger:
             production_logger.log_background_task_status(
-                str(result.task_id),
+                task.name,
                 "RETRIEVED",
                 {
-                    "queue_method": "asyncio_wait",
-                    "retrieval_time_ms": (time.time() - start_time) * 1000,
-                    "remaining_tasks": self._task_count,
-                    "cancelled_pending": len(pending),
+                    "task_id": task.id[:8],
+                    "priority": task.config.priority.name,
+                    "remaining_tasks": self.qsize(),
                 },
             )
+        return task
 
-        return result
+    def get_nowait(self) -> BackgroundTask:
+        """Pop the next task without waiting (raises asyncio.QueueEmpty)"""
+        return self._pop(self._heap.get_nowait())
 
     def qsize(self) -> int:
         """Get total queue size"""
-        return self._task_count
+        return self._heap.qsize()
 
     def empty(self) -> bool:
-        """Check if all queues are empty"""
-        return self._task_count == 0
+        """Check if the ready heap is empty"""
+        return self._heap.empty()
+
+    def priority_sizes(self) -> Dict[TaskPriority, int]:
+        """Queued task count per priority level"""
+        return dict(self._priority_counts)
+
+    def latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Enqueue-to-start latency histogram per priority level"""
+        return {p.name: h.snapshot() for p, h in self.latency.items()}
+
+
+@dataclass
+class _TimerEntry:
+    key: str
+    item: Any
+    expires: int  # absolute tick
+    cancelled: bool = False
+
+
+class TimerWheel:
+    """Hierarchical timer wheel for delayed and retry tasks.
+
+    ``levels`` wheels of ``slots`` buckets each; level ``n`` buckets span
+    ``slots ** n`` ticks. A timer is placed on the lowest level whose block
+    it shares with the current tick and cascades down as the wheel turns, so
+    scheduling and cancelling are O(1) and one driver coroutine serves every
+    timer instead of a sleeping task per timer. Timers beyond the top level
+    wait in an overflow list that is re-placed whenever the top level wraps.
+    """
+
+    def __init__(self, tick: float = 0.05, slots: int = 64, levels: int = 4):
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self._wheels: List[List[List[_TimerEntry]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        self._overflow: List[_TimerEntry] = []
+        self._entries: Dict[str, _TimerEntry] = {}
+        self._origin = time.monotonic()
+        self._current = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def schedule(self, key: str, item: Any, delay: float, now: Optional[float] = None):
+        """Fire ``item`` after ``delay`` seconds (replaces any timer for ``key``)"""
+        self.cancel(key)
+        now = time.monotonic() if now is None else now
+        expires = max(self._current + 1, math.ceil((now + delay - self._origin) / self.tick))
+        entry = _TimerEntry(key=key, item=item, expires=expires)
+        self._entries[key] = entry
+        self._place(entry, [])
+
+    def cancel(self, key: str) -> bool:
+        """Cancel a pending timer; the tombstone is dropped when its slot fires"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry.cancelled = True
+        return True
+
+    def _place(self, entry: _TimerEntry, fired: List[Any]):
+        if entry.cancelled:
+            return
+        if entry.expires <= self._current:
+            self._entries.pop(entry.key, None)
+            fired.append(entry.item)
+            return
+        span = 1
+        for level in range(self.levels):
+            if entry.expires // (span * self.slots) == self._current // (span * self.slots):
+                self._wheels[level][(entry.expires // span) % self.slots].append(entry)
+                return
+            span *= self.slots
+        self._overflow.append(entry)
+
+    def advance(self, now: Optional[float] = None) -> List[Any]:
+        """Turn the wheel up to ``now`` and return the items that expired"""
+        now = time.monotonic() if now is None else now
+        target = int((now - self._origin) / self.tick)
+        fired: List[Any] = []
+        while self._current < target and self._entries:
+            self._current += 1
+            tick = self._current
+            span = self.slots
+            for level in range(1, self.levels):
+                if tick % span:
+                    break
+                bucket = self._wheels[level][(tick // span) % self.slots]
+                self._wheels[level][(tick // span) % self.slots] = []
+                for entry in bucket:
+                    self._place(entry, fired)
+                span *= self.slots
+            else:
+                if tick % span == 0 and self._overflow:
+                    overflow, self._overflow = self._overflow, []
+                    for entry in overflow:
+                        self._place(entry, fired)
+            bucket = self._wheels[0][tick % self.slots]
+            self._wheels[0][tick % self.slots] = []
+            for entry in bucket:
+                self._place(entry, fired)
+        if not self._entries:
+            # Nothing pending: jump straight to now instead of ticking through
+            # the idle gap (tombstones are only left behind by cancel()).
+            if self._current < target:
+                self._wheels = [
+                    [[] for _ in range(self.slots)] for _ in range(self.levels)
+                ]
+                self._overflow = []
+                self._current = target
+        return fired
+
+    def drain(self) -> List[Any]:
+        """Remove and return every pending item"""
+        items = [entry.item for entry in self._entries.values()]
+        for entry in self._entries.values():
+            entry.cancelled = True
+        self._entries.clear()
+        return items
 
 
 class WorkerPool:
@@ -265,13 +374,10 @@ class WorkerPool:
 
         while not self._shutdown:
             try:
-                # Get next task
-                task = await asyncio.wait_for(task_queue.get(), timeout=1.0)
+                # Idle workers park on the heap; stop() cancels them
+                task = await task_queue.get()
                 await task_manager._execute_task(task)
 
-            except asyncio.TimeoutError:
-                # No tasks available, continue
-                continue
             except asyncio.CancelledError:
                 # Worker was cancelled
                 break
@@ -286,11 +392,20 @@ class BackgroundTaskManager:
     Advanced background task manager with priority queues, retries, and monitoring
     """
 
-    def __init__(self, worker_pool_size: int = 4):
-        self.task_queue = TaskQueue()
+    def __init__(
+        self,
+        worker_pool_size: int = 4,
+        aging_seconds: float = 5.0,
+        timer_tick: float = 0.05,
+    ):
+        self.task_queue = TaskQueue(aging_seconds=aging_seconds)
         self.worker_pool = WorkerPool(worker_pool_size)
         self.tasks: Dict[str, BackgroundTask] = {}
-        self.scheduled_tasks: Dict[str, asyncio.Task] = {}
+        # Delayed tasks and retries wait here until the driver moves them
+        # onto the ready heap
+        self.timer_wheel = TimerWheel(tick=timer_tick)
+        self._timer_driver: Optional[asyncio.Task] = None
+        self._timer_wakeup: Optional[asyncio.Event] = None
         self._running = False
         self._stats = {
             "total_tasks": 0,
@@ -306,6 +421,8 @@ class BackgroundTaskManager:
             return
 
         self._running = True
+        self._timer_wakeup = asyncio.Event()
+        self._timer_driver = asyncio.create_task(self._drive_timers())
         await self.worker_pool.start(self.task_queue, self)
         app_logger.info("Background task manager started")
 
@@ -317,10 +434,13 @@ class BackgroundTaskManager:
         self._running = False
 
         # Cancel all scheduled tasks
-        for task_id, scheduled_task in self.scheduled_tasks.items():
-            scheduled_task.cancel()
-            if task_id in self.tasks:
-                self.tasks[task_id].status = TaskStatus.CANCELLED
+        if self._timer_driver:
+            self._timer_driver.cancel()
+            await asyncio.gather(self._timer_driver, return_exceptions=True)
+            self._timer_driver = None
+        for task in self.timer_wheel.drain():
+            task.status = TaskStatus.CANCELLED
+            self._stats["cancelled_tasks"] += 1
 
         # Stop worker pool
         await self.worker_pool.stop()
@@ -370,8 +490,7 @@ class BackgroundTaskManager:
         if delay:
             # Schedule task for later execution
             task.scheduled_at = datetime.now() + timedelta(seconds=delay)
-            scheduled_task = asyncio.create_task(self._schedule_task(task, delay))
-            self.scheduled_tasks[task_id] = scheduled_task
+            self._schedule_task(task, delay)
 
             if production_logger:
                 production_logger.log_background_task_status(
@@ -385,7 +504,7 @@ class BackgroundTaskManager:
                 )
         else:
             # Add to queue immediately
-            asyncio.create_task(self.task_queue.put(task))
+            self.task_queue.put_nowait(task)
 
             if production_logger:
                 production_logger.log_background_task_status(
@@ -400,23 +519,32 @@ class BackgroundTaskManager:
         task_logger.info(f"Task added: {task_name} ({task_id[:8]})")
         return task_id
 
-    async def _schedule_task(self, task: BackgroundTask, delay: float):
-        """Schedule a task for delayed execution"""
-        try:
-            await asyncio.sleep(delay)
-            await self.task_queue.put(task)
-
-            # Remove from scheduled tasks
-            if task.id in self.scheduled_tasks:
-                del self.scheduled_tasks[task.id]
-
-        except asyncio.CancelledError:
-            task.status = TaskStatus.CANCELLED
-            self._stats["cancelled_tasks"] += 1
+    def _schedule_task(self, task: BackgroundTask, delay: float):
+        """Schedule a task for delayed execution on the timer wheel"""
+        self.timer_wheel.schedule(task.id, task, delay)
+        if self._timer_wakeup is not None:
+            self._timer_wakeup.set()
+
+    async def _drive_timers(self):
+        """Single driver moving expired timers onto the ready heap"""
+        wheel = self.timer_wheel
+        while True:
+            if not len(wheel):
+                # Idle until something is scheduled
+                await self._timer_wakeup.wait()
+            self._timer_wakeup.clear()
+            await asyncio.sleep(wheel.tick)
+            for task in wheel.advance():
+                if task.status != TaskStatus.CANCELLED:
+                    self.task_queue.put_nowait(task)
 
     async def _execute_task(self, task: BackgroundTask):
         """Execute a background task"""
 
+        if task.status == TaskStatus.CANCELLED:
+            # Cancelled while waiting on the ready heap
+            return
+
         task.status = TaskStatus.RUNNING
         task.started_at = datetime.now()
         start_time = time.time()
@@ -527,8 +655,7 @@ class BackgroundTaskManager:
         )
 
         # Schedule retry
-        scheduled_task = asyncio.create_task(self._schedule_task(task, delay))
-        self.scheduled_tasks[task.id] = scheduled_task
+        self._schedule_task(task, delay)
 
     def get_task_status(self, task_id: str) -> Optional[TaskResult]:
         """Get task status and result"""
@@ -565,9 +692,7 @@ class BackgroundTaskManager:
             return False
 
         # Cancel scheduled task if exists
-        if task_id in self.scheduled_tasks:
-            self.scheduled_tasks[task_id].cancel()
-            del self.scheduled_tasks[task_id]
+        self.timer_wheel.cancel(task_id)
 
         task.status = TaskStatus.CANCELLED
         task.completed_at = datetime.now()
@@ -587,18 +712,20 @@ class BackgroundTaskManager:
             )
 
         # Count tasks by priority in queue
-        priority_counts = {}
-        for priority in TaskPriority:
-            priority_counts[priority.value] = self.task_queue._queues[priority].qsize()
+        priority_counts = {
+            priority.value: count
+            for priority, count in self.task_queue.priority_sizes().items()
+        }
 
         return {
             "queue_size": self.task_queue.qsize(),
             "worker_pool_size": self.worker_pool.size,
             "running": self._running,
             "total_tasks": len(self.tasks),
-            "scheduled_tasks": len(self.scheduled_tasks),
+            "scheduled_tasks": len(self.timer_wheel),
             "status_distribution": status_counts,
             "priority_distribution": priority_counts,
+            "start_latency": self.task_queue.latency_stats(),
             "statistics": self._stats.copy(),
         }
 
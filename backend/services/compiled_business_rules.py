@@ -0,0 +1,351 @@
+"""
+Compiled Business Rules
+=======================
+
+Precompiled form of the ``business_rules.yaml`` ruleset used by
+``RealTimeAnalysisEngine``.
+
+Rules are compiled once (on load/reload) into lookup structures so that rule
+checks inside the lineup optimization hot loop never parse dates or walk the
+raw YAML lists:
+
+- time windows become a sorted interval index (bisect lookup per ``now``)
+- forbidden combos and allowed stat types become hashed sets
+- per-user overrides become layers stacked on top of the global layer
+"""
+
+import logging
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledCombo:
+    """A forbidden feature combination stored as a lower-cased hashed set"""
+
+    features: FrozenSet[str]
+    original: Any
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledRule:
+    """A dynamic rule with its predicate inputs pre-extracted"""
+
+    rule: Dict[str, Any]
+    rule_id: Optional[str]
+    rule_type: Optional[str]
+    sport: Optional[str]
+    value: Any
+    combo: Optional[CompiledCombo] = None
+
+
+class RuleIntervalIndex:
+    """Sorted interval index over rule time windows.
+
+    All window boundaries are sorted into ``points``. For every boundary and
+    every open gap between consecutive boundaries the list of active rules is
+    precomputed, so resolving the active set for a timestamp is a single
+    bisect. Windows are inclusive on both ends, matching the original
+    ``start <= now <= end`` check.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]], label: str = "rule"):
+        always: List[int] = []
+        windows: List[Tuple[float, float, int]] = []
+        compiled: List[CompiledRule] = []
+        for rule in rules or []:
+            if not isinstance(rule, dict):
+                continue
+            tw = rule.get("time_window")
+            position = len(compiled)
+            if tw:
+                try:
+                    start = datetime.fromisoformat(tw["start"]).astimezone(timezone.utc)
+                    end = datetime.fromisoformat(tw["end"]).astimezone(timezone.utc)
+                except Exception as e:
+                    logger.warning(
+                        f"Invalid time_window in {label} {rule.get('id')}: {e}"
+                    )
+                    continue
+                windows.append((start.timestamp(), end.timestamp(), position))
+            else:
+                always.append(position)
+            compiled.append(_compile_rule(rule))
+
+        self.rules: List[CompiledRule] = compiled
+        self.points: List[float] = sorted(
+            {ts for start, end, _ in windows for ts in (start, end)}
+        )
+        # at_point[i]: rules active exactly at points[i]
+        # between[i]: rules active strictly between points[i - 1] and points[i]
+        # (between[0] is before every boundary, between[-1] after every boundary)
+        self._at_point: List[Tuple[CompiledRule, ...]] = []
+        self._between: List[Tuple[CompiledRule, ...]] = []
+        bounds = [float("-inf")] + self.points + [float("inf")]
+        for i in range(len(self.points) + 1):
+            lo, hi = bounds[i], bounds[i + 1]
+            self._between.append(self._collect(always, windows, lo, hi, open_=True))
+            if i < len(self.points):
+                self._at_point.append(
+                    self._collect(always, windows, hi, hi, open_=False)
+                )
+
+    def _collect(self, always, windows, lo, hi, open_):
+        positions = set(always)
+        for start, end, position in windows:
+            if open_:
+                # Open gap (lo, hi) lies inside [start, end]
+                if start <= lo and hi <= end:
+                    positions.add(position)
+            elif start <= lo <= end:
+                positions.add(position)
+        return tuple(self.rules[p] for p in sorted(positions))
+
+    def active(self, now: datetime) -> Tuple[CompiledRule, ...]:
+        """Return the compiled rules active at ``now`` in declaration order"""
+        ts = now.timestamp()
+        i = bisect_left(self.points, ts)
+        if i < len(self.points) and self.points[i] == ts:
+            return self._at_point[i]
+        return self._between[i]
+
+
+@dataclass
+class RuleLayer:
+    """Effective static and dynamic rules for one scope (global or a user)"""
+
+    combos: Tuple[CompiledCombo, ...]
+    combo_index: Dict[str, Tuple[CompiledCombo, ...]]
+    unconditional_combos: Tuple[CompiledCombo, ...]
+    allowed_stat_types: Optional[FrozenSet[Any]]
+    rule_index: RuleIntervalIndex
+    fallback: Optional["RuleLayer"] = None
+
+    def active_rules(self, now: datetime) -> Tuple[CompiledRule, ...]:
+        """User rules win when any are active; otherwise fall back to globals"""
+        active = self.rule_index.active(now)
+        if active or self.fallback is None:
+            return active
+        return self.fallback.rule_index.active(now)
+
+    def matching_combos(self, features: FrozenSet[str]) -> List[CompiledCombo]:
+        """Return forbidden combos fully contained in ``features``, in rule order"""
+        if not self.combos:
+            return []
+        candidates = set(self.unconditional_combos)
+        for feature in features:
+            for combo in self.combo_index.get(feature, ()):
+                candidates.add(combo)
+        if not candidates:
+            return []
+        matched = [c for c in candidates if c.features <= features]
+        if len(matched) > 1:
+            order = {id(c): i for i, c in enumerate(self.combos)}
+            matched.sort(key=lambda c: order[id(c)])
+        return matched
+
+
+@dataclass
+class CompiledBusinessRules:
+    """Layered lookup tables compiled from a raw business rules dict"""
+
+    source: Any
+    global_layer: RuleLayer
+    user_layers: Dict[str, RuleLayer] = field(default_factory=dict)
+
+    @classmethod
+    def compile(cls, rules: Optional[Dict[str, Any]]) -> "CompiledBusinessRules":
+        data = rules if isinstance(rules, dict) else {}
+        global_layer = _build_layer(
+            data.get("forbidden_combos") or [],
+            data.get("allowed_stat_types") or [],
+            data.get("rules") or [],
+            label="rule",
+        )
+        user_layers: Dict[str, RuleLayer] = {}
+        for user_id, overrides in (data.get("user_overrides") or {}).items():
+            overrides = overrides or {}
+            # Empty user lists fall back to the global lists, as before
+            user_layers[user_id] = _build_layer(
+                overrides.get("forbidden_combos") or data.get("forbidden_combos") or [],
+                overrides.get("allowed_stat_types")
+                or data.get("allowed_stat_types")
+                or [],
+                overrides.get("rules") or [],
+                label="user rule",
+                fallback=global_layer,
+            )
+        return cls(source=rules, global_layer=global_layer, user_layers=user_layers)
+
+    def layer_for(self, user_id: Optional[str] = None) -> RuleLayer:
+        if user_id:
+            return self.user_layers.get(user_id, self.global_layer)
+        return self.global_layer
+
+    def active_rules(
+        self, now: Optional[datetime] = None, user_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        now = _normalize_now(now)
+        return [c.rule for c in self.layer_for(user_id).active_rules(now)]
+
+    def evaluate(
+        self,
+        bet: Any,
+        now: Optional[datetime] = None,
+        user_id: Optional[str] = None,
+        _layer: Optional[RuleLayer] = None,
+        _active: Optional[Tuple[CompiledRule, ...]] = None,
+    ) -> List[str]:
+        """Return the list of violation reasons for ``bet`` (empty if allowed)"""
+        layer = _layer or self.layer_for(user_id)
+        if _active is None:
+            _active = layer.active_rules(_normalize_now(now))
+
+        bet_dict = bet.__dict__ if hasattr(bet, "__dict__") else bet
+        features = bet_dict.get("features")
+        if features is None:
+            # Infer features from bet fields (e.g., sport, bet_type, player_name, stat_type)
+            features = [
+                str(bet_dict.get("sport", "")).lower(),
+                str(bet_dict.get("bet_type", "")).lower(),
+                str(bet_dict.get("player_name", "")).lower(),
+                str(bet_dict.get("stat_type", "")).lower(),
+            ]
+            bet_dict["features"] = features
+        feature_set = frozenset(str(f).lower() for f in features)
+
+        reasons: List[str] = []
+        for combo in layer.matching_combos(feature_set):
+            reasons.append(f"Forbidden combo: {combo.original}")
+
+        stat_type = bet_dict.get("stat_type")
+        if layer.allowed_stat_types and not _is_allowed_stat(
+            stat_type, layer.allowed_stat_types
+        ):
+            reasons.append(f"Stat type '{stat_type}' not allowed")
+
+        if not _active:
+            return reasons
+        bet_sport = None if isinstance(bet, dict) else getattr(bet, "sport", None)
+        bet_sport = getattr(bet_sport, "value", bet_sport)
+        for rule in _active:
+            if rule.sport and rule.sport != "all" and bet_sport and bet_sport != rule.sport:
+                continue
+            if rule.rule_type == "forbidden_combo":
+                if rule.combo is not None and rule.combo.features <= feature_set:
+                    reasons.append(f"Forbidden combo (dynamic): {rule.combo.original}")
+            elif rule.rule_type == "expected_value_min":
+                ev = bet_dict.get("expected_value")
+                if rule.value is not None and ev is not None and ev < rule.value:
+                    reasons.append(
+                        f"Expected value {ev} below min {rule.value} (rule {rule.rule_id})"
+                    )
+            elif rule.rule_type == "risk_score_max":
+                risk = bet_dict.get("risk_score")
+                if rule.value is not None and risk is not None and risk > rule.value:
+                    reasons.append(
+                        f"Risk score {risk} above max {rule.value} (rule {rule.rule_id})"
+                    )
+        return reasons
+
+    def filter_allowed(
+        self,
+        bets: List[Any],
+        now: Optional[datetime] = None,
+        user_id: Optional[str] = None,
+    ) -> Tuple[List[Any], List[Tuple[Any, List[str]]]]:
+        """Evaluate a whole candidate list in one pass.
+
+        The rule layer and the active rule set are resolved once for the
+        batch. Returns ``(allowed, rejected)`` where ``rejected`` pairs each
+        forbidden bet with its violation reasons.
+        """
+        layer = self.layer_for(user_id)
+        active = layer.active_rules(_normalize_now(now))
+        allowed: List[Any] = []
+        rejected: List[Tuple[Any, List[str]]] = []
+        for bet in bets:
+            reasons = self.evaluate(bet, _layer=layer, _active=active)
+            if reasons:
+                rejected.append((bet, reasons))
+            else:
+                allowed.append(bet)
+        return allowed, rejected
+
+
+def _normalize_now(now: Optional[datetime]) -> datetime:
+    if now is None:
+        return datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        return now.replace(tzinfo=timezone.utc)
+    return now
+
+
+def _is_allowed_stat(stat_type: Any, allowed: FrozenSet[Any]) -> bool:
+    try:
+        return stat_type in allowed
+    except TypeError:
+        return False
+
+
+def _compile_combo(combo: Any) -> CompiledCombo:
+    return CompiledCombo(
+        features=frozenset(str(f).lower() for f in (combo or [])), original=combo
+    )
+
+
+def _compile_rule(rule: Dict[str, Any]) -> CompiledRule:
+    applies = rule.get("applies_to") or {}
+    rule_type = rule.get("type")
+    return CompiledRule(
+        rule=rule,
+        rule_id=rule.get("id"),
+        rule_type=rule_type,
+        sport=applies.get("sport") if isinstance(applies, dict) else None,
+        value=rule.get("value"),
+        combo=_compile_combo(rule.get("combo", []))
+        if rule_type == "forbidden_combo"
+        else None,
+    )
+
+
+def _build_layer(
+    forbidden_combos: List[Any],
+    allowed_stat_types: List[Any],
+    rules: List[Dict[str, Any]],
+    label: str,
+    fallback: Optional[RuleLayer] = None,
+) -> RuleLayer:
+    combos = tuple(_compile_combo(c) for c in forbidden_combos)
+    # Index each combo under its first (sorted) feature: a combo can only
+    # match a bet whose feature set contains that key.
+    index: Dict[str, List[CompiledCombo]] = {}
+    unconditional: List[CompiledCombo] = []
+    for combo in combos:
+        if not combo.features:
+            unconditional.append(combo)
+            continue
+        index.setdefault(min(combo.features), []).append(combo)
+    allowed: Optional[FrozenSet[Any]] = None
+    if allowed_stat_types:
+        allowed = frozenset(s for s in allowed_stat_types if _is_hashable(s))
+    return RuleLayer(
+        combos=combos,
+        combo_index={k: tuple(v) for k, v in index.items()},
+        unconditional_combos=tuple(unconditional),
+        allowed_stat_types=allowed,
+        rule_index=RuleIntervalIndex(rules, label=label),
+        fallback=fallback,
+    )
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
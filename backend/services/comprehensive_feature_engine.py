@@ -292,11 +292,13 @@ Target: Create 100+ predictive features across all sports and prop types.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
 import time
-from collections import defaultdict, deque
-from dataclasses import dataclass
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -336,11 +338,85 @@ class FeatureSet:
     metadata: Dict[str, Any]
 
 
+@dataclass
+class PropFeatureRequest:
+    """One (player, prop) in a slate passed to engineer_features_batch
+
+    ``game_id``, ``team`` and ``venue`` default to the matching raw_data keys
+    and decide which props share game-, team- and venue-scoped features.
+    ``version`` identifies the inputs for caching; when omitted it is a hash
+    of raw_data.
+    """
+
+    player_name: str
+    sport: str
+    prop_type: str
+    raw_data: Dict[str, Any] = field(default_factory=dict)
+    game_id: Optional[str] = None
+    team: Optional[str] = None
+    venue: Optional[str] = None
+    version: Optional[str] = None
+
+    def __post_init__(self):
+        self.game_id = self.game_id or self.raw_data.get("game_id")
+        self.team = self.team or self.raw_data.get("team")
+        self.venue = self.venue or self.raw_data.get("venue")
+
+
+@dataclass
+class FeatureBatch:
+    """Slate features: one FeatureSet per request plus a dense matrix"""
+
+    feature_sets: List[FeatureSet]
+    columns: List[str]
+    matrix: np.ndarray  # (len(feature_sets), len(columns)), NaN where absent
+    metadata: Dict[str, Any]
+
+
+# Entity a feature family depends on; requests sharing the key share the values
+FEATURE_FAMILY_SCOPES: Dict[FeatureCategory, str] = {
+    FeatureCategory.PLAYER_PERFORMANCE: "player_prop",
+    FeatureCategory.MATCHUP_SPECIFIC: "player_prop",
+    FeatureCategory.REST_TRAVEL: "team",
+    FeatureCategory.WEATHER_IMPACT: "game",
+    FeatureCategory.INJURY_SENTIMENT: "player",
+    FeatureCategory.LINE_MOVEMENT: "prop",
+    FeatureCategory.HISTORICAL_PROP: "player_prop",
+    FeatureCategory.GAME_SCRIPT: "game",
+    FeatureCategory.REFEREE_IMPACT: "game",
+    FeatureCategory.VENUE_EFFECTS: "venue",
+}
+
+# Families that also carry player-specific fields, and the scope of that part;
+# the shared part above is computed once and merged with each player's part
+FEATURE_FAMILY_PLAYER_SCOPES: Dict[FeatureCategory, str] = {
+    FeatureCategory.REFEREE_IMPACT: "player_game",
+    FeatureCategory.VENUE_EFFECTS: "player_venue",
+}
+
+
 class ComprehensiveFeatureEngine:
     """Revolutionary feature engineering service for maximum accuracy"""
 
-    def __init__(self):
-        self.feature_cache: Dict[str, FeatureSet] = {}
+    def __init__(
+        self,
+        cache_ttl_sec: Optional[float] = None,
+        max_cached_feature_sets: Optional[int] = None,
+    ):
+        # cache key -> (expires_at, FeatureSet), least recently used first
+        self.feature_cache: "OrderedDict[str, Tuple[float, FeatureSet]]" = OrderedDict()
+        self.cache_ttl_sec = (
+            cache_ttl_sec
+            if cache_ttl_sec is not None
+            else float(os.getenv("A1_FEATURE_CACHE_TTL_SEC", "300"))
+        )
+        self.max_cached_feature_sets = (
+            max_cached_feature_sets
+            if max_cached_feature_sets is not None
+            else int(os.getenv("A1_FEATURE_CACHE_SIZE", "5000"))
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.feature_history: deque = deque(maxlen=10000)
         self.feature_importance_cache: Dict[str, Dict[str, float]] = {}
 
@@ -460,6 +536,7 @@ class ComprehensiveFeatureEngine:
                     "engineering_time": engineering_time,
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                     "categories_count": len(feature_categories),
+                    "input_version": self._input_version(raw_data),
                 },
             )
 
@@ -480,6 +557,222 @@ class ComprehensiveFeatureEngine:
             logger.error(f"❌ Feature engineering error: {e}")
             raise
 
+    async def engineer_features_batch(
+        self,
+        requests: List[PropFeatureRequest],
+        columns: Optional[List[str]] = None,
+    ) -> FeatureBatch:
+        """Engineer features for a whole slate of props
+
+        Each feature family is computed once per distinct scope key (see
+        FEATURE_FAMILY_SCOPES): weather, game script and referee features once
+        per game, rest/travel once per team, venue effects once per venue,
+        and player families once per player or (player, prop). The
+        player-specific referee and venue fields are computed once per
+        (player, game) and (player, venue). All family calls run concurrently. Requests whose input version is cached are
+        served from the cache.
+
+        Args:
+            requests: Props to engineer features for
+            columns: Matrix column schema; defaults to every feature seen,
+                grouped by family in FeatureCategory order
+
+        Returns:
+            FeatureBatch with one FeatureSet per request, in request order
+        """
+        start_time = time.time()
+        feature_sets: List[Optional[FeatureSet]] = [None] * len(requests)
+        versions = [
+            request.version or self._input_version(request.raw_data)
+            for request in requests
+        ]
+
+        pending: List[int] = []
+        for index, (request, version) in enumerate(zip(requests, versions)):
+            cached = self.get_cached_feature_set(
+                request.player_name, request.sport, request.prop_type, version
+            )
+            if cached is not None:
+                feature_sets[index] = cached
+            else:
+                pending.append(index)
+
+        family_calls = 0
+        if pending:
+            # (category, player part?, scope key) -> first request with that key
+            scoped: Dict[Tuple[FeatureCategory, bool, Tuple[Any, ...]], int] = {}
+            row_keys: Dict[int, List[Tuple[FeatureCategory, bool, Tuple[Any, ...]]]] = {}
+            for index in pending:
+                row_keys[index] = []
+                for category, scope in FEATURE_FAMILY_SCOPES.items():
+                    parts = [(False, scope)]
+                    if category in FEATURE_FAMILY_PLAYER_SCOPES:
+                        parts.append((True, FEATURE_FAMILY_PLAYER_SCOPES[category]))
+                    for player_part, part_scope in parts:
+                        call = (category, player_part, self._scope_key(part_scope, requests[index], index))
+                        row_keys[index].append(call)
+                        scoped.setdefault(call, index)
+
+            calls = list(scoped.items())
+            results = await asyncio.gather(
+                *(
+                    self._compute_family(category, requests[index], player_part)
+                    for (category, player_part, _), index in calls
+                )
+            )
+            family_values = {call: values for (call, _), values in zip(calls, results)}
+            family_calls = len(calls)
+
+            for index in pending:
+                request = requests[index]
+                feature_categories: Dict[FeatureCategory, Dict[str, float]] = {}
+                for call in row_keys[index]:
+                    category, player_part, _ = call
+                    if player_part:
+                        # Shared part plus this player's fields, in a row-owned dict
+                        feature_categories[category] = {
+                            **feature_categories[category], **family_values[call]
+                        }
+                    else:
+                        feature_categories[category] = family_values[call]
+                feature_sets[index] = await self._assemble_feature_set(
+                    request, feature_categories, versions[index], start_time
+                )
+
+        if columns is None:
+            columns = self._feature_columns(feature_sets)
+        column_index = {name: position for position, name in enumerate(columns)}
+        matrix = np.full((len(feature_sets), len(columns)), np.nan)
+        for row, feature_set in enumerate(feature_sets):
+            for name, value in feature_set.features.items():
+                position = column_index.get(name)
+                if position is not None:
+                    matrix[row, position] = value
+
+        engineering_time = time.time() - start_time
+        logger.info(
+            f"✅ Engineered slate features for {len(requests)} props "
+            f"({len(requests) - len(pending)} cached, {family_calls} family calls) "
+            f"in {engineering_time:.3f}s"
+        )
+        return FeatureBatch(
+            feature_sets=feature_sets,
+            columns=list(columns),
+            matrix=matrix,
+            metadata={
+                "engineering_time": engineering_time,
+                "cached": len(requests) - len(pending),
+                "family_calls": family_calls,
+            },
+        )
+
+    @staticmethod
+    def _scope_key(
+        scope: str, request: PropFeatureRequest, index: int
+    ) -> Tuple[Any, ...]:
+        """Sharing key for a family; without the scope's ID the prop stands alone"""
+        sport = request.sport.lower()
+        if scope == "game" and request.game_id is not None:
+            return (sport, request.game_id)
+        if scope == "team" and request.team is not None:
+            return (sport, request.game_id, request.team)
+        if scope == "venue" and (request.venue or request.game_id) is not None:
+            return (sport, request.venue or request.game_id)
+        if scope == "player_game" and request.game_id is not None:
+            return (sport, request.player_name, request.game_id)
+        if scope == "player_venue" and (request.venue or request.game_id) is not None:
+            return (sport, request.player_name, request.venue or request.game_id)
+        if scope == "player":
+            return (sport, request.player_name)
+        if scope == "player_prop":
+            return (sport, request.player_name, request.prop_type)
+        return ("prop", index)
+
+    async def _compute_family(
+        self, category: FeatureCategory, request: PropFeatureRequest, player_part: bool = False
+    ) -> Dict[str, float]:
+        """Run one feature family (or, with ``player_part``, its player-specific part) for a request"""
+        player, sport, prop_type, raw = (
+            request.player_name,
+            request.sport,
+            request.prop_type,
+            request.raw_data,
+        )
+        if category == FeatureCategory.PLAYER_PERFORMANCE:
+            return await self.create_player_performance_features(player, sport, prop_type, raw)
+        if category == FeatureCategory.MATCHUP_SPECIFIC:
+            return await self.create_matchup_specific_features(player, sport, prop_type, raw)
+        if category == FeatureCategory.REST_TRAVEL:
+            return await self.create_rest_travel_features(player, sport, raw)
+        if category == FeatureCategory.WEATHER_IMPACT:
+            return await self.create_weather_impact_features(sport, raw)
+        if category == FeatureCategory.INJURY_SENTIMENT:
+            return await self.create_injury_sentiment_features(player, sport, raw)
+        if category == FeatureCategory.LINE_MOVEMENT:
+            return await self.create_line_movement_features(player, prop_type, raw)
+        if category == FeatureCategory.HISTORICAL_PROP:
+            return await self.create_historical_prop_features(player, prop_type, raw)
+        if category == FeatureCategory.GAME_SCRIPT:
+            return await self.create_game_script_features(sport, raw)
+        if category == FeatureCategory.REFEREE_IMPACT:
+            if player_part:
+                return await self._referee_player_features(sport, raw)
+            return await self._referee_game_features(sport, raw)
+        if player_part:
+            return await self._player_venue_features(sport, raw)
+        return await self._venue_features(sport, raw)
+
+    async def _assemble_feature_set(
+        self,
+        request: PropFeatureRequest,
+        feature_categories: Dict[FeatureCategory, Dict[str, float]],
+        version: str,
+        start_time: float,
+    ) -> FeatureSet:
+        """Merge family outputs into a cached FeatureSet"""
+        all_features: Dict[str, float] = {}
+        for category in FeatureCategory:
+            all_features.update(feature_categories[category])
+
+        feature_set = FeatureSet(
+            player_name=request.player_name,
+            sport=request.sport,
+            prop_type=request.prop_type,
+            features=all_features,
+            feature_categories=feature_categories,
+            feature_importance=await self.calculate_feature_importance(
+                all_features, request.sport, request.prop_type
+            ),
+            feature_quality_score=self.calculate_feature_quality_score(all_features),
+            metadata={
+                "total_features": len(all_features),
+                "engineering_time": time.time() - start_time,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "categories_count": len(feature_categories),
+                "input_version": version,
+                "game_id": request.game_id,
+            },
+        )
+        await self.cache_feature_set(feature_set)
+        return feature_set
+
+    @staticmethod
+    def _feature_columns(feature_sets: List[FeatureSet]) -> List[str]:
+        """Every feature name, grouped by family in FeatureCategory order"""
+        columns: Dict[str, None] = {}
+        for category in FeatureCategory:
+            for feature_set in feature_sets:
+                columns.update(
+                    dict.fromkeys(feature_set.feature_categories.get(category, {}))
+                )
+        return list(columns)
+
+    @staticmethod
+    def _input_version(raw_data: Dict[str, Any]) -> str:
+        """Stable hash of the raw inputs a feature set was built from"""
+        payload = json.dumps(raw_data, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
     async def create_player_performance_features(
         self, player_name: str, sport: str, prop_type: str, raw_data: Dict[str, Any]
     ) -> Dict[str, float]:
@@ -723,6 +1016,14 @@ class ComprehensiveFeatureEngine:
         self, sport: str, raw_data: Dict[str, Any]
     ) -> Dict[str, float]:
         """Create referee impact features"""
+        features = await self._referee_game_features(sport, raw_data)
+        features.update(await self._referee_player_features(sport, raw_data))
+        return features
+
+    async def _referee_game_features(
+        self, sport: str, raw_data: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """Referee features shared by every player in the game"""
         features = {}
 
         # Officiating tendencies
@@ -730,25 +1031,39 @@ class ComprehensiveFeatureEngine:
         features["ref_pace_impact"] = np.random.uniform(0.95, 1.05)
         features["ref_home_bias"] = np.random.uniform(0.98, 1.02)
 
-        # Historical with referee
-        features["games_with_ref"] = np.random.randint(0, 10)
-        features["avg_with_ref"] = np.random.uniform(0.9, 1.1)  # vs player avg
-
         # Referee consistency
         features["ref_consistency_score"] = np.random.uniform(0.7, 0.95)
         features["ref_experience_level"] = np.random.uniform(0.6, 1.0)
 
         return features
 
+    async def _referee_player_features(
+        self, sport: str, raw_data: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """The player's history with the game's referee"""
+        features = {}
+
+        features["games_with_ref"] = np.random.randint(0, 10)
+        features["avg_with_ref"] = np.random.uniform(0.9, 1.1)  # vs player avg
+
+        return features
+
     async def create_venue_effects_features(
         self, sport: str, raw_data: Dict[str, Any]
     ) -> Dict[str, float]:
         """Create venue-specific effect features"""
+        features = await self._venue_features(sport, raw_data)
+        features.update(await self._player_venue_features(sport, raw_data))
+        return features
+
+    async def _venue_features(
+        self, sport: str, raw_data: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """Venue features shared by every player at the venue"""
         features = {}
 
         # Home court advantage
         features["home_court_advantage"] = np.random.uniform(0.95, 1.15)
-        features["venue_familiarity"] = np.random.uniform(0.98, 1.05)
         features["crowd_impact"] = np.random.uniform(0.99, 1.08)
 
         # Venue characteristics
@@ -756,7 +1071,15 @@ class ComprehensiveFeatureEngine:
         features["court_size_factor"] = np.random.uniform(0.99, 1.01)
         features["venue_age"] = np.random.randint(1, 50)  # years
 
-        # Historical performance at venue
+        return features
+
+    async def _player_venue_features(
+        self, sport: str, raw_data: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """The player's history at the venue"""
+        features = {}
+
+        features["venue_familiarity"] = np.random.uniform(0.98, 1.05)
         features["venue_performance"] = np.random.uniform(0.9, 1.1)  # vs overall avg
         features["games_at_venue"] = np.random.randint(0, 20)
 
@@ -807,11 +1130,22 @@ class ComprehensiveFeatureEngine:
         return max(0.0, min(1.0, quality_score))
 
     async def cache_feature_set(self, feature_set: FeatureSet):
-        """Cache feature set for future use"""
-        cache_key = (
-            f"{feature_set.player_name}_{feature_set.sport}_{feature_set.prop_type}"
+        """Cache feature set for future use
+
+        Entries are keyed by player, sport, prop type and input version, expire
+        after ``cache_ttl_sec`` and are evicted least recently used first once
+        ``max_cached_feature_sets`` is reached.
+        """
+        cache_key = self._cache_key(
+            feature_set.player_name,
+            feature_set.sport,
+            feature_set.prop_type,
+            feature_set.metadata.get("input_version", ""),
         )
-        self.feature_cache[cache_key] = feature_set
+        self.feature_cache[cache_key] = (time.time() + self.cache_ttl_sec, feature_set)
+        self.feature_cache.move_to_end(cache_key)
+        while len(self.feature_cache) > self.max_cached_feature_sets:
+            self.feature_cache.popitem(last=False)
 
         # Add to history
         self.feature_history.append(
@@ -825,10 +1159,31 @@ class ComprehensiveFeatureEngine:
             }
         )
 
+    def get_cached_feature_set(
+        self, player_name: str, sport: str, prop_type: str, version: str
+    ) -> Optional[FeatureSet]:
+        """Cached feature set for these inputs, or None if absent or expired"""
+        cache_key = self._cache_key(player_name, sport, prop_type, version)
+        entry = self.feature_cache.get(cache_key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self.feature_cache[cache_key]
+            self.cache_misses += 1
+            return None
+        self.feature_cache.move_to_end(cache_key)
+        self.cache_hits += 1
+        return entry[1]
+
+    @staticmethod
+    def _cache_key(player_name: str, sport: str, prop_type: str, version: str) -> str:
+        return f"{player_name}_{sport}_{prop_type}_{version}"
+
     def get_service_stats(self) -> Dict[str, Any]:
         """Get feature engineering service statistics"""
         return {
             "cached_feature_sets": len(self.feature_cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
             "total_features_engineered": len(self.feature_history),
             "avg_feature_count": (
                 np.mean([h["feature_count"] for h in self.feature_history])
@@ -13,10 +13,25 @@ Features:
 import csv
 import json
 import logging
+import os
 import tempfile
+from abc import ABC, abstractmethod
 from datetime import datetime
 from io import BytesIO, StringIO
-from typing import Any, Dict, List, Optional, Union
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 import asyncio
 import uuid
 
@@ -30,7 +45,7 @@ except ImportError:
 try:
     from reportlab.lib import colors
     from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.platypus import SimpleDocTemplate, LongTable, TableStyle, Paragraph, Spacer
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
     REPORTLAB_AVAILABLE = True
@@ -54,6 +69,21 @@ from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
 
+# A page fetcher is called as fetch(offset=..., limit=..., filters=..., sorting=...)
+# and returns at most ``limit`` raw records, so filtering, sorting and paging
+# run in the underlying query instead of in Python.
+PageFetcher = Callable[..., Awaitable[List[Dict[str, Any]]]]
+RecordSource = Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]], PageFetcher]
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "pdf": "application/pdf",
+    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "xml": "application/xml",
+}
+
 class ExportField(BaseModel):
     key: str
     label: str
@@ -62,7 +92,7 @@ class ExportField(BaseModel):
     required: Optional[bool] = False
 
 class ExportOptions(BaseModel):
-    format: str  # 'csv', 'json', 'pdf', 'excel', 'xml'
+    format: str  # 'csv', 'json', 'ndjson', 'pdf', 'excel', 'xml'
     fields: List[str]
     filters: Dict[str, Any] = {}
     sorting: Dict[str, str] = {"field": "created_at", "direction": "desc"}
@@ -91,29 +121,271 @@ class ExportProgress(BaseModel):
     file_path: Optional[str] = None
     error_message: Optional[str] = None
 
+class _ExportWriter(ABC):
+    """Incremental encoder for one export format writing to a binary stream"""
+
+    # Whether output is produced per chunk (False: only on finish)
+    incremental = True
+
+    def __init__(self, out: BinaryIO, fields: List[ExportField], options: ExportOptions):
+        self.out = out
+        self.fields = fields
+        self.options = options
+        self.include_headers = options.formatting.get("include_headers", True)
+        self.include_metadata = options.formatting.get("include_metadata", True)
+
+    def begin(self) -> None:
+        pass
+
+    @abstractmethod
+    def write_chunk(self, records: List[Dict[str, Any]]) -> None:
+        pass
+
+    def finish(self, total_records: int) -> None:
+        pass
+
+
+class _CsvWriter(_ExportWriter):
+    def begin(self) -> None:
+        if self.include_headers:
+            # Use field labels as headers
+            self.write_chunk([{f.key: f.label for f in self.fields}])
+
+    def write_chunk(self, records: List[Dict[str, Any]]) -> None:
+        buffer = StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=[f.key for f in self.fields])
+        writer.writerows(records)
+        self.out.write(buffer.getvalue().encode("utf-8"))
+
+
+class _JsonWriter(_ExportWriter):
+    """``{"data": [...], "metadata": {...}}``, or a bare list without metadata"""
+
+    def begin(self) -> None:
+        self.out.write(b'{\n  "data": [' if self.include_metadata else b"[")
+        self._first = True
+
+    def write_chunk(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        separator = "\n    " if self.include_metadata else "\n  "
+        body = ("," + separator).join(json.dumps(r, default=str) for r in records)
+        self.out.write((("" if self._first else ",") + separator + body).encode("utf-8"))
+        self._first = False
+
+    def finish(self, total_records: int) -> None:
+        if not self.include_metadata:
+            self.out.write(b"\n]")
+            return
+        metadata = {
+            "total_records": total_records,
+            "fields": [{"key": f.key, "label": f.label, "type": f.type} for f in self.fields],
+            "export_date": datetime.now().isoformat(),
+            "options": self.options.dict(),
+        }
+        self.out.write(
+            ('\n  ],\n  "metadata": ' + json.dumps(metadata, default=str) + "\n}").encode("utf-8")
+        )
+
+
+class _NdjsonWriter(_ExportWriter):
+    def write_chunk(self, records: List[Dict[str, Any]]) -> None:
+        if records:
+            lines = "\n".join(json.dumps(r, default=str) for r in records) + "\n"
+            self.out.write(lines.encode("utf-8"))
+
+
+class _XmlWriter(_ExportWriter):
+    """``<export><data>...</data><metadata/></export>``; metadata closes the document"""
+
+    def begin(self) -> None:
+        if not XML_AVAILABLE:
+            raise HTTPException(status_code=500, detail="XML export not available")
+        self.out.write(b"<?xml version='1.0' encoding='utf-8'?>\n<export><data>")
+        self._tags = [(f.key, f.key.replace(" ", "_")) for f in self.fields]
+
+    def write_chunk(self, records: List[Dict[str, Any]]) -> None:
+        parts = []
+        for record in records:
+            record_elem = ET.Element("record")
+            for key, tag in self._tags:
+                ET.SubElement(record_elem, tag).text = str(record.get(key, ""))
+            parts.append(ET.tostring(record_elem, encoding="unicode"))
+        self.out.write("".join(parts).encode("utf-8"))
+
+    def finish(self, total_records: int) -> None:
+        self.out.write(b"</data>")
+        if self.include_metadata:
+            metadata = ET.Element("metadata")
+            ET.SubElement(metadata, "total_records").text = str(total_records)
+            ET.SubElement(metadata, "export_date").text = datetime.now().isoformat()
+            ET.SubElement(metadata, "format").text = "xml"
+            fields_elem = ET.SubElement(metadata, "fields")
+            for field in self.fields:
+                field_elem = ET.SubElement(fields_elem, "field")
+                field_elem.set("key", field.key)
+                field_elem.set("type", field.type)
+                field_elem.text = field.label
+            self.out.write(ET.tostring(metadata, encoding="unicode").encode("utf-8"))
+        self.out.write(b"</export>")
+
+
+class _ExcelWriter(_ExportWriter):
+    """xlsxwriter in constant-memory mode: rows are flushed as they are written"""
+
+    incremental = False
+
+    def begin(self) -> None:
+        self.workbook = xlsxwriter.Workbook(self.out, {"constant_memory": True})
+        self.worksheet = self.workbook.add_worksheet("Data")
+
+        # Define formats
+        header_format = self.workbook.add_format({
+            'bold': True,
+            'bg_color': '#D7E4BC',
+            'border': 1
+        })
+        self.data_format = self.workbook.add_format({
+            'border': 1
+        })
+
+        # Column widths must be set before rows are flushed
+        for col_idx, field in enumerate(self.fields):
+            max_length = max(len(field.label), 10)
+            self.worksheet.set_column(col_idx, col_idx, min(max_length, 30))
+
+        self.row = 0
+        if self.include_headers:
+            for col, field in enumerate(self.fields):
+                self.worksheet.write(0, col, field.label, header_format)
+            self.row = 1
+
+    def write_chunk(self, records: List[Dict[str, Any]]) -> None:
+        for record in records:
+            for col_idx, field in enumerate(self.fields):
+                value = record.get(field.key, "")
+
+                # Try to convert numbers for proper Excel formatting
+                if field.type == "number" and isinstance(value, str):
+                    try:
+                        value = float(value)
+                    except ValueError:
+                        pass
+
+                self.worksheet.write(self.row, col_idx, value, self.data_format)
+            self.row += 1
+
+    def finish(self, total_records: int) -> None:
+        self.workbook.close()
+
+
+class _PdfWriter(_ExportWriter):
+    """
+    reportlab lays out the whole document at build time, so table rows are
+    kept until ``finish``; only the output goes straight to the stream.
+    """
+
+    incremental = False
+
+    def begin(self) -> None:
+        if not REPORTLAB_AVAILABLE:
+            raise HTTPException(status_code=500, detail="PDF export not available - reportlab not installed")
+        self.table_data = []
+        if self.include_headers:
+            self.table_data.append([f.label for f in self.fields])
+
+    def write_chunk(self, records: List[Dict[str, Any]]) -> None:
+        self.table_data.extend([str(r.get(f.key, "")) for f in self.fields] for r in records)
+
+    def finish(self, total_records: int) -> None:
+        doc = SimpleDocTemplate(self.out, pagesize=letter)
+        elements = []
+        styles = getSampleStyleSheet()
+
+        # Title
+        title = self.options.customization.get("title") or "Data Export"
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=16,
+            spaceAfter=30,
+            alignment=1  # Center alignment
+        )
+        elements.append(Paragraph(title, title_style))
+
+        # Description
+        description = self.options.customization.get("description", "")
+        if description:
+            elements.append(Paragraph(description, styles['Normal']))
+            elements.append(Spacer(1, 12))
+
+        # Create table, repeating the header row on every page
+        if self.table_data:
+            table = LongTable(self.table_data, repeatRows=1 if self.include_headers else 0)
+            table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 10),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 1), (-1, -1), 8),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]))
+            elements.append(table)
+
+        # Metadata
+        if self.include_metadata:
+            elements.append(Spacer(1, 20))
+            metadata_style = ParagraphStyle(
+                'Metadata',
+                parent=styles['Normal'],
+                fontSize=8,
+                textColor=colors.grey
+            )
+            metadata_text = f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total records: {total_records}"
+            elements.append(Paragraph(metadata_text, metadata_style))
+
+        doc.build(elements)
+        self.table_data = []
+
+
 class DataExportService:
     """Service for handling data exports in multiple formats"""
     
-    def __init__(self):
+    def __init__(self, page_size: int = 1000, spool_max_bytes: int = 8 * 1024 * 1024):
         self.active_exports: Dict[str, ExportProgress] = {}
         self.temp_dir = tempfile.gettempdir()
+        # Records pulled, formatted and encoded per chunk
+        self.page_size = page_size
+        # Non-incremental formats (excel, pdf) spill to disk above this size
+        self.spool_max_bytes = spool_max_bytes
     
     async def create_export(
         self,
-        data: List[Dict[str, Any]],
+        data: RecordSource,
         available_fields: List[ExportField],
-        options: ExportOptions
+        options: ExportOptions,
+        total_records: Optional[int] = None
     ) -> str:
-        """Create a new export job and return export ID"""
+        """Create a new export job and return export ID
+        
+        ``data`` may be a list, any (async) iterable of records or a page
+        fetcher (see ``PageFetcher``); only one page is held in memory at a time.
+        """
         
         export_id = str(uuid.uuid4())
+        if total_records is None and hasattr(data, "__len__"):
+            total_records = len(data)
         
         # Initialize progress tracking
         progress = ExportProgress(
             export_id=export_id,
             status="pending",
             progress=0,
-            total_records=len(data),
+            total_records=total_records or 0,
             processed_records=0,
             created_at=datetime.now().isoformat()
         )
@@ -128,32 +400,22 @@ class DataExportService:
     async def _process_export(
         self,
         export_id: str,
-        data: List[Dict[str, Any]],
+        data: RecordSource,
         available_fields: List[ExportField],
         options: ExportOptions
     ):
-        """Process the export asynchronously"""
+        """Process the export asynchronously, encoding straight into the export file"""
         
+        file_path = None
         try:
             progress = self.active_exports[export_id]
             progress.status = "processing"
             
-            # Filter and prepare data
-            prepared_data = await self._prepare_data(data, available_fields, options, export_id)
-            
-            # Generate export file
-            file_content = await self._generate_export_file(prepared_data, available_fields, options, export_id)
-            
-            # Save file to temp location
             filename = self._generate_filename(options)
             file_path = f"{self.temp_dir}/{export_id}_{filename}"
             
-            if isinstance(file_content, bytes):
-                with open(file_path, 'wb') as f:
-                    f.write(file_content)
-            else:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(file_content)
+            with open(file_path, 'wb') as f:
+                await self._write_export(data, available_fields, options, f, export_id)
             
             # Update progress
             progress.status = "completed"
@@ -167,64 +429,238 @@ class DataExportService:
             if progress:
                 progress.status = "failed"
                 progress.error_message = str(e)
+            if file_path and os.path.exists(file_path):
+                os.remove(file_path)
     
-    async def _prepare_data(
+    def _create_writer(
         self,
-        data: List[Dict[str, Any]],
+        out: BinaryIO,
+        fields: List[ExportField],
+        options: ExportOptions
+    ) -> _ExportWriter:
+        """Pick the incremental writer for the requested format"""
+        
+        writers = {
+            "csv": _CsvWriter,
+            "json": _JsonWriter,
+            "ndjson": _NdjsonWriter,
+            "xml": _XmlWriter,
+            "pdf": _PdfWriter,
+            # Fallback to CSV if xlsxwriter not available
+            "excel": _ExcelWriter if XLSXWRITER_AVAILABLE else _CsvWriter,
+        }
+        writer_cls = writers.get(options.format)
+        if writer_cls is None:
+            raise ValueError(f"Unsupported export format: {options.format}")
+        return writer_cls(out, fields, options)
+    
+    async def _write_export(
+        self,
+        data: RecordSource,
         available_fields: List[ExportField],
         options: ExportOptions,
-        export_id: str
-    ) -> List[Dict[str, Any]]:
-        """Prepare and filter data for export"""
-        
-        progress = self.active_exports[export_id]
-        field_map = {f.key: f for f in available_fields}
+        out: BinaryIO,
+        export_id: Optional[str] = None
+    ) -> int:
+        """Encode all prepared chunks into ``out``; returns the record count"""
         
-        # Filter fields
         selected_fields = [f for f in available_fields if f.key in options.fields]
+        writer = self._create_writer(out, selected_fields, options)
+        writer.begin()
+        total = 0
+        async for chunk in self._iter_prepared(data, available_fields, options, export_id):
+            writer.write_chunk(chunk)
+            total += len(chunk)
+        writer.finish(total)
+        return total
+    
+    async def stream_export(
+        self,
+        data: RecordSource,
+        available_fields: List[ExportField],
+        options: ExportOptions,
+        block_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the encoded export as it is produced, for a ``StreamingResponse``.
         
-        prepared_data = []
+        CSV, JSON, NDJSON and XML are yielded per chunk of records. Excel and
+        PDF can only be read back once complete, so they are written to a
+        spooled temporary file first and then yielded in ``block_size`` blocks.
+        """
         
-        for i, record in enumerate(data):
-            # Apply filters if any
-            if options.filters and not self._record_matches_filters(record, options.filters):
-                continue
-            
-            # Select and format fields
-            prepared_record = {}
-            for field in selected_fields:
-                value = record.get(field.key)
-                if value is not None:
-                    prepared_record[field.key] = self._format_field_value(value, field, options)
-                else:
-                    prepared_record[field.key] = ""
+        selected_fields = [f for f in available_fields if f.key in options.fields]
+        sink = BytesIO()
+        writer = self._create_writer(sink, selected_fields, options)
+        
+        if not writer.incremental:
+            with tempfile.SpooledTemporaryFile(max_size=self.spool_max_bytes, dir=self.temp_dir) as spool:
+                await self._write_export(data, available_fields, options, spool)
+                spool.seek(0)
+                while True:
+                    block = spool.read(block_size)
+                    if not block:
+                        break
+                    yield block
+            return
+        
+        def drain() -> bytes:
+            content = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return content
+        
+        writer.begin()
+        total = 0
+        async for chunk in self._iter_prepared(data, available_fields, options):
+            writer.write_chunk(chunk)
+            total += len(chunk)
+            if sink.tell() >= block_size:
+                yield drain()
+        writer.finish(total)
+        tail = drain()
+        if tail:
+            yield tail
+    
+    async def _iter_records(
+        self,
+        data: RecordSource,
+        available_fields: List[ExportField],
+        options: ExportOptions
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of raw records with filters, sorting and pagination applied"""
+        
+        page_size = self.page_size
+        offset = options.pagination.get("offset") or 0
+        # A missing or zero limit means "no limit" for every source
+        limit = options.pagination.get("limit") or None
+        
+        if callable(data):
+            # Push filters, sorting and pagination into the query
+            while limit is None or limit > 0:
+                batch = page_size if limit is None else min(page_size, limit)
+                page = await data(offset=offset, limit=batch, filters=options.filters, sorting=options.sorting)
+                if not page:
+                    break
+                yield page
+                offset += len(page)
+                if limit is not None:
+                    limit -= len(page)
+                if len(page) < batch:
+                    break
+            return
+        
+        filters = options.filters
+        selected_keys = {f.key for f in available_fields if f.key in options.fields}
+        sort_field = options.sorting.get("field")
+        
+        if sort_field in selected_keys:
+            # Sorting needs every matching record; only references are kept
+            if isinstance(data, (list, tuple)):
+                matching = [r for r in data if not filters or self._record_matches_filters(r, filters)]
+            else:
+                matching = [r async for r in self._aiter(data) if not filters or self._record_matches_filters(r, filters)]
+            field = next(f for f in available_fields if f.key == sort_field)
+            reverse = options.sorting.get("direction", "asc") == "desc"
             
-            prepared_data.append(prepared_record)
+            def sort_key(record):
+                value = record.get(sort_field)
+                return self._format_field_value(value, field, options) if value is not None else ""
             
-            # Update progress every 100 records
-            if i % 100 == 0:
-                progress.processed_records = i
-                progress.progress = min(int((i / len(data)) * 80), 80)  # 80% for data prep
-        
-        # Apply sorting
-        if options.sorting["field"] in [f.key for f in selected_fields]:
-            reverse = options.sorting.get("direction", "asc") == "desc"
-            prepared_data.sort(
-                key=lambda x: x.get(options.sorting["field"], ""),
-                reverse=reverse
-            )
+            matching.sort(key=sort_key, reverse=reverse)
+            end = None if limit is None else offset + limit
+            rows = iter(matching[offset:end])
+            while True:
+                page = list(islice(rows, page_size))
+                if not page:
+                    break
+                yield page
+            return
+        
+        page: List[Dict[str, Any]] = []
+        skipped = 0
+        emitted = 0
+        async for record in self._aiter(data):
+            # Apply filters if any
+            if filters and not self._record_matches_filters(record, filters):
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            if limit is not None and emitted >= limit:
+                break
+            page.append(record)
+            emitted += 1
+            if len(page) >= page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+    
+    @staticmethod
+    async def _aiter(data: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]):
+        if hasattr(data, "__aiter__"):
+            async for record in data:
+                yield record
+        else:
+            for record in data:
+                yield record
+    
+    async def _iter_prepared(
+        self,
+        data: RecordSource,
+        available_fields: List[ExportField],
+        options: ExportOptions,
+        export_id: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of selected, formatted records, updating progress per page"""
         
-        # Apply pagination
-        start_idx = options.pagination.get("offset", 0)
-        limit = options.pagination.get("limit")
-        if limit:
-            prepared_data = prepared_data[start_idx:start_idx + limit]
-        elif start_idx > 0:
-            prepared_data = prepared_data[start_idx:]
+        progress = self.active_exports.get(export_id) if export_id else None
+        selected_fields = [f for f in available_fields if f.key in options.fields]
+        processed = 0
         
-        progress.processed_records = len(prepared_data)
-        progress.progress = 85
+        async for page in self._iter_records(data, available_fields, options):
+            prepared_page = [self._prepare_record(record, selected_fields, options) for record in page]
+            processed += len(prepared_page)
+            
+            if progress:
+                progress.processed_records = processed
+                if progress.total_records:
+                    progress.progress = min(int(processed / progress.total_records * 95), 95)
+            
+            yield prepared_page
+            # Let other requests run between pages
+            await asyncio.sleep(0)
+    
+    def _prepare_record(
+        self,
+        record: Dict[str, Any],
+        selected_fields: List[ExportField],
+        options: ExportOptions
+    ) -> Dict[str, Any]:
+        """Select and format the exported fields of one record"""
+        
+        prepared_record = {}
+        for field in selected_fields:
+            value = record.get(field.key)
+            if value is not None:
+                prepared_record[field.key] = self._format_field_value(value, field, options)
+            else:
+                prepared_record[field.key] = ""
+        return prepared_record
+    
+    async def _prepare_data(
+        self,
+        data: RecordSource,
+        available_fields: List[ExportField],
+        options: ExportOptions,
+        export_id: str
+    ) -> List[Dict[str, Any]]:
+        """Prepare and filter data for export (materialized; prefer _iter_prepared)"""
         
+        prepared_data = []
+        async for page in self._iter_prepared(data, available_fields, options, export_id):
+            prepared_data.extend(page)
         return prepared_data
     
     def _record_matches_filters(self, record: Dict[str, Any], filters: Dict[str, Any]) -> bool:
@@ -312,223 +748,46 @@ class DataExportService:
     ) -> Union[str, bytes]:
         """Generate the export file in the requested format"""
         
-        progress = self.active_exports[export_id]
         selected_fields = [f for f in available_fields if f.key in options.fields]
-        
-        if options.format == "csv":
-            return self._generate_csv(data, selected_fields, options)
-        elif options.format == "json":
-            return self._generate_json(data, selected_fields, options)
-        elif options.format == "pdf":
-            return self._generate_pdf(data, selected_fields, options)
-        elif options.format == "excel":
-            return self._generate_excel(data, selected_fields, options)
-        elif options.format == "xml":
-            return self._generate_xml(data, selected_fields, options)
-        else:
-            raise ValueError(f"Unsupported export format: {options.format}")
+        content = self._encode_prepared(data, selected_fields, options, options.format)
+        return content if options.format in ("pdf", "excel") else content.decode("utf-8")
+    
+    def _encode_prepared(
+        self,
+        data: List[Dict[str, Any]],
+        fields: List[ExportField],
+        options: ExportOptions,
+        export_format: str
+    ) -> bytes:
+        """Encode already prepared records in one call, chunk by chunk"""
+        
+        out = BytesIO()
+        writer = self._create_writer(out, fields, options.model_copy(update={"format": export_format}))
+        writer.begin()
+        for start in range(0, len(data), self.page_size):
+            writer.write_chunk(data[start:start + self.page_size])
+        writer.finish(len(data))
+        return out.getvalue()
     
     def _generate_csv(self, data: List[Dict[str, Any]], fields: List[ExportField], options: ExportOptions) -> str:
         """Generate CSV export"""
-        
-        output = StringIO()
-        fieldnames = [f.key for f in fields]
-        
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        
-        # Write headers if requested
-        if options.formatting.get("include_headers", True):
-            # Use field labels as headers
-            header_row = {f.key: f.label for f in fields}
-            writer.writerow(header_row)
-        
-        # Write data
-        for record in data:
-            writer.writerow(record)
-        
-        return output.getvalue()
+        return self._encode_prepared(data, fields, options, "csv").decode("utf-8")
     
     def _generate_json(self, data: List[Dict[str, Any]], fields: List[ExportField], options: ExportOptions) -> str:
         """Generate JSON export"""
-        
-        export_data = {
-            "data": data,
-            "metadata": {
-                "total_records": len(data),
-                "fields": [{"key": f.key, "label": f.label, "type": f.type} for f in fields],
-                "export_date": datetime.now().isoformat(),
-                "options": options.dict()
-            } if options.formatting.get("include_metadata", True) else None
-        }
-        
-        if not options.formatting.get("include_metadata", True):
-            export_data = data
-        
-        return json.dumps(export_data, indent=2, default=str)
+        return self._encode_prepared(data, fields, options, "json").decode("utf-8")
     
     def _generate_pdf(self, data: List[Dict[str, Any]], fields: List[ExportField], options: ExportOptions) -> bytes:
         """Generate PDF export"""
-        
-        if not REPORTLAB_AVAILABLE:
-            raise HTTPException(status_code=500, detail="PDF export not available - reportlab not installed")
-        
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
-        elements = []
-        styles = getSampleStyleSheet()
-        
-        # Title
-        title = options.customization.get("title", "Data Export")
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=16,
-            spaceAfter=30,
-            alignment=1  # Center alignment
-        )
-        elements.append(Paragraph(title, title_style))
-        
-        # Description
-        description = options.customization.get("description", "")
-        if description:
-            elements.append(Paragraph(description, styles['Normal']))
-            elements.append(Spacer(1, 12))
-        
-        # Prepare table data
-        table_data = []
-        
-        # Headers
-        if options.formatting.get("include_headers", True):
-            headers = [f.label for f in fields]
-            table_data.append(headers)
-        
-        # Data rows
-        for record in data:
-            row = [str(record.get(f.key, "")) for f in fields]
-            table_data.append(row)
-        
-        # Create table
-        if table_data:
-            table = Table(table_data)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            elements.append(table)
-        
-        # Metadata
-        if options.formatting.get("include_metadata", True):
-            elements.append(Spacer(1, 20))
-            metadata_style = ParagraphStyle(
-                'Metadata',
-                parent=styles['Normal'],
-                fontSize=8,
-                textColor=colors.grey
-            )
-            metadata_text = f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total records: {len(data)}"
-            elements.append(Paragraph(metadata_text, metadata_style))
-        
-        doc.build(elements)
-        return buffer.getvalue()
+        return self._encode_prepared(data, fields, options, "pdf")
     
     def _generate_excel(self, data: List[Dict[str, Any]], fields: List[ExportField], options: ExportOptions) -> bytes:
         """Generate Excel export"""
-        
-        if not XLSXWRITER_AVAILABLE:
-            # Fallback to CSV if xlsxwriter not available
-            csv_content = self._generate_csv(data, fields, options)
-            return csv_content.encode('utf-8')
-        
-        buffer = BytesIO()
-        workbook = xlsxwriter.Workbook(buffer, {'in_memory': True})
-        worksheet = workbook.add_worksheet('Data')
-        
-        # Define formats
-        header_format = workbook.add_format({
-            'bold': True,
-            'bg_color': '#D7E4BC',
-            'border': 1
-        })
-        
-        data_format = workbook.add_format({
-            'border': 1
-        })
-        
-        # Write headers
-        if options.formatting.get("include_headers", True):
-            for col, field in enumerate(fields):
-                worksheet.write(0, col, field.label, header_format)
-            start_row = 1
-        else:
-            start_row = 0
-        
-        # Write data
-        for row_idx, record in enumerate(data):
-            for col_idx, field in enumerate(fields):
-                value = record.get(field.key, "")
-                
-                # Try to convert numbers for proper Excel formatting
-                if field.type == "number" and isinstance(value, str):
-                    try:
-                        value = float(value)
-                    except:
-                        pass
-                
-                worksheet.write(start_row + row_idx, col_idx, value, data_format)
-        
-        # Auto-adjust column widths
-        for col_idx, field in enumerate(fields):
-            max_length = max(len(field.label), 10)
-            worksheet.set_column(col_idx, col_idx, min(max_length, 30))
-        
-        workbook.close()
-        return buffer.getvalue()
+        return self._encode_prepared(data, fields, options, "excel")
     
     def _generate_xml(self, data: List[Dict[str, Any]], fields: List[ExportField], options: ExportOptions) -> str:
         """Generate XML export"""
-        
-        if not XML_AVAILABLE:
-            raise HTTPException(status_code=500, detail="XML export not available")
-        
-        # Create root element
-        root = ET.Element("export")
-        
-        # Add metadata if requested
-        if options.formatting.get("include_metadata", True):
-            metadata = ET.SubElement(root, "metadata")
-            ET.SubElement(metadata, "total_records").text = str(len(data))
-            ET.SubElement(metadata, "export_date").text = datetime.now().isoformat()
-            ET.SubElement(metadata, "format").text = "xml"
-            
-            fields_elem = ET.SubElement(metadata, "fields")
-            for field in fields:
-                field_elem = ET.SubElement(fields_elem, "field")
-                field_elem.set("key", field.key)
-                field_elem.set("type", field.type)
-                field_elem.text = field.label
-        
-        # Add data
-        data_elem = ET.SubElement(root, "data")
-        
-        for record in data:
-            record_elem = ET.SubElement(data_elem, "record")
-            for field in fields:
-                field_elem = ET.SubElement(record_elem, field.key.replace(" ", "_"))
-                field_elem.text = str(record.get(field.key, ""))
-        
-        # Convert to string
-        tree = ET.ElementTree(root)
-        xml_str = ET.tostring(root, encoding='unicode', xml_declaration=True)
-        
-        return xml_str
+        return self._encode_prepared(data, fields, options, "xml").decode("utf-8")
     
     def _generate_filename(self, options: ExportOptions) -> str:
         """Generate filename for export"""
@@ -544,8 +803,27 @@ class DataExportService:
         """Get export progress by ID"""
         return self.active_exports.get(export_id)
     
+    async def iter_export_file(self, export_id: str, block_size: int = 64 * 1024) -> Optional[AsyncIterator[bytes]]:
+        """Stream a completed export file in blocks (for ``StreamingResponse``)"""
+        progress = self.active_exports.get(export_id)
+        if not progress or progress.status != "completed" or not progress.file_path:
+            return None
+        if not os.path.exists(progress.file_path):
+            logger.error(f"Export file {progress.file_path} is missing")
+            return None
+        
+        async def blocks() -> AsyncIterator[bytes]:
+            with open(progress.file_path, 'rb') as f:
+                while True:
+                    block = await asyncio.to_thread(f.read, block_size)
+                    if not block:
+                        break
+                    yield block
+        
+        return blocks()
+    
     async def get_export_file(self, export_id: str) -> Optional[bytes]:
-        """Get the exported file content"""
+        """Get the exported file content (whole file; prefer iter_export_file)"""
         progress = self.active_exports.get(export_id)
         if not progress or progress.status != "completed" or not progress.file_path:
             return None
@@ -571,7 +849,6 @@ class DataExportService:
             progress = self.active_exports.pop(export_id, None)
             if progress and progress.file_path:
                 try:
-                    import os
                     os.remove(progress.file_path)
                 except Exception as e:
                     logger.error(f"Failed to delete export file {progress.file_path}: {e}")
@@ -1,15 +1,23 @@
 """
 Health Collector - Comprehensive system health monitoring service
 Gathers health information from various system components including database, Redis, WebSocket manager, and performance metrics.
+
+Dependencies are probed by a background prober, each on its own cadence and
+with exponential backoff while unhealthy. Health endpoints serve the latest
+snapshot instead of fanning out to the database and Redis on every request.
 """
 
 import asyncio
+import logging
 import os
 import platform
+import random
 import sys
 import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Literal, Optional, Any
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Literal, Optional
 
 try:
     import psutil
@@ -22,14 +30,91 @@ from .health_models import (
     HealthResponse,
     InfrastructureStats,
     PerformanceStats,
+    ProbeFreshness,
     ServiceStatus,
 )
 from ..metrics.unified_metrics_collector import get_metrics_collector
 
+logger = logging.getLogger(__name__)
+
 
 # Store application startup time
 _APP_START_TIME = time.time()
 
+# Seconds between probes of a healthy dependency
+DEFAULT_PROBE_INTERVALS: Dict[str, float] = {
+    "database": 10.0,
+    "redis": 10.0,
+    "model_registry": 30.0,
+    "websocket_manager": 5.0,
+}
+PROBE_LATENCY_HISTORY = 20
+
+
+@dataclass
+class ProbeState:
+    """Schedule and recent results of one dependency probe"""
+    
+    name: str
+    check: Callable[[], Awaitable[ServiceStatus]]
+    interval_sec: float
+    status: Optional[ServiceStatus] = None
+    checked_at: Optional[float] = None  # wall clock, for reporting
+    checked_mono: Optional[float] = None
+    succeeded_mono: Optional[float] = None  # last check that returned rather than failing
+    next_due: float = 0.0  # monotonic
+    current_interval_sec: float = 0.0
+    consecutive_failures: int = 0
+    latency_history_ms: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=PROBE_LATENCY_HISTORY)
+    )
+    
+    def record(
+        self, status: ServiceStatus, duration_ms: float, max_backoff_sec: float, succeeded: bool = True
+    ) -> None:
+        """Store a probe result and schedule the next probe.
+        
+        Unhealthy dependencies are probed exponentially less often (with
+        jitter), up to ``max_backoff_sec``, so a struggling database or Redis
+        is not hammered by health checks while it recovers.
+        """
+        now = time.monotonic()
+        self.status = status
+        self.checked_at = time.time()
+        self.checked_mono = now
+        if succeeded:
+            self.succeeded_mono = now
+        self.latency_history_ms.append(round(duration_ms, 2))
+        if status.status == "ok":
+            self.consecutive_failures = 0
+            delay = self.interval_sec
+        else:
+            self.consecutive_failures += 1
+            delay = min(
+                self.interval_sec * (2 ** self.consecutive_failures),
+                max(max_backoff_sec, self.interval_sec),
+            )
+            delay *= random.uniform(0.9, 1.1)
+        self.current_interval_sec = delay
+        self.next_due = now + delay
+    
+    def freshness(self, now_mono: float, grace_sec: float) -> ProbeFreshness:
+        age = None if self.checked_mono is None else max(0.0, now_mono - self.checked_mono)
+        return ProbeFreshness(
+            name=self.name,
+            status=self.status.status if self.status else None,
+            checked_at=(
+                datetime.fromtimestamp(self.checked_at, timezone.utc)
+                if self.checked_at is not None else None
+            ),
+            age_sec=round(age, 3) if age is not None else None,
+            stale=age is None or age > self.current_interval_sec + grace_sec,
+            interval_sec=round(self.current_interval_sec or self.interval_sec, 3),
+            next_probe_in_sec=round(max(0.0, self.next_due - now_mono), 3),
+            consecutive_failures=self.consecutive_failures,
+            latency_history_ms=list(self.latency_history_ms),
+        )
+
 
 class HealthCollector:
     """
@@ -44,7 +129,14 @@ class HealthCollector:
     - Cache statistics
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        probe_intervals: Optional[Dict[str, float]] = None,
+        max_backoff_sec: float = 120.0,
+        probe_timeout_sec: float = 10.0,
+        performance_interval_sec: float = 5.0,
+        auto_start: bool = True,
+    ):
         """Initialize health collector with service monitoring capabilities."""
         self._metrics_collector = get_metrics_collector()
         
@@ -53,6 +145,42 @@ class HealthCollector:
         self._cached_infrastructure_stats: Optional[InfrastructureStats] = None
         self._cache_ttl = 30  # Cache infrastructure stats for 30 seconds
         
+        # Background prober configuration
+        intervals = {**DEFAULT_PROBE_INTERVALS, **(probe_intervals or {})}
+        self.max_backoff_sec = max_backoff_sec
+        self.probe_timeout_sec = probe_timeout_sec
+        self.performance_interval_sec = performance_interval_sec
+        self.auto_start = auto_start
+        self.redis_info_interval_sec = 60.0
+        self._probes: Dict[str, ProbeState] = {
+            name: ProbeState(name=name, check=check, interval_sec=intervals[name])
+            for name, check in (
+                ("database", self.check_database_health),
+                ("redis", self.check_redis_health),
+                ("model_registry", self.check_model_registry_health),
+                ("websocket_manager", self.check_websocket_manager_health),
+            )
+        }
+        
+        # Latest snapshot served by the health endpoints
+        self._snapshot: Optional[HealthResponse] = None
+        self._created_mono = time.monotonic()
+        self._performance: Optional[PerformanceStats] = None
+        self._cache_stats: Optional[CacheStats] = None
+        self._performance_due = 0.0
+        self._prober_task: Optional[asyncio.Task] = None
+        self._prober_wakeup: Optional[asyncio.Event] = None
+        self._probe_tasks: Dict[str, asyncio.Task] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        # Shared probe clients, created on first use and reused across probes
+        self._process = psutil.Process() if HAS_PSUTIL else None
+        self._db_engine = None
+        self._redis_client = None
+        self._redis_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis_memory_usage = "unknown"
+        self._redis_info_at = 0.0
+        
     async def check_database_health(self) -> ServiceStatus:
         """
         Check database connectivity with simple SELECT 1 query.
@@ -85,13 +213,9 @@ class HealthCollector:
             except ImportError:
                 # Fallback for when database service isn't available
                 try:
-                    # Try SQLAlchemy direct connection if available
-                    from sqlalchemy import create_engine, text
-                    from ..config import get_database_url
-                    
-                    engine = create_engine(get_database_url(), pool_pre_ping=True)
-                    with engine.connect() as conn:
-                        conn.execute(text("SELECT 1"))
+                    # Try SQLAlchemy direct connection if available (pooled engine)
+                    engine = self._get_db_engine()
+                    await asyncio.wait_for(asyncio.to_thread(self._select_one, engine), timeout=5.0)
                     
                     latency_ms = (time.time() - start_time) * 1000
                     return ServiceStatus(
@@ -146,9 +270,12 @@ class HealthCollector:
                 
                 latency_ms = (time.time() - start_time) * 1000
                 
-                # Get additional Redis info if available
-                info = await redis_service.info("memory")
-                memory_usage = info.get("used_memory_human", "unknown") if info else "unknown"
+                # Get additional Redis info if available (refreshed on a slower cadence)
+                if time.monotonic() - self._redis_info_at >= self.redis_info_interval_sec:
+                    info = await redis_service.info("memory")
+                    self._redis_memory_usage = info.get("used_memory_human", "unknown") if info else "unknown"
+                    self._redis_info_at = time.monotonic()
+                memory_usage = self._redis_memory_usage
                 
                 return ServiceStatus(
                     name="redis",
@@ -164,12 +291,9 @@ class HealthCollector:
             except ImportError:
                 # Try direct redis connection if service not available
                 try:
-                    import redis.asyncio as redis
-                    
-                    # Use default Redis connection parameters
-                    client = redis.Redis(host="localhost", port=6379, decode_responses=True)
+                    # Use default Redis connection parameters (shared client)
+                    client = self._get_redis_client()
                     await asyncio.wait_for(client.ping(), timeout=3.0)
-                    await client.close()
                     
                     latency_ms = (time.time() - start_time) * 1000
                     return ServiceStatus(
@@ -339,6 +463,37 @@ class HealthCollector:
                 details={"error": str(e)[:100]}
             )
     
+    # ------------------------------------------------------------------
+    # Shared probe clients
+    # ------------------------------------------------------------------
+    
+    def _get_db_engine(self):
+        if self._db_engine is None:
+            from sqlalchemy import create_engine
+            from ..config import get_database_url
+            
+            self._db_engine = create_engine(get_database_url(), pool_pre_ping=True)
+        return self._db_engine
+    
+    @staticmethod
+    def _select_one(engine) -> None:
+        from sqlalchemy import text
+        
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    
+    def _get_redis_client(self):
+        # redis.asyncio connections are bound to the loop that opened them
+        loop = asyncio.get_running_loop()
+        if self._redis_client is None or self._redis_client_loop is not loop:
+            import redis.asyncio as redis
+            
+            self._redis_client = redis.Redis(
+                host="localhost", port=6379, decode_responses=True, max_connections=2
+            )
+            self._redis_client_loop = loop
+        return self._redis_client
+    
     def get_performance_stats(self) -> PerformanceStats:
         """
         Collect system performance statistics.
@@ -353,10 +508,11 @@ class HealthCollector:
         if HAS_PSUTIL:
             try:
                 # Get current process
-                process = psutil.Process()
+                process = self._process
                 
-                # CPU usage for current process
-                cpu_percent = process.cpu_percent(interval=0.1)
+                # CPU usage for current process since the previous sample
+                # (non-blocking; the prober samples on a fixed cadence)
+                cpu_percent = min(process.cpu_percent(interval=None), 100.0)
                 
                 # Memory usage
                 memory_info = process.memory_info()
@@ -512,67 +668,219 @@ class HealthCollector:
                 "python_version": health_response.infrastructure.python_version,
                 "build_commit": health_response.infrastructure.build_commit,
                 "environment": health_response.infrastructure.environment
-            }
+            },
+            "snapshot_age_sec": health_response.snapshot_age_sec,
+            "probes": [probe.model_dump(mode="json") for probe in health_response.probes or []],
         }
 
     async def collect_health(self) -> HealthResponse:
         """
-        Collect comprehensive health information from all monitored services.
+        Return the latest health snapshot with per-probe freshness metadata.
+        
+        Starts the background prober on first use. Dependencies are only
+        probed inline when no snapshot exists yet, or when no prober is
+        running and the snapshot is older than the shortest probe interval.
         
         Returns:
             Complete HealthResponse with all health data
         """
-        # Collect service statuses concurrently
-        service_tasks = [
-            self.check_database_health(),
-            self.check_redis_health(),
-            self.check_model_registry_health(),
-            self.check_websocket_manager_health()
-        ]
+        if self.auto_start:
+            self.start()
+        if self._snapshot is None or (
+            not self.is_running
+            and time.monotonic() - self._data_mono() > min(p.interval_sec for p in self._probes.values())
+        ):
+            await self.refresh()
+        return self._serve_snapshot()
+    
+    # ------------------------------------------------------------------
+    # Background prober
+    # ------------------------------------------------------------------
+    
+    @property
+    def is_running(self) -> bool:
+        task = self._prober_task
+        if task is None or task.done():
+            return False
+        try:
+            return task.get_loop() is asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+    
+    def start(self) -> None:
+        """Start the background prober on the running event loop (idempotent)"""
+        if self.is_running:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._prober_task = loop.create_task(self._prober_loop())
+    
+    async def stop(self) -> None:
+        """Stop the background prober and release shared probe clients"""
+        task, self._prober_task = self._prober_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        probe_tasks = list(self._probe_tasks.values())
+        self._probe_tasks.clear()
+        for probe_task in probe_tasks:
+            probe_task.cancel()
+        # Tasks left on another (closed) loop cannot be awaited from this one
+        loop = asyncio.get_running_loop()
+        probe_tasks = [t for t in probe_tasks if t.get_loop() is loop]
+        if probe_tasks:
+            await asyncio.gather(*probe_tasks, return_exceptions=True)
+        if self._redis_client is not None:
+            try:
+                await self._redis_client.close()
+            except Exception:
+                pass
+            self._redis_client = None
+        if self._db_engine is not None:
+            self._db_engine.dispose()
+            self._db_engine = None
+    
+    async def refresh(self) -> HealthResponse:
+        """Probe every dependency now and rebuild the snapshot.
         
+        Concurrent callers share a single in-flight refresh.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = self._refresh_task = loop.create_task(self._refresh_all())
+        return await asyncio.shield(task)
+    
+    async def _refresh_all(self) -> HealthResponse:
+        await self._run_probes(list(self._probes.values()))
+        self._refresh_local_stats()
+        return self._rebuild_snapshot()
+    
+    async def _prober_loop(self) -> None:
+        self._prober_wakeup = asyncio.Event()
+        if self._snapshot is None:
+            await self.refresh()
+        while True:
+            try:
+                self._prober_wakeup.clear()
+                now = time.monotonic()
+                # Each probe runs as its own task so one slow dependency never
+                # delays the others' schedules
+                for probe in self._probes.values():
+                    if probe.next_due <= now and self._probe_task(probe) is None:
+                        self._start_probe(probe)
+                if now >= self._performance_due:
+                    self._refresh_local_stats()
+                    self._rebuild_snapshot()
+                
+                next_due = min(
+                    [p.next_due for p in self._probes.values() if self._probe_task(p) is None]
+                    + [self._performance_due]
+                )
+                try:
+                    await asyncio.wait_for(
+                        self._prober_wakeup.wait(), timeout=max(0.05, next_due - time.monotonic())
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Health prober iteration failed: {e}")
+                await asyncio.sleep(1.0)
+    
+    def _probe_task(self, probe: ProbeState) -> Optional[asyncio.Task]:
+        """The probe's in-flight task on the running loop, if any"""
+        task = self._probe_tasks.get(probe.name)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+    
+    def _start_probe(self, probe: ProbeState) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(self._probe_once(probe))
+        self._probe_tasks[probe.name] = task
+        return task
+    
+    async def _run_probes(self, probes: List[ProbeState]) -> None:
+        """Probe ``probes`` now, joining probes that are already in flight"""
+        await asyncio.gather(*(
+            self._probe_task(probe) or self._start_probe(probe) for probe in probes
+        ))
+    
+    async def _probe_once(self, probe: ProbeState) -> None:
+        start = time.perf_counter()
+        succeeded = False
         try:
-            # Wait for all service checks with timeout
-            services = await asyncio.wait_for(
-                asyncio.gather(*service_tasks, return_exceptions=True),
-                timeout=10.0
-            )
-            
-            # Filter out any exceptions and convert to ServiceStatus
-            valid_services: List[ServiceStatus] = []
-            for service in services:
-                if isinstance(service, ServiceStatus):
-                    valid_services.append(service)
-                elif isinstance(service, Exception):
-                    # Create error service status for failed checks
-                    valid_services.append(ServiceStatus(
-                        name="unknown_service",
-                        status="down",
-                        latency_ms=None,
-                        details={"error": str(service)[:100]}
-                    ))
-            
+            status = await asyncio.wait_for(probe.check(), timeout=self.probe_timeout_sec)
+            succeeded = True
         except asyncio.TimeoutError:
-            # Create minimal service statuses for timeout case
-            valid_services = [
-                ServiceStatus(name="database", status="degraded", latency_ms=None, details={"error": "health_check_timeout"}),
-                ServiceStatus(name="redis", status="degraded", latency_ms=None, details={"error": "health_check_timeout"}),
-                ServiceStatus(name="model_registry", status="degraded", latency_ms=None, details={"error": "health_check_timeout"}),
-                ServiceStatus(name="websocket_manager", status="degraded", latency_ms=None, details={"error": "health_check_timeout"})
-            ]
-        
-        # Collect performance and infrastructure stats
-        performance = self.get_performance_stats()
-        cache = self.get_cache_stats()
-        infrastructure = self.get_infrastructure_stats()
-        
-        return HealthResponse(
+            status = ServiceStatus(
+                name=probe.name, status="degraded", latency_ms=None,
+                details={"error": "health_check_timeout"}
+            )
+        except Exception as e:
+            status = ServiceStatus(
+                name=probe.name, status="down", latency_ms=None,
+                details={"error": str(e)[:100]}
+            )
+        previous = probe.status.status if probe.status else None
+        probe.record(status, (time.perf_counter() - start) * 1000, self.max_backoff_sec, succeeded)
+        if previous is not None and previous != status.status:
+            logger.info(
+                f"Health probe {probe.name}: {previous} -> {status.status} "
+                f"(next probe in {probe.current_interval_sec:.1f}s)"
+            )
+        if self._snapshot is not None:
+            self._rebuild_snapshot()
+        if self._prober_wakeup is not None:
+            self._prober_wakeup.set()
+    
+    def _refresh_local_stats(self) -> None:
+        self._performance = self.get_performance_stats()
+        self._cache_stats = self.get_cache_stats()
+        self._performance_due = time.monotonic() + self.performance_interval_sec
+    
+    def _rebuild_snapshot(self) -> HealthResponse:
+        self._snapshot = HealthResponse(
             timestamp=datetime.now(timezone.utc),
             version="v2",
-            services=valid_services,
-            performance=performance,
-            cache=cache,
-            infrastructure=infrastructure
+            services=[p.status for p in self._probes.values() if p.status is not None],
+            performance=self._performance or self.get_performance_stats(),
+            cache=self._cache_stats or self.get_cache_stats(),
+            infrastructure=self.get_infrastructure_stats()
+        )
+        return self._snapshot
+    
+    def _data_mono(self) -> float:
+        """When the oldest probe result in the snapshot was obtained.
+        
+        Each probe counts from its last successful check (or from collector
+        creation if it never succeeded), so rebuilding the snapshot after one
+        fast probe does not make the other probes' results look fresh.
+        """
+        return min(
+            (p.succeeded_mono if p.succeeded_mono is not None else self._created_mono)
+            for p in self._probes.values()
         )
+    
+    def _serve_snapshot(self) -> HealthResponse:
+        now = time.monotonic()
+        return self._snapshot.model_copy(update={
+            "snapshot_age_sec": round(max(0.0, now - self._data_mono()), 3),
+            "probes": [
+                probe.freshness(now, grace_sec=self.probe_timeout_sec)
+                for probe in self._probes.values()
+            ],
+        })
+    
+    def get_probe_history(self) -> Dict[str, List[float]]:
+        """Recent probe durations (ms) per dependency, oldest first"""
+        return {name: list(p.latency_history_ms) for name, p in self._probes.items()}
 
 
 def map_statuses_to_overall(services: List[ServiceStatus]) -> Literal["ok", "degraded", "down"]:
@@ -86,6 +86,34 @@ class InfrastructureStats(BaseModel):
     })
 
 
+class ProbeFreshness(BaseModel):
+    """Freshness and recent latency of one background health probe"""
+    
+    name: str = Field(..., description="Probed service name")
+    status: Optional[Literal["ok", "degraded", "down"]] = Field(None, description="Status from the last probe")
+    checked_at: Optional[datetime] = Field(None, description="When the last probe finished")
+    age_sec: Optional[float] = Field(None, description="Seconds since the last probe finished", ge=0)
+    stale: bool = Field(..., description="True when the last result is older than the probe schedule allows")
+    interval_sec: float = Field(..., description="Current probe interval, including unhealthy backoff", ge=0)
+    next_probe_in_sec: Optional[float] = Field(None, description="Seconds until the next scheduled probe", ge=0)
+    consecutive_failures: int = Field(0, description="Consecutive non-ok probe results", ge=0)
+    latency_history_ms: List[float] = Field(default_factory=list, description="Recent probe durations, oldest first")
+
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "name": "redis",
+            "status": "ok",
+            "checked_at": "2025-08-17T12:00:00Z",
+            "age_sec": 3.2,
+            "stale": False,
+            "interval_sec": 10.0,
+            "next_probe_in_sec": 6.8,
+            "consecutive_failures": 0,
+            "latency_history_ms": [1.9, 2.1, 2.0]
+        }
+    })
+
+
 class HealthResponse(BaseModel):
     """Complete health status response model"""
     
@@ -95,6 +123,8 @@ class HealthResponse(BaseModel):
     performance: PerformanceStats = Field(..., description="System performance metrics")
     cache: CacheStats = Field(..., description="Cache performance statistics")
     infrastructure: InfrastructureStats = Field(..., description="Infrastructure and deployment information")
+    snapshot_age_sec: Optional[float] = Field(None, description="Seconds since the oldest probe result in the snapshot was obtained", ge=0)
+    probes: Optional[List[ProbeFreshness]] = Field(None, description="Per-probe freshness and latency history")
 
     model_config = ConfigDict(json_schema_extra={
         "example": {
@@ -173,7 +173,8 @@ class InferenceAuditService:
                     primary_pred=inference_result.prediction,
                     shadow_pred=inference_result.shadow_prediction,
                     primary_latency=inference_result.latency_ms,
-                    shadow_latency=inference_result.shadow_latency_ms
+                    shadow_latency=inference_result.shadow_latency_ms,
+                    feature_hash=inference_result.feature_hash
                 )
             except Exception as e:
                 logger.warning(f"Failed to record inference to drift monitor: {e}")
@@ -332,6 +333,9 @@ class InferenceAuditService:
                     "thresholds": drift_analysis.thresholds,
                     "earliest_detected_ts": drift_analysis.earliest_detected_ts
                 }
+                if drift_analysis.distribution is not None:
+                    drift_metrics["psi"] = drift_analysis.distribution.psi
+                    drift_metrics["ks_statistic"] = drift_analysis.distribution.ks_statistic
                 
                 # Get readiness assessment
                 readiness_assessment = self.drift_monitor.get_readiness_score()
@@ -342,15 +346,8 @@ class InferenceAuditService:
                     "latency_penalty_applied": readiness_assessment.latency_penalty_applied
                 }
                 
-                # Get calibration metrics
-                recent_entries_for_calibration = [
-                    {
-                        "feature_hash": e.feature_hash,
-                        "prediction": e.prediction
-                    } for e in successful_entries[-200:]  # Last 200 for calibration
-                ]
-                
-                calibration_analysis = self.drift_monitor.get_calibration_metrics(recent_entries_for_calibration)
+                # Get calibration metrics (maintained as outcomes arrive)
+                calibration_analysis = self.drift_monitor.get_calibration_metrics()
                 calibration_metrics = {
                     "count": calibration_analysis.count,
                     "mae": calibration_analysis.mae,
@@ -42,11 +42,12 @@ Provides comprehensive drift detection, status classification, and readiness sco
 for model performance monitoring and shadow model promotion decisions.
 """
 
+import bisect
 import math
 import os
 import time
 import threading
-from collections import deque
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, Deque, Tuple
 from enum import Enum
@@ -55,6 +56,14 @@ from backend.utils.log_context import get_contextual_logger
 
 logger = get_contextual_logger(__name__)
 
+# Rolling windows reported alongside the full buffer ("wall")
+DRIFT_WINDOWS: Tuple[Tuple[str, int], ...] = (("w50", 50), ("w200", 200))
+
+CALIBRATION_BUCKETS: Tuple[str, ...] = ("lt_0_25", "lt_0_5", "lt_0_75", "gte_0_75")
+
+# Proportion floor so empty histogram buckets keep PSI finite
+_PSI_EPSILON = 1e-4
+
 
 class DriftStatus(Enum):
     """Drift status classification levels."""
@@ -80,6 +89,14 @@ class DriftWindow:
     sample_count: int
 
 
+@dataclass
+class DistributionShift:
+    """Primary vs shadow prediction distribution shift over the paired buffer."""
+    psi: float  # Population Stability Index
+    ks_statistic: float  # Max CDF gap between the bucketed distributions
+    sample_count: int
+
+
 @dataclass
 class ReadinessScore:
     """Shadow model promotion readiness assessment."""
@@ -104,6 +121,63 @@ class DriftMetrics:
     thresholds: Dict[str, float]
     windows: Dict[str, DriftWindow]
     earliest_detected_ts: Optional[float] = None
+    distribution: Optional[DistributionShift] = None
+
+
+class _RollingWindow:
+    """
+    Running sum, sum of squares and large-value count over the last ``size`` values.
+
+    Each append is O(1). The sums are re-anchored from the retained values once
+    every ``size`` evictions so floating point error from subtraction stays bounded.
+    """
+
+    __slots__ = ("size", "values", "large_thresh", "total", "total_sq", "large_count", "_evictions")
+
+    def __init__(self, size: int, large_thresh: float = math.inf):
+        self.size = size
+        self.values: Deque[float] = deque(maxlen=size)
+        self.large_thresh = large_thresh
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.large_count = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, value: float) -> None:
+        if len(self.values) == self.size:
+            evicted = self.values[0]
+            self.total -= evicted
+            self.total_sq -= evicted * evicted
+            if evicted >= self.large_thresh:
+                self.large_count -= 1
+            self._evictions += 1
+
+        self.values.append(value)
+        self.total += value
+        self.total_sq += value * value
+        if value >= self.large_thresh:
+            self.large_count += 1
+
+        if self._evictions >= self.size:
+            self.total = math.fsum(self.values)
+            self.total_sq = math.fsum(v * v for v in self.values)
+            self._evictions = 0
+
+    def mean(self) -> float:
+        return self.total / len(self.values) if self.values else 0.0
+
+    def std(self) -> float:
+        count = len(self.values)
+        if count < 2:
+            return 0.0
+        mean = self.total / count
+        return math.sqrt(max(0.0, self.total_sq / count - mean * mean))
+
+    def large_fraction(self) -> float:
+        return self.large_count / len(self.values) if self.values else 0.0
 
 
 class DriftMonitor:
@@ -112,11 +186,23 @@ class DriftMonitor:
     
     Tracks prediction differences, computes status classifications,
     and provides readiness scoring for shadow model promotion.
+    
+    All window statistics, the primary/shadow histograms and the calibration
+    buckets are maintained incrementally as samples arrive, so the read
+    methods polled by dashboards do constant work per call.
     """
 
-    def __init__(self, maxlen: int = 1000, large_diff_thresh: float = 0.15):
+    def __init__(
+        self,
+        maxlen: int = 1000,
+        large_diff_thresh: float = 0.15,
+        histogram_bins: int = 10,
+        histogram_range: Tuple[float, float] = (0.0, 1.0),
+        outcome_capacity: int = 10000
+    ):
         self.maxlen = maxlen
         self.large_diff_thresh = large_diff_thresh
+        self.outcome_capacity = outcome_capacity
         
         # Initialize thresholds from environment
         self.drift_warn_threshold = float(os.getenv("A1_DRIFT_WARN", "0.08"))
@@ -125,29 +211,42 @@ class DriftMonitor:
         # Thread-safe storage
         self.lock = threading.Lock()
         
+        # Rolling windows; "wall" spans the whole buffer and owns the raw series
+        window_sizes = [(name, min(size, maxlen)) for name, size in DRIFT_WINDOWS]
+        window_sizes.append(("wall", maxlen))
+        self._primary_windows = {name: _RollingWindow(size) for name, size in window_sizes}
+        self._diff_windows = {
+            name: _RollingWindow(size, large_diff_thresh) for name, size in window_sizes
+        }
+        self._primary_latency = _RollingWindow(maxlen)
+        self._shadow_latency = _RollingWindow(maxlen)
+        
         # Rolling data storage
-        self.primary_predictions: Deque[float] = deque(maxlen=maxlen)
+        self.primary_predictions: Deque[float] = self._primary_windows["wall"].values
         self.shadow_predictions: Deque[float] = deque(maxlen=maxlen)
-        self.diffs: Deque[float] = deque(maxlen=maxlen)
-        self.primary_latencies: Deque[float] = deque(maxlen=maxlen)
-        self.shadow_latencies: Deque[float] = deque(maxlen=maxlen)
+        self.diffs: Deque[float] = self._diff_windows["wall"].values
+        self.primary_latencies: Deque[float] = self._primary_latency.values
+        self.shadow_latencies: Deque[float] = self._shadow_latency.values
         self.timestamps: Deque[float] = deque(maxlen=maxlen)
         
-        # Incremental aggregates
-        self._sum_primary = 0.0
-        self._sum_diffs = 0.0
-        self._sum_squared_primary = 0.0
-        self._sum_abs_diffs = 0.0
-        self._large_diff_count = 0
+        # Fixed-bucket histograms of paired primary/shadow predictions
+        low, high = histogram_range
+        step = (high - low) / histogram_bins
+        self._histogram_edges = [low + step * i for i in range(1, histogram_bins)]
+        self._primary_histogram = [0] * histogram_bins
+        self._shadow_histogram = [0] * histogram_bins
+        self._paired_buckets: Deque[Tuple[int, int]] = deque(maxlen=maxlen)
         
         # Status tracking
         self._current_status = DriftStatus.NORMAL
         self._status_change_ts: Optional[float] = None
         
         # Outcome storage for calibration
-        self.outcome_store: Dict[str, float] = {}  # feature_hash -> outcome
-        self.error_sum = 0.0
-        self.error_count = 0
+        self.outcome_store: "OrderedDict[str, float]" = OrderedDict()  # feature_hash -> outcome
+        self._pending_predictions: "OrderedDict[str, float]" = OrderedDict()  # feature_hash -> prediction
+        self._calibration_errors = _RollingWindow(maxlen)
+        self._calibration_outcome_buckets: Deque[int] = deque(maxlen=maxlen)
+        self._calibration_counts = [0] * len(CALIBRATION_BUCKETS)
         
         logger.info(
             "Drift monitor initialized",
@@ -160,7 +259,8 @@ class DriftMonitor:
         )
 
     def record_inference(self, primary_pred: float, shadow_pred: Optional[float], 
-                        primary_latency: float, shadow_latency: Optional[float]) -> None:
+                        primary_latency: float, shadow_latency: Optional[float],
+                        feature_hash: Optional[str] = None) -> None:
         """
         Record a new inference result for drift analysis.
         
@@ -169,54 +269,60 @@ class DriftMonitor:
             shadow_pred: Shadow model prediction (optional)
             primary_latency: Primary model latency in ms
             shadow_latency: Shadow model latency in ms (optional)
+            feature_hash: Hash of the input features, used to match a later outcome
         """
         with self.lock:
-            current_time = time.time()
+            self.timestamps.append(time.time())
             
             # Always record primary data
-            self.primary_predictions.append(primary_pred)
-            self.primary_latencies.append(primary_latency)
-            self.timestamps.append(current_time)
+            for window in self._primary_windows.values():
+                window.append(primary_pred)
+            self._primary_latency.append(primary_latency)
             
-            # Update incremental aggregates for primary
-            if len(self.primary_predictions) > 1:  # Remove old value if buffer was full
-                if len(self.primary_predictions) == self.maxlen:
-                    old_primary = self.primary_predictions[0] if len(self.primary_predictions) > 0 else 0
-                    self._sum_primary -= old_primary
-                    self._sum_squared_primary -= old_primary * old_primary
-            
-            self._sum_primary += primary_pred
-            self._sum_squared_primary += primary_pred * primary_pred
+            if feature_hash is not None:
+                self._remember(self._pending_predictions, feature_hash, primary_pred)
             
             # Handle shadow data if available
             if shadow_pred is not None:
                 diff = abs(primary_pred - shadow_pred)
                 
                 self.shadow_predictions.append(shadow_pred)
-                self.shadow_latencies.append(shadow_latency or 0.0)
-                self.diffs.append(diff)
-                
-                # Update diff aggregates
-                if len(self.diffs) > 1 and len(self.diffs) == self.maxlen:
-                    old_diff = self.diffs[0] if len(self.diffs) > 0 else 0
-                    old_is_large = old_diff >= self.large_diff_thresh
-                    self._sum_abs_diffs -= old_diff
-                    if old_is_large:
-                        self._large_diff_count -= 1
-                
-                self._sum_abs_diffs += diff
-                if diff >= self.large_diff_thresh:
-                    self._large_diff_count += 1
+                self._shadow_latency.append(shadow_latency or 0.0)
+                for window in self._diff_windows.values():
+                    window.append(diff)
+                self._record_pair(primary_pred, shadow_pred)
             
             # Update status
             self._update_drift_status()
 
+    def _record_pair(self, primary_pred: float, shadow_pred: float) -> None:
+        """Move a primary/shadow pair into the histograms (called under lock)."""
+        if len(self._paired_buckets) == self.maxlen:
+            old_primary, old_shadow = self._paired_buckets[0]
+            self._primary_histogram[old_primary] -= 1
+            self._shadow_histogram[old_shadow] -= 1
+        
+        buckets = (
+            bisect.bisect_right(self._histogram_edges, primary_pred),
+            bisect.bisect_right(self._histogram_edges, shadow_pred),
+        )
+        self._paired_buckets.append(buckets)
+        self._primary_histogram[buckets[0]] += 1
+        self._shadow_histogram[buckets[1]] += 1
+
+    def _remember(self, store: "OrderedDict[str, float]", feature_hash: str, value: float) -> None:
+        """Insert into a feature-hash map bounded by outcome_capacity (called under lock)."""
+        store[feature_hash] = value
+        store.move_to_end(feature_hash)
+        if len(store) > self.outcome_capacity:
+            store.popitem(last=False)
+
     def _update_drift_status(self) -> None:
         """Update drift status based on current metrics (called under lock)."""
         if len(self.diffs) < 10:  # Need minimum samples
             return
             
-        mean_abs_diff = self._sum_abs_diffs / len(self.diffs)
+        mean_abs_diff = self._diff_windows["wall"].mean()
         previous_status = self._current_status
         
         if mean_abs_diff >= self.drift_alert_threshold:
@@ -244,47 +350,21 @@ class DriftMonitor:
         Get comprehensive drift metrics across multiple rolling windows.
         
         Returns:
-            DriftMetrics with status, thresholds, and window analysis
+            DriftMetrics with status, thresholds, window analysis and
+            primary/shadow distribution shift
         """
         with self.lock:
-            # Calculate windows: last 50, 200, and full buffer
+            # Windows: last 50, 200, and full buffer
             windows = {}
             
-            for window_name, window_size in [("w50", 50), ("w200", 200), ("wall", len(self.diffs))]:
-                if len(self.diffs) == 0:
-                    windows[window_name] = DriftWindow(
-                        window_size=0, mean_abs_diff=0.0, pct_large_diff=0.0,
-                        std_dev_primary=0.0, sample_count=0
-                    )
-                    continue
-                
-                # Get window slice
-                effective_size = min(window_size, len(self.diffs))
-                if effective_size == 0:
-                    continue
-                    
-                window_diffs = list(self.diffs)[-effective_size:]
-                window_primary = list(self.primary_predictions)[-effective_size:]
-                
-                # Compute window metrics
-                mean_abs_diff = sum(window_diffs) / len(window_diffs)
-                large_count = sum(1 for d in window_diffs if d >= self.large_diff_thresh)
-                pct_large_diff = large_count / len(window_diffs) if window_diffs else 0.0
-                
-                # Primary std dev
-                if len(window_primary) > 1:
-                    primary_mean = sum(window_primary) / len(window_primary)
-                    variance = sum((p - primary_mean) ** 2 for p in window_primary) / len(window_primary)
-                    std_dev_primary = math.sqrt(variance)
-                else:
-                    std_dev_primary = 0.0
-                
+            for window_name, diff_window in self._diff_windows.items():
+                sample_count = len(diff_window)
                 windows[window_name] = DriftWindow(
-                    window_size=effective_size,
-                    mean_abs_diff=mean_abs_diff,
-                    pct_large_diff=pct_large_diff,
-                    std_dev_primary=std_dev_primary,
-                    sample_count=effective_size
+                    window_size=sample_count,
+                    mean_abs_diff=diff_window.mean(),
+                    pct_large_diff=diff_window.large_fraction(),
+                    std_dev_primary=self._primary_windows[window_name].std() if sample_count else 0.0,
+                    sample_count=sample_count
                 )
             
             return DriftMetrics(
@@ -294,9 +374,33 @@ class DriftMonitor:
                     "alert": self.drift_alert_threshold
                 },
                 windows=windows,
-                earliest_detected_ts=self._status_change_ts if self._current_status != DriftStatus.NORMAL else None
+                earliest_detected_ts=self._status_change_ts if self._current_status != DriftStatus.NORMAL else None,
+                distribution=self._distribution_shift()
             )
 
+    def _distribution_shift(self) -> Optional[DistributionShift]:
+        """PSI and bucketed KS between shadow and primary histograms (called under lock)."""
+        sample_count = len(self._paired_buckets)
+        if sample_count == 0:
+            return None
+        
+        psi = 0.0
+        ks_statistic = 0.0
+        primary_cdf = 0.0
+        shadow_cdf = 0.0
+        for primary_count, shadow_count in zip(self._primary_histogram, self._shadow_histogram):
+            primary_pct = primary_count / sample_count
+            shadow_pct = shadow_count / sample_count
+            primary_cdf += primary_pct
+            shadow_cdf += shadow_pct
+            ks_statistic = max(ks_statistic, abs(shadow_cdf - primary_cdf))
+            
+            primary_pct = max(primary_pct, _PSI_EPSILON)
+            shadow_pct = max(shadow_pct, _PSI_EPSILON)
+            psi += (shadow_pct - primary_pct) * math.log(shadow_pct / primary_pct)
+        
+        return DistributionShift(psi=psi, ks_statistic=ks_statistic, sample_count=sample_count)
+
     def get_readiness_score(self) -> ReadinessScore:
         """
         Calculate shadow model promotion readiness score.
@@ -313,7 +417,7 @@ class DriftMonitor:
                 )
             
             # Base readiness calculation
-            mean_abs_diff = self._sum_abs_diffs / len(self.diffs)
+            mean_abs_diff = self._diff_windows["wall"].mean()
             base_score = max(0.0, 1.0 - mean_abs_diff / self.drift_alert_threshold)
             
             # Apply latency penalty if shadow is significantly slower
@@ -321,8 +425,8 @@ class DriftMonitor:
             penalty_factor = 1.0
             
             if len(self.shadow_latencies) > 0 and len(self.primary_latencies) > 0:
-                avg_shadow_latency = sum(self.shadow_latencies) / len(self.shadow_latencies)
-                avg_primary_latency = sum(self.primary_latencies) / len(self.primary_latencies)
+                avg_shadow_latency = self._shadow_latency.mean()
+                avg_primary_latency = self._primary_latency.mean()
                 
                 if avg_shadow_latency > avg_primary_latency * 1.25:
                     penalty_factor = 0.8  # 20% penalty for slow shadow
@@ -355,32 +459,56 @@ class DriftMonitor:
         """
         Record an observed outcome for calibration analysis.
         
+        If the prediction for ``feature_hash`` was recorded with
+        record_inference, the calibration buckets are updated right away.
+        
         Args:
             feature_hash: Hash of the input features
             outcome_value: Observed outcome value
         """
         with self.lock:
-            self.outcome_store[feature_hash] = outcome_value
+            self._remember(self.outcome_store, feature_hash, outcome_value)
+            
+            prediction = self._pending_predictions.pop(feature_hash, None)
+            if prediction is not None:
+                if len(self._calibration_outcome_buckets) == self.maxlen:
+                    self._calibration_counts[self._calibration_outcome_buckets[0]] -= 1
+                bucket = _outcome_bucket(outcome_value)
+                self._calibration_outcome_buckets.append(bucket)
+                self._calibration_counts[bucket] += 1
+                self._calibration_errors.append(abs(prediction - outcome_value))
             
         logger.debug(
             "Outcome recorded",
             extra={"feature_hash": feature_hash[:8], "outcome_value": outcome_value}
         )
 
-    def get_calibration_metrics(self, recent_entries: List[Dict[str, Any]]) -> CalibrationMetrics:
+    def get_calibration_metrics(
+        self,
+        recent_entries: Optional[List[Dict[str, Any]]] = None
+    ) -> CalibrationMetrics:
         """
         Get calibration metrics based on recorded outcomes.
         
         Args:
-            recent_entries: Recent audit entries to match with outcomes
+            recent_entries: Recent audit entries to match with outcomes. When
+                omitted, the incrementally maintained buckets for the last
+                ``maxlen`` matched outcomes are returned.
             
         Returns:
             CalibrationMetrics with MAE and outcome distribution
         """
         with self.lock:
+            if recent_entries is None:
+                return CalibrationMetrics(
+                    count=len(self._calibration_errors),
+                    mae=self._calibration_errors.mean(),
+                    buckets=dict(zip(CALIBRATION_BUCKETS, self._calibration_counts))
+                )
+            
             # Match predictions with outcomes
-            errors = []
-            outcome_values = []
+            error_sum = 0.0
+            counts = [0] * len(CALIBRATION_BUCKETS)
             
             for entry in recent_entries:
                 feature_hash = entry.get("feature_hash")
@@ -388,30 +516,14 @@ class DriftMonitor:
                 
                 if feature_hash in self.outcome_store and prediction is not None:
                     outcome = self.outcome_store[feature_hash]
-                    error = abs(prediction - outcome)
-                    errors.append(error)
-                    outcome_values.append(outcome)
-            
-            # Calculate MAE
-            mae = sum(errors) / len(errors) if errors else 0.0
-            
-            # Distribute outcomes into quartile buckets
-            buckets = {"lt_0_25": 0, "lt_0_5": 0, "lt_0_75": 0, "gte_0_75": 0}
-            
-            for outcome in outcome_values:
-                if outcome < 0.25:
-                    buckets["lt_0_25"] += 1
-                elif outcome < 0.5:
-                    buckets["lt_0_5"] += 1
-                elif outcome < 0.75:
-                    buckets["lt_0_75"] += 1
-                else:
-                    buckets["gte_0_75"] += 1
+                    error_sum += abs(prediction - outcome)
+                    counts[_outcome_bucket(outcome)] += 1
             
+            count = sum(counts)
             return CalibrationMetrics(
-                count=len(errors),
-                mae=mae,
-                buckets=buckets
+                count=count,
+                mae=error_sum / count if count else 0.0,
+                buckets=dict(zip(CALIBRATION_BUCKETS, counts))
             )
 
     def is_alert_active(self) -> bool:
@@ -441,6 +553,17 @@ class DriftMonitor:
             }
 
 
+def _outcome_bucket(outcome: float) -> int:
+    """Index into CALIBRATION_BUCKETS for an observed outcome."""
+    if outcome < 0.25:
+        return 0
+    if outcome < 0.5:
+        return 1
+    if outcome < 0.75:
+        return 2
+    return 3
+
+
 # Global drift monitor instance
 _drift_monitor: Optional[DriftMonitor] = None
 
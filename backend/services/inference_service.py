@@ -8,10 +8,15 @@ and integration with the audit system for observability.
 import asyncio
 import hashlib
 import json
+import os
 import time
 import uuid
-from typing import Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict, Any, List, Optional, Sequence, Set, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
 
 from backend.utils.log_context import get_contextual_logger
 from backend.utils.trace_utils import trace_span, add_span_tag, add_span_log
@@ -38,6 +43,43 @@ class PredictionResult:
     status: str = "success"
 
 
+class BucketHistogram:
+    """Thread-safe fixed-bucket histogram (cumulative-free bucket counts)."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets: List[float] = sorted(buckets)
+        self._counts: List[int] = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = Lock()
+
+    def observe(self, value: float, count: int = 1) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += count
+            self._sum += value * count
+            self._count += count
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            histogram = {str(b): c for b, c in zip(self.buckets, self._counts)}
+            histogram["+Inf"] = self._counts[-1]
+            return {
+                "histogram": histogram,
+                "count": self._count,
+                "sum": self._sum,
+                "avg": self._sum / self._count if self._count else 0.0,
+            }
+
+
+@dataclass
+class _PendingInference:
+    """A queued single-row inference request awaiting its batch."""
+    features: Dict[str, Any]
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
 class InferenceService:
     """
     Service for running model inference with observability and shadow mode support.
@@ -50,6 +92,18 @@ class InferenceService:
         # Initialize loaded models cache
         self._loaded_models: Dict[str, Dict[str, Any]] = {}
 
+        # Micro-batching front end: requests for the same model version are
+        # collected for up to max_wait_ms or max_batch_size rows, then served
+        # by one matrix inference (primary and shadow run concurrently).
+        self.batching_enabled = os.getenv("A1_INFERENCE_BATCHING", "true").lower() in ("1", "true", "yes")
+        self.batch_max_size = int(os.getenv("A1_INFERENCE_BATCH_MAX_SIZE", "64"))
+        self.batch_max_wait_ms = float(os.getenv("A1_INFERENCE_BATCH_MAX_WAIT_MS", "3"))
+        self._pending: Dict[str, List[_PendingInference]] = {}
+        self._flush_handles: Dict[str, asyncio.TimerHandle] = {}
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self.batch_size_histogram = BucketHistogram([1, 2, 4, 8, 16, 32, 64, 128, 256])
+        self.queue_wait_histogram = BucketHistogram([0.5, 1, 2, 5, 10, 25, 50, 100])
+
     def _compute_feature_hash(self, features: Dict[str, Any]) -> str:
         """
         Compute deterministic hash of feature dictionary.
@@ -61,9 +115,13 @@ class InferenceService:
             SHA256 hash of canonicalized features
         """
         # Canonicalize features for deterministic hashing
-        canonical_json = json.dumps(features, sort_keys=True, separators=(',', ':'))
+        canonical_json = self._canonical_features(features)
         return hashlib.sha256(canonical_json.encode('utf-8')).hexdigest()[:16]
 
+    def _canonical_features(self, features: Dict[str, Any]) -> str:
+        """Canonical JSON used for feature hashing (and batch de-duplication)."""
+        return json.dumps(features, sort_keys=True, separators=(',', ':'))
+
     def _get_or_load_model(self, version: str) -> Dict[str, Any]:
         """
         Get model from cache or load it.
@@ -113,6 +171,296 @@ class InferenceService:
         
         return prediction, confidence
 
+    def _build_feature_matrix(self, rows: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """
+        Convert feature dicts into one contiguous float matrix.
+        
+        Columns are the sorted union of numeric feature names; non-numeric or
+        missing values become 0.0 so row sums match the single-row path.
+        """
+        columns = sorted({
+            name for row in rows for name, value in row.items()
+            if isinstance(value, (int, float))
+        })
+        index = {name: i for i, name in enumerate(columns)}
+        matrix = np.zeros((len(rows), len(columns)), dtype=np.float64)
+        for r, row in enumerate(rows):
+            for name, value in row.items():
+                if isinstance(value, (int, float)):
+                    matrix[r, index[name]] = value
+        return matrix
+
+    def _run_model_inference_batch(
+        self, model: Dict[str, Any], matrix: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run model inference over a feature matrix (stub implementation).
+        
+        Vectorized counterpart of _run_model_inference; row i yields the same
+        (prediction, confidence) as the single-row call on that row.
+        
+        Args:
+            model: Model stub dictionary
+            matrix: (rows x features) feature matrix
+            
+        Returns:
+            Tuple of (predictions, confidences) arrays
+        """
+        feature_sum = matrix.sum(axis=1)
+        predictions = np.clip(0.3 + np.mod(feature_sum, 100) / 150.0, 0.0, 1.0)
+        confidences = np.clip(0.6 + np.mod(feature_sum, 50) / 100.0, 0.5, 0.95)
+        
+        # Add small delay to simulate processing (once per batch)
+        time.sleep(0.001)
+        
+        return predictions, confidences
+
+    async def submit_inference(self, model_version: str, features: Dict[str, Any]) -> PredictionResult:
+        """
+        Queue a single-row inference into the micro-batcher for its model version.
+        
+        Requests are flushed as one batch when max_batch_size rows are queued or
+        max_wait_ms has elapsed since the first queued row, whichever comes first.
+        
+        Args:
+            model_version: Model version to use for inference
+            features: Input features dictionary
+            
+        Returns:
+            PredictionResult for this request
+        """
+        loop = asyncio.get_running_loop()
+        pending = _PendingInference(features=features, future=loop.create_future())
+        queue = self._pending.setdefault(model_version, [])
+        queue.append(pending)
+        
+        if len(queue) >= self.batch_max_size:
+            self._flush_pending(model_version)
+        elif model_version not in self._flush_handles:
+            self._flush_handles[model_version] = loop.call_later(
+                self.batch_max_wait_ms / 1000.0, self._flush_pending, model_version
+            )
+        
+        return await pending.future
+
+    def _flush_pending(self, model_version: str) -> None:
+        """Detach the queued requests for a model version and run them as a batch."""
+        handle = self._flush_handles.pop(model_version, None)
+        if handle is not None:
+            handle.cancel()
+        batch = self._pending.pop(model_version, [])
+        if batch:
+            task = asyncio.get_running_loop().create_task(
+                self._process_pending_batch(model_version, batch)
+            )
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._on_flush_done)
+
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        """Forget a finished flush task and log anything it failed to deliver."""
+        self._flush_tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error(
+                "Micro-batch flush task failed",
+                extra={"error": str(error)}
+            )
+
+    async def _process_pending_batch(
+        self, model_version: str, batch: List[_PendingInference]
+    ) -> None:
+        now = time.perf_counter()
+        for pending in batch:
+            self.queue_wait_histogram.observe((now - pending.enqueued_at) * 1000)
+        try:
+            results = await self.run_inference_batch(
+                model_version, [pending.features for pending in batch]
+            )
+        except Exception as e:
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+        for pending, result in zip(batch, results):
+            if not pending.future.done():
+                pending.future.set_result(result)
+
+    async def run_inference_batch(
+        self, model_version: str, feature_rows: Sequence[Dict[str, Any]]
+    ) -> List[PredictionResult]:
+        """
+        Run inference for many feature rows in one model call.
+        
+        Identical rows share one canonical encoding, hash and matrix row. When
+        shadow mode is enabled the shadow model scores the same matrix
+        concurrently with the primary model.
+        
+        Args:
+            model_version: Model version to use for inference
+            feature_rows: Input feature dictionaries
+            
+        Returns:
+            One PredictionResult per input row, in order
+            
+        Raises:
+            Exception: If the primary model cannot be loaded or run
+        """
+        if not feature_rows:
+            return []
+        self.batch_size_histogram.observe(len(feature_rows))
+        
+        # Hash each distinct row once and map requests onto unique matrix rows
+        unique_rows: List[Dict[str, Any]] = []
+        unique_hashes: List[str] = []
+        row_index: Dict[str, int] = {}
+        request_rows: List[int] = []
+        for features in feature_rows:
+            canonical = self._canonical_features(features)
+            index = row_index.get(canonical)
+            if index is None:
+                index = len(unique_rows)
+                row_index[canonical] = index
+                unique_rows.append(features)
+                unique_hashes.append(
+                    hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+                )
+            request_rows.append(index)
+        request_ids = [str(uuid.uuid4()) for _ in feature_rows]
+        
+        start_time = time.time()
+        with trace_span(
+            "model_inference_batch",
+            service_name="inference",
+            operation_name="primary_prediction_batch"
+        ) as span_id:
+            add_span_tag(span_id, "model_version", model_version)
+            add_span_tag(span_id, "batch_size", len(feature_rows))
+            add_span_tag(span_id, "unique_rows", len(unique_rows))
+            
+            try:
+                primary_model = self._get_or_load_model(model_version)
+                matrix = self._build_feature_matrix(unique_rows)
+                loop = asyncio.get_running_loop()
+                
+                primary_call = loop.run_in_executor(
+                    None, self._run_model_inference_batch, primary_model, matrix
+                )
+                shadow_version = None
+                shadow_call = None
+                if self.model_registry.is_shadow_mode_enabled():
+                    shadow_version = self.model_registry.get_shadow_model_version()
+                    if shadow_version:
+                        shadow_call = self._run_shadow_inference_batch(
+                            shadow_version, matrix, span_id
+                        )
+                
+                if shadow_call is not None:
+                    (predictions, confidences), shadow = await asyncio.gather(
+                        primary_call, shadow_call
+                    )
+                else:
+                    predictions, confidences = await primary_call
+                    shadow = None
+                primary_latency_ms = (time.time() - start_time) * 1000
+                add_span_tag(span_id, "latency_ms", primary_latency_ms)
+            
+            except Exception as e:
+                add_span_tag(span_id, "error", str(e))
+                add_span_log(span_id, f"Batch inference failed: {str(e)}", "error")
+                latency_ms = (time.time() - start_time) * 1000
+                for request_id, row in zip(request_ids, request_rows):
+                    self.audit_service.record_inference(PredictionResult(
+                        prediction=0.0,
+                        confidence=0.0,
+                        model_version=model_version,
+                        request_id=request_id,
+                        latency_ms=latency_ms,
+                        feature_hash=unique_hashes[row],
+                        status="error"
+                    ))
+                logger.error(
+                    "Batch model inference failed",
+                    extra={
+                        "model_version": model_version,
+                        "batch_size": len(feature_rows),
+                        "error": str(e)
+                    }
+                )
+                raise
+        
+        results: List[PredictionResult] = []
+        for request_id, row in zip(request_ids, request_rows):
+            prediction = float(predictions[row])
+            result = PredictionResult(
+                prediction=prediction,
+                confidence=float(confidences[row]),
+                model_version=model_version,
+                request_id=request_id,
+                latency_ms=primary_latency_ms,
+                feature_hash=unique_hashes[row],
+                status="success"
+            )
+            if shadow is not None:
+                shadow_predictions, shadow_confidences, shadow_latency_ms = shadow
+                result.shadow_prediction = float(shadow_predictions[row])
+                result.shadow_confidence = float(shadow_confidences[row])
+                result.shadow_version = shadow_version
+                result.shadow_latency_ms = shadow_latency_ms
+                result.shadow_diff = abs(prediction - result.shadow_prediction)
+            self.audit_service.record_inference(result)
+            results.append(result)
+        
+        logger.info(
+            "Batch model inference completed",
+            extra={
+                "model_version": model_version,
+                "batch_size": len(feature_rows),
+                "unique_rows": len(unique_rows),
+                "latency_ms": primary_latency_ms,
+                "shadow_enabled": shadow is not None
+            }
+        )
+        return results
+
+    async def _run_shadow_inference_batch(
+        self, shadow_version: str, matrix: np.ndarray, parent_span_id: Any
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, float]]:
+        """Score a batch with the shadow model; failures never fail the primary."""
+        start_time = time.time()
+        try:
+            shadow_model = self._get_or_load_model(shadow_version)
+            loop = asyncio.get_running_loop()
+            predictions, confidences = await loop.run_in_executor(
+                None, self._run_model_inference_batch, shadow_model, matrix
+            )
+            return predictions, confidences, (time.time() - start_time) * 1000
+        except Exception as e:
+            add_span_log(parent_span_id, f"Shadow batch inference failed: {str(e)}", "error")
+            logger.warning(
+                "Shadow batch inference failed, continuing with primary only",
+                extra={"shadow_version": shadow_version, "error": str(e)}
+            )
+            return None
+
+    def get_batching_stats(self) -> Dict[str, Any]:
+        """
+        Get micro-batching configuration, queue depth and histograms.
+        
+        Returns:
+            Dictionary with batch-size and queue-wait (ms) histograms
+        """
+        return {
+            "enabled": self.batching_enabled,
+            "max_batch_size": self.batch_max_size,
+            "max_wait_ms": self.batch_max_wait_ms,
+            "queued": {version: len(q) for version, q in self._pending.items()},
+            "in_flight": len(self._flush_tasks),
+            "batch_size": self.batch_size_histogram.snapshot(),
+            "queue_wait_ms": self.queue_wait_histogram.snapshot(),
+        }
+
     async def run_inference(self, model_version: str, features: Dict[str, Any]) -> PredictionResult:
         """
         Run model inference with full observability and shadow mode support.
@@ -367,4 +715,17 @@ async def run_inference(model_version: str, features: Dict[str, Any]) -> Predict
     Returns:
         PredictionResult with prediction and metadata
     """
-    return await _inference_service.run_inference(model_version, features)
\ No newline at end of file
+    return await _inference_service.run_inference(model_version, features)
+
+async def run_inference_batched(model_version: str, features: Dict[str, Any]) -> PredictionResult:
+    """
+    Run model inference through the micro-batching front end.
+    
+    Args:
+        model_version: Model version to use
+        features: Input features dictionary
+        
+    Returns:
+        PredictionResult with prediction and metadata
+    """
+    return await _inference_service.submit_inference(model_version, features)
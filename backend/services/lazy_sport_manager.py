@@ -3,19 +3,49 @@ Lazy Sport Service Manager for A1Betting Backend
 
 Manages sport-specific resources on demand for optimal performance.
 Only loads models and services when the corresponding sport tab is selected.
+
+Each activation records the service's initialization time and resident
+memory footprint. Loaded services are kept within an optional global memory
+budget (``A1_SPORT_MEMORY_BUDGET_MB``) by evicting the services that are
+cheapest to lose: rarely used, quick to rebuild and memory hungry. Scheduled
+game windows prewarm their sport ahead of start time and pin it until the
+window closes.
 """
 
 import asyncio
 import logging
+import math
+import os
 import time
+from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from backend.services.sport_service_base import SportServiceBase
 from backend.utils.enhanced_logging import get_logger
 
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil is a runtime dependency
+    psutil = None
+
 logger = get_logger("lazy_sport_manager")
 
+Timestamp = Union[datetime, float]
+
+
+def _current_rss() -> Optional[int]:
+    if psutil is None:
+        return None
+    try:
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+def _to_epoch(value: Timestamp) -> float:
+    return value.timestamp() if isinstance(value, datetime) else float(value)
+
 
 class SportStatus(Enum):
     """Status of a sport service"""
@@ -40,6 +70,20 @@ class SportServiceInfo:
         self.error_message: Optional[str] = None
         self.active_requests: int = 0
 
+        # Cost model, measured on every load
+        self.rss_bytes: Optional[int] = None
+        self.init_seconds: Optional[float] = None
+        self.activations: int = 0
+        self.evictions: int = 0
+        # Exponentially decayed request count, see LazySportManager._predicted_usage
+        self.usage: float = 0.0
+        self.usage_at: Optional[float] = None
+
+        # In-flight load shared by concurrent activations
+        self.load_task: Optional[asyncio.Task] = None
+        # Scheduled (start, end) epoch windows, sorted by start
+        self.game_windows: List[Tuple[float, float]] = []
+
 
 class LazySportManager:
     """
@@ -47,19 +91,38 @@ class LazySportManager:
 
     Best Practices Implemented:
     - Lazy Loading: Only load models when sport is selected
-    - Resource Management: Unload unused models after timeout
+    - Resource Management: Unload unused models after timeout or under budget pressure
     - Error Handling: Graceful fallback and retry logic
-    - Performance Tracking: Monitor load times and usage
+    - Performance Tracking: Monitor load times, footprint and usage
     - Memory Optimization: Clean up unused resources
+    - Prewarming: Load sports ahead of scheduled game windows
     """
 
-    def __init__(self, inactive_timeout: int = 1800):  # 30 minutes default
+    def __init__(
+        self,
+        inactive_timeout: int = 1800,  # 30 minutes default
+        memory_budget_mb: Optional[float] = None,
+        prewarm_lead_sec: float = 600.0,
+        default_window_sec: float = 4 * 3600.0,
+        sweep_interval_sec: float = 300.0,
+    ):
         self.services: Dict[str, SportServiceInfo] = {}
         self.active_sport: Optional[str] = None
         self.inactive_timeout = inactive_timeout
         self.cleanup_task: Optional[asyncio.Task] = None
         self.initialization_locks: Dict[str, asyncio.Lock] = {}
 
+        if memory_budget_mb is None and os.getenv("A1_SPORT_MEMORY_BUDGET_MB"):
+            memory_budget_mb = float(os.getenv("A1_SPORT_MEMORY_BUDGET_MB"))
+        self.memory_budget_bytes: Optional[int] = (
+            int(memory_budget_mb * 1024 * 1024) if memory_budget_mb else None
+        )
+        self.prewarm_lead_sec = prewarm_lead_sec
+        self.default_window_sec = default_window_sec
+        self.sweep_interval_sec = sweep_interval_sec
+        self._wakeup: Optional[asyncio.Event] = None
+        self._prewarm_tasks: Set[asyncio.Task] = set()
+
         # Supported sports with their initialization functions
         self.sport_initializers = {
             "MLB": self._initialize_mlb_service,
@@ -78,8 +141,9 @@ class LazySportManager:
         )
 
     async def start_cleanup_service(self):
-        """Start the background cleanup service"""
+        """Start the background cleanup and prewarm service"""
         if not self.cleanup_task:
+            self._wakeup = asyncio.Event()
             self.cleanup_task = asyncio.create_task(self._cleanup_loop())
             logger.info("CLEANUP: Cleanup service started")
 
@@ -93,13 +157,129 @@ class LazySportManager:
                 pass
             self.cleanup_task = None
             logger.info("STOPPED: Cleanup service stopped")
+        for task in list(self._prewarm_tasks):
+            task.cancel()
+        self._prewarm_tasks.clear()
+
+    # Game windows
+
+    def schedule_game_window(
+        self, sport: str, start: Timestamp, end: Optional[Timestamp] = None
+    ) -> None:
+        """
+        Register a scheduled game window for a sport.
+
+        The sport is prewarmed ``prewarm_lead_sec`` (plus its measured init
+        time) before ``start`` and is not evicted until ``end``.
+        """
+        sport = sport.upper()
+        if sport not in self.services:
+            raise ValueError(f"Unsupported sport: {sport}")
+        start_ts = _to_epoch(start)
+        end_ts = _to_epoch(end) if end is not None else start_ts + self.default_window_sec
+        windows = self.services[sport].game_windows
+        windows.append((start_ts, end_ts))
+        windows.sort()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def set_game_windows(
+        self, sport: str, windows: Iterable[Tuple[Timestamp, Optional[Timestamp]]]
+    ) -> None:
+        """Replace the scheduled game windows of a sport"""
+        sport = sport.upper()
+        if sport not in self.services:
+            raise ValueError(f"Unsupported sport: {sport}")
+        self.services[sport].game_windows = []
+        for start, end in windows:
+            self.schedule_game_window(sport, start, end)
+
+    def _prewarm_at(self, info: SportServiceInfo, now: float) -> Optional[float]:
+        """When the sport should start loading for its next open window"""
+        for start, end in info.game_windows:
+            if end > now:
+                return start - self.prewarm_lead_sec - (info.init_seconds or 0.0)
+        return None
+
+    def _in_game_window(self, info: SportServiceInfo, now: float) -> bool:
+        prewarm_at = self._prewarm_at(info, now)
+        return prewarm_at is not None and prewarm_at <= now
+
+    # Usage and cost model
+
+    def _record_access(self, info: SportServiceInfo, now: float) -> None:
+        info.usage = self._predicted_usage(info, now) + 1.0
+        info.usage_at = now
+
+    def _predicted_usage(self, info: SportServiceInfo, now: float) -> float:
+        """Request count decayed with a time constant of ``inactive_timeout``"""
+        if info.usage_at is None:
+            return 0.0
+        return info.usage * math.exp(-(now - info.usage_at) / max(self.inactive_timeout, 1))
+
+    def _keep_score(self, info: SportServiceInfo, now: float) -> float:
+        """Expected cost of evicting a service per byte freed; lowest goes first"""
+        if self._in_game_window(info, now):
+            return math.inf
+        reload_cost = info.init_seconds if info.init_seconds is not None else 1.0
+        return self._predicted_usage(info, now) * reload_cost / max(info.rss_bytes or 1, 1)
+
+    @property
+    def loaded_bytes(self) -> int:
+        return sum(
+            info.rss_bytes or 0
+            for info in self.services.values()
+            if info.status in (SportStatus.READY, SportStatus.LOADING)
+        )
+
+    async def _enforce_memory_budget(
+        self, protect: Optional[str] = None, incoming_bytes: int = 0
+    ) -> List[str]:
+        """Evict the cheapest idle services until the budget fits ``incoming_bytes`` more"""
+        if self.memory_budget_bytes is None:
+            return []
+        now = time.time()
+        candidates = sorted(
+            (
+                info
+                for sport, info in self.services.items()
+                if sport != protect
+                and info.status == SportStatus.READY
+                and info.active_requests == 0
+                and not self._in_game_window(info, now)
+            ),
+            key=lambda info: self._keep_score(info, now),
+        )
+        evicted = []
+        for info in candidates:
+            if self.loaded_bytes + incoming_bytes <= self.memory_budget_bytes:
+                break
+            logger.info(
+                f"CLEANUP: Evicting {info.sport_name} to stay within memory budget "
+                f"({(info.rss_bytes or 0) / 1e6:.1f}MB, init {info.init_seconds or 0:.2f}s)"
+            )
+            result = await self.deactivate_sport(info.sport_name)
+            if result.get("status") == "deactivated":
+                info.evictions += 1
+                evicted.append(info.sport_name)
+        if self.loaded_bytes + incoming_bytes > self.memory_budget_bytes:
+            logger.warning(
+                f"Sport services use {self.loaded_bytes / 1e6:.1f}MB, over the "
+                f"{self.memory_budget_bytes / 1e6:.1f}MB budget; nothing left to evict"
+            )
+        return evicted
+
+    # Activation
 
-    async def activate_sport(self, sport: str) -> Dict[str, Any]:
+    async def activate_sport(self, sport: str, trigger: str = "request") -> Dict[str, Any]:
         """
         Activate a sport service with lazy loading.
 
+        Concurrent activations of the same sport share one load.
+
         Args:
             sport: Sport name (e.g., "MLB", "NBA", "NFL", "NHL")
+            trigger: "request" for user traffic, "prewarm" for scheduled loads
 
         Returns:
             Dict with status, timing, and error information
@@ -118,11 +298,14 @@ class LazySportManager:
             }
 
         service_info = self.services[sport]
+        if trigger == "request":
+            self._record_access(service_info, start_time)
 
         # If already ready, just update access time
         if service_info.status == SportStatus.READY:
-            service_info.last_accessed = time.time()
-            self.active_sport = sport
+            if trigger == "request":
+                service_info.last_accessed = time.time()
+                self.active_sport = sport
             logger.info(f"READY: {sport} service already ready, updated access time")
             return {
                 "status": "ready",
@@ -132,78 +315,110 @@ class LazySportManager:
             }
 
         # If currently loading, wait for it
-        if service_info.status == SportStatus.LOADING:
-            async with self.initialization_locks[sport]:
-                # Check again after acquiring lock
-                if service_info.status == SportStatus.READY:
-                    service_info.last_accessed = time.time()
-                    self.active_sport = sport
-                    return {
-                        "status": "ready",
-                        "sport": sport,
-                        "waited": True,
-                        "load_time": time.time() - start_time,
-                    }
+        load_task = service_info.load_task
+        waited = load_task is not None
+        if load_task is None:
+            load_task = asyncio.create_task(self._load_sport(sport, trigger))
+            service_info.load_task = load_task
+
+        result = dict(await asyncio.shield(load_task))
+        if waited:
+            result.pop("newly_loaded", None)
+            result["waited"] = True
+            result["load_time"] = time.time() - start_time
+        if result["status"] == "ready" and trigger == "request":
+            service_info.last_accessed = time.time()
+            self.active_sport = sport
+        return result
 
-        # Load the service
-        async with self.initialization_locks[sport]:
-            service_info.status = SportStatus.LOADING
-            service_info.load_time = time.time()
+    async def _load_sport(self, sport: str, trigger: str) -> Dict[str, Any]:
+        """Initialize a sport service, measuring its init time and footprint"""
+        service_info = self.services[sport]
+        try:
+            async with self.initialization_locks[sport]:
+                # Make room using the footprint measured on the previous load
+                await self._enforce_memory_budget(
+                    protect=sport, incoming_bytes=service_info.rss_bytes or 0
+                )
 
-            try:
-                logger.info(f"Loading {sport} service and models...")
+                service_info.status = SportStatus.LOADING
+                service_info.load_time = time.time()
+                rss_before = _current_rss()
+                started = time.perf_counter()
 
-                # Initialize the sport service
-                service_instance = await self.sport_initializers[sport]()
+                try:
+                    logger.info(f"Loading {sport} service and models ({trigger})...")
 
-                service_info.service_instance = service_instance
-                service_info.status = SportStatus.READY
-                service_info.last_accessed = time.time()
-                service_info.error_message = None
-                self.active_sport = sport
+                    # Initialize the sport service
+                    service_instance = await self.sport_initializers[sport]()
 
-                # Register the service with unified_sport_service
-                try:
-                    from backend.services.sport_service_base import unified_sport_service
+                    service_info.init_seconds = time.perf_counter() - started
+                    rss_after = _current_rss()
+                    if rss_before is not None and rss_after is not None:
+                        # Loads of other sports may overlap; never go negative
+                        service_info.rss_bytes = max(0, rss_after - rss_before)
 
-                    unified_sport_service.register_sport_service(sport, service_instance)
-                    logger.info(f"Registered {sport} service with unified_sport_service")
-                except ImportError as e:
-                    logger.warning(
-                        f"Could not import unified_sport_service: {e}"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to register {sport} with unified_sport_service: {e}"
+                    service_info.service_instance = service_instance
+                    service_info.status = SportStatus.READY
+                    service_info.last_accessed = time.time()
+                    service_info.error_message = None
+                    service_info.activations += 1
+
+                    # Register the service with unified_sport_service
+                    try:
+                        from backend.services.sport_service_base import unified_sport_service
+
+                        unified_sport_service.register_sport_service(sport, service_instance)
+                        logger.info(f"Registered {sport} service with unified_sport_service")
+                    except ImportError as e:
+                        logger.warning(
+                            f"Could not import unified_sport_service: {e}"
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to register {sport} with unified_sport_service: {e}"
+                        )
+
+                    load_duration = time.time() - (service_info.load_time or time.time())
+                    logger.info(
+                        f"{sport} service loaded successfully in {load_duration:.2f}s "
+                        f"(+{(service_info.rss_bytes or 0) / 1e6:.1f}MB RSS)"
                     )
 
-                load_duration = time.time() - (service_info.load_time or time.time())
-                logger.info(
-                    f"{sport} service loaded successfully in {load_duration:.2f}s"
-                )
+                    result = {
+                        "status": "ready",
+                        "sport": sport,
+                        "load_time": load_duration,
+                        "newly_loaded": True,
+                        "trigger": trigger,
+                        "rss_bytes": service_info.rss_bytes,
+                    }
 
-                return {
-                    "status": "ready",
-                    "sport": sport,
-                    "load_time": load_duration,
-                    "newly_loaded": True,
-                }
+                except Exception as e:
+                    service_info.status = SportStatus.ERROR
+                    service_info.error_message = str(e)
+                    load_duration = time.time() - (service_info.load_time or time.time())
 
-            except Exception as e:
-                service_info.status = SportStatus.ERROR
-                service_info.error_message = str(e)
-                load_duration = time.time() - (service_info.load_time or time.time())
+                    logger.error(
+                        f"Failed to load {sport} service in {load_duration:.2f}s: {e}"
+                    )
 
-                logger.error(
-                    f"Failed to load {sport} service in {load_duration:.2f}s: {e}"
-                )
+                    return {
+                        "status": "error",
+                        "sport": sport,
+                        "error": str(e),
+                        "load_time": load_duration,
+                    }
+        finally:
+            service_info.load_task = None
 
-                return {
-                    "status": "error",
-                    "sport": sport,
-                    "error": str(e),
-                    "load_time": load_duration,
-                }
+        # The measured footprint may push other services over budget
+        await self._enforce_memory_budget(protect=sport)
+        return result
+
+    async def prewarm_sport(self, sport: str) -> Dict[str, Any]:
+        """Load a sport ahead of demand without marking it as the active tab"""
+        return await self.activate_sport(sport, trigger="prewarm")
 
     async def deactivate_sport(self, sport: str) -> Dict[str, Any]:
         """
@@ -271,6 +486,7 @@ class LazySportManager:
             return {"status": "unknown", "sport": sport}
 
         service_info = self.services[sport]
+        now = time.time()
 
         return {
             "sport": sport,
@@ -280,6 +496,13 @@ class LazySportManager:
             "error_message": service_info.error_message,
             "active_requests": service_info.active_requests,
             "is_active": self.active_sport == sport,
+            "rss_bytes": service_info.rss_bytes,
+            "init_seconds": service_info.init_seconds,
+            "activations": service_info.activations,
+            "evictions": service_info.evictions,
+            "predicted_usage": self._predicted_usage(service_info, now),
+            "prewarm_at": self._prewarm_at(service_info, now),
+            "in_game_window": self._in_game_window(service_info, now),
         }
 
     def get_all_statuses(self) -> Dict[str, Any]:
@@ -295,18 +518,61 @@ class LazySportManager:
                 [s for s in self.services.values() if s.status == SportStatus.READY]
             ),
             "total_supported": len(self.services),
+            "loaded_bytes": self.loaded_bytes,
+            "memory_budget_bytes": self.memory_budget_bytes,
         }
 
     async def _cleanup_loop(self):
-        """Background task to cleanup inactive services"""
+        """Background task to prewarm scheduled sports and clean up inactive ones"""
         while True:
             try:
-                await asyncio.sleep(300)  # Check every 5 minutes
+                self._start_due_prewarms()
                 await self._cleanup_inactive_services()
+                await self._enforce_memory_budget()
+
+                # Sleep until the next sweep or the next prewarm deadline. Due
+                # prewarms were started above and wake the loop when they finish
+                now = time.time()
+                timeout = self.sweep_interval_sec
+                for info in self.services.values():
+                    prewarm_at = self._prewarm_at(info, now)
+                    if (
+                        prewarm_at is not None
+                        and prewarm_at > now
+                        and info.status == SportStatus.NOT_LOADED
+                    ):
+                        timeout = min(timeout, prewarm_at - now)
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=max(timeout, 0.05))
+                except asyncio.TimeoutError:
+                    pass
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in cleanup loop: {e}")
+                await asyncio.sleep(1)
+
+    def _start_due_prewarms(self) -> None:
+        """Start loads for sports whose game window (minus lead time) has begun"""
+        now = time.time()
+        for sport, info in self.services.items():
+            # Drop windows that have already closed
+            info.game_windows = [w for w in info.game_windows if w[1] > now]
+            if (
+                info.status in (SportStatus.NOT_LOADED, SportStatus.ERROR)
+                and info.load_task is None
+                and self._in_game_window(info, now)
+            ):
+                logger.info(f"PREWARM: Loading {sport} ahead of scheduled game window")
+                task = asyncio.create_task(self.prewarm_sport(sport))
+                self._prewarm_tasks.add(task)
+                task.add_done_callback(self._on_prewarm_done)
+
+    def _on_prewarm_done(self, task: asyncio.Task) -> None:
+        self._prewarm_tasks.discard(task)
+        if self._wakeup is not None:
+            self._wakeup.set()
 
     async def _cleanup_inactive_services(self):
         """Clean up services that haven't been accessed recently"""
@@ -318,6 +584,7 @@ class LazySportManager:
                 and service_info.last_accessed
                 and current_time - service_info.last_accessed > self.inactive_timeout
                 and service_info.active_requests == 0
+                and not self._in_game_window(service_info, current_time)
             ):
 
                 logger.info(
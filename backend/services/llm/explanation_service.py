@@ -8,10 +8,11 @@ with rate limiting, concurrency control, and comprehensive error handling.
 import asyncio
 import hashlib
 import time
-from collections import deque, defaultdict
+import weakref
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Set
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Any, Set
 
 from fastapi import HTTPException
 
@@ -81,6 +82,40 @@ class RateLimiter:
         return max(0, int(oldest_request + self.window_seconds - time.time()))
 
 
+class SingleFlight:
+    """Coalesce concurrent calls for the same key onto one in-flight task
+    
+    Entries are held in a weak-value table and removed when the task
+    finishes, so the table only ever contains keys that are being generated
+    right now instead of growing with every edge ever requested.
+    """
+    
+    def __init__(self):
+        self._inflight: "weakref.WeakValueDictionary[Hashable, asyncio.Task]" = (
+            weakref.WeakValueDictionary()
+        )
+    
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``factory`` for ``key`` unless a call for it is already in flight"""
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+        # Shield so one cancelled waiter does not cancel the shared work
+        return await asyncio.shield(task)
+    
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+    
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
 class ExplanationService:
     """Main service for LLM edge explanations"""
     
@@ -94,8 +129,8 @@ class ExplanationService:
             window_seconds=60
         )
         
-        # Concurrency locks per edge_id to prevent duplicate generation
-        self._generation_locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Single-flight table per edge_id to prevent duplicate generation
+        self._generation_locks = SingleFlight()
         
         # Active generation tracking
         self._active_generations: Set[int] = set()
@@ -123,62 +158,10 @@ class ExplanationService:
         start_time = time.time()
         
         try:
-            # Get edge context (simplified for now)
-            async with self._generation_locks[edge_id]:
-                edge_context = await self._load_edge_context_simple(edge_id)
-                if not edge_context:
-                    raise HTTPException(
-                        status_code=404,
-                        detail=f"Edge {edge_id} not found or insufficient data"
-                    )
-                
-                # Generate cache key
-                valuation_hash = self._generate_valuation_hash(edge_context)
-                cache_key = llm_cache.generate_cache_key(
-                    edge_id=edge_id,
-                    model_version_id=edge_context.model_version_id,
-                    valuation_hash=valuation_hash,
-                    prompt_template_version=PROMPT_TEMPLATE_VERSION
-                )
-                
-                # Check cache unless force refresh
-                if not force_refresh:
-                    cached = llm_cache.get_cached_explanation(cache_key)
-                    if cached:
-                        return ExplanationDTO(
-                            edge_id=edge_id,
-                            model_version_id=edge_context.model_version_id,
-                            prompt_version=PROMPT_TEMPLATE_VERSION,
-                            content=cached.content,
-                            provider=cached.provider,
-                            tokens_used=cached.tokens_used,
-                            cache_hit=True,
-                            created_at=cached.created_at
-                        )
-                
-                # Check rate limit
-                if not self.rate_limiter.is_allowed():
-                    wait_time = self.rate_limiter.time_until_allowed()
-                    raise HTTPException(
-                        status_code=429,
-                        detail=f"LLM rate limit exceeded. Try again in {wait_time} seconds.",
-                        headers={"Retry-After": str(wait_time)}
-                    )
-                
-                # Generate explanation
-                try:
-                    self._active_generations.add(edge_id)
-                    explanation_dto = await self._generate_explanation(
-                        edge_id, edge_context, cache_key
-                    )
-                    
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    explanation_dto.generation_time_ms = duration_ms
-                    
-                    return explanation_dto
-                    
-                finally:
-                    self._active_generations.discard(edge_id)
+            return await self._generation_locks.do(
+                (edge_id, force_refresh),
+                lambda: self._get_or_generate(edge_id, None, force_refresh, start_time)
+            )
         
         except HTTPException:
             raise
@@ -188,6 +171,65 @@ class ExplanationService:
             # Return fallback explanation
             return await self._create_fallback_explanation(edge_id, str(e))
     
+    async def _get_or_generate(
+        self,
+        edge_id: int,
+        edge_context: Optional[EdgeContext],
+        force_refresh: bool,
+        start_time: float
+    ) -> ExplanationDTO:
+        """Serve an explanation from cache or generate it (runs single-flight per edge)"""
+        if edge_context is None:
+            # Get edge context (simplified for now)
+            edge_context = await self._load_edge_context_simple(edge_id)
+        if not edge_context:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Edge {edge_id} not found or insufficient data"
+            )
+        
+        # Generate cache key
+        cache_key = self._cache_key_for(edge_id, edge_context)
+        
+        # Check cache unless force refresh
+        if not force_refresh:
+            cached = llm_cache.get_cached_explanation(cache_key)
+            if cached:
+                return ExplanationDTO(
+                    edge_id=edge_id,
+                    model_version_id=edge_context.model_version_id,
+                    prompt_version=PROMPT_TEMPLATE_VERSION,
+                    content=cached.content,
+                    provider=cached.provider,
+                    tokens_used=cached.tokens_used,
+                    cache_hit=True,
+                    created_at=cached.created_at
+                )
+        
+        # Check rate limit
+        if not self.rate_limiter.is_allowed():
+            wait_time = self.rate_limiter.time_until_allowed()
+            raise HTTPException(
+                status_code=429,
+                detail=f"LLM rate limit exceeded. Try again in {wait_time} seconds.",
+                headers={"Retry-After": str(wait_time)}
+            )
+        
+        # Generate explanation
+        try:
+            self._active_generations.add(edge_id)
+            explanation_dto = await self._generate_explanation(
+                edge_id, edge_context, cache_key
+            )
+            
+            duration_ms = int((time.time() - start_time) * 1000)
+            explanation_dto.generation_time_ms = duration_ms
+            
+            return explanation_dto
+            
+        finally:
+            self._active_generations.discard(edge_id)
+    
     async def prefetch_explanations_for_edges(
         self, 
         edge_ids: List[int], 
@@ -212,31 +254,39 @@ class ExplanationService:
         start_time = time.time()
         semaphore = asyncio.Semaphore(concurrency)
         
-        # Filter to edges without cached explanations
-        edges_to_generate = []
-        cache_hits = 0
+        # Load every distinct edge's context up front, then resolve all cache keys at once
+        unique_edge_ids = list(dict.fromkeys(edge_ids))
+        loaded = await asyncio.gather(
+            *[self._load_edge_context_simple(edge_id) for edge_id in unique_edge_ids]
+        )
+        contexts = {
+            edge_id: edge_context
+            for edge_id, edge_context in zip(unique_edge_ids, loaded)
+            if edge_context
+        }
+        cache_keys = {
+            edge_id: self._cache_key_for(edge_id, edge_context)
+            for edge_id, edge_context in contexts.items()
+        }
+        cached = llm_cache.get_many(cache_keys.values())
         
-        for edge_id in edge_ids:
-            edge_context = await self._load_edge_context_simple(edge_id)
-            if edge_context:
-                valuation_hash = self._generate_valuation_hash(edge_context)
-                cache_key = llm_cache.generate_cache_key(
-                    edge_id=edge_id,
-                    model_version_id=edge_context.model_version_id,
-                    valuation_hash=valuation_hash,
-                    prompt_template_version=PROMPT_TEMPLATE_VERSION
-                )
-                
-                if llm_cache.get_cached_explanation(cache_key):
-                    cache_hits += 1
-                else:
-                    edges_to_generate.append(edge_id)
+        # Filter to edges without cached explanations
+        edges_to_generate = [
+            edge_id for edge_id, cache_key in cache_keys.items()
+            if cache_key not in cached
+        ]
+        cache_hits = len(cache_keys) - len(edges_to_generate)
         
         # Generate concurrently
         async def generate_with_semaphore(edge_id: int):
             async with semaphore:
                 try:
-                    await self.generate_or_get_edge_explanation(edge_id)
+                    await self._generation_locks.do(
+                        (edge_id, False),
+                        lambda: self._get_or_generate(
+                            edge_id, contexts[edge_id], False, time.time()
+                        )
+                    )
                     return True
                 except Exception as e:
                     logger.warning(f"Prefetch failed for edge {edge_id}: {e}")
@@ -358,6 +408,15 @@ class ExplanationService:
             created_at=datetime.now(timezone.utc)
         )
     
+    def _cache_key_for(self, edge_id: int, edge_context: EdgeContext) -> str:
+        """Build the explanation cache key for an edge context"""
+        return llm_cache.generate_cache_key(
+            edge_id=edge_id,
+            model_version_id=edge_context.model_version_id,
+            valuation_hash=self._generate_valuation_hash(edge_context),
+            prompt_template_version=PROMPT_TEMPLATE_VERSION
+        )
+    
     def _generate_valuation_hash(self, edge_context: EdgeContext) -> str:
         """Generate hash of valuation context for cache key"""
         context_data = {
@@ -11,7 +11,7 @@ import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, Optional, Any
 
 from backend.services.unified_logging import get_logger
 from backend.services.unified_config import get_config
@@ -115,7 +115,11 @@ class LLMCache:
                 return record
         
         # Check database cache
-        db_record = self._get_from_database(cache_key)
+        try:
+            db_record = self._get_from_database(cache_key)
+        except Exception as e:
+            logger.warning(f"LLM cache database lookup failed: {e}")
+            db_record = None
         if db_record:
             # Add to memory cache
             self.set_cached_explanation(
@@ -131,6 +135,35 @@ class LLMCache:
         self.stats.misses += 1
         return None
     
+    def get_many(self, cache_keys: Iterable[str]) -> Dict[str, ExplanationRecord]:
+        """
+        Resolve many cache keys at once from the memory cache
+        
+        There is no database tier behind this yet (see _get_from_database),
+        so keys that are not in memory are counted as misses.
+        
+        Args:
+            cache_keys: Cache keys to lookup
+            
+        Returns:
+            Dict mapping each found cache key to its ExplanationRecord
+        """
+        found: Dict[str, ExplanationRecord] = {}
+        for cache_key in dict.fromkeys(cache_keys):
+            record = self._memory_cache.get(cache_key)
+            if record is not None and self._is_expired(record):
+                self._memory_cache.pop(cache_key)
+                self.stats.evictions += 1
+                record = None
+            if record is None:
+                self.stats.misses += 1
+                continue
+            self._memory_cache.move_to_end(cache_key)
+            self.stats.hits += 1
+            found[cache_key] = record
+        
+        return found
+    
     def set_cached_explanation(
         self,
         cache_key: str,
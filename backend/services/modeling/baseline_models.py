@@ -5,27 +5,69 @@ Baseline Models - Simple statistical models for NBA prop predictions
 import hashlib
 import logging
 import math
-from typing import Dict, Any
+from abc import abstractmethod
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .model_registry import BaseStatModel
 from .historical_stats_provider import historical_stats_provider
+from ..valuation.distributions import prob_over_lines
 
 logger = logging.getLogger(__name__)
 
 
-class PoissonLikeModel(BaseStatModel):
+@dataclass
+class StatHistoryMatrix:
+    """Zero-padded (rows x lookback) block of stat histories for a slate"""
+    values: np.ndarray
+    counts: np.ndarray
+    
+    @classmethod
+    def from_histories(cls, histories: Sequence[Sequence[float]]) -> "StatHistoryMatrix":
+        counts = np.fromiter((len(h) for h in histories), dtype=np.int64, count=len(histories))
+        width = int(counts.max()) if len(counts) else 0
+        values = np.zeros((len(histories), width))
+        mask = np.arange(width) < counts[:, None]
+        values[mask] = np.fromiter(chain.from_iterable(histories), dtype=float, count=int(counts.sum()))
+        return cls(values=values, counts=counts)
+    
+    @property
+    def mask(self) -> np.ndarray:
+        return np.arange(self.values.shape[1]) < self.counts[:, None]
+    
+    @property
+    def mean(self) -> np.ndarray:
+        return np.divide(
+            self.values.sum(axis=1), self.counts,
+            out=np.zeros(len(self.counts)), where=self.counts > 0
+        )
+    
+    def sample_variance(self, mean: Optional[np.ndarray] = None) -> np.ndarray:
+        """Row-wise sample variance; NaN for rows with fewer than two games"""
+        if mean is None:
+            mean = self.mean
+        squared = np.where(self.mask, (self.values - mean[:, None]) ** 2, 0.0)
+        return np.divide(
+            squared.sum(axis=1), self.counts - 1,
+            out=np.full(len(self.counts), np.nan), where=self.counts > 1
+        )
+
+
+class BaselineStatModel(BaseStatModel):
     """
-    Poisson-like model for counting statistics (ASSISTS, REBOUNDS, STEALS, etc.)
+    Shared single and batch prediction flow for the baseline models.
+    
+    Subclasses implement ``_estimate`` over a whole ``StatHistoryMatrix``;
+    ``predict`` is a one-row ``predict_batch`` so both paths return the same
+    numbers and feature hashes.
     """
     
-    def __init__(self):
-        self.name = "baseline_poisson"
-        self.version = "v1"
-        self.model_type = "POISSON"
-        self.hyperparams = {
-            "lookback_games": 5,
-            "min_lambda": 0.01
-        }
+    name: str
+    model_type: str
+    hyperparams: Dict[str, Any]
     
     async def predict(
         self, 
@@ -35,59 +77,154 @@ class PoissonLikeModel(BaseStatModel):
         context: dict
     ) -> dict:
         """
-        Predict using Poisson distribution for counting stats.
+        Predict for a single player and prop type.
         
         Args:
             player_id: Player identifier
-            prop_type: Prop type (ASSISTS, REBOUNDS, etc.)
+            prop_type: Prop type (POINTS, ASSISTS, REBOUNDS, etc.)
             context: Additional context data
             
         Returns:
             dict: Prediction with mean, variance, distribution_family, etc.
         """
+        prediction = (await self.predict_batch(requests=[(player_id, prop_type)], context=context))[0]
+        logger.debug(f"{self.model_type} prediction for player {player_id}, {prop_type}: {prediction}")
+        return prediction
+    
+    async def predict_batch(
+        self,
+        *,
+        requests: Sequence[Tuple[int, str]],
+        context: Optional[dict] = None,
+        lines: Optional[Sequence[Optional[float]]] = None
+    ) -> List[dict]:
+        """
+        Predict a whole slate of (player_id, prop_type) pairs.
+        
+        Histories are fetched with one grouped provider call and the moments
+        are computed across all rows at once.
+        
+        Args:
+            requests: (player_id, prop_type) pairs, one prediction per entry
+            context: Additional context data shared by the slate
+            lines: Optional betting line per request; adds ``prob_over``
+            
+        Returns:
+            List[dict]: Predictions in request order
+        """
+        requests = [(player_id, prop_type) for player_id, prop_type in requests]
+        if not requests:
+            return []
+        
+        lookback_games = self.hyperparams.get("lookback_games", 5)
         try:
-            # Get historical stats
-            lookback_games = self.hyperparams.get("lookback_games", 5)
-            historical_stats = await historical_stats_provider.get_player_stat_history(
-                player_id=player_id,
-                prop_type=prop_type,
-                lookback_games=lookback_games
+            histories = await historical_stats_provider.get_player_stat_histories(
+                requests, lookback_games=lookback_games
+            )
+            history = StatHistoryMatrix.from_histories([histories.get(key) or [] for key in requests])
+            mean, variance, features = self._estimate(history, lookback_games)
+            dispersion = np.divide(
+                history.sample_variance(), history.mean,
+                out=np.full(len(requests), np.nan), where=history.mean > 0
             )
-            
-            if not historical_stats:
-                logger.warning(f"No historical stats for player {player_id}, prop {prop_type}")
-                return self._default_prediction(prop_type)
-            
-            # Calculate Poisson parameter (lambda)
-            historical_mean = sum(historical_stats) / len(historical_stats)
-            lambda_param = max(self.hyperparams.get("min_lambda", 0.01), historical_mean)
-            
-            # For Poisson distribution: variance = mean
-            variance = lambda_param
-            
-            # Compute feature hash
-            features_used = {
-                "historical_mean": historical_mean,
-                "lookback_games": lookback_games,
-                "lambda": lambda_param
-            }
-            features_hash = self._compute_features_hash(features_used)
-            
-            prediction = {
-                "mean": lambda_param,
-                "variance": variance,
-                "distribution_family": "POISSON",
-                "sample_size": len(historical_stats),
-                "features_used": features_used,
-                "features_hash": features_hash
-            }
-            
-            logger.debug(f"Poisson prediction for player {player_id}, {prop_type}: {prediction}")
-            return prediction
-            
         except Exception as e:
-            logger.error(f"Error in Poisson prediction: {e}")
-            return self._default_prediction(prop_type)
+            logger.error(f"Error in {self.model_type} batch prediction: {e}")
+            return [self._default_prediction(prop_type) for _, prop_type in requests]
+        
+        predictions: List[dict] = []
+        missing = 0
+        columns = {key: value.tolist() for key, value in features.items() if isinstance(value, np.ndarray)}
+        constants = {key: value for key, value in features.items() if key not in columns}
+        for row, (mean_i, variance_i, count, dispersion_i) in enumerate(zip(
+            mean.tolist(), variance.tolist(), history.counts.tolist(), dispersion.tolist()
+        )):
+            if count == 0:
+                missing += 1
+                prediction = self._default_prediction(requests[row][1])
+                mean[row] = prediction["mean"]
+                variance[row] = prediction["variance"]
+            else:
+                features_used = dict(constants)
+                for key, column in columns.items():
+                    features_used[key] = column[row]
+                prediction = {
+                    "mean": mean_i,
+                    "variance": variance_i,
+                    "distribution_family": self.model_type,
+                    "sample_size": count,
+                    "features_used": features_used,
+                    "features_hash": self._compute_features_hash(features_used),
+                    "dispersion": dispersion_i if math.isfinite(dispersion_i) else None,
+                }
+            predictions.append(prediction)
+        
+        if missing:
+            logger.warning(f"No historical stats for {missing} of {len(requests)} player props ({self.model_type})")
+        
+        if lines is not None:
+            line_values = np.array([np.nan if line is None else line for line in lines], dtype=float)
+            prob_over = prob_over_lines(line_values, mean, variance, self.model_type).tolist()
+            for prediction, line, prob in zip(predictions, lines, prob_over):
+                if line is not None:
+                    prediction["prob_over"] = prob
+        
+        return predictions
+    
+    @abstractmethod
+    def _estimate(
+        self,
+        history: StatHistoryMatrix,
+        lookback_games: int
+    ) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+        """
+        Compute row-wise mean, variance and features_used columns.
+        
+        Feature values may be arrays (one entry per row) or constants.
+        """
+        pass
+    
+    @abstractmethod
+    def _default_prediction(self, prop_type: str) -> dict:
+        """Prediction used when a player has no historical stats"""
+        pass
+    
+    def _compute_features_hash(self, features: Dict[str, Any]) -> str:
+        """Compute SHA256 hash of features"""
+        # Sort features for consistent hashing
+        sorted_features = sorted(features.items())
+        features_str = str(sorted_features)
+        return hashlib.sha256(features_str.encode()).hexdigest()
+
+
+class PoissonLikeModel(BaselineStatModel):
+    """
+    Poisson-like model for counting statistics (ASSISTS, REBOUNDS, STEALS, etc.)
+    """
+    
+    def __init__(self):
+        self.name = "baseline_poisson"
+        self.version = "v1"
+        self.model_type = "POISSON"
+        self.hyperparams = {
+            "lookback_games": 5,
+            "min_lambda": 0.01
+        }
+    
+    def _estimate(
+        self,
+        history: StatHistoryMatrix,
+        lookback_games: int
+    ) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+        """Poisson rate per row; variance equals the mean"""
+        historical_mean = history.mean
+        lambda_param = np.maximum(self.hyperparams.get("min_lambda", 0.01), historical_mean)
+        
+        features = {
+            "historical_mean": historical_mean,
+            "lookback_games": lookback_games,
+            "lambda": lambda_param
+        }
+        return lambda_param, lambda_param.copy(), features
     
     def _default_prediction(self, prop_type: str) -> dict:
         """Default prediction when data is unavailable"""
@@ -111,16 +248,9 @@ class PoissonLikeModel(BaseStatModel):
             "features_used": {"default": True, "default_lambda": lambda_param},
             "features_hash": self._compute_features_hash({"default": True, "prop_type": prop_type})
         }
-    
-    def _compute_features_hash(self, features: Dict[str, Any]) -> str:
-        """Compute SHA256 hash of features"""
-        # Sort features for consistent hashing
-        sorted_features = sorted(features.items())
-        features_str = str(sorted_features)
-        return hashlib.sha256(features_str.encode()).hexdigest()
 
 
-class NormalModel(BaseStatModel):
+class NormalModel(BaselineStatModel):
     """
     Normal distribution model for continuous statistics (POINTS, MINUTES, etc.)
     """
@@ -134,76 +264,28 @@ class NormalModel(BaseStatModel):
             "min_variance": 0.25  # Minimum variance floor
         }
     
-    async def predict(
-        self, 
-        *, 
-        player_id: int, 
-        prop_type: str, 
-        context: dict
-    ) -> dict:
-        """
-        Predict using Normal distribution for continuous stats.
+    def _estimate(
+        self,
+        history: StatHistoryMatrix,
+        lookback_games: int
+    ) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+        """Sample mean and variance per row, with a variance floor"""
+        mean = history.mean
         
-        Args:
-            player_id: Player identifier
-            prop_type: Prop type (POINTS, MINUTES, etc.)
-            context: Additional context data
-            
-        Returns:
-            dict: Prediction with mean, variance, distribution_family, etc.
-        """
-        try:
-            # Get historical stats
-            lookback_games = self.hyperparams.get("lookback_games", 5)
-            historical_stats = await historical_stats_provider.get_player_stat_history(
-                player_id=player_id,
-                prop_type=prop_type,
-                lookback_games=lookback_games
-            )
-            
-            if not historical_stats:
-                logger.warning(f"No historical stats for player {player_id}, prop {prop_type}")
-                return self._default_prediction(prop_type)
-            
-            # Calculate mean and variance
-            n = len(historical_stats)
-            mean = sum(historical_stats) / n
-            
-            if n > 1:
-                # Sample variance
-                variance = sum((x - mean) ** 2 for x in historical_stats) / (n - 1)
-            else:
-                # Single sample - use heuristic variance
-                variance = (mean * 0.3) ** 2  # 30% coefficient of variation
-            
-            # Apply minimum variance floor
-            min_variance = self.hyperparams.get("min_variance", 0.25)
-            variance = max(variance, min_variance)
-            
-            # Compute feature hash
-            features_used = {
-                "historical_mean": mean,
-                "historical_variance": variance,
-                "lookback_games": lookback_games,
-                "sample_size": n
-            }
-            features_hash = self._compute_features_hash(features_used)
-            
-            prediction = {
-                "mean": mean,
-                "variance": variance,
-                "distribution_family": "NORMAL",
-                "sample_size": n,
-                "features_used": features_used,
-                "features_hash": features_hash
-            }
-            
-            logger.debug(f"Normal prediction for player {player_id}, {prop_type}: {prediction}")
-            return prediction
-            
-        except Exception as e:
-            logger.error(f"Error in Normal prediction: {e}")
-            return self._default_prediction(prop_type)
+        # Single sample - use heuristic variance (30% coefficient of variation)
+        variance = np.where(history.counts > 1, history.sample_variance(mean), (mean * 0.3) ** 2)
+        
+        # Apply minimum variance floor
+        min_variance = self.hyperparams.get("min_variance", 0.25)
+        variance = np.maximum(variance, min_variance)
+        
+        features = {
+            "historical_mean": mean,
+            "historical_variance": variance,
+            "lookback_games": lookback_games,
+            "sample_size": history.counts
+        }
+        return mean, variance, features
     
     def _default_prediction(self, prop_type: str) -> dict:
         """Default prediction when data is unavailable"""
@@ -226,16 +308,9 @@ class NormalModel(BaseStatModel):
             "features_used": {"default": True, "default_mean": default["mean"], "default_std": default["std"]},
             "features_hash": self._compute_features_hash({"default": True, "prop_type": prop_type})
         }
-    
-    def _compute_features_hash(self, features: Dict[str, Any]) -> str:
-        """Compute SHA256 hash of features"""
-        # Sort features for consistent hashing
-        sorted_features = sorted(features.items())
-        features_str = str(sorted_features)
-        return hashlib.sha256(features_str.encode()).hexdigest()
 
 
-class NegativeBinomialModel(BaseStatModel):
+class NegativeBinomialModel(BaselineStatModel):
     """
     Negative Binomial model for overdispersed count data (stub implementation)
     """
@@ -249,71 +324,26 @@ class NegativeBinomialModel(BaseStatModel):
             "overdispersion_k": 2.0  # Default overdispersion parameter
         }
     
-    async def predict(
-        self, 
-        *, 
-        player_id: int, 
-        prop_type: str, 
-        context: dict
-    ) -> dict:
-        """
-        Predict using Negative Binomial distribution for overdispersed counts.
+    def _estimate(
+        self,
+        history: StatHistoryMatrix,
+        lookback_games: int
+    ) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+        """Mean per row with a fixed overdispersion parameter"""
+        mean = history.mean
         
-        TODO: Implement proper overdispersion estimation
+        # TODO: Implement proper overdispersion estimation
+        # For now, use simple heuristic: variance = mean + mean^2 / k
+        k = self.hyperparams.get("overdispersion_k", 2.0)
+        variance = mean + (mean ** 2) / k
         
-        Args:
-            player_id: Player identifier
-            prop_type: Prop type
-            context: Additional context data
-            
-        Returns:
-            dict: Prediction with mean, variance, distribution_family, etc.
-        """
-        try:
-            # Get historical stats
-            lookback_games = self.hyperparams.get("lookback_games", 5)
-            historical_stats = await historical_stats_provider.get_player_stat_history(
-                player_id=player_id,
-                prop_type=prop_type,
-                lookback_games=lookback_games
-            )
-            
-            if not historical_stats:
-                logger.warning(f"No historical stats for player {player_id}, prop {prop_type}")
-                return self._default_prediction(prop_type)
-            
-            # Calculate mean
-            mean = sum(historical_stats) / len(historical_stats)
-            
-            # TODO: Implement proper overdispersion estimation
-            # For now, use simple heuristic: variance = mean + mean^2 / k
-            k = self.hyperparams.get("overdispersion_k", 2.0)
-            variance = mean + (mean ** 2) / k
-            
-            # Compute feature hash
-            features_used = {
-                "historical_mean": mean,
-                "overdispersion_k": k,
-                "lookback_games": lookback_games,
-                "sample_size": len(historical_stats)
-            }
-            features_hash = self._compute_features_hash(features_used)
-            
-            prediction = {
-                "mean": mean,
-                "variance": variance,
-                "distribution_family": "NEG_BINOMIAL",
-                "sample_size": len(historical_stats),
-                "features_used": features_used,
-                "features_hash": features_hash
-            }
-            
-            logger.debug(f"Negative Binomial prediction for player {player_id}, {prop_type}: {prediction}")
-            return prediction
-            
-        except Exception as e:
-            logger.error(f"Error in Negative Binomial prediction: {e}")
-            return self._default_prediction(prop_type)
+        features = {
+            "historical_mean": mean,
+            "overdispersion_k": k,
+            "lookback_games": lookback_games,
+            "sample_size": history.counts
+        }
+        return mean, variance, features
     
     def _default_prediction(self, prop_type: str) -> dict:
         """Default prediction when data is unavailable"""
@@ -338,13 +368,7 @@ class NegativeBinomialModel(BaseStatModel):
             "features_used": {"default": True, "default_mean": mean, "overdispersion_k": k},
             "features_hash": self._compute_features_hash({"default": True, "prop_type": prop_type})
         }
-    
-    def _compute_features_hash(self, features: Dict[str, Any]) -> str:
-        """Compute SHA256 hash of features"""
-        # Sort features for consistent hashing
-        sorted_features = sorted(features.items())
-        features_str = str(sorted_features)
-        return hashlib.sha256(features_str.encode()).hexdigest()
+
 
 
 # Model factory for creating instances
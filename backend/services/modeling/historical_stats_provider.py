@@ -2,9 +2,10 @@
 Historical Stats Provider - Data provider with fallback chains for player statistics
 """
 
+import asyncio
 import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +67,65 @@ class HistoricalStatsProvider:
         self.cache[cache_key] = heuristic_stats
         return heuristic_stats
     
+    async def get_player_stat_histories(
+        self,
+        keys: Sequence[Tuple[int, str]],
+        lookback_games: int = 5
+    ) -> Dict[Tuple[int, str], List[float]]:
+        """
+        Get historical statistics for many (player_id, prop_type) pairs at once.
+        
+        Runs the same fallback chain as ``get_player_stat_history`` but each
+        stage is a single grouped lookup for every key still unresolved, so a
+        full slate costs one round trip per stage instead of one per player.
+        
+        Args:
+            keys: (player_id, prop_type) pairs; duplicates are resolved once
+            lookback_games: Number of recent games to consider
+            
+        Returns:
+            Dict mapping each requested key to its historical stat values
+        """
+        results: Dict[Tuple[int, str], List[float]] = {}
+        missing: List[Tuple[int, str]] = []
+        for key in dict.fromkeys(keys):
+            cached = self.cache.get(f"{key[0]}_{key[1]}_{lookback_games}")
+            if cached is not None:
+                results[key] = cached
+            else:
+                missing.append(key)
+        
+        for stage, fetch in (
+            ("historical stats", self._fetch_historical_stats_bulk),
+            ("offered lines", self._fetch_from_offered_lines_bulk),
+        ):
+            if not missing:
+                break
+            try:
+                fetched = await fetch(missing, lookback_games)
+            except Exception as e:
+                logger.warning(f"Failed to fetch {stage} for {len(missing)} player props: {e}")
+                continue
+            still_missing = []
+            for key in missing:
+                stats = fetched.get(key)
+                if stats:
+                    self.cache[f"{key[0]}_{key[1]}_{lookback_games}"] = stats
+                    results[key] = stats
+                else:
+                    still_missing.append(key)
+            missing = still_missing
+        
+        # Heuristic baselines only depend on the prop type
+        heuristics: Dict[str, List[float]] = {}
+        for player_id, prop_type in missing:
+            if prop_type not in heuristics:
+                heuristics[prop_type] = self._get_heuristic_baseline(prop_type, lookback_games)
+            self.cache[f"{player_id}_{prop_type}_{lookback_games}"] = heuristics[prop_type]
+            results[(player_id, prop_type)] = heuristics[prop_type]
+        
+        return results
+    
     async def _fetch_historical_stats(
         self,
         player_id: int,
@@ -78,7 +138,7 @@ class HistoricalStatsProvider:
         TODO: Integrate with real data warehouse/API
         """
         # Placeholder implementation - would connect to real data source
-        logger.info(f"TODO: Fetch real historical stats for player {player_id}, prop {prop_type}")
+        logger.debug(f"TODO: Fetch real historical stats for player {player_id}, prop {prop_type}")
         
         # For now, return None to trigger fallback
         return None
@@ -95,11 +155,42 @@ class HistoricalStatsProvider:
         TODO: Query ingestion pipeline for recent prop lines
         """
         # Placeholder implementation - would query recent prop lines from ingestion
-        logger.info(f"TODO: Fetch from offered lines for player {player_id}, prop {prop_type}")
+        logger.debug(f"TODO: Fetch from offered lines for player {player_id}, prop {prop_type}")
         
         # For now, return None to trigger final fallback
         return None
     
+    async def _fetch_historical_stats_bulk(
+        self,
+        keys: List[Tuple[int, str]],
+        lookback_games: int
+    ) -> Dict[Tuple[int, str], List[float]]:
+        """Fetch real historical statistics for many player props (per-player fetches, run concurrently)"""
+        return await self._fetch_each(self._fetch_historical_stats, keys, lookback_games)
+    
+    async def _fetch_from_offered_lines_bulk(
+        self,
+        keys: List[Tuple[int, str]],
+        lookback_games: int
+    ) -> Dict[Tuple[int, str], List[float]]:
+        """Fetch statistics from recent offered lines for many player props (per-player fetches, run concurrently)"""
+        return await self._fetch_each(self._fetch_from_offered_lines, keys, lookback_games)
+    
+    @staticmethod
+    async def _fetch_each(fetch, keys: List[Tuple[int, str]], lookback_games: int) -> Dict[Tuple[int, str], List[float]]:
+        """Run a per-player fetch for every key; keys that fail or return nothing are omitted"""
+        fetched = await asyncio.gather(
+            *[fetch(player_id, prop_type, lookback_games) for player_id, prop_type in keys],
+            return_exceptions=True
+        )
+        results: Dict[Tuple[int, str], List[float]] = {}
+        for key, stats in zip(keys, fetched):
+            if isinstance(stats, Exception):
+                logger.warning(f"Failed to fetch stats for player {key[0]}, prop {key[1]}: {stats}")
+            elif stats:
+                results[key] = stats
+        return results
+    
     def _get_heuristic_baseline(self, prop_type: str, lookback_games: int) -> List[float]:
         """
         Get heuristic baseline constants for different prop types.
@@ -16,12 +16,21 @@ Features:
 - Persist events to local storage (in browser) or memory (server)
 - Batch events for efficient network usage
 - Provide visibility into queue status
+
+Ready events sit in per-priority deques and retries in a min-heap keyed on
+``next_retry_at``, so dequeue is O(log n) however far the queue backs up.
+With persistence enabled, every state change is written to a SQLite WAL
+store in group commits and unacknowledged events are recovered on restart.
 """
 
 import time
 import json
 import asyncio
-from typing import Dict, Any, List, Optional, Callable, Union
+import heapq
+import itertools
+import os
+import sqlite3
+from typing import Dict, Any, List, Optional, Callable, Tuple, Union
 from dataclasses import dataclass, field
 from collections import deque
 from enum import Enum
@@ -123,6 +132,171 @@ class RetryPolicy:
         return delay
 
 
+class SQLiteEventStore:
+    """
+    Durable event log backed by SQLite in WAL mode
+
+    Writes are buffered and committed in groups (when ``group_commit_size``
+    operations are pending or the oldest is ``group_commit_interval`` seconds
+    old), so a burst of queued events costs one fsync rather than one each.
+    A crash can lose at most the last uncommitted group; a group that fails
+    to commit stays buffered and is retried by the next flush. Events are upserted
+    on every state change and marked terminal when acknowledged (completed,
+    failed or evicted); ``compact`` deletes terminal rows and truncates the WAL.
+    """
+
+    TERMINAL_STATUSES = ("completed", "failed", "evicted")
+
+    def __init__(
+        self,
+        path: str,
+        group_commit_size: int = 256,
+        group_commit_interval: float = 0.05,
+        compact_after_acks: int = 1000,
+    ):
+        self.path = path
+        self.group_commit_size = group_commit_size
+        self.group_commit_interval = group_commit_interval
+        self.compact_after_acks = compact_after_acks
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS offline_events (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._oldest_pending: Optional[float] = None
+        self._acks_since_compaction = 0
+        self.stats = {'commits': 0, 'rows_written': 0, 'compactions': 0}
+
+    def append(self, event: QueuedEvent):
+        """Record the current state of an event"""
+        self._buffer(event.id, event.status.value, json.dumps(event.to_dict()))
+
+    def ack(self, event_id: str, status: str = "completed"):
+        """Mark an event terminal so compaction can drop it"""
+        self._buffer(event_id, status, None)
+        self._acks_since_compaction += 1
+
+    def _buffer(self, event_id: str, status: str, payload: Optional[str]):
+        with self._lock:
+            previous = self._pending.get(event_id)
+            if payload is None and previous is not None:
+                # Keep the last known payload for an event acked in the same group
+                payload = previous[1]
+            self._pending[event_id] = (status, payload)
+            if self._oldest_pending is None:
+                self._oldest_pending = time.monotonic()
+            due = (
+                len(self._pending) >= self.group_commit_size
+                or time.monotonic() - self._oldest_pending >= self.group_commit_interval
+            )
+        if due:
+            self.flush()
+
+    def maybe_flush(self):
+        """Commit the pending group if its interval has elapsed"""
+        oldest = self._oldest_pending
+        if oldest is not None and time.monotonic() - oldest >= self.group_commit_interval:
+            self.flush()
+
+    def flush(self):
+        """Commit every buffered write in one transaction"""
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            oldest, self._oldest_pending = self._oldest_pending, None
+            now = time.time()
+            upserts = [
+                (event_id, status, payload, now)
+                for event_id, (status, payload) in pending.items()
+                if payload is not None
+            ]
+            status_only = [
+                (status, now, event_id)
+                for event_id, (status, payload) in pending.items()
+                if payload is None
+            ]
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT INTO offline_events (id, status, payload, updated_at) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET "
+                    "status=excluded.status, payload=excluded.payload, "
+                    "updated_at=excluded.updated_at",
+                    upserts,
+                )
+                self._conn.executemany(
+                    "UPDATE offline_events SET status=?, updated_at=? WHERE id=?",
+                    status_only,
+                )
+                self._conn.execute("COMMIT")
+                self.stats['commits'] += 1
+                self.stats['rows_written'] += len(pending)
+            except sqlite3.Error as e:
+                # BEGIN itself may have failed (e.g. database locked)
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                # Keep the group buffered so the next flush retries it
+                self._pending = pending
+                self._oldest_pending = oldest
+                logger.error(f"Failed to commit offline event group ({len(pending)} rows): {e}")
+                return
+
+        if self.compact_after_acks and self._acks_since_compaction >= self.compact_after_acks:
+            self.compact()
+
+    def load(self) -> List[QueuedEvent]:
+        """Return every unacknowledged event, oldest first (crash recovery)"""
+        self.flush()
+        placeholders = ",".join("?" for _ in self.TERMINAL_STATUSES)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT payload FROM offline_events WHERE status NOT IN ({placeholders})",
+                self.TERMINAL_STATUSES,
+            ).fetchall()
+        events = []
+        for (payload,) in rows:
+            try:
+                events.append(QueuedEvent.from_dict(json.loads(payload)))
+            except Exception as e:
+                logger.warning(f"Skipping unreadable offline event record: {e}")
+        events.sort(key=lambda e: e.created_at)
+        return events
+
+    def compact(self) -> int:
+        """Delete acknowledged events and truncate the WAL; returns rows removed"""
+        self.flush()
+        placeholders = ",".join("?" for _ in self.TERMINAL_STATUSES)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM offline_events WHERE status IN ({placeholders})",
+                self.TERMINAL_STATUSES,
+            )
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._acks_since_compaction = 0
+            self.stats['compactions'] += 1
+        logger.debug(f"Compacted offline event store: {cursor.rowcount} acknowledged events removed")
+        return cursor.rowcount
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
 class NetworkConnectivityMonitor:
     """Monitors network connectivity status"""
     
@@ -168,20 +342,25 @@ class OfflineEventQueue:
         max_queue_size: int = 10000,
         max_memory_mb: int = 50,
         retry_policy: Optional[RetryPolicy] = None,
-        enable_persistence: bool = False
+        enable_persistence: bool = False,
+        persistence_path: Optional[str] = None
     ):
         self.max_queue_size = max_queue_size
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
         self.retry_policy = retry_policy or RetryPolicy()
         self.enable_persistence = enable_persistence
         
-        # Queue storage (priority-based)
+        # Queue storage: per-priority deques of ready (PENDING) events plus a
+        # min-heap of RETRYING events keyed on next_retry_at
         self.queues = {
             EventPriority.CRITICAL: deque(),
             EventPriority.HIGH: deque(),
             EventPriority.NORMAL: deque(),
             EventPriority.LOW: deque()
         }
+        self.retry_heap: List[Tuple[float, int, QueuedEvent]] = []
+        self._retry_counts = {priority: 0 for priority in EventPriority}
+        self._retry_seq = itertools.count()
         
         # Event processing
         self.event_processors: Dict[str, Callable] = {}
@@ -207,6 +386,39 @@ class OfflineEventQueue:
         self.connectivity_monitor = NetworkConnectivityMonitor()
         self.connectivity_monitor.add_connectivity_callback(self._on_connectivity_change)
         
+        # Durable store (optional)
+        self.store: Optional[SQLiteEventStore] = None
+        if enable_persistence:
+            self.store = SQLiteEventStore(
+                persistence_path
+                or os.getenv("A1_OFFLINE_QUEUE_PATH", "data/offline_event_queue.db")
+            )
+            self._recover()
+    
+    def _recover(self):
+        """Reload unacknowledged events from the store after a restart"""
+        events = self.store.load()
+        with self.lock:
+            for event in events:
+                if event.status == EventStatus.RETRYING and event.next_retry_at:
+                    self._push_retry(event)
+                else:
+                    event.status = EventStatus.PENDING
+                    self.queues[event.priority].append(event)
+            self.stats['queue_size'] = self._get_total_queue_size()
+            if events:
+                self.stats['oldest_event'] = events[0].created_at
+        if events:
+            logger.info(f"Recovered {len(events)} offline events from {self.store.path}")
+    
+    def _push_retry(self, event: QueuedEvent):
+        heapq.heappush(self.retry_heap, (event.next_retry_at, next(self._retry_seq), event))
+        self._retry_counts[event.priority] += 1
+    
+    def _ack(self, event: QueuedEvent, status: Optional[str] = None):
+        if self.store:
+            self.store.ack(event.id, status or event.status.value)
+        
     def register_processor(self, event_type: str, processor: Callable):
         """Register a processor function for an event type"""
         self.event_processors[event_type] = processor
@@ -245,6 +457,8 @@ class OfflineEventQueue:
             
             # Add to appropriate priority queue
             self.queues[priority].append(event)
+            if self.store:
+                self.store.append(event)
             self.stats['events_queued'] += 1
             self.stats['queue_size'] = self._get_total_queue_size()
             
@@ -262,7 +476,7 @@ class OfflineEventQueue:
     
     def _get_total_queue_size(self) -> int:
         """Get total number of events across all queues"""
-        return sum(len(queue) for queue in self.queues.values())
+        return sum(len(queue) for queue in self.queues.values()) + len(self.retry_heap)
     
     def _evict_old_events(self):
         """Evict old events when queue is full"""
@@ -270,12 +484,28 @@ class OfflineEventQueue:
         # Never evict critical events
         priorities_to_evict = [EventPriority.LOW, EventPriority.NORMAL, EventPriority.HIGH]
         
+        evicted = None
         for priority in priorities_to_evict:
             queue = self.queues[priority]
             if queue:
                 evicted = queue.popleft()
-                logger.warning(f"Evicted event due to queue size limit: {evicted.event_type} (id: {evicted.id})")
                 break
+            if self._retry_counts[priority]:
+                # Only retries left at this level: drop the oldest one (rare, O(n))
+                index = min(
+                    (i for i, entry in enumerate(self.retry_heap) if entry[2].priority == priority),
+                    key=lambda i: self.retry_heap[i][2].created_at,
+                )
+                evicted = self.retry_heap[index][2]
+                self.retry_heap[index] = self.retry_heap[-1]
+                self.retry_heap.pop()
+                heapq.heapify(self.retry_heap)
+                self._retry_counts[priority] -= 1
+                break
+        
+        if evicted is not None:
+            self._ack(evicted, "evicted")
+            logger.warning(f"Evicted event due to queue size limit: {evicted.event_type} (id: {evicted.id})")
     
     def _start_processing(self):
         """Start the event processing loop"""
@@ -298,8 +528,12 @@ class OfflineEventQueue:
         
         while self.processing_active:
             try:
-                await self._process_next_event()
-                await asyncio.sleep(0.1)  # Brief pause between events
+                if await self._process_next_event():
+                    await asyncio.sleep(0)  # Yield, then keep draining
+                else:
+                    if self.store:
+                        self.store.maybe_flush()
+                    await asyncio.sleep(0.1)  # Idle: nothing ready yet
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -314,47 +548,49 @@ class OfflineEventQueue:
         
         while self.processing_active:
             try:
-                self._process_next_event_sync()
-                time.sleep(0.1)  # Brief pause between events
+                if not self._process_next_event_sync():
+                    if self.store:
+                        self.store.maybe_flush()
+                    time.sleep(0.1)  # Idle: nothing ready yet
             except Exception as e:
                 logger.error(f"Error in event processing loop: {e}")
                 time.sleep(1)  # Pause on error
         
         logger.info("Offline event queue processing stopped")
     
-    async def _process_next_event(self):
-        """Process the next event in queue (async)"""
+    async def _process_next_event(self) -> bool:
+        """Process the next event in queue (async); False when none is ready"""
         event = self._get_next_event()
         if event:
             await self._process_event(event)
+            return True
+        return False
     
-    def _process_next_event_sync(self):
-        """Process the next event in queue (sync)"""
+    def _process_next_event_sync(self) -> bool:
+        """Process the next event in queue (sync); False when none is ready"""
         event = self._get_next_event()
         if event:
             self._process_event_sync(event)
+            return True
+        return False
     
     def _get_next_event(self) -> Optional[QueuedEvent]:
         """Get the next event to process based on priority and retry timing"""
         with self.lock:
             current_time = time.time()
             
+            # Move due retries onto the back of their ready deque
+            heap = self.retry_heap
+            while heap and heap[0][0] <= current_time:
+                _, _, event = heapq.heappop(heap)
+                self._retry_counts[event.priority] -= 1
+                self.queues[event.priority].append(event)
+            
             # Check each priority queue in order
             for priority in [EventPriority.CRITICAL, EventPriority.HIGH, EventPriority.NORMAL, EventPriority.LOW]:
                 queue = self.queues[priority]
-                
-                # Look for events ready to process
-                for i, event in enumerate(queue):
-                    if event.status == EventStatus.PENDING:
-                        # Remove and return the event
-                        del queue[i]
-                        return event
-                    elif (event.status == EventStatus.RETRYING and 
-                          event.next_retry_at and 
-                          event.next_retry_at <= current_time):
-                        # Remove and return the retry event
-                        del queue[i]
-                        return event
+                if queue:
+                    return queue.popleft()
         
         return None
     
@@ -367,6 +603,7 @@ class OfflineEventQueue:
             event.status = EventStatus.FAILED
             event.last_error = "No processor registered"
             self.stats['events_failed'] += 1
+            self._ack(event)
             return
         
         try:
@@ -383,6 +620,7 @@ class OfflineEventQueue:
             
             # Mark as completed
             event.status = EventStatus.COMPLETED
+            self._ack(event)
             self.stats['events_processed'] += 1
             self.stats['last_processed'] = time.time()
             
@@ -401,6 +639,7 @@ class OfflineEventQueue:
             event.status = EventStatus.FAILED
             event.last_error = "No processor registered"
             self.stats['events_failed'] += 1
+            self._ack(event)
             return
         
         try:
@@ -414,6 +653,7 @@ class OfflineEventQueue:
             
             # Mark as completed
             event.status = EventStatus.COMPLETED
+            self._ack(event)
             self.stats['events_processed'] += 1
             self.stats['last_processed'] = time.time()
             
@@ -444,6 +684,7 @@ class OfflineEventQueue:
         else:
             event.status = EventStatus.FAILED
             self.stats['events_failed'] += 1
+            self._ack(event)
             logger.error(f"Event failed permanently after {event.retry_count} retries: {event.event_type} (id: {event.id})")
     
     def _schedule_retry(self, event: QueuedEvent, error: str):
@@ -457,7 +698,9 @@ class OfflineEventQueue:
         
         # Put back in queue
         with self.lock:
-            self.queues[event.priority].append(event)
+            self._push_retry(event)
+            if self.store:
+                self.store.append(event)
             self.stats['events_retried'] += 1
         
         logger.info(
@@ -481,11 +724,17 @@ class OfflineEventQueue:
     def get_queue_stats(self) -> Dict[str, Any]:
         """Get detailed queue statistics"""
         with self.lock:
-            queue_sizes = {priority.value: len(queue) for priority, queue in self.queues.items()}
+            queue_sizes = {
+                priority.value: len(queue) + self._retry_counts[priority]
+                for priority, queue in self.queues.items()
+            }
             
             return {
                 **self.stats.copy(),
                 'queue_sizes_by_priority': queue_sizes,
+                'retry_queue_size': len(self.retry_heap),
+                'next_retry_at': self.retry_heap[0][0] if self.retry_heap else None,
+                'persistence': dict(self.store.stats, path=self.store.path) if self.store else None,
                 'is_online': self.connectivity_monitor.is_online,
                 'processing_active': self.processing_active,
                 'registered_processors': list(self.event_processors.keys())
@@ -497,6 +746,13 @@ class OfflineEventQueue:
         
         if self.processor_task:
             self.processor_task.cancel()
+        
+        if self.store:
+            self.store.flush()
+    
+    def compact(self) -> int:
+        """Drop acknowledged events from the durable store"""
+        return self.store.compact() if self.store else 0
 
 
 # Global queue instance
@@ -7,9 +7,14 @@ Implements decay-based scoring for temporal relevance.
 
 import logging
 import math
+import os
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional, Tuple
-from collections import defaultdict
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+from collections import OrderedDict
+
+import numpy as np
 
 from backend.models.risk_personalization import UserInterestSignal, InterestSignalType
 from backend.services.unified_config import unified_config
@@ -17,11 +22,157 @@ from backend.services.unified_config import unified_config
 logger = logging.getLogger(__name__)
 
 
+# Score boost per interest point
+PROP_TYPE_BOOST = 0.1
+PLAYER_BOOST = 0.15
+
+SECONDS_PER_DAY = 86400.0
+
+
+class UserInterestProfile:
+    """
+    Exponentially decayed prop type and player interest for one user.
+    
+    Scores are stored relative to a reference time: a signal at time t adds
+    weight * exp(rate * (t - reference)) and reading at time now multiplies by
+    exp(-rate * (now - reference)). Recording a signal therefore touches only
+    its own entries; the reference is moved forward (rescaling every score)
+    only when the growth factor gets large.
+    """
+    
+    RENORMALIZE_ABOVE = 1e12
+    
+    def __init__(self, decay_rate: float, reference_time: datetime):
+        self.decay_rate = decay_rate  # per day
+        self.reference_time = reference_time
+        self.prop_type_scores: Dict[str, float] = {}
+        self.player_scores: Dict[str, float] = {}
+        self.total_signals = 0
+        
+    def add(
+        self,
+        weight: float,
+        prop_type: Optional[str],
+        player_id: Optional[str],
+        at: datetime
+    ) -> None:
+        growth = math.exp(self.decay_rate * self._days_since_reference(at))
+        if growth > self.RENORMALIZE_ABOVE:
+            self._renormalize(at)
+            growth = 1.0
+            
+        adjusted_weight = weight * growth
+        if prop_type:
+            self.prop_type_scores[prop_type] = self.prop_type_scores.get(prop_type, 0.0) + adjusted_weight
+        if player_id:
+            self.player_scores[player_id] = self.player_scores.get(player_id, 0.0) + adjusted_weight
+        self.total_signals += 1
+        
+    def scale(self, at: datetime) -> float:
+        """Multiplier turning stored scores into decayed scores at ``at``"""
+        return math.exp(-self.decay_rate * self._days_since_reference(at))
+        
+    def _days_since_reference(self, at: datetime) -> float:
+        return (at - self.reference_time).total_seconds() / SECONDS_PER_DAY
+        
+    def _renormalize(self, at: datetime) -> None:
+        factor = self.scale(at)
+        for scores in (self.prop_type_scores, self.player_scores):
+            for key in scores:
+                scores[key] *= factor
+        self.reference_time = at
+
+
+@dataclass
+class EdgePoolEncoding:
+    """
+    Column encoding of an edge pool: base scores plus prop type and player
+    index columns (-1 where missing). Build it once with encode_edge_pool and
+    rank the same pool for any number of users.
+    """
+    edges: Sequence[Dict[str, Any]]
+    base_scores: np.ndarray
+    prop_type_codes: np.ndarray
+    player_codes: np.ndarray
+    prop_type_index: Dict[str, int]
+    player_index: Dict[str, int]
+    
+    def __len__(self) -> int:
+        return len(self.edges)
+
+
+def encode_edge_pool(edges_pool: Sequence[Dict[str, Any]]) -> EdgePoolEncoding:
+    """Encode an edge pool into columns for vectorized interest scoring"""
+    prop_type_index: Dict[str, int] = {}
+    player_index: Dict[str, int] = {}
+    base_scores = np.empty(len(edges_pool), dtype=float)
+    prop_type_codes = np.full(len(edges_pool), -1, dtype=np.int64)
+    player_codes = np.full(len(edges_pool), -1, dtype=np.int64)
+    
+    for row, edge in enumerate(edges_pool):
+        base_scores[row] = edge.get("ev", 0)  # Base on expected value
+        prop_type = edge.get("prop_type")
+        if prop_type:
+            prop_type_codes[row] = prop_type_index.setdefault(prop_type, len(prop_type_index))
+        player_id = edge.get("player_id")
+        if player_id:
+            player_codes[row] = player_index.setdefault(player_id, len(player_index))
+            
+    return EdgePoolEncoding(
+        edges=edges_pool,
+        base_scores=base_scores,
+        prop_type_codes=prop_type_codes,
+        player_codes=player_codes,
+        prop_type_index=prop_type_index,
+        player_index=player_index,
+    )
+
+
+def _interest_column(
+    scores: Dict[str, float],
+    index: Dict[str, int],
+    codes: np.ndarray,
+    scale: float
+) -> np.ndarray:
+    """Per-edge decayed interest from a user's scores; 0 for missing codes"""
+    # One trailing zero slot absorbs the -1 "missing" code
+    lookup = np.zeros(len(index) + 1)
+    for key, score in scores.items():
+        position = index.get(key)
+        if position is not None:
+            lookup[position] = score * scale
+    return lookup[codes]
+
+
+def _top_k(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k largest values, ordered by value descending and then by
+    position, matching a stable descending sort truncated to k.
+    """
+    count = len(values)
+    k = min(k, count)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < count:
+        candidates = np.argpartition(-values, k - 1)[:k]
+        kth = values[candidates].min()
+        # Ties at the cut-off go to the earliest edges, as with a stable sort
+        above = np.flatnonzero(values > kth)
+        ties = np.flatnonzero(values == kth)[:k - len(above)]
+        candidates = np.concatenate([above, ties])
+    else:
+        candidates = np.arange(count)
+    return candidates[np.lexsort((candidates, -values[candidates]))]
+
+
 class InterestModelService:
     """Service for tracking user interests and providing personalized recommendations"""
     
-    def __init__(self):
+    def __init__(self, max_profiles: Optional[int] = None):
         self.config = unified_config
+        self.max_profiles = max_profiles or int(os.getenv("A1_INTEREST_PROFILE_CACHE_SIZE", "10000"))
+        self._profiles: "OrderedDict[str, UserInterestProfile]" = OrderedDict()
+        self._profiles_lock = threading.Lock()
         
     def record_signal(
         self,
@@ -62,6 +213,8 @@ class InterestModelService:
         )
         
         # TODO: Save to database
+        with self._profiles_lock:
+            self._get_profile(user_id).add(weight, prop_type, player_id, signal.created_at)
         logger.debug("Interest signal recorded: %s", signal)
         
     def get_interest_profile(self, user_id: str) -> Dict[str, Any]:
@@ -77,51 +230,33 @@ class InterestModelService:
         
         logger.info("Generating interest profile: user_id=%s", user_id)
         
-        # In real implementation, this would query UserInterestSignal table
-        # For now, return mock data with realistic structure
-        
-        # Mock data for demonstration
-        signals = self._get_mock_signals(user_id)
-        
-        # Calculate scores with decay
-        prop_type_scores = defaultdict(float)
-        player_scores = defaultdict(float)
-        
         current_time = datetime.now(timezone.utc)
-        decay_rate = self.config.get_config_value("INTEREST_DECAY_RATE", 0.1)
-        
-        for signal in signals:
-            age_days = (current_time - signal["created_at"]).days
-            decay_factor = self._calculate_decay_factor(age_days, decay_rate)
-            adjusted_weight = signal["weight"] * decay_factor
+        with self._profiles_lock:
+            interest = self._get_profile(user_id)
+            scale = interest.scale(current_time)
             
-            # Score prop types
-            if signal["prop_type"]:
-                prop_type_scores[signal["prop_type"]] += adjusted_weight
-                
-            # Score players
-            if signal["player_id"]:
-                player_scores[signal["player_id"]] += adjusted_weight
-                
-        # Sort by score descending
-        prop_type_scores = dict(sorted(
-            prop_type_scores.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        ))
-        
-        player_scores = dict(sorted(
-            player_scores.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        ))
+            # Sort by score descending
+            prop_type_scores = {
+                prop_type: score * scale
+                for prop_type, score in sorted(
+                    interest.prop_type_scores.items(), key=lambda x: x[1], reverse=True
+                )
+            }
+            player_scores = {
+                player_id: score * scale
+                for player_id, score in sorted(
+                    interest.player_scores.items(), key=lambda x: x[1], reverse=True
+                )
+            }
+            total_signals = interest.total_signals
+            decay_rate = interest.decay_rate
         
         profile = {
             "user_id": user_id,
             "generated_at": current_time.isoformat(),
             "prop_type_scores": prop_type_scores,
             "player_scores": player_scores,
-            "total_signals": len(signals),
+            "total_signals": total_signals,
             "decay_rate": decay_rate
         }
         
@@ -135,7 +270,7 @@ class InterestModelService:
     def recommend_edges(
         self,
         user_id: str,
-        edges_pool: List[Dict[str, Any]],
+        edges_pool: Union[List[Dict[str, Any]], EdgePoolEncoding],
         limit: int = 20
     ) -> List[Dict[str, Any]]:
         """
@@ -143,7 +278,8 @@ class InterestModelService:
         
         Args:
             user_id: User ID
-            edges_pool: Pool of available edges to rank
+            edges_pool: Pool of available edges to rank, or its encode_edge_pool()
+                encoding when the same pool is ranked for many users
             limit: Maximum number of edges to return
             
         Returns:
@@ -155,48 +291,34 @@ class InterestModelService:
             user_id, len(edges_pool), limit
         )
         
-        # Get user's interest profile
-        profile = self.get_interest_profile(user_id)
-        prop_type_scores = profile["prop_type_scores"]
-        player_scores = profile["player_scores"]
+        encoding = edges_pool if isinstance(edges_pool, EdgePoolEncoding) else encode_edge_pool(edges_pool)
         
-        # Score each edge
-        scored_edges = []
-        for edge in edges_pool:
-            base_score = edge.get("ev", 0)  # Base on expected value
-            interest_boost = 0.0
-            
-            # Apply prop type interest boost
-            prop_type = edge.get("prop_type")
-            if prop_type and prop_type in prop_type_scores:
-                prop_boost = prop_type_scores[prop_type] * 0.1  # 10% boost per interest point
-                interest_boost += prop_boost
-                
-            # Apply player interest boost
-            player_id = edge.get("player_id")
-            if player_id and player_id in player_scores:
-                player_boost = player_scores[player_id] * 0.15  # 15% boost per interest point
-                interest_boost += player_boost
-                
-            # Calculate final score
-            final_score = base_score + interest_boost
-            
-            edge_with_scores = edge.copy()
+        current_time = datetime.now(timezone.utc)
+        with self._profiles_lock:
+            interest = self._get_profile(user_id)
+            scale = interest.scale(current_time)
+            prop_type_interest = _interest_column(
+                interest.prop_type_scores, encoding.prop_type_index, encoding.prop_type_codes, scale
+            )
+            player_interest = _interest_column(
+                interest.player_scores, encoding.player_index, encoding.player_codes, scale
+            )
+        
+        # Score the whole pool at once, then materialize only the top edges
+        interest_boost = prop_type_interest * PROP_TYPE_BOOST + player_interest * PLAYER_BOOST
+        final_scores = encoding.base_scores + interest_boost
+        
+        recommended_edges = []
+        for row in _top_k(final_scores, limit).tolist():
+            edge_with_scores = dict(encoding.edges[row])
             edge_with_scores.update({
-                "base_score": base_score,
-                "interest_boost": interest_boost,
-                "final_score": final_score,
-                "prop_type_interest": prop_type_scores.get(prop_type, 0),
-                "player_interest": player_scores.get(player_id, 0)
+                "base_score": float(encoding.base_scores[row]),
+                "interest_boost": float(interest_boost[row]),
+                "final_score": float(final_scores[row]),
+                "prop_type_interest": float(prop_type_interest[row]),
+                "player_interest": float(player_interest[row])
             })
-            
-            scored_edges.append(edge_with_scores)
-            
-        # Sort by final score descending
-        scored_edges.sort(key=lambda x: x["final_score"], reverse=True)
-        
-        # Apply limit
-        recommended_edges = scored_edges[:limit]
+            recommended_edges.append(edge_with_scores)
         
         logger.info(
             "Edge recommendations generated: user_id=%s, recommended=%s",
@@ -205,10 +327,37 @@ class InterestModelService:
         
         return recommended_edges
         
-    def _calculate_decay_factor(self, age_days: int, decay_rate: float) -> float:
-        """Calculate decay factor based on age"""
-        # Simple decay function: 1 / (1 + decay_rate * age_days)
-        return 1.0 / (1.0 + decay_rate * age_days)
+    def recommend_edges_for_users(
+        self,
+        user_ids: List[str],
+        edges_pool: List[Dict[str, Any]],
+        limit: int = 20
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Rank one edge pool for several users, encoding the pool once"""
+        encoding = encode_edge_pool(edges_pool)
+        return {
+            user_id: self.recommend_edges(user_id, encoding, limit)
+            for user_id in user_ids
+        }
+        
+    def _get_profile(self, user_id: str) -> UserInterestProfile:
+        """Return the user's live profile, building it on first use (called under lock)"""
+        interest = self._profiles.get(user_id)
+        if interest is not None:
+            self._profiles.move_to_end(user_id)
+            return interest
+        
+        decay_rate = self.config.get_config_value("INTEREST_DECAY_RATE", 0.1)
+        interest = UserInterestProfile(decay_rate, datetime.now(timezone.utc))
+        
+        # TODO: Replay persisted UserInterestSignal rows instead of mock signals
+        for signal in self._get_mock_signals(user_id):
+            interest.add(signal["weight"], signal["prop_type"], signal["player_id"], signal["created_at"])
+        
+        self._profiles[user_id] = interest
+        if len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+        return interest
         
     def _get_mock_signals(self, user_id: str) -> List[Dict[str, Any]]:
         """Generate mock interest signals for demonstration"""
@@ -10,25 +10,175 @@ This service resolves player identification issues between different data source
 This creates a unified mapping system for player identification across all data sources.
 """
 
+import difflib
 import logging
 import re
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import pybaseball as pyb
 
 logger = logging.getLogger("player_id_mapping")
 
+_SUFFIX_PATTERN = r",?\s+(?:jr|sr|ii|iii|iv|v)\.?(?=\s|,|$)"
+_LAST_FIRST_PATTERN = r"^\s*([^,]+?)\s*,\s*(.+?)\s*$"
+
+
+def normalize_player_names(names: pd.Series) -> pd.Series:
+    """
+    Vectorized name key: ASCII, lower case, no suffixes or punctuation,
+    "Last, First" reordered to "first last".
+    """
+    keys = (
+        names.astype("string")
+        .str.normalize("NFKD")
+        .str.encode("ascii", errors="ignore")
+        .str.decode("ascii")
+        .str.lower()
+        .str.replace(_SUFFIX_PATTERN, "", regex=True)
+        .str.replace(_LAST_FIRST_PATTERN, r"\2 \1", regex=True)
+        .str.replace(r"[.'`]", "", regex=True)
+        .str.replace(r"[^a-z0-9]+", " ", regex=True)
+        .str.strip()
+    )
+    return keys.replace("", pd.NA)
+
+
+def normalize_player_name(name: str) -> Optional[str]:
+    """Name key for a single player name (see normalize_player_names)"""
+    if not isinstance(name, str):
+        return None
+    key = normalize_player_names(pd.Series([name])).iloc[0]
+    return None if pd.isna(key) else key
+
+
+class PlayerRegisterIndex:
+    """
+    Local name -> MLBAM ID index built from the Chadwick player register.
+
+    Keys are normalized "first last" names plus alias keys (initials joined,
+    e.g. "J. D. Martinez" -> "jd martinez", and explicit aliases). When two
+    players share a key the most recently active one wins. Unmatched names
+    fall back to a fuzzy match among players with a similar last name.
+    """
+
+    fuzzy_cutoff = 0.85
+
+    def __init__(self, register: pd.DataFrame, aliases: Optional[Dict[str, int]] = None):
+        register = register.dropna(subset=["key_mlbam", "name_last"])
+        register = register[register["key_mlbam"] > 0]
+        if "mlb_played_last" in register.columns:
+            register = register.sort_values("mlb_played_last", ascending=False, na_position="last")
+
+        first = register["name_first"].fillna("").astype(str)
+        full_names = normalize_player_names(first + " " + register["name_last"].astype(str))
+        initials = normalize_player_names(
+            first.str.replace(r"[.\s]+", "", regex=True) + " " + register["name_last"].astype(str)
+        )
+        ids = register["key_mlbam"].astype("int64")
+
+        frames = [pd.DataFrame({"key": full_names, "player_id": ids, "priority": 1})]
+        frames.append(pd.DataFrame({"key": initials, "player_id": ids, "priority": 2}))
+        if aliases:
+            alias_names = pd.Series(list(aliases.keys()), dtype="string")
+            frames.append(pd.DataFrame({
+                "key": normalize_player_names(alias_names).to_numpy(),
+                "player_id": np.fromiter(aliases.values(), dtype="int64", count=len(aliases)),
+                "priority": 0,
+            }))
+        keys = pd.concat(frames, ignore_index=True).dropna(subset=["key"])
+        # Stable sort keeps the most recently active player first within a priority
+        keys = keys.sort_values("priority", kind="stable").drop_duplicates("key")
+        self.keys = keys[["key", "player_id"]].reset_index(drop=True)
+        self._ids = dict(zip(self.keys["key"], self.keys["player_id"]))
+
+        by_last: Dict[str, List[str]] = {}
+        for key in self.keys["key"]:
+            by_last.setdefault(key.rsplit(" ", 1)[-1], []).append(key)
+        self._by_last = by_last
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def load(cls, path: Path, aliases: Optional[Dict[str, int]] = None) -> "PlayerRegisterIndex":
+        return cls(pd.read_pickle(path), aliases=aliases)
+
+    def lookup_key(self, key: Optional[str]) -> Optional[int]:
+        """Exact key lookup, then fuzzy match within similar last names"""
+        if not key:
+            return None
+        player_id = self._ids.get(key)
+        if player_id is not None:
+            return int(player_id)
+
+        last = key.rsplit(" ", 1)[-1]
+        candidates = list(self._by_last.get(last, ()))
+        for similar in difflib.get_close_matches(last, self._by_last.keys(), n=3, cutoff=self.fuzzy_cutoff):
+            if similar != last:
+                candidates.extend(self._by_last[similar])
+        match = difflib.get_close_matches(key, candidates, n=1, cutoff=self.fuzzy_cutoff)
+        return int(self._ids[match[0]]) if match else None
+
+    def resolve(self, names: pd.Series, fuzzy: bool = True) -> pd.Series:
+        """
+        Resolve a whole name column to MLBAM IDs.
+
+        Unique names are normalized once and joined against the index in a
+        single merge; only names with no exact key go through fuzzy matching.
+
+        Returns:
+            Int64 Series aligned with ``names`` (<NA> where unresolved)
+        """
+        codes, uniques = pd.factorize(names, use_na_sentinel=True)
+        unique_keys = normalize_player_names(pd.Series(uniques, dtype="object"))
+        matched = (
+            pd.DataFrame({"key": unique_keys})
+            .merge(self.keys, on="key", how="left", sort=False)["player_id"]
+            .astype("Int64")
+        )
+        if fuzzy:
+            for i in np.flatnonzero(matched.isna().to_numpy() & unique_keys.notna().to_numpy()):
+                player_id = self.lookup_key(unique_keys.iloc[i])
+                if player_id is not None:
+                    matched.iloc[i] = player_id
+
+        ids = matched.to_numpy(dtype="float64", na_value=np.nan)
+        resolved = np.where(codes >= 0, ids[np.maximum(codes, 0)] if len(ids) else np.nan, np.nan)
+        return pd.Series(resolved, index=names.index, name="player_id").astype("Int64")
+
 
 class PlayerIDMappingService:
     """
     Service to handle player ID mapping and normalization across different data sources
     """
 
-    def __init__(self):
-        # Cache for player lookups to avoid repeated API calls
-        self.player_cache: Dict[str, Dict] = {}
-        self.name_cache: Dict[str, int] = {}
+    def __init__(
+        self,
+        register_path: Union[str, Path] = "data/player_register/chadwick_register.pkl",
+        register_ttl_hours: float = 24 * 7,
+        negative_cache_ttl_sec: float = 3600.0,
+        max_cached_names: int = 50_000,
+        aliases: Optional[Dict[str, int]] = None,
+    ):
+        # Bounded cache of resolved names; misses expire so transient
+        # lookup failures are retried
+        self.name_cache: "OrderedDict[str, int]" = OrderedDict()
+        self.max_cached_names = max_cached_names
+        self.negative_cache: Dict[str, float] = {}
+        self.negative_cache_ttl_sec = negative_cache_ttl_sec
+
+        # Local Chadwick register index used for offline resolution
+        self.register_path = Path(register_path)
+        self.register_ttl_hours = register_ttl_hours
+        self.aliases = dict(aliases or {})
+        self._register_index: Optional[PlayerRegisterIndex] = None
+        self._register_checked_at: Optional[float] = None
 
         # Common name variations and normalizations
         self.name_normalizations = {
@@ -44,6 +194,10 @@ class PlayerIDMappingService:
         """
         Normalize Statcast data to include player_id column expected by ML pipeline
 
+        Each event yields one batting row (batter set) followed by one pitching
+        row (pitcher set). The output is gathered from the input with a single
+        ``take`` instead of copying, splitting and concatenating the frame.
+
         Args:
             statcast_data: Raw Statcast DataFrame with 'batter' and 'pitcher' columns
 
@@ -53,61 +207,42 @@ class PlayerIDMappingService:
         logger.info(f"📊 Normalizing Statcast data: {len(statcast_data)} records")
 
         try:
-            # Create a copy to avoid modifying original data
-            normalized_data = statcast_data.copy()
-
             # Check if we have the expected Statcast columns
             if (
-                "batter" not in normalized_data.columns
-                and "pitcher" not in normalized_data.columns
+                "batter" not in statcast_data.columns
+                and "pitcher" not in statcast_data.columns
             ):
                 logger.warning(
                     "⚠️ No 'batter' or 'pitcher' columns found in Statcast data"
                 )
-                return normalized_data
-
-            # For batting events, use batter ID as player_id
-            if "batter" in normalized_data.columns:
-                # Create batting records with player_id from batter column
-                batting_data = normalized_data[normalized_data["batter"].notna()].copy()
-                batting_data["player_id"] = batting_data["batter"].astype(int)
-                batting_data["player_type"] = "batter"
-
-                logger.info(
-                    f"✅ Created {len(batting_data)} batting records with player_id"
-                )
-            else:
-                batting_data = pd.DataFrame()
-
-            # For pitching events, use pitcher ID as player_id
-            if "pitcher" in normalized_data.columns:
-                # Create pitching records with player_id from pitcher column
-                pitching_data = normalized_data[
-                    normalized_data["pitcher"].notna()
-                ].copy()
-                pitching_data["player_id"] = pitching_data["pitcher"].astype(int)
-                pitching_data["player_type"] = "pitcher"
-
-                logger.info(
-                    f"✅ Created {len(pitching_data)} pitching records with player_id"
-                )
-            else:
-                pitching_data = pd.DataFrame()
-
-            # Combine batting and pitching data
-            if len(batting_data) > 0 and len(pitching_data) > 0:
-                # For events that have both batter and pitcher, we'll create two records
-                # This allows us to analyze both batting and pitching performance
-                combined_data = pd.concat(
-                    [batting_data, pitching_data], ignore_index=True
-                )
-            elif len(batting_data) > 0:
-                combined_data = batting_data
-            elif len(pitching_data) > 0:
-                combined_data = pitching_data
-            else:
+                return statcast_data
+
+            positions = []
+            player_ids = []
+            counts = []
+            for role in ("batter", "pitcher"):
+                if role not in statcast_data.columns:
+                    counts.append(0)
+                    continue
+                ids = statcast_data[role].to_numpy()
+                present = np.flatnonzero(pd.notna(ids))
+                positions.append(present)
+                player_ids.append(ids[present].astype("int64"))
+                counts.append(len(present))
+                logger.info(f"✅ Created {len(present)} {role} records with player_id")
+
+            if not sum(counts):
                 logger.warning("⚠️ No valid batter or pitcher data found")
-                return normalized_data
+                return statcast_data
+
+            # For events that have both batter and pitcher, we'll create two records
+            # This allows us to analyze both batting and pitching performance
+            combined_data = statcast_data.take(np.concatenate(positions))
+            combined_data.reset_index(drop=True, inplace=True)
+            combined_data["player_id"] = np.concatenate(player_ids)
+            combined_data["player_type"] = np.repeat(
+                np.array(["batter", "pitcher"], dtype=object), counts
+            )
 
             logger.info(
                 f"✅ Normalized Statcast data: {len(combined_data)} total records"
@@ -118,9 +253,93 @@ class PlayerIDMappingService:
             logger.error(f"❌ Failed to normalize Statcast data: {e}")
             return statcast_data
 
+    def get_register_index(self, refresh: bool = False) -> Optional[PlayerRegisterIndex]:
+        """
+        Load the local player register index, downloading it when missing or stale.
+
+        Falls back to a stale local copy when the download fails, and returns
+        None when no register is available at all.
+        """
+        now = time.monotonic()
+        if (
+            not refresh
+            and self._register_index is not None
+            and self._register_checked_at is not None
+            and now - self._register_checked_at < self.register_ttl_hours * 3600
+        ):
+            return self._register_index
+        if (
+            not refresh
+            and self._register_index is None
+            and self._register_checked_at is not None
+            and now - self._register_checked_at < self.negative_cache_ttl_sec
+        ):
+            return None
+        self._register_checked_at = now
+
+        path = self.register_path
+        fresh = path.exists() and (
+            datetime.now() - datetime.fromtimestamp(path.stat().st_mtime)
+        ).total_seconds() < self.register_ttl_hours * 3600
+        if not fresh or refresh:
+            try:
+                register = pyb.chadwick_register()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                register.to_pickle(tmp_path)
+                tmp_path.replace(path)
+                self._register_index = PlayerRegisterIndex(register, aliases=self.aliases)
+                logger.info(f"✅ Player register refreshed: {len(self._register_index)} name keys")
+                return self._register_index
+            except Exception as e:
+                logger.warning(f"⚠️ Could not download player register: {e}")
+
+        if path.exists():
+            try:
+                self._register_index = PlayerRegisterIndex.load(path, aliases=self.aliases)
+                logger.info(f"📁 Loaded player register index: {len(self._register_index)} name keys")
+            except Exception as e:
+                logger.error(f"❌ Failed to load player register {path}: {e}")
+        return self._register_index
+
+    def _cache_result(self, player_name: str, player_id: Optional[int]) -> None:
+        if player_id is None:
+            self.negative_cache[player_name] = time.monotonic() + self.negative_cache_ttl_sec
+            return
+        self.negative_cache.pop(player_name, None)
+        self.name_cache[player_name] = player_id
+        self.name_cache.move_to_end(player_name)
+        while len(self.name_cache) > self.max_cached_names:
+            self.name_cache.popitem(last=False)
+
+    def resolve_player_ids(self, names: pd.Series, fuzzy: bool = True) -> pd.Series:
+        """
+        Resolve a column of player names to MLB player IDs in bulk
+
+        Args:
+            names: Series of player names in any common format
+            fuzzy: Whether to fuzzy-match names with no exact register key
+
+        Returns:
+            Int64 Series of MLB player IDs aligned with ``names``
+        """
+        index = self.get_register_index()
+        if index is not None:
+            resolved = index.resolve(names, fuzzy=fuzzy)
+            logger.info(
+                f"✅ Resolved {int(resolved.notna().sum())}/{len(names)} player names from local register"
+            )
+            return resolved
+
+        # No register available: resolve each unique name once online
+        uniques = pd.unique(names.dropna())
+        lookup = {name: self.get_player_id_from_name(name) for name in uniques}
+        return names.map(lookup).astype("Int64").rename("player_id")
+
     def get_player_id_from_name(self, player_name: str) -> Optional[int]:
         """
-        Get MLB player ID from player name using pybaseball lookup
+        Get MLB player ID from player name using the local register index,
+        falling back to a pybaseball lookup when no register is available
 
         Args:
             player_name: Player name in "First Last" format
@@ -133,7 +352,21 @@ class PlayerIDMappingService:
 
         # Check cache first
         if player_name in self.name_cache:
+            self.name_cache.move_to_end(player_name)
             return self.name_cache[player_name]
+        expires_at = self.negative_cache.get(player_name)
+        if expires_at is not None:
+            if time.monotonic() < expires_at:
+                return None
+            del self.negative_cache[player_name]
+
+        index = self.get_register_index()
+        if index is not None:
+            player_id = index.lookup_key(normalize_player_name(player_name))
+            if player_id is None:
+                logger.warning(f"⚠️ No player found for: {player_name}")
+            self._cache_result(player_name, player_id)
+            return player_id
 
         try:
             # Parse name into first and last
@@ -151,18 +384,18 @@ class PlayerIDMappingService:
             if len(players) > 0:
                 # Get the most recent player (highest key_mlbam)
                 player_id = int(players.iloc[0]["key_mlbam"])
-                self.name_cache[player_name] = player_id
+                self._cache_result(player_name, player_id)
 
                 logger.info(f"✅ Found player ID for {player_name}: {player_id}")
                 return player_id
             else:
                 logger.warning(f"⚠️ No player found for: {player_name}")
-                self.name_cache[player_name] = None
+                self._cache_result(player_name, None)
                 return None
 
         except Exception as e:
             logger.error(f"❌ Error looking up player {player_name}: {e}")
-            self.name_cache[player_name] = None
+            self._cache_result(player_name, None)
             return None
 
     def create_unified_player_mapping(
@@ -213,14 +446,19 @@ class PlayerIDMappingService:
         unique_all_players = list(set(all_players))
         mapping_data = []
 
+        # Resolve all player names in one bulk pass
+        player_names = pd.Series([p for p in unique_all_players if isinstance(p, str)], dtype=object)
+        resolved_ids = self.resolve_player_ids(player_names) if len(player_names) else player_names
+        name_ids = dict(zip(player_names, resolved_ids))
+
         for player in unique_all_players:
             if isinstance(player, str):
                 # Player name - lookup ID
-                player_id = self.get_player_id_from_name(player)
+                player_id = name_ids.get(player)
                 mapping_data.append(
                     {
                         "player_name": player,
-                        "player_id": player_id,
+                        "player_id": None if pd.isna(player_id) else int(player_id),
                         "source_type": "name",
                     }
                 )
@@ -17,13 +17,17 @@ import asyncio
 import json
 import logging
 import os
+import struct
+import sys
 import time
+import zlib
+from array import array
 from collections import defaultdict, deque
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from ..services.unified_config import get_streaming_config
 
@@ -69,16 +73,152 @@ class IntegrityIssue:
     remediation_details: Optional[Dict[str, Any]] = None
 
 
-@dataclass 
-class DependencySnapshot:
-    """Serializable snapshot of dependency index state"""
-    timestamp: float
-    node_count: int
-    edge_count: int
-    integrity_issues_count: int
-    nodes: Dict[str, Dict[int, Dict[str, Any]]]
-    integrity_issues: List[Dict[str, Any]]
-    metadata: Dict[str, Any]
+# Dependency index persistence: an append-only binary write-ahead log plus
+# periodic columnar checkpoints. A WAL record is ``<len><crc32><payload>``
+# and every payload starts with ``<lsn><op><timestamp>``.
+_WAL_HEADER = struct.Struct("<II")
+_WAL_PREFIX = struct.Struct("<QBd")
+_WAL_ID = struct.Struct("<q")
+_WAL_EDGE = struct.Struct("<qq")
+_WAL_TICKET = struct.Struct("<qI")
+_WAL_KEY = struct.Struct("<Bq")
+
+_WAL_OP_PROP = 1
+_WAL_OP_EDGE = 2
+_WAL_OP_TICKET = 3
+_WAL_OP_STATUS = 4
+_WAL_OP_DELETE = 5
+
+_ENTITY_CODES = {"prop": 0, "edge": 1, "ticket": 2}
+_ENTITY_NAMES = {code: name for name, code in _ENTITY_CODES.items()}
+
+_CHECKPOINT_MAGIC = b"A1DI"
+_CHECKPOINT_VERSION = 1
+_CHECKPOINT_HEADER = struct.Struct("<4sHQdI")
+_SECTION_LEN = struct.Struct("<Q")
+# Column name -> array typecode, in file order. Dependencies and dependents
+# are stored CSR-style: per-node offsets into flat (type, id) columns.
+_CHECKPOINT_COLUMNS = (
+    ("types", "B"),
+    ("ids", "q"),
+    ("status_codes", "H"),
+    ("last_updated", "d"),
+    ("dep_offsets", "I"),
+    ("dep_types", "B"),
+    ("dep_ids", "q"),
+    ("rdep_offsets", "I"),
+    ("rdep_types", "B"),
+    ("rdep_ids", "q"),
+)
+
+
+def _pack_status(status: str) -> bytes:
+    raw = status.encode("utf-8")[:255]
+    return bytes((len(raw),)) + raw
+
+
+def _unpack_status(buf: memoryview, offset: int) -> str:
+    length = buf[offset]
+    return bytes(buf[offset + 1:offset + 1 + length]).decode("utf-8", "ignore")
+
+
+def _file_sequence(path: Path) -> int:
+    """LSN encoded in a ``wal_*``/``checkpoint_*`` file name"""
+    return int(path.stem.split("_", 1)[1])
+
+
+def _read_wal_records(path: Path) -> Iterator[Tuple[int, int, float, memoryview]]:
+    """Yield ``(lsn, op, timestamp, body)`` from one WAL segment.
+
+    Stops at the first short or corrupt record: a torn tail left by a crash
+    mid-write. Later segments are still replayed, since a restarted writer
+    always opens a fresh segment.
+    """
+    data = path.read_bytes()
+    view = memoryview(data)
+    offset = 0
+    while offset + _WAL_HEADER.size <= len(data):
+        length, crc = _WAL_HEADER.unpack_from(data, offset)
+        start = offset + _WAL_HEADER.size
+        payload = view[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        lsn, op, timestamp = _WAL_PREFIX.unpack_from(payload)
+        yield lsn, op, timestamp, payload[_WAL_PREFIX.size:]
+        offset = start + length
+    if offset < len(data):
+        logging.getLogger("dependency_index").warning("Truncated WAL tail ignored", extra={
+            "category": "dependency_index",
+            "action": "wal_torn_tail",
+            "wal_segment": path.name,
+            "bytes_ignored": len(data) - offset,
+        })
+
+
+def _column_bytes(column: array) -> bytes:
+    if sys.byteorder != "little":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _column_from_bytes(typecode: str, raw: bytes) -> array:
+    column = array(typecode)
+    column.frombytes(raw)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column
+
+
+def _write_checkpoint(path: Path, lsn: int, timestamp: float,
+                      columns: Dict[str, Any], extra: Dict[str, Any]) -> int:
+    """Write a checkpoint atomically (tmp file + fsync + rename), return its size"""
+    meta = dict(extra, statuses=columns["statuses"])
+    sections = [_column_bytes(columns[name]) for name, _ in _CHECKPOINT_COLUMNS]
+    sections.append(json.dumps(meta, separators=(",", ":")).encode("utf-8"))
+
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_CHECKPOINT_HEADER.pack(
+            _CHECKPOINT_MAGIC, _CHECKPOINT_VERSION, lsn, timestamp, len(columns["ids"])
+        ))
+        for section in sections:
+            f.write(_SECTION_LEN.pack(len(section)))
+            f.write(section)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return path.stat().st_size
+
+
+def _read_checkpoint(path: Path) -> Dict[str, Any]:
+    data = path.read_bytes()
+    magic, version, lsn, timestamp, node_count = _CHECKPOINT_HEADER.unpack_from(data)
+    if magic != _CHECKPOINT_MAGIC or version != _CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint format in {path.name}")
+    offset = _CHECKPOINT_HEADER.size
+    sections = []
+    for _ in range(len(_CHECKPOINT_COLUMNS) + 1):
+        (length,) = _SECTION_LEN.unpack_from(data, offset)
+        offset += _SECTION_LEN.size
+        sections.append(data[offset:offset + length])
+        offset += length
+    columns = {
+        name: _column_from_bytes(typecode, raw)
+        for (name, typecode), raw in zip(_CHECKPOINT_COLUMNS, sections)
+    }
+    return {
+        "lsn": lsn,
+        "timestamp": timestamp,
+        "node_count": node_count,
+        "columns": columns,
+        "meta": json.loads(sections[-1].decode("utf-8")),
+    }
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
 
 
 class DependencyIndex:
@@ -87,9 +227,15 @@ class DependencyIndex:
     
     Tracks relationships between props -> edges -> tickets and maintains
     integrity through verification and auto-remediation.
+
+    Every mutation is appended to a binary write-ahead log (group-committed
+    by the background worker) and the graph is periodically compacted into a
+    columnar checkpoint. Recovery loads the newest checkpoint and replays the
+    WAL records logged after it.
     """
     
-    def __init__(self, persist_dir: Optional[str] = None):
+    def __init__(self, persist_dir: Optional[str] = None, wal_enabled: bool = True,
+                 recover_on_start: bool = True):
         self.logger = logging.getLogger("dependency_index")
         self.persist_dir = Path(persist_dir) if persist_dir else Path("./data/dependency_snapshots")
         self.persist_dir.mkdir(parents=True, exist_ok=True)
@@ -114,6 +260,34 @@ class DependencyIndex:
         self.snapshot_interval_sec = 300  # 5 minutes
         self.verification_interval_sec = 60  # 1 minute
         self._background_verification_enabled = True  # Can be disabled for testing
+        self.wal_enabled = wal_enabled
+        self.recover_on_start = recover_on_start
+        self.wal_flush_interval_sec = 1.0  # group commit window
+        self.wal_flush_bytes = 256 * 1024  # flush early once this much is buffered
+        self.wal_fsync = True
+        self.checkpoint_yield_every = 2048  # nodes copied between event loop yields
+        self.max_checkpoints = 10
+        
+        # Write-ahead log state. Records are buffered on the hot path and
+        # written by flush_wal(); the queue holds sealed chunks (bytes) and
+        # segment roll markers (the first LSN of the next segment).
+        self._lsn = 0
+        self._wal_ready = False
+        self._wal_buffer = bytearray()
+        self._wal_queue: deque = deque()
+        self._wal_file = None
+        self._wal_next_segment = 1
+        self._wal_io_lock = asyncio.Lock()
+        self._wal_wakeup = asyncio.Event()
+        self.wal_bytes_written = 0
+        
+        # Checkpoint copy-on-write view: while a checkpoint is being built,
+        # the first mutation of a node captured in the view saves its
+        # pre-image, so the checkpoint sees the graph as of its LSN.
+        self._checkpoint_lock = asyncio.Lock()
+        self._cow_view: Optional[Dict[Tuple[str, int], DependencyNode]] = None
+        self._cow_preimages: Dict[Tuple[str, int], Tuple[str, float, tuple, tuple]] = {}
+        self.last_checkpoint_lsn = 0
         
         # Background task tracking
         self._verification_task: Optional[asyncio.Task] = None
@@ -123,6 +297,8 @@ class DependencyIndex:
         """Start background verification and snapshotting tasks"""
         try:
             loop = asyncio.get_running_loop()
+            if self.recover_on_start and not self.nodes and self._has_persisted_state():
+                await self.load_snapshot()
             self._verification_task = loop.create_task(self._integrity_verifier_worker())
             self._snapshot_task = loop.create_task(self._snapshot_worker())
             
@@ -135,22 +311,21 @@ class DependencyIndex:
         except RuntimeError:
             self.logger.info("DependencyIndex will start background tasks on first use")
     
+    async def close(self) -> None:
+        """Stop background tasks and flush the WAL to disk"""
+        for task in (self._verification_task, self._snapshot_task):
+            if task:
+                task.cancel()
+        await self.flush_wal()
+        async with self._wal_io_lock:
+            await asyncio.to_thread(self._close_wal_file)
+    
     async def update_prop(self, prop_id: int, status: str = "active") -> None:
         """Update prop status in dependency index"""
         async with self.node_lock:
-            key = ("prop", prop_id)
-            if key not in self.nodes:
-                self.nodes[key] = DependencyNode(
-                    entity_type="prop", 
-                    entity_id=prop_id,
-                    status=status,
-                    last_updated=time.time()
-                )
-            else:
-                self.nodes[key].status = status
-                self.nodes[key].last_updated = time.time()
-            
-            self.update_count += 1
+            now = time.time()
+            self._apply_prop(prop_id, status, now)
+            self._log(_WAL_OP_PROP, now, _WAL_ID.pack(prop_id) + _pack_status(status))
             
             self.logger.debug("Prop updated in dependency index", extra={
                 "category": "dependency_index",
@@ -163,28 +338,9 @@ class DependencyIndex:
     async def update_edge(self, edge_id: int, prop_id: int, status: str = "active") -> None:
         """Update edge and its prop dependency"""
         async with self.node_lock:
-            # Ensure prop exists
-            await self._ensure_node_exists("prop", prop_id)
-            
-            # Update/create edge
-            edge_key = ("edge", edge_id)
-            if edge_key not in self.nodes:
-                self.nodes[edge_key] = DependencyNode(
-                    entity_type="edge",
-                    entity_id=edge_id, 
-                    status=status,
-                    last_updated=time.time()
-                )
-            else:
-                self.nodes[edge_key].status = status
-                self.nodes[edge_key].last_updated = time.time()
-            
-            # Update dependencies
-            prop_key = ("prop", prop_id)
-            self.nodes[edge_key].dependencies.add(prop_key)
-            self.nodes[prop_key].dependents.add(edge_key)
-            
-            self.update_count += 1
+            now = time.time()
+            self._apply_edge(edge_id, prop_id, status, now)
+            self._log(_WAL_OP_EDGE, now, _WAL_EDGE.pack(edge_id, prop_id) + _pack_status(status))
             
             self.logger.debug("Edge updated in dependency index", extra={
                 "category": "dependency_index",
@@ -198,39 +354,14 @@ class DependencyIndex:
     async def update_ticket(self, ticket_id: int, edge_ids: List[int], status: str = "active") -> None:
         """Update ticket and its edge dependencies"""
         async with self.node_lock:
-            # Ensure all edges exist
-            for edge_id in edge_ids:
-                await self._ensure_node_exists("edge", edge_id)
-            
-            # Update/create ticket
-            ticket_key = ("ticket", ticket_id)
-            if ticket_key not in self.nodes:
-                self.nodes[ticket_key] = DependencyNode(
-                    entity_type="ticket",
-                    entity_id=ticket_id,
-                    status=status,
-                    last_updated=time.time()
-                )
-            else:
-                self.nodes[ticket_key].status = status
-                self.nodes[ticket_key].last_updated = time.time()
-            
-            # Clear old dependencies and rebuild
-            old_deps = set(self.nodes[ticket_key].dependencies)
-            self.nodes[ticket_key].dependencies.clear()
-            
-            # Remove this ticket from old dependencies' dependents
-            for old_dep in old_deps:
-                if old_dep in self.nodes:
-                    self.nodes[old_dep].dependents.discard(ticket_key)
-            
-            # Add new dependencies
-            for edge_id in edge_ids:
-                edge_key = ("edge", edge_id)
-                self.nodes[ticket_key].dependencies.add(edge_key)
-                self.nodes[edge_key].dependents.add(ticket_key)
-            
-            self.update_count += 1
+            now = time.time()
+            self._apply_ticket(ticket_id, edge_ids, status, now)
+            self._log(
+                _WAL_OP_TICKET, now,
+                _WAL_TICKET.pack(ticket_id, len(edge_ids))
+                + struct.pack(f"<{len(edge_ids)}q", *edge_ids)
+                + _pack_status(status),
+            )
             
             self.logger.debug("Ticket updated in dependency index", extra={
                 "category": "dependency_index",
@@ -243,14 +374,236 @@ class DependencyIndex:
     
     async def _ensure_node_exists(self, entity_type: str, entity_id: int) -> None:
         """Ensure a node exists in the index (create if missing)"""
+        self._ensure_node(entity_type, entity_id, time.time())
+    
+    # === Graph mutations (shared by the live path and WAL replay) ===
+    
+    def _touch(self, key: Tuple[str, int]) -> None:
+        """Save a node's pre-image before its first change during a checkpoint"""
+        view = self._cow_view
+        if view is None or key in self._cow_preimages:
+            return
+        node = view.get(key)
+        if node is not None:
+            self._cow_preimages[key] = (
+                node.status, node.last_updated,
+                tuple(node.dependencies), tuple(node.dependents),
+            )
+    
+    def _ensure_node(self, entity_type: str, entity_id: int, timestamp: float) -> DependencyNode:
         key = (entity_type, entity_id)
-        if key not in self.nodes:
-            self.nodes[key] = DependencyNode(
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = DependencyNode(
                 entity_type=entity_type,
                 entity_id=entity_id,
                 status="unknown",  # Will be updated by next update
-                last_updated=time.time()
+                last_updated=timestamp
+            )
+        return node
+    
+    def _upsert_node(self, entity_type: str, entity_id: int, status: str,
+                     timestamp: float) -> DependencyNode:
+        key = (entity_type, entity_id)
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = DependencyNode(
+                entity_type=entity_type,
+                entity_id=entity_id,
+                status=status,
+                last_updated=timestamp
             )
+        else:
+            self._touch(key)
+            node.status = status
+            node.last_updated = timestamp
+        return node
+    
+    def _apply_prop(self, prop_id: int, status: str, timestamp: float) -> None:
+        self._upsert_node("prop", prop_id, status, timestamp)
+        self.update_count += 1
+    
+    def _apply_edge(self, edge_id: int, prop_id: int, status: str, timestamp: float) -> None:
+        prop_key = ("prop", prop_id)
+        edge_key = ("edge", edge_id)
+        prop = self._ensure_node("prop", prop_id, timestamp)
+        edge = self._upsert_node("edge", edge_id, status, timestamp)
+        
+        edge.dependencies.add(prop_key)
+        if edge_key not in prop.dependents:
+            self._touch(prop_key)
+            prop.dependents.add(edge_key)
+        self.update_count += 1
+    
+    def _apply_ticket(self, ticket_id: int, edge_ids: List[int], status: str,
+                      timestamp: float) -> None:
+        ticket_key = ("ticket", ticket_id)
+        for edge_id in edge_ids:
+            self._ensure_node("edge", edge_id, timestamp)
+        ticket = self._upsert_node("ticket", ticket_id, status, timestamp)
+        
+        # Replace dependencies, unlinking edges the ticket no longer uses
+        new_deps = {("edge", edge_id) for edge_id in edge_ids}
+        for old_dep in ticket.dependencies - new_deps:
+            old_node = self.nodes.get(old_dep)
+            if old_node is not None:
+                self._touch(old_dep)
+                old_node.dependents.discard(ticket_key)
+        ticket.dependencies.clear()
+        ticket.dependencies.update(new_deps)
+        
+        for edge_key in new_deps:
+            edge = self.nodes[edge_key]
+            if ticket_key not in edge.dependents:
+                self._touch(edge_key)
+                edge.dependents.add(ticket_key)
+        self.update_count += 1
+    
+    def _apply_status(self, key: Tuple[str, int], status: str, timestamp: float) -> None:
+        node = self.nodes.get(key)
+        if node is not None:
+            self._touch(key)
+            node.status = status
+            node.last_updated = timestamp
+    
+    def _apply_delete(self, key: Tuple[str, int]) -> Optional[DependencyNode]:
+        node = self.nodes.get(key)
+        if node is None:
+            return None
+        self._touch(key)
+        for dependent_key in node.dependents:
+            if dependent_key in self.nodes:
+                self._touch(dependent_key)
+                self.nodes[dependent_key].dependencies.discard(key)
+        for dependency_key in node.dependencies:
+            if dependency_key in self.nodes:
+                self._touch(dependency_key)
+                self.nodes[dependency_key].dependents.discard(key)
+        del self.nodes[key]
+        return node
+    
+    def _set_node_status(self, key: Tuple[str, int], status: str, timestamp: float) -> None:
+        """Status change made by verification/remediation, logged to the WAL"""
+        self._apply_status(key, status, timestamp)
+        self._log(_WAL_OP_STATUS, timestamp,
+                  _WAL_KEY.pack(_ENTITY_CODES[key[0]], key[1]) + _pack_status(status))
+    
+    def _delete_node(self, key: Tuple[str, int]) -> Optional[DependencyNode]:
+        node = self._apply_delete(key)
+        if node is not None:
+            self._log(_WAL_OP_DELETE, time.time(), _WAL_KEY.pack(_ENTITY_CODES[key[0]], key[1]))
+        return node
+    
+    def _replay_record(self, op: int, timestamp: float, body: memoryview) -> None:
+        if op == _WAL_OP_PROP:
+            (prop_id,) = _WAL_ID.unpack_from(body)
+            self._apply_prop(prop_id, _unpack_status(body, _WAL_ID.size), timestamp)
+        elif op == _WAL_OP_EDGE:
+            edge_id, prop_id = _WAL_EDGE.unpack_from(body)
+            self._apply_edge(edge_id, prop_id, _unpack_status(body, _WAL_EDGE.size), timestamp)
+        elif op == _WAL_OP_TICKET:
+            ticket_id, count = _WAL_TICKET.unpack_from(body)
+            edge_ids = list(struct.unpack_from(f"<{count}q", body, _WAL_TICKET.size))
+            status = _unpack_status(body, _WAL_TICKET.size + 8 * count)
+            self._apply_ticket(ticket_id, edge_ids, status, timestamp)
+        elif op == _WAL_OP_STATUS:
+            code, entity_id = _WAL_KEY.unpack_from(body)
+            key = (_ENTITY_NAMES[code], entity_id)
+            self._apply_status(key, _unpack_status(body, _WAL_KEY.size), timestamp)
+        elif op == _WAL_OP_DELETE:
+            code, entity_id = _WAL_KEY.unpack_from(body)
+            self._apply_delete((_ENTITY_NAMES[code], entity_id))
+    
+    # === Write-ahead log ===
+    
+    def _wal_segments(self) -> List[Path]:
+        return sorted(self.persist_dir.glob("wal_*.bin"), key=_file_sequence)
+    
+    def _checkpoint_files(self) -> List[Path]:
+        return sorted(self.persist_dir.glob("checkpoint_*.bin"), key=_file_sequence)
+    
+    def _has_persisted_state(self) -> bool:
+        return bool(self._checkpoint_files() or self._wal_segments())
+    
+    def _resume_lsn(self) -> None:
+        """Continue LSN numbering after whatever is already on disk"""
+        self._wal_ready = True
+        last = self._lsn
+        checkpoints = self._checkpoint_files()
+        if checkpoints:
+            last = max(last, _file_sequence(checkpoints[-1]))
+        segments = self._wal_segments()
+        if segments:
+            last = max(last, _file_sequence(segments[-1]) - 1)
+            for lsn, _, _, _ in _read_wal_records(segments[-1]):
+                last = max(last, lsn)
+        self._lsn = last
+        # Never append to an existing segment: it may end in a torn record
+        self._wal_queue.append(last + 1)
+    
+    def _log(self, op: int, timestamp: float, body: bytes) -> None:
+        """Append a mutation record to the WAL buffer (caller holds node_lock)"""
+        if not self.wal_enabled:
+            return
+        if not self._wal_ready:
+            self._resume_lsn()
+        self._lsn += 1
+        payload = _WAL_PREFIX.pack(self._lsn, op, timestamp) + body
+        self._wal_buffer += _WAL_HEADER.pack(len(payload), zlib.crc32(payload))
+        self._wal_buffer += payload
+        if len(self._wal_buffer) >= self.wal_flush_bytes:
+            self._wal_wakeup.set()
+    
+    def _roll_wal(self) -> None:
+        """Seal the buffered records; later records go to a new segment"""
+        if self._wal_buffer:
+            self._wal_queue.append(bytes(self._wal_buffer))
+            self._wal_buffer = bytearray()
+        self._wal_queue.append(self._lsn + 1)
+    
+    async def flush_wal(self) -> None:
+        """Group-commit buffered WAL records to disk"""
+        async with self._wal_io_lock:
+            self._wal_wakeup.clear()
+            items = list(self._wal_queue)
+            self._wal_queue.clear()
+            if self._wal_buffer:
+                items.append(bytes(self._wal_buffer))
+                self._wal_buffer = bytearray()
+            if items:
+                await asyncio.to_thread(self._write_wal_items, items)
+    
+    def _write_wal_items(self, items: List[Union[bytes, int]]) -> None:
+        for item in items:
+            if isinstance(item, int):
+                self._close_wal_file()
+                self._wal_next_segment = item
+            elif item:
+                if self._wal_file is None:
+                    segment = self.persist_dir / f"wal_{self._wal_next_segment:020d}.bin"
+                    self._wal_file = open(segment, "ab")
+                self._wal_file.write(item)
+                self.wal_bytes_written += len(item)
+        if self._wal_file is not None:
+            self._wal_file.flush()
+            if self.wal_fsync:
+                os.fsync(self._wal_file.fileno())
+    
+    def _close_wal_file(self) -> None:
+        if self._wal_file is None:
+            return
+        self._wal_file.flush()
+        os.fsync(self._wal_file.fileno())
+        self._wal_file.close()
+        self._wal_file = None
+    
+    def _load_wal_tail(self, after_lsn: int) -> List[Tuple[int, int, float, memoryview]]:
+        return [
+            record
+            for segment in self._wal_segments()
+            for record in _read_wal_records(segment)
+            if record[0] > after_lsn
+        ]
     
     async def get_dependency_health(self) -> Dict[str, Any]:
         """Get comprehensive dependency health status"""
@@ -304,9 +657,17 @@ class DependencyIndex:
     async def _get_latest_snapshot_info(self) -> Optional[Dict[str, Any]]:
         """Get information about the latest snapshot"""
         try:
-            snapshots = list(self.persist_dir.glob("snapshot_*.json"))
+            segments = self._wal_segments()
+            wal_info = {
+                "segments": len(segments),
+                "size_bytes": sum(p.stat().st_size for p in segments),
+                "buffered_bytes": len(self._wal_buffer),
+                "last_lsn": self._lsn,
+                "checkpoint_lsn": self.last_checkpoint_lsn,
+            }
+            snapshots = self._checkpoint_files() or list(self.persist_dir.glob("snapshot_*.json"))
             if not snapshots:
-                return None
+                return {"wal": wal_info} if segments else None
             
             latest = max(snapshots, key=lambda p: p.stat().st_mtime)
             stat = latest.stat()
@@ -316,6 +677,7 @@ class DependencyIndex:
                 "timestamp": stat.st_mtime,
                 "size_bytes": stat.st_size,
                 "age_sec": time.time() - stat.st_mtime,
+                "wal": wal_info,
             }
         except Exception:
             return None
@@ -411,7 +773,7 @@ class DependencyIndex:
                         
                         # Mark as stale status
                         if node.status == "active":
-                            node.status = "stale"
+                            self._set_node_status((entity_type, entity_id), "stale", node.last_updated)
         
         self.verification_runs += 1
         self.last_full_verification = time.time()
@@ -543,8 +905,7 @@ class DependencyIndex:
             if action == RemediationAction.AUTO_RETIRE:
                 if key in self.nodes:
                     old_status = self.nodes[key].status
-                    self.nodes[key].status = "retired"
-                    self.nodes[key].last_updated = time.time()
+                    self._set_node_status(key, "retired", time.time())
                     
                     # Update issue with remediation details
                     issue.remediation_action = action
@@ -571,20 +932,8 @@ class DependencyIndex:
             elif action == RemediationAction.CASCADE_DELETE:
                 # Remove the node and update dependents
                 if key in self.nodes:
-                    node = self.nodes[key]
-                    
-                    # Notify dependents of deletion
-                    for dependent_key in node.dependents:
-                        if dependent_key in self.nodes:
-                            self.nodes[dependent_key].dependencies.discard(key)
-                    
-                    # Remove from dependencies' dependents
-                    for dependency_key in node.dependencies:
-                        if dependency_key in self.nodes:
-                            self.nodes[dependency_key].dependents.discard(key)
-                    
-                    # Remove the node
-                    del self.nodes[key]
+                    # Unlink from dependents and dependencies, then remove
+                    node = self._delete_node(key)
                     
                     issue.remediation_action = action
                     issue.remediation_applied_at = time.time()
@@ -616,11 +965,20 @@ class DependencyIndex:
             })
     
     async def _snapshot_worker(self) -> None:
-        """Background task to create periodic snapshots"""
+        """Background group commit of the WAL plus periodic checkpoints"""
+        last_checkpoint = time.time()
         while True:
             try:
-                await asyncio.sleep(self.snapshot_interval_sec)
-                await self._create_snapshot()
+                try:
+                    await asyncio.wait_for(self._wal_wakeup.wait(), timeout=self.wal_flush_interval_sec)
+                except asyncio.TimeoutError:
+                    pass
+                await self.flush_wal()
+                if time.time() - last_checkpoint >= self.snapshot_interval_sec:
+                    last_checkpoint = time.time()
+                    await self._create_snapshot()
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 self.logger.error("Snapshot worker error", extra={
                     "category": "dependency_index",
@@ -629,93 +987,171 @@ class DependencyIndex:
                 })
                 await asyncio.sleep(60)  # Back off on error
     
+    def _serialize_issue(self, issue: IntegrityIssue) -> Dict[str, Any]:
+        return {
+            "issue_type": issue.issue_type.value,
+            "entity_type": issue.entity_type,
+            "entity_id": issue.entity_id,
+            "description": issue.description,
+            "severity": issue.severity,
+            "detected_at": issue.detected_at,
+            "remediation_action": issue.remediation_action.value if issue.remediation_action else None,
+            "remediation_applied_at": issue.remediation_applied_at,
+            "remediation_details": issue.remediation_details,
+        }
+    
+    def _restore_issue(self, issue_data: Dict[str, Any]) -> None:
+        issue_id = f"{issue_data['issue_type']}_{issue_data['entity_type']}_{issue_data['entity_id']}"
+        
+        self.integrity_issues[issue_id] = IntegrityIssue(
+            issue_type=IntegrityIssueType(issue_data["issue_type"]),
+            entity_type=issue_data["entity_type"],
+            entity_id=issue_data["entity_id"],
+            description=issue_data["description"],
+            severity=issue_data["severity"],
+            detected_at=issue_data["detected_at"],
+            remediation_action=RemediationAction(issue_data["remediation_action"]) if issue_data.get("remediation_action") else None,
+            remediation_applied_at=issue_data.get("remediation_applied_at"),
+            remediation_details=issue_data.get("remediation_details")
+        )
+    
+    def _restore_metadata(self, metadata: Dict[str, Any]) -> None:
+        self.update_count = metadata.get("updates_processed", 0)
+        self.verification_runs = metadata.get("verification_runs", 0)
+        self.remediation_count = metadata.get("remediations_applied", 0)
+    
     async def _create_snapshot(self) -> str:
-        """Create a persistence snapshot of the current state"""
-        timestamp = time.time()
+        """Write a compacted columnar checkpoint and retire covered WAL segments.
         
-        async with self.node_lock:
-            async with self.integrity_lock:
-                # Prepare serializable snapshot
-                nodes_by_type = defaultdict(dict)
-                for (entity_type, entity_id), node in self.nodes.items():
-                    nodes_by_type[entity_type][entity_id] = {
-                        "status": node.status,
-                        "last_updated": node.last_updated,
-                        "dependents": [(t, i) for t, i in node.dependents],
-                        "dependencies": [(t, i) for t, i in node.dependencies],
-                    }
-                
-                # Serialize integrity issues
-                serialized_issues = []
-                for issue in self.integrity_issues.values():
-                    serialized_issues.append({
-                        "issue_type": issue.issue_type.value,
-                        "entity_type": issue.entity_type,
-                        "entity_id": issue.entity_id,
-                        "description": issue.description,
-                        "severity": issue.severity,
-                        "detected_at": issue.detected_at,
-                        "remediation_action": issue.remediation_action.value if issue.remediation_action else None,
-                        "remediation_applied_at": issue.remediation_applied_at,
-                        "remediation_details": issue.remediation_details,
-                    })
-                
-                snapshot = DependencySnapshot(
-                    timestamp=timestamp,
-                    node_count=len(self.nodes),
-                    edge_count=sum(1 for (t, _) in self.nodes.keys() if t == "edge"),
-                    integrity_issues_count=len(self.integrity_issues),
-                    nodes=dict(nodes_by_type),
-                    integrity_issues=serialized_issues,
-                    metadata={
+        Only capturing the view (a shallow copy of the node map and the
+        integrity issues) happens under the locks. Node contents are copied
+        afterwards in chunks, yielding to the event loop; updates landing
+        meanwhile save a pre-image first, so the checkpoint reflects exactly
+        the state at its LSN while ingestion keeps running.
+        """
+        async with self._checkpoint_lock:
+            timestamp = time.time()
+            
+            async with self.node_lock:
+                async with self.integrity_lock:
+                    if self.wal_enabled and not self._wal_ready:
+                        self._resume_lsn()
+                    view = dict(self.nodes)
+                    lsn = self._lsn
+                    issues = [self._serialize_issue(i) for i in self.integrity_issues.values()]
+                    metadata = {
                         "updates_processed": self.update_count,
                         "verification_runs": self.verification_runs,
                         "remediations_applied": self.remediation_count,
                         "snapshot_interval": self.snapshot_interval_sec,
                     }
-                )
-        
-        # Write to disk
-        filename = f"snapshot_{int(timestamp)}.json"
-        filepath = self.persist_dir / filename
-        
-        try:
-            with open(filepath, 'w') as f:
-                json.dump(asdict(snapshot), f, indent=2)
-            
-            # Cleanup old snapshots (keep last 10)
-            await self._cleanup_old_snapshots()
+                    self._cow_preimages = {}
+                    self._cow_view = view
+                    if self.wal_enabled:
+                        self._roll_wal()
             
-            self.logger.debug("Dependency snapshot created", extra={
-                "category": "dependency_index",
-                "action": "snapshot_created",
-                "snapshot_file": filename,
-                "node_count": snapshot.node_count,
-                "issues_count": snapshot.integrity_issues_count,
-                "size_bytes": filepath.stat().st_size,
-            })
+            try:
+                columns = await self._build_checkpoint_columns(view)
+            finally:
+                self._cow_view = None
+                self._cow_preimages = {}
             
-            return str(filepath)
+            filename = f"checkpoint_{lsn:020d}.bin"
+            filepath = self.persist_dir / filename
             
-        except Exception as e:
-            self.logger.error("Failed to create snapshot", extra={
-                "category": "dependency_index",
-                "action": "snapshot_failed",
-                "snapshot_file": filename,
-                "error": str(e),
-            })
-            return ""
+            try:
+                size_bytes = await asyncio.to_thread(
+                    _write_checkpoint, filepath, lsn, timestamp, columns,
+                    {"integrity_issues": issues, "metadata": metadata},
+                )
+                self.last_checkpoint_lsn = lsn
+                
+                # Segments before the roll are fully covered by the checkpoint
+                await self.flush_wal()
+                for segment in self._wal_segments():
+                    if _file_sequence(segment) <= lsn:
+                        segment.unlink()
+                
+                # Cleanup old checkpoints
+                await self._cleanup_old_snapshots()
+                
+                self.logger.debug("Dependency checkpoint created", extra={
+                    "category": "dependency_index",
+                    "action": "snapshot_created",
+                    "snapshot_file": filename,
+                    "lsn": lsn,
+                    "node_count": len(view),
+                    "issues_count": len(issues),
+                    "size_bytes": size_bytes,
+                    "build_ms": (time.time() - timestamp) * 1000,
+                })
+                
+                return str(filepath)
+                
+            except Exception as e:
+                self.logger.error("Failed to create snapshot", extra={
+                    "category": "dependency_index",
+                    "action": "snapshot_failed",
+                    "snapshot_file": filename,
+                    "error": str(e),
+                })
+                return ""
+    
+    async def _build_checkpoint_columns(self, view: Dict[Tuple[str, int], DependencyNode]) -> Dict[str, Any]:
+        """Flatten the checkpoint view into typed columns"""
+        columns: Dict[str, Any] = {name: array(typecode) for name, typecode in _CHECKPOINT_COLUMNS}
+        columns["dep_offsets"].append(0)
+        columns["rdep_offsets"].append(0)
+        status_codes: Dict[str, int] = {}
+        
+        types, ids = columns["types"], columns["ids"]
+        codes, updated = columns["status_codes"], columns["last_updated"]
+        dep_offsets, dep_types, dep_ids = columns["dep_offsets"], columns["dep_types"], columns["dep_ids"]
+        rdep_offsets, rdep_types, rdep_ids = columns["rdep_offsets"], columns["rdep_types"], columns["rdep_ids"]
+        
+        for position, (key, node) in enumerate(view.items(), 1):
+            image = self._cow_preimages.get(key)
+            if image is None:
+                status, last_updated, dependencies, dependents = (
+                    node.status, node.last_updated, node.dependencies, node.dependents
+                )
+            else:
+                status, last_updated, dependencies, dependents = image
+            
+            types.append(_ENTITY_CODES[key[0]])
+            ids.append(key[1])
+            code = status_codes.get(status)
+            if code is None:
+                code = status_codes[status] = len(status_codes)
+            codes.append(code)
+            updated.append(last_updated)
+            for entity_type, entity_id in dependencies:
+                dep_types.append(_ENTITY_CODES[entity_type])
+                dep_ids.append(entity_id)
+            dep_offsets.append(len(dep_ids))
+            for entity_type, entity_id in dependents:
+                rdep_types.append(_ENTITY_CODES[entity_type])
+                rdep_ids.append(entity_id)
+            rdep_offsets.append(len(rdep_ids))
+            
+            if position % self.checkpoint_yield_every == 0:
+                await asyncio.sleep(0)
+        
+        columns["statuses"] = list(status_codes)
+        return columns
     
     async def _cleanup_old_snapshots(self) -> None:
         """Keep only the most recent snapshots"""
         try:
+            for old_checkpoint in self._checkpoint_files()[:-self.max_checkpoints]:
+                old_checkpoint.unlink()
+            
+            # Legacy JSON snapshots: remove all but the 10 most recent
             snapshots = sorted(
                 self.persist_dir.glob("snapshot_*.json"),
                 key=lambda p: p.stat().st_mtime,
                 reverse=True
             )
-            
-            # Remove all but the 10 most recent
             for old_snapshot in snapshots[10:]:
                 old_snapshot.unlink()
                 
@@ -726,23 +1162,96 @@ class DependencyIndex:
                 "error": str(e),
             })
     
+    def _restore_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        columns = checkpoint["columns"]
+        meta = checkpoint["meta"]
+        statuses = meta["statuses"]
+        types, ids = columns["types"], columns["ids"]
+        codes, updated = columns["status_codes"], columns["last_updated"]
+        dep_offsets, dep_types, dep_ids = columns["dep_offsets"], columns["dep_types"], columns["dep_ids"]
+        rdep_offsets, rdep_types, rdep_ids = columns["rdep_offsets"], columns["rdep_types"], columns["rdep_ids"]
+        
+        for i in range(checkpoint["node_count"]):
+            entity_type = _ENTITY_NAMES[types[i]]
+            node = DependencyNode(
+                entity_type=entity_type,
+                entity_id=ids[i],
+                status=statuses[codes[i]],
+                last_updated=updated[i]
+            )
+            node.dependencies = {
+                (_ENTITY_NAMES[dep_types[j]], dep_ids[j])
+                for j in range(dep_offsets[i], dep_offsets[i + 1])
+            }
+            node.dependents = {
+                (_ENTITY_NAMES[rdep_types[j]], rdep_ids[j])
+                for j in range(rdep_offsets[i], rdep_offsets[i + 1])
+            }
+            self.nodes[(entity_type, node.entity_id)] = node
+        
+        for issue_data in meta.get("integrity_issues", []):
+            self._restore_issue(issue_data)
+        self._restore_metadata(meta.get("metadata", {}))
+    
+    def _restore_json(self, data: Dict[str, Any]) -> None:
+        """Restore a legacy JSON snapshot"""
+        for entity_type, entities in data["nodes"].items():
+            for entity_id_str, node_data in entities.items():
+                entity_id = int(entity_id_str)
+                node = DependencyNode(
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    status=node_data["status"],
+                    last_updated=node_data["last_updated"]
+                )
+                
+                # Restore relationships
+                node.dependents = set(
+                    (t, i) for t, i in node_data.get("dependents", [])
+                )
+                node.dependencies = set(
+                    (t, i) for t, i in node_data.get("dependencies", [])
+                )
+                
+                self.nodes[(entity_type, entity_id)] = node
+        
+        for issue_data in data.get("integrity_issues", []):
+            self._restore_issue(issue_data)
+        self._restore_metadata(data.get("metadata", {}))
+    
     async def load_snapshot(self, filename: Optional[str] = None) -> bool:
-        """Load dependency state from a snapshot"""
+        """Recover dependency state from a checkpoint plus the WAL tail.
+        
+        Without ``filename`` the newest checkpoint is used, falling back to
+        the newest legacy JSON snapshot. WAL records with an LSN above the
+        checkpoint's are replayed on top of it.
+        """
         try:
             if filename:
-                filepath = self.persist_dir / filename
+                filepath: Optional[Path] = self.persist_dir / filename
+                if not filepath.exists():
+                    return False
             else:
-                # Load most recent snapshot
+                checkpoints = self._checkpoint_files()
                 snapshots = list(self.persist_dir.glob("snapshot_*.json"))
-                if not snapshots:
+                if checkpoints:
+                    filepath = checkpoints[-1]
+                elif snapshots:
+                    filepath = max(snapshots, key=lambda p: p.stat().st_mtime)
+                else:
+                    filepath = None
+                if filepath is None and not self._wal_segments():
                     return False
-                filepath = max(snapshots, key=lambda p: p.stat().st_mtime)
             
-            if not filepath.exists():
-                return False
-            
-            with open(filepath) as f:
-                data = json.load(f)
+            checkpoint = None
+            data = None
+            base_lsn = 0
+            if filepath is not None and filepath.suffix == ".json":
+                data = await asyncio.to_thread(_read_json, filepath)
+            elif filepath is not None:
+                checkpoint = await asyncio.to_thread(_read_checkpoint, filepath)
+                base_lsn = checkpoint["lsn"]
+            records = await asyncio.to_thread(self._load_wal_tail, base_lsn)
             
             # Restore state
             async with self.node_lock:
@@ -750,57 +1259,27 @@ class DependencyIndex:
                     self.nodes.clear()
                     self.integrity_issues.clear()
                     
-                    # Restore nodes
-                    for entity_type, entities in data["nodes"].items():
-                        for entity_id_str, node_data in entities.items():
-                            entity_id = int(entity_id_str)
-                            key = (entity_type, entity_id)
-                            
-                            node = DependencyNode(
-                                entity_type=entity_type,
-                                entity_id=entity_id,
-                                status=node_data["status"],
-                                last_updated=node_data["last_updated"]
-                            )
-                            
-                            # Restore relationships
-                            node.dependents = set(
-                                (t, i) for t, i in node_data.get("dependents", [])
-                            )
-                            node.dependencies = set(
-                                (t, i) for t, i in node_data.get("dependencies", [])
-                            )
-                            
-                            self.nodes[key] = node
+                    if checkpoint is not None:
+                        self._restore_checkpoint(checkpoint)
+                        self.last_checkpoint_lsn = base_lsn
+                    elif data is not None:
+                        self._restore_json(data)
                     
-                    # Restore integrity issues
-                    for issue_data in data.get("integrity_issues", []):
-                        issue_id = f"{issue_data['issue_type']}_{issue_data['entity_type']}_{issue_data['entity_id']}"
-                        
-                        issue = IntegrityIssue(
-                            issue_type=IntegrityIssueType(issue_data["issue_type"]),
-                            entity_type=issue_data["entity_type"],
-                            entity_id=issue_data["entity_id"],
-                            description=issue_data["description"],
-                            severity=issue_data["severity"],
-                            detected_at=issue_data["detected_at"],
-                            remediation_action=RemediationAction(issue_data["remediation_action"]) if issue_data.get("remediation_action") else None,
-                            remediation_applied_at=issue_data.get("remediation_applied_at"),
-                            remediation_details=issue_data.get("remediation_details")
-                        )
-                        
-                        self.integrity_issues[issue_id] = issue
+                    for _, op, timestamp, body in records:
+                        self._replay_record(op, timestamp, body)
                     
-                    # Restore metadata
-                    metadata = data.get("metadata", {})
-                    self.update_count = metadata.get("updates_processed", 0)
-                    self.verification_runs = metadata.get("verification_runs", 0)
-                    self.remediation_count = metadata.get("remediations_applied", 0)
+                    # New records continue after the replayed tail, in a new segment
+                    if not self._wal_ready:
+                        self._resume_lsn()
+                    self._lsn = max(self._lsn, base_lsn, records[-1][0] if records else 0)
+                    self._roll_wal()
             
             self.logger.info("Dependency snapshot loaded", extra={
                 "category": "dependency_index",
                 "action": "snapshot_loaded", 
-                "snapshot_file": filepath.name,
+                "snapshot_file": filepath.name if filepath else None,
+                "checkpoint_lsn": base_lsn,
+                "wal_records_replayed": len(records),
                 "node_count": len(self.nodes),
                 "issues_count": len(self.integrity_issues),
             })
@@ -1146,6 +1625,50 @@ class ImpactedCluster:
     requires_matrix_refresh: bool = False
 
 
+class EdgeUnionFind:
+    """Union-find over edge ids (union by size, path halving)"""
+    
+    def __init__(self):
+        self.parent: Dict[int, int] = {}
+        self.size: Dict[int, int] = {}
+    
+    def __contains__(self, edge_id: int) -> bool:
+        return edge_id in self.parent
+    
+    def add(self, edge_id: int, root: Optional[int] = None) -> None:
+        """Add an edge as a singleton, or directly under an existing root"""
+        if root is None:
+            self.parent[edge_id] = edge_id
+            self.size[edge_id] = 1
+        else:
+            self.parent[edge_id] = root
+            self.size[root] += 1
+    
+    def find(self, edge_id: int) -> int:
+        parent = self.parent
+        while parent[edge_id] != edge_id:
+            parent[edge_id] = parent[parent[edge_id]]
+            edge_id = parent[edge_id]
+        return edge_id
+    
+    def union_roots(self, root_a: int, root_b: int) -> Tuple[int, int]:
+        """Link two roots; returns ``(surviving_root, absorbed_root)``"""
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size.pop(root_b)
+        return root_a, root_b
+    
+    def reset(self, members: Set[int]) -> int:
+        """Re-root a (split-off) member set as its own tree, returning the root"""
+        root = next(iter(members))
+        for edge_id in members:
+            self.parent[edge_id] = root
+            self.size.pop(edge_id, None)
+        self.size[root] = len(members)
+        return root
+
+
 class EdgeChangeAggregator:
     """
     Edge change aggregation system that computes impacted correlation clusters.
@@ -1155,6 +1678,11 @@ class EdgeChangeAggregator:
     - Computes impacted clusters when change thresholds are exceeded
     - Schedules correlation matrix warm cache when cluster impact size > threshold
     - Provides selective refresh targeting for optimization efficiency
+    
+    Clusters are the connected components of the graph linking edges whose
+    absolute correlation exceeds ``correlation_threshold``. Per-edge neighbor
+    lists make placing a new edge O(degree); clusters merge through
+    union-find and are split locally when a correlation delta removes a link.
     """
     
     def __init__(self, cluster_impact_threshold: float = 0.3, 
@@ -1174,17 +1702,40 @@ class EdgeChangeAggregator:
         
         # Cluster tracking  
         self.impacted_clusters: Dict[str, ImpactedCluster] = {}
-        self.edge_to_cluster: Dict[int, str] = {}
         self.cluster_lock = asyncio.Lock()
-        
-        # Correlation matrix for clustering
+        self._forest = EdgeUnionFind()
+        self._root_cluster: Dict[int, str] = {}  # union-find root -> cluster_id
+        self._cluster_pair_stats: Dict[str, List[float]] = {}  # cluster_id -> [sum |corr|, pairs]
+        self._cluster_seq = 0
+        
+        # Correlation matrix for clustering, keyed by (min_edge, max_edge).
+        # correlations_by_edge is its adjacency form; neighbors keeps only the
+        # links above the correlation threshold.
         self.correlation_matrix: Dict[Tuple[int, int], float] = {}
+        self.correlations_by_edge: Dict[int, Dict[int, float]] = defaultdict(dict)
+        self.neighbors: Dict[int, Set[int]] = defaultdict(set)
         self.matrix_last_updated: float = 0.0
         
         # Statistics
         self.total_changes_processed = 0
         self.clusters_updated = 0
         self.matrix_refreshes_scheduled = 0
+        self.clusters_merged = 0
+        self.clusters_split = 0
+    
+    @property
+    def edge_to_cluster(self) -> Dict[int, str]:
+        """Current cluster id for every clustered edge"""
+        return {
+            edge_id: self._root_cluster[self._forest.find(edge_id)]
+            for edge_id in self._forest.parent
+        }
+    
+    def get_cluster_id(self, edge_id: int) -> Optional[str]:
+        """Cluster id for ``edge_id``, or None if the edge has not been seen"""
+        if edge_id not in self._forest:
+            return None
+        return self._root_cluster[self._forest.find(edge_id)]
         
     async def record_edge_change(self, edge_id: int, change_type: str, 
                                 magnitude: float, metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
@@ -1223,6 +1774,7 @@ class EdgeChangeAggregator:
         
         # Check if cluster impact exceeds threshold
         async with self.cluster_lock:
+            cluster_id = self.get_cluster_id(edge_id)
             cluster = self.impacted_clusters[cluster_id]
             if cluster.impact_magnitude > self.cluster_impact_threshold:
                 cluster.requires_matrix_refresh = True
@@ -1259,53 +1811,179 @@ class EdgeChangeAggregator:
         """Get existing cluster for edge or create new one based on correlation"""
         async with self.cluster_lock:
             # Check if edge already has a cluster
-            if edge_id in self.edge_to_cluster:
-                return self.edge_to_cluster[edge_id]
-            
-            # Find existing cluster with correlated edges
-            best_cluster_id = None
-            best_correlation = 0.0
-            
-            for cluster_id, cluster in self.impacted_clusters.items():
-                # Calculate average correlation with edges in this cluster
-                correlations = []
-                for other_edge_id in cluster.edge_ids:
-                    correlation = self._get_edge_correlation(edge_id, other_edge_id)
-                    if correlation is not None:
-                        correlations.append(abs(correlation))
-                
-                if correlations:
-                    avg_correlation = sum(correlations) / len(correlations)
-                    if avg_correlation > self.correlation_threshold and avg_correlation > best_correlation:
-                        best_correlation = avg_correlation
-                        best_cluster_id = cluster_id
-            
-            # Use existing cluster if found
-            if best_cluster_id:
-                self.edge_to_cluster[edge_id] = best_cluster_id
-                return best_cluster_id
-            
-            # Create new cluster
-            new_cluster_id = f"cluster_{len(self.impacted_clusters) + 1}_{int(time.time())}"
-            self.impacted_clusters[new_cluster_id] = ImpactedCluster(
-                cluster_id=new_cluster_id,
-                correlation_strength=1.0  # Single edge cluster
-            )
-            self.edge_to_cluster[edge_id] = new_cluster_id
+            cluster_id = self.get_cluster_id(edge_id)
+            if cluster_id is not None:
+                return cluster_id
             
-            return new_cluster_id
+            # Clusters of already-seen correlated neighbors
+            roots = {
+                self._forest.find(other)
+                for other in self.neighbors.get(edge_id, ())
+                if other in self._forest
+            }
+            
+            if not roots:
+                # Create new cluster
+                self._forest.add(edge_id)
+                cluster_id = self._new_cluster(edge_id, {edge_id})
+                return cluster_id
+            
+            # Join the largest neighboring cluster, then merge the others into it
+            root = max(roots, key=lambda r: self._forest.size[r])
+            cluster_id = self._root_cluster[root]
+            cluster = self.impacted_clusters[cluster_id]
+            stats = self._cluster_pair_stats[cluster_id]
+            for other, correlation in self.correlations_by_edge.get(edge_id, {}).items():
+                if other in cluster.edge_ids:
+                    stats[0] += abs(correlation)
+                    stats[1] += 1
+            self._forest.add(edge_id, root)
+            cluster.edge_ids.add(edge_id)
+            
+            for other_root in roots - {root}:
+                root = self._merge_roots(self._forest.find(root), other_root)
+            
+            cluster_id = self._root_cluster[self._forest.find(root)]
+            self._refresh_correlation_strength(self.impacted_clusters[cluster_id])
+            return cluster_id
+    
+    def _new_cluster(self, root: int, edge_ids: Set[int], template: Optional[ImpactedCluster] = None) -> str:
+        self._cluster_seq += 1
+        cluster_id = f"cluster_{self._cluster_seq}_{int(time.time())}"
+        cluster = ImpactedCluster(
+            cluster_id=cluster_id,
+            edge_ids=set(edge_ids),
+            correlation_strength=1.0  # Single edge cluster
+        )
+        if template is not None:
+            cluster.impact_magnitude = template.impact_magnitude
+            cluster.last_updated = template.last_updated
+            cluster.requires_matrix_refresh = template.requires_matrix_refresh
+        self.impacted_clusters[cluster_id] = cluster
+        self._root_cluster[root] = cluster_id
+        self._cluster_pair_stats[cluster_id] = [0.0, 0]
+        return cluster_id
+    
+    def _merge_roots(self, root_a: int, root_b: int) -> int:
+        """Merge two clusters; the larger one keeps its id. Returns the new root"""
+        if root_a == root_b:
+            return root_a
+        root, absorbed_root = self._forest.union_roots(root_a, root_b)
+        cluster_id = self._root_cluster.pop(root)
+        absorbed_id = self._root_cluster.pop(absorbed_root)
+        self._root_cluster[root] = cluster_id
+        
+        cluster = self.impacted_clusters[cluster_id]
+        absorbed = self.impacted_clusters.pop(absorbed_id)
+        stats = self._cluster_pair_stats[cluster_id]
+        absorbed_stats = self._cluster_pair_stats.pop(absorbed_id)
+        
+        # Pair stats: both sides plus the correlations across them
+        stats[0] += absorbed_stats[0]
+        stats[1] += absorbed_stats[1]
+        for edge_id in absorbed.edge_ids:
+            for other, correlation in self.correlations_by_edge.get(edge_id, {}).items():
+                if other in cluster.edge_ids:
+                    stats[0] += abs(correlation)
+                    stats[1] += 1
+        
+        cluster.edge_ids |= absorbed.edge_ids
+        cluster.prop_ids |= absorbed.prop_ids
+        cluster.change_count += absorbed.change_count
+        cluster.impact_magnitude = max(cluster.impact_magnitude, absorbed.impact_magnitude)
+        cluster.last_updated = max(cluster.last_updated, absorbed.last_updated)
+        cluster.requires_matrix_refresh = cluster.requires_matrix_refresh or absorbed.requires_matrix_refresh
+        self._refresh_correlation_strength(cluster)
+        self.clusters_merged += 1
+        
+        self.logger.debug("Clusters merged", extra={
+            "category": "edge_change_aggregator",
+            "action": "cluster_merge",
+            "cluster_id": cluster_id,
+            "absorbed_cluster_id": absorbed_id,
+            "edge_count": len(cluster.edge_ids),
+        })
+        return root
+    
+    def _split_if_disconnected(self, cluster_id: str) -> None:
+        """Split a cluster whose neighbor graph is no longer connected"""
+        cluster = self.impacted_clusters.get(cluster_id)
+        if cluster is None or len(cluster.edge_ids) < 2:
+            return
+        
+        members = cluster.edge_ids
+        seen: Set[int] = set()
+        components: List[Set[int]] = []
+        for start in members:
+            if start in seen:
+                continue
+            seen.add(start)
+            component = {start}
+            stack = [start]
+            while stack:
+                for other in self.neighbors.get(stack.pop(), ()):
+                    if other in members and other not in seen:
+                        seen.add(other)
+                        component.add(other)
+                        stack.append(other)
+            components.append(component)
+        
+        if len(components) == 1:
+            return
+        
+        # The largest component keeps the cluster id and its change history
+        components.sort(key=len, reverse=True)
+        del self._root_cluster[self._forest.find(next(iter(members)))]
+        cluster.edge_ids = components[0]
+        self._root_cluster[self._forest.reset(components[0])] = cluster_id
+        self._recompute_pair_stats(cluster)
+        
+        new_ids = []
+        for component in components[1:]:
+            new_id = self._new_cluster(self._forest.reset(component), component, template=cluster)
+            self._recompute_pair_stats(self.impacted_clusters[new_id])
+            new_ids.append(new_id)
+        self.clusters_split += 1
+        
+        self.logger.debug("Cluster split", extra={
+            "category": "edge_change_aggregator",
+            "action": "cluster_split",
+            "cluster_id": cluster_id,
+            "new_cluster_ids": new_ids,
+            "edge_count": len(cluster.edge_ids),
+        })
+    
+    def _recompute_pair_stats(self, cluster: ImpactedCluster) -> None:
+        total = 0.0
+        pairs = 0
+        for edge_id in cluster.edge_ids:
+            for other, correlation in self.correlations_by_edge.get(edge_id, {}).items():
+                if other > edge_id and other in cluster.edge_ids:
+                    total += abs(correlation)
+                    pairs += 1
+        self._cluster_pair_stats[cluster.cluster_id] = [total, pairs]
+        self._refresh_correlation_strength(cluster)
+    
+    def _refresh_correlation_strength(self, cluster: ImpactedCluster) -> None:
+        total, pairs = self._cluster_pair_stats[cluster.cluster_id]
+        if pairs:
+            cluster.correlation_strength = total / pairs
+        elif len(cluster.edge_ids) == 1:
+            cluster.correlation_strength = 1.0
     
     def _get_edge_correlation(self, edge_id1: int, edge_id2: int) -> Optional[float]:
         """Get correlation between two edges from correlation matrix"""
-        key1 = (min(edge_id1, edge_id2), max(edge_id1, edge_id2))
-        key2 = (max(edge_id1, edge_id2), min(edge_id1, edge_id2))
-        
-        return self.correlation_matrix.get(key1) or self.correlation_matrix.get(key2)
+        return self.correlation_matrix.get((min(edge_id1, edge_id2), max(edge_id1, edge_id2)))
     
     async def _update_impacted_cluster(self, cluster_id: str, change: EdgeChangeRecord) -> None:
         """Update cluster impact metrics with new change"""
         async with self.cluster_lock:
-            cluster = self.impacted_clusters[cluster_id]
+            # A concurrent merge may have folded the cluster into another one
+            cluster = self.impacted_clusters.get(cluster_id)
+            if cluster is None:
+                cluster_id = self.get_cluster_id(change.edge_id)
+                change.correlation_cluster_id = cluster_id
+                cluster = self.impacted_clusters[cluster_id]
             
             # Add edge and increment change count
             cluster.edge_ids.add(change.edge_id)
@@ -1325,32 +2003,85 @@ class EdgeChangeAggregator:
             
             self.clusters_updated += 1
     
-    async def update_correlation_matrix(self, correlation_data: Dict[Tuple[int, int], float]) -> None:
-        """Update correlation matrix used for clustering"""
+    async def update_correlation_matrix(self, correlation_data: Dict[Tuple[int, int], Optional[float]]) -> None:
+        """Apply correlation deltas in place.
+        
+        Each entry sets the correlation for an edge pair; a value of None
+        removes the pair. Neighbor lists, cluster pair statistics and cluster
+        membership are adjusted only for the pairs in the delta: new links
+        above the threshold merge clusters, removed links trigger a local
+        connectivity check on the affected cluster.
+        
+        Removed links are kept as edge pairs and checked only after every
+        merge in the delta has been applied, so the connectivity check runs
+        on the cluster the pair belongs to at that point.
+        """
         async with self.cluster_lock:
-            self.correlation_matrix.update(correlation_data)
-            self.matrix_last_updated = time.time()
+            touched: Set[str] = set()
+            unlinked: List[Tuple[int, int]] = []
             
-            # Recalculate cluster correlations
-            for cluster in self.impacted_clusters.values():
-                if len(cluster.edge_ids) > 1:
-                    correlations = []
-                    edge_list = list(cluster.edge_ids)
-                    
-                    for i in range(len(edge_list)):
-                        for j in range(i + 1, len(edge_list)):
-                            correlation = self._get_edge_correlation(edge_list[i], edge_list[j])
-                            if correlation is not None:
-                                correlations.append(abs(correlation))
-                    
-                    if correlations:
-                        cluster.correlation_strength = sum(correlations) / len(correlations)
+            for (edge_a, edge_b), value in correlation_data.items():
+                if edge_a == edge_b:
+                    continue
+                key = (min(edge_a, edge_b), max(edge_a, edge_b))
+                old = self.correlation_matrix.get(key)
+                if value is None:
+                    if old is None:
+                        continue
+                    del self.correlation_matrix[key]
+                    self.correlations_by_edge[edge_a].pop(edge_b, None)
+                    self.correlations_by_edge[edge_b].pop(edge_a, None)
+                else:
+                    self.correlation_matrix[key] = value
+                    self.correlations_by_edge[edge_a][edge_b] = value
+                    self.correlations_by_edge[edge_b][edge_a] = value
+                
+                cluster_a = self.get_cluster_id(edge_a)
+                cluster_b = self.get_cluster_id(edge_b)
+                same_cluster = cluster_a is not None and cluster_a == cluster_b
+                if same_cluster:
+                    stats = self._cluster_pair_stats[cluster_a]
+                    if old is not None:
+                        stats[0] -= abs(old)
+                        stats[1] -= 1
+                    if value is not None:
+                        stats[0] += abs(value)
+                        stats[1] += 1
+                    touched.add(cluster_a)
+                
+                was_linked = old is not None and abs(old) > self.correlation_threshold
+                is_linked = value is not None and abs(value) > self.correlation_threshold
+                if is_linked and not was_linked:
+                    self.neighbors[edge_a].add(edge_b)
+                    self.neighbors[edge_b].add(edge_a)
+                    if cluster_a is not None and cluster_b is not None and not same_cluster:
+                        root = self._merge_roots(self._forest.find(edge_a), self._forest.find(edge_b))
+                        touched.add(self._root_cluster[root])
+                elif was_linked and not is_linked:
+                    self.neighbors[edge_a].discard(edge_b)
+                    self.neighbors[edge_b].discard(edge_a)
+                    unlinked.append((edge_a, edge_b))
+            
+            # Resolve each removed link against the clusters as they stand
+            # after all merges; a pair already split apart needs no check
+            for edge_a, edge_b in unlinked:
+                cluster_id = self.get_cluster_id(edge_a)
+                if cluster_id is not None and cluster_id == self.get_cluster_id(edge_b):
+                    self._split_if_disconnected(cluster_id)
+                    touched.add(cluster_id)
+            for cluster_id in touched:
+                cluster = self.impacted_clusters.get(cluster_id)
+                if cluster is not None:
+                    self._refresh_correlation_strength(cluster)
+            
+            self.matrix_last_updated = time.time()
             
             self.logger.info("Correlation matrix updated", extra={
                 "category": "edge_change_aggregator",
                 "action": "update_correlation_matrix",
                 "matrix_entries": len(self.correlation_matrix),
-                "clusters_updated": len(self.impacted_clusters),
+                "delta_entries": len(correlation_data),
+                "clusters_updated": len(touched),
                 "result": "updated",
             })
     
@@ -1388,6 +2119,8 @@ class EdgeChangeAggregator:
             "matrix_refreshes_scheduled": self.matrix_refreshes_scheduled,
             "correlation_matrix_entries": len(self.correlation_matrix),
             "matrix_last_updated": self.matrix_last_updated,
+            "clusters_merged": self.clusters_merged,
+            "clusters_split": self.clusters_split,
             "configuration": {
                 "cluster_impact_threshold": self.cluster_impact_threshold,
                 "correlation_threshold": self.correlation_threshold,
@@ -3354,6 +4087,7 @@ class ProviderResilienceManager:
             self._batch_processor_task.cancel()
         if self._metrics_updater_task:
             self._metrics_updater_task.cancel()
+        await self.dependency_index.close()
         
         self.logger.info("ProviderResilienceManager shut down", extra={
             "category": "system",
@@ -3465,7 +4199,6 @@ __all__ = [
     "RemediationAction",
     "DependencyNode",
     "IntegrityIssue",
-    "DependencySnapshot",
     "EdgeChangeAggregator",
     "EdgeChangeRecord",
     "ImpactedCluster",
@@ -23,6 +23,8 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from backend.services.compiled_business_rules import CompiledBusinessRules
+
 logger = logging.getLogger(__name__)
 
 
@@ -122,6 +124,7 @@ class RealTimeAnalysisEngine:
         old_rules = copy.deepcopy(getattr(self, "business_rules", {}))
         self._load_business_rules()
         new_rules = getattr(self, "business_rules", {})
+        self._compiled_business_rules()
         self._audit_rule_changes(
             old_rules, new_rules, user_id=user_id, reason=reason, request_ip=request_ip
         )
@@ -348,59 +351,29 @@ class RealTimeAnalysisEngine:
         except Exception as e:
             logger.error(f"Failed to load business rules: {e}")
             rules = {"forbidden_combos": [], "allowed_stat_types": []}
+        compiled = CompiledBusinessRules.compile(rules)
         # Thread-safe assignment
         if hasattr(self, "_job_lock"):
             with self._job_lock:
                 self.business_rules = rules
+                self._compiled_rules = compiled
         else:
             self.business_rules = rules
+            self._compiled_rules = compiled
         logger.debug(f"Loaded business_rules: {self.business_rules}")
 
+    def _compiled_business_rules(self) -> CompiledBusinessRules:
+        """Return compiled rules, recompiling if ``business_rules`` was replaced."""
+        br = getattr(self, "business_rules", None)
+        compiled = getattr(self, "_compiled_rules", None)
+        if compiled is None or compiled.source is not br:
+            compiled = CompiledBusinessRules.compile(br)
+            self._compiled_rules = compiled
+        return compiled
+
     def _get_active_rules(self, now=None, user_id=None):
         """Return list of active rules for current UTC time or supplied 'now', checking user_overrides if user_id is given."""
-        br = getattr(self, "business_rules", {})
-        now = now or datetime.now(timezone.utc)
-        # User-specific rules
-        if user_id:
-            user_overrides = br.get("user_overrides", {}).get(user_id, {})
-            user_rules = user_overrides.get("rules", [])
-            active = []
-            for rule in user_rules:
-                tw = rule.get("time_window")
-                if not tw:
-                    active.append(rule)
-                    continue
-                try:
-                    start = datetime.fromisoformat(tw["start"]).astimezone(timezone.utc)
-                    end = datetime.fromisoformat(tw["end"]).astimezone(timezone.utc)
-                    if start <= now <= end:
-                        active.append(rule)
-                except Exception as e:
-                    logger.warning(
-                        f"Invalid time_window in user rule {rule.get('id')}: {e}"
-                    )
-            logger.debug(
-                f"Active user rules for {user_id} at {now}: {[r.get('id') for r in active]}"
-            )
-            if active:
-                return active
-        # Fallback to global rules
-        rules = br.get("rules", [])
-        active = []
-        for rule in rules:
-            tw = rule.get("time_window")
-            if not tw:
-                active.append(rule)
-                continue
-            try:
-                start = datetime.fromisoformat(tw["start"]).astimezone(timezone.utc)
-                end = datetime.fromisoformat(tw["end"]).astimezone(timezone.utc)
-                if start <= now <= end:
-                    active.append(rule)
-            except Exception as e:
-                logger.warning(f"Invalid time_window in rule {rule.get('id')}: {e}")
-        logger.debug(f"Active global rules at {now}: {[r.get('id') for r in active]}")
-        return active
+        return self._compiled_business_rules().active_rules(now=now, user_id=user_id)
 
     def _is_bet_allowed(self, bet, now=None, user_id=None):
         """
@@ -408,114 +381,22 @@ class RealTimeAnalysisEngine:
         Returns (True, []) if allowed, (False, [reasons]) if forbidden.
         Reasons are granular and specific to the violated rule(s).
         """
-        br = getattr(
-            self,
-            "business_rules",
-            {
-                "forbidden_combos": [],
-                "allowed_stat_types": [],
-                "rules": [],
-                "user_overrides": {},
-            },
+        reasons = self._compiled_business_rules().evaluate(
+            bet, now=now, user_id=user_id
         )
-        # User-specific overrides
-        forbidden_combos = []
-        allowed_stat_types = []
-        if user_id:
-            user_overrides = br.get("user_overrides", {}).get(user_id, {})
-            forbidden_combos = user_overrides.get("forbidden_combos", [])
-            allowed_stat_types = user_overrides.get("allowed_stat_types", [])
-        if not forbidden_combos:
-            forbidden_combos = br.get("forbidden_combos", [])
-        if not allowed_stat_types:
-            allowed_stat_types = br.get("allowed_stat_types", [])
-        active_rules = self._get_active_rules(now=now, user_id=user_id)
-        if hasattr(bet, "__dict__"):
-            bet_dict = bet.__dict__
-        else:
-            bet_dict = bet
-        # Ensure features list exists for combo rules
-        features = bet_dict.get("features")
-        if features is None:
-            # Try to infer features from bet fields (e.g., sport, bet_type, player_name, stat_type)
-            features = [
-                str(bet_dict.get("sport", "")).lower(),
-                str(bet_dict.get("bet_type", "")).lower(),
-                str(bet_dict.get("player_name", "")).lower(),
-                str(bet_dict.get("stat_type", "")).lower(),
-            ]
-            bet_dict["features"] = features
-        reasons = []
-        # Static forbidden combos
-        for combo in forbidden_combos:
-            if all(
-                str(feature).lower()
-                in [str(f).lower() for f in bet_dict.get("features", [])]
-                for feature in combo
-            ):
-                reasons.append(f"Forbidden combo: {combo}")
-        # Static allowed stat types
-        if allowed_stat_types and bet_dict.get("stat_type") not in allowed_stat_types:
-            reasons.append(f"Stat type '{bet_dict.get('stat_type')}' not allowed")
-        # Dynamic/time-windowed rules
-        for rule in active_rules:
-            applies = rule.get("applies_to", {})
-            sport = applies.get("sport")
-            logger.debug(
-                f"Evaluating rule {rule.get('id')} for bet sport {getattr(bet, 'sport', None)}"
-            )
-            if (
-                sport
-                and sport != "all"
-                and getattr(bet, "sport", None)
-                and getattr(bet, "sport").value != sport
-            ):
-                logger.debug(
-                    f"Rule {rule.get('id')} skipped: sport mismatch ({sport} != {getattr(bet, 'sport', None)})"
-                )
-                continue
-            rtype = rule.get("type")
-            if rtype == "forbidden_combo":
-                combo = rule.get("combo", [])
-                logger.debug(
-                    f"Checking forbidden_combo {combo} against features {bet_dict.get('features', [])}"
-                )
-                if all(
-                    str(feature).lower()
-                    in [str(f).lower() for f in bet_dict.get("features", [])]
-                    for feature in combo
-                ):
-                    reasons.append(f"Forbidden combo (dynamic): {combo}")
-            elif rtype == "expected_value_min":
-                min_ev = rule.get("value")
-                logger.debug(
-                    f"Checking expected_value_min {min_ev} against bet expected_value {bet_dict.get('expected_value')}"
-                )
-                if (
-                    min_ev is not None
-                    and (bet_dict.get("expected_value") is not None)
-                    and bet_dict["expected_value"] < min_ev
-                ):
-                    reasons.append(
-                        f"Expected value {bet_dict['expected_value']} below min {min_ev} (rule {rule.get('id')})"
-                    )
-            elif rtype == "risk_score_max":
-                max_risk = rule.get("value")
-                logger.debug(
-                    f"Checking risk_score_max {max_risk} against bet risk_score {bet_dict.get('risk_score')}"
-                )
-                if (
-                    max_risk is not None
-                    and (bet_dict.get("risk_score") is not None)
-                    and bet_dict["risk_score"] > max_risk
-                ):
-                    reasons.append(
-                        f"Risk score {bet_dict['risk_score']} above max {max_risk} (rule {rule.get('id')})"
-                    )
         if reasons:
             return False, reasons
         return True, []
 
+    def filter_allowed(self, bets, now=None, user_id=None):
+        """
+        Evaluate a whole list of candidate bets against the business rules in one pass.
+        Returns (allowed_bets, [(bet, reasons), ...]) for the rejected ones.
+        """
+        return self._compiled_business_rules().filter_allowed(
+            bets, now=now, user_id=user_id
+        )
+
     async def _fetch_caesars_data(self, sport: SportCategory) -> List[RealTimeBet]:
         """Fetch Caesars data for specific sport using real API (production-ready)."""
         import httpx
@@ -673,6 +554,7 @@ class RealTimeAnalysisEngine:
                 min_ev = max(min_ev, rule.get("value", min_ev))
             elif rtype == "risk_score_max":
                 max_risk = min(max_risk, rule.get("value", max_risk))
+        scored = []
         for bet in batch:
             try:
                 # Feature engineering
@@ -686,26 +568,27 @@ class RealTimeAnalysisEngine:
                 bet.risk_score = ensemble_results.get("risk_score", 1.0)
                 bet.shap_explanation = ensemble_results.get("shap_explanation", {})
                 bet.analyzed_at = datetime.now(timezone.utc)
-                # Enforce business rules (static + dynamic)
-                allowed, reasons = self._is_bet_allowed(bet)
-                if not allowed:
-                    logger.info(f"Bet {bet.id} filtered by business rules: {reasons}")
-                    if not hasattr(bet, "violations"):
-                        bet.violations = []
-                    bet.violations.extend(reasons)
-                    for reason in reasons:
-                        self.violations.append({"bet_id": bet.id, "reason": reason})
-                    continue
-                # Only keep high-quality opportunities (respect dynamic thresholds)
-                if (
-                    (bet.ml_confidence or 0.0) >= min_confidence
-                    and (bet.expected_value or 0.0) >= min_ev
-                    and (bet.risk_score or 0.0) <= max_risk
-                ):
-                    analyzed_batch.append(bet)
+                scored.append(bet)
             except Exception as e:
                 logger.warning("⚠️ Failed to analyze bet %s: %s", bet.id, str(e))
                 continue
+        # Enforce business rules (static + dynamic) across the whole batch
+        allowed_bets, rejected = self.filter_allowed(scored)
+        for bet, reasons in rejected:
+            logger.info(f"Bet {bet.id} filtered by business rules: {reasons}")
+            if not hasattr(bet, "violations"):
+                bet.violations = []
+            bet.violations.extend(reasons)
+            for reason in reasons:
+                self.violations.append({"bet_id": bet.id, "reason": reason})
+        for bet in allowed_bets:
+            # Only keep high-quality opportunities (respect dynamic thresholds)
+            if (
+                (bet.ml_confidence or 0.0) >= min_confidence
+                and (bet.expected_value or 0.0) >= min_ev
+                and (bet.risk_score or 0.0) <= max_risk
+            ):
+                analyzed_batch.append(bet)
         return analyzed_batch
 
     async def _optimize_cross_sport_lineups(
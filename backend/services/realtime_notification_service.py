@@ -6,8 +6,11 @@ Comprehensive notification infrastructure for live betting updates
 import asyncio
 import json
 import logging
+import math
+import os
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Any, Callable
+from typing import Dict, List, Optional, Set, Any, Callable, Hashable, Iterable, Tuple
 from enum import Enum
 from dataclasses import dataclass, asdict
 from fastapi import WebSocket
@@ -36,6 +39,14 @@ class NotificationPriority(Enum):
     HIGH = 3
     CRITICAL = 4
 
+# Notification types where only the latest pending update per subject matters
+COALESCED_TYPES = {
+    NotificationType.ODDS_CHANGE,
+    NotificationType.LINE_MOVEMENT,
+    NotificationType.PREDICTION_UPDATE,
+    NotificationType.GAME_STATUS_UPDATE,
+}
+
 @dataclass
 class NotificationMessage:
     """Structured notification message"""
@@ -65,6 +76,19 @@ class NotificationMessage:
         if self.expires_at:
             result['expires_at'] = self.expires_at.isoformat()
         return result
+    
+    def coalesce_key(self) -> Optional[Tuple]:
+        """Subject key under which a newer pending update replaces an older one"""
+        if self.type not in COALESCED_TYPES:
+            return None
+        return (
+            self.type.value,
+            self.user_id,
+            self.data.get('sport'),
+            self.data.get('event'),
+            self.data.get('player_name'),
+            self.data.get('sportsbook'),
+        )
 
 @dataclass
 class SubscriptionFilter:
@@ -107,10 +131,190 @@ class SubscriptionFilter:
         
         return True
 
+FilterKey = Tuple[str, int]  # (connection_id, position in the connection's filter list)
+
+class SubscriptionIndex:
+    """
+    Inverted index from notification attributes to subscribed connections.
+    
+    Filters are bucketed by (notification type, sport) and (notification type, tag),
+    with None standing for "any", so routing a notification only evaluates the
+    filters that can match it. Connections without filters receive everything.
+    """
+    
+    def __init__(self):
+        self._filters: Dict[FilterKey, SubscriptionFilter] = {}
+        self._filter_keys: Dict[str, List[FilterKey]] = {}
+        self._unfiltered: Set[str] = set()
+        self._by_sport: Dict[Tuple[NotificationType, Optional[str]], Set[FilterKey]] = defaultdict(set)
+        self._by_tag: Dict[Tuple[NotificationType, Optional[str]], Set[FilterKey]] = defaultdict(set)
+        self._by_user: Dict[Optional[str], Set[str]] = defaultdict(set)
+        self._users: Dict[str, Optional[str]] = {}
+    
+    def add(self, connection_id: str, user_id: Optional[str], filters: List[SubscriptionFilter]):
+        """Index a new connection"""
+        self._users[connection_id] = user_id
+        self._by_user[user_id].add(connection_id)
+        self._index_filters(connection_id, filters)
+    
+    def set_filters(self, connection_id: str, filters: List[SubscriptionFilter]):
+        """Replace a connection's indexed filters"""
+        self._unindex_filters(connection_id)
+        self._index_filters(connection_id, filters)
+    
+    def remove(self, connection_id: str):
+        """Drop a connection from every index"""
+        self._unindex_filters(connection_id)
+        user_id = self._users.pop(connection_id, None)
+        self._discard(self._by_user, user_id, connection_id)
+    
+    def clear(self):
+        for index in (self._filters, self._filter_keys, self._unfiltered,
+                      self._by_sport, self._by_tag, self._by_user, self._users):
+            index.clear()
+    
+    def route(self, notification: NotificationMessage) -> Set[str]:
+        """Connection IDs with at least one filter matching the notification"""
+        matched = set(self._unfiltered)
+        notification_type = notification.type
+        
+        sport_keys = self._union(
+            self._by_sport,
+            [(notification_type, None), (notification_type, notification.data.get('sport'))]
+        )
+        if not sport_keys:
+            return matched
+        tag_keys = self._union(
+            self._by_tag,
+            [(notification_type, None)] + [(notification_type, tag) for tag in notification.tags]
+        )
+        
+        for key in sport_keys & tag_keys:
+            connection_id = key[0]
+            # Priority and players are checked on the few remaining candidates
+            if connection_id not in matched and self._filters[key].matches(notification):
+                matched.add(connection_id)
+        return matched
+    
+    def connections_for_users(self, user_ids: Iterable[Optional[str]]) -> Set[str]:
+        """Connection IDs owned by any of the given users"""
+        matched: Set[str] = set()
+        for user_id in user_ids:
+            matched |= self._by_user.get(user_id, set())
+        return matched
+    
+    def _index_filters(self, connection_id: str, filters: List[SubscriptionFilter]):
+        if not filters:
+            self._unfiltered.add(connection_id)
+            self._filter_keys[connection_id] = []
+            return
+        
+        keys = []
+        for position, subscription in enumerate(filters):
+            key = (connection_id, position)
+            self._filters[key] = subscription
+            for bucket in self._buckets(subscription, 'sports'):
+                self._by_sport[bucket].add(key)
+            for bucket in self._buckets(subscription, 'tags'):
+                self._by_tag[bucket].add(key)
+            keys.append(key)
+        self._filter_keys[connection_id] = keys
+    
+    def _unindex_filters(self, connection_id: str):
+        self._unfiltered.discard(connection_id)
+        for key in self._filter_keys.pop(connection_id, []):
+            subscription = self._filters.pop(key)
+            for bucket in self._buckets(subscription, 'sports'):
+                self._discard(self._by_sport, bucket, key)
+            for bucket in self._buckets(subscription, 'tags'):
+                self._discard(self._by_tag, bucket, key)
+    
+    @staticmethod
+    def _buckets(subscription: SubscriptionFilter, attribute: str):
+        values = getattr(subscription, attribute) or (None,)
+        for notification_type in subscription.notification_types:
+            for value in values:
+                yield (notification_type, value)
+    
+    @staticmethod
+    def _union(index: Dict[Any, Set], buckets: List[Hashable]) -> Set:
+        result: Set = set()
+        for bucket in buckets:
+            keys = index.get(bucket)
+            if keys:
+                result |= keys
+        return result
+    
+    @staticmethod
+    def _discard(index: Dict[Any, Set], bucket: Hashable, value: Any):
+        values = index.get(bucket)
+        if values is not None:
+            values.discard(value)
+            if not values:
+                del index[bucket]
+
+class TimerWheel:
+    """
+    Hashed timing wheel for connection liveness deadlines.
+    
+    Scheduling and cancelling are O(1), and each tick only visits the slot
+    that has come due instead of sweeping every connection.
+    """
+    
+    def __init__(self, tick_seconds: float = 5.0, slot_count: int = 64):
+        self.tick_seconds = tick_seconds
+        self._slots: List[Set[str]] = [set() for _ in range(slot_count)]
+        self._cursor = 0
+        self._entries: Dict[str, Tuple[int, int]] = {}  # key -> (slot, remaining rotations)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+    
+    def schedule(self, key: str, delay_seconds: float):
+        """(Re)schedule key to come due after delay_seconds, at the next tick at the earliest"""
+        self.cancel(key)
+        ticks = max(1, math.ceil(delay_seconds / self.tick_seconds))
+        slot = (self._cursor + ticks) % len(self._slots)
+        self._slots[slot].add(key)
+        self._entries[key] = (slot, (ticks - 1) // len(self._slots))
+    
+    def cancel(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._slots[entry[0]].discard(key)
+    
+    def advance(self) -> List[str]:
+        """Move one tick forward and return the keys that came due"""
+        self._cursor = (self._cursor + 1) % len(self._slots)
+        slot = self._slots[self._cursor]
+        due = []
+        for key in list(slot):
+            index, rotations = self._entries[key]
+            if rotations == 0:
+                slot.discard(key)
+                del self._entries[key]
+                due.append(key)
+            else:
+                self._entries[key] = (index, rotations - 1)
+        return due
+    
+    def clear(self):
+        for slot in self._slots:
+            slot.clear()
+        self._entries.clear()
+
 class WebSocketConnection:
     """Enhanced WebSocket connection with user context"""
     
-    def __init__(self, websocket: WebSocket, user_id: Optional[str] = None):
+    # enqueue() outcomes
+    QUEUED = "queued"
+    COALESCED = "coalesced"
+    DISPLACED = "displaced"  # queued after dropping an older pending message
+    
+    def __init__(self, websocket: WebSocket, user_id: Optional[str] = None, max_queue_size: int = 256):
         self.websocket = websocket
         self.user_id = user_id
         self.connected_at = datetime.utcnow()
@@ -118,23 +322,87 @@ class WebSocketConnection:
         self.subscription_filters: List[SubscriptionFilter] = []
         self.message_count = 0
         self.is_active = True
+        
+        # Bounded send queue of encoded payloads, drained by a per-connection task
+        self.max_queue_size = max_queue_size
+        self.send_queue: "OrderedDict[Hashable, Tuple[NotificationPriority, str]]" = OrderedDict()
+        self.sender_task: Optional[asyncio.Task] = None
+        self.dropped_messages = 0
+        self.coalesced_messages = 0
+        self._queue_ready = asyncio.Event()
+        self._sequence = 0
     
-    async def send_message(self, notification: NotificationMessage):
-        """Send notification if it matches filters"""
+    def wants(self, notification: NotificationMessage) -> bool:
+        """Check if any filter matches (no filters means everything)"""
+        return not self.subscription_filters or any(
+            f.matches(notification) for f in self.subscription_filters
+        )
+    
+    def enqueue(
+        self,
+        payload: str,
+        priority: NotificationPriority,
+        coalesce_key: Optional[Hashable] = None
+    ) -> str:
+        """
+        Queue an encoded notification for sending.
+        
+        A pending message with the same coalesce key is replaced in place. When
+        the queue is full the oldest non-critical message is dropped.
+        """
+        if coalesce_key is not None and coalesce_key in self.send_queue:
+            self.send_queue[coalesce_key] = (priority, payload)
+            self.coalesced_messages += 1
+            return self.COALESCED
+        
+        outcome = self.QUEUED
+        if len(self.send_queue) >= self.max_queue_size:
+            self._drop_oldest()
+            outcome = self.DISPLACED
+        
+        if coalesce_key is None:
+            self._sequence += 1
+            coalesce_key = self._sequence
+        self.send_queue[coalesce_key] = (priority, payload)
+        self._queue_ready.set()
+        return outcome
+    
+    def _drop_oldest(self):
+        victim = next(
+            (key for key, (priority, _) in self.send_queue.items()
+             if priority != NotificationPriority.CRITICAL),
+            None
+        )
+        if victim is None:
+            victim = next(iter(self.send_queue))
+        del self.send_queue[victim]
+        self.dropped_messages += 1
+    
+    async def next_payload(self) -> str:
+        """Wait for and pop the oldest pending payload"""
+        while not self.send_queue:
+            self._queue_ready.clear()
+            await self._queue_ready.wait()
+        _, (_, payload) = self.send_queue.popitem(last=False)
+        return payload
+    
+    async def send_payload(self, payload: str):
+        """Send an already encoded message"""
         try:
-            # Check if any filter matches
-            if not self.subscription_filters or any(
-                f.matches(notification) for f in self.subscription_filters
-            ):
-                await self.websocket.send_text(json.dumps(notification.to_dict()))
-                self.message_count += 1
-                return True
-            return False
+            await self.websocket.send_text(payload)
+            self.message_count += 1
         except Exception as e:
             logger.error(f"Failed to send message to {self.user_id}: {e}")
             self.is_active = False
             raise
     
+    async def send_message(self, notification: NotificationMessage):
+        """Send notification immediately if it matches filters"""
+        if not self.wants(notification):
+            return False
+        await self.send_payload(json.dumps(notification.to_dict()))
+        return True
+    
     async def ping(self):
         """Send ping to keep connection alive"""
         try:
@@ -151,22 +419,42 @@ class WebSocketConnection:
 class RealtimeNotificationService:
     """Comprehensive real-time notification service"""
     
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        send_queue_size: Optional[int] = None,
+        ping_interval_seconds: float = 60.0,
+        stale_after_seconds: float = 300.0,
+        liveness_tick_seconds: float = 5.0
+    ):
         self.connections: Dict[str, WebSocketConnection] = {}
         self.redis_client = None
         self.notification_queue = asyncio.Queue()
         self.processing_task = None
-        self.cleanup_task = None
-        self.ping_task = None
+        self.liveness_task = None
         self.redis_url = redis_url
         
+        # Per-connection send queue bound
+        self.send_queue_size = send_queue_size or int(os.getenv("A1_NOTIFICATION_QUEUE_SIZE", "256"))
+        
+        # Routing index and liveness deadlines
+        self.subscriptions = SubscriptionIndex()
+        self.ping_interval_seconds = ping_interval_seconds
+        self.stale_after = timedelta(seconds=stale_after_seconds)
+        self.liveness = TimerWheel(
+            tick_seconds=liveness_tick_seconds,
+            slot_count=math.ceil(max(ping_interval_seconds, stale_after_seconds) / liveness_tick_seconds) + 1
+        )
+        
         # Statistics
         self.stats = {
             'total_notifications': 0,
             'total_connections': 0,
             'notifications_sent': 0,
             'failed_sends': 0,
-            'active_connections': 0
+            'active_connections': 0,
+            'dropped_messages': 0,
+            'coalesced_messages': 0
         }
     
     async def initialize(self):
@@ -176,8 +464,7 @@ class RealtimeNotificationService:
             
             # Start background tasks
             self.processing_task = asyncio.create_task(self._process_notifications())
-            self.cleanup_task = asyncio.create_task(self._cleanup_connections())
-            self.ping_task = asyncio.create_task(self._ping_connections())
+            self.liveness_task = asyncio.create_task(self._run_liveness_wheel())
             
             logger.info("RealtimeNotificationService initialized successfully")
         except Exception as e:
@@ -189,35 +476,39 @@ class RealtimeNotificationService:
         # Cancel background tasks
         if self.processing_task:
             self.processing_task.cancel()
-        if self.cleanup_task:
-            self.cleanup_task.cancel()
-        if self.ping_task:
-            self.ping_task.cancel()
+        if self.liveness_task:
+            self.liveness_task.cancel()
         
         # Close all connections
         for connection in list(self.connections.values()):
+            if connection.sender_task:
+                connection.sender_task.cancel()
             try:
                 await connection.websocket.close()
             except:
                 pass
         
         self.connections.clear()
+        self.subscriptions.clear()
+        self.liveness.clear()
         logger.info("RealtimeNotificationService shutdown complete")
     
     async def add_connection(
-        self, 
-        websocket: WebSocket, 
+        self,
+        websocket: WebSocket,
         user_id: Optional[str] = None,
         filters: Optional[List[SubscriptionFilter]] = None
     ) -> str:
         """Add new WebSocket connection"""
         connection_id = f"{user_id or 'anonymous'}_{datetime.utcnow().timestamp()}"
         
-        connection = WebSocketConnection(websocket, user_id)
+        connection = WebSocketConnection(websocket, user_id, max_queue_size=self.send_queue_size)
         if filters:
             connection.subscription_filters = filters
         
         self.connections[connection_id] = connection
+        self.subscriptions.add(connection_id, user_id, connection.subscription_filters)
+        self.liveness.schedule(connection_id, self.ping_interval_seconds)
         self.stats['total_connections'] += 1
         self.stats['active_connections'] = len(self.connections)
         
@@ -238,20 +529,42 @@ class RealtimeNotificationService:
         except:
             pass
         
+        connection.sender_task = asyncio.create_task(self._drain_connection(connection_id, connection))
+        
         return connection_id
     
     async def remove_connection(self, connection_id: str):
         """Remove WebSocket connection"""
-        if connection_id in self.connections:
-            connection = self.connections[connection_id]
-            try:
-                await connection.websocket.close()
-            except:
-                pass
-            
-            del self.connections[connection_id]
-            self.stats['active_connections'] = len(self.connections)
-            logger.info(f"Removed WebSocket connection: {connection_id}")
+        connection = self.connections.pop(connection_id, None)
+        if connection is None:
+            return
+        
+        self.subscriptions.remove(connection_id)
+        self.liveness.cancel(connection_id)
+        if connection.sender_task and connection.sender_task is not asyncio.current_task():
+            connection.sender_task.cancel()
+        try:
+            await connection.websocket.close()
+        except:
+            pass
+        
+        self.stats['active_connections'] = len(self.connections)
+        logger.info(f"Removed WebSocket connection: {connection_id}")
+    
+    def add_subscription_filter(self, connection_id: str, subscription_filter: SubscriptionFilter):
+        """Append a filter to a connection and update the routing index"""
+        connection = self.connections.get(connection_id)
+        if connection is None:
+            return
+        self.set_subscription_filters(connection_id, connection.subscription_filters + [subscription_filter])
+    
+    def set_subscription_filters(self, connection_id: str, filters: List[SubscriptionFilter]):
+        """Replace a connection's filters and update the routing index"""
+        connection = self.connections.get(connection_id)
+        if connection is None:
+            return
+        connection.subscription_filters = list(filters)
+        self.subscriptions.set_filters(connection_id, connection.subscription_filters)
     
     async def send_notification(self, notification: NotificationMessage):
         """Queue notification for processing"""
@@ -259,20 +572,17 @@ class RealtimeNotificationService:
         self.stats['total_notifications'] += 1
     
     async def send_targeted_notification(
-        self, 
-        notification: NotificationMessage, 
+        self,
+        notification: NotificationMessage,
         user_ids: List[str]
     ):
         """Send notification to specific users"""
-        for connection_id, connection in self.connections.items():
-            if connection.user_id in user_ids:
-                try:
-                    sent = await connection.send_message(notification)
-                    if sent:
-                        self.stats['notifications_sent'] += 1
-                except Exception as e:
-                    self.stats['failed_sends'] += 1
-                    logger.error(f"Failed to send targeted notification: {e}")
+        connection_ids = [
+            connection_id
+            for connection_id in self.subscriptions.connections_for_users(user_ids)
+            if self.connections[connection_id].wants(notification)
+        ]
+        self._fan_out(notification, connection_ids)
     
     async def broadcast_system_alert(self, title: str, message: str, priority: NotificationPriority = NotificationPriority.MEDIUM):
         """Broadcast system-wide alert"""
@@ -288,88 +598,96 @@ class RealtimeNotificationService:
         
         await self.send_notification(notification)
     
+    def _fan_out(self, notification: NotificationMessage, connection_ids: Iterable[str]) -> str:
+        """Encode once and queue the payload on each connection; returns the payload"""
+        payload = json.dumps(notification.to_dict())
+        coalesce_key = notification.coalesce_key()
+        
+        for connection_id in connection_ids:
+            connection = self.connections.get(connection_id)
+            if connection is None or not connection.is_active:
+                continue
+            outcome = connection.enqueue(payload, notification.priority, coalesce_key)
+            if outcome == WebSocketConnection.COALESCED:
+                self.stats['coalesced_messages'] += 1
+            elif outcome == WebSocketConnection.DISPLACED:
+                self.stats['dropped_messages'] += 1
+        
+        return payload
+    
     async def _process_notifications(self):
         """Background task to process notification queue"""
         while True:
             try:
                 notification = await self.notification_queue.get()
                 
-                # Send to all matching connections
-                for connection_id, connection in list(self.connections.items()):
-                    if not connection.is_active:
-                        continue
-                    
-                    try:
-                        sent = await connection.send_message(notification)
-                        if sent:
-                            self.stats['notifications_sent'] += 1
-                    except Exception as e:
-                        self.stats['failed_sends'] += 1
-                        logger.error(f"Failed to send notification to {connection_id}: {e}")
-                        # Mark connection as inactive
-                        connection.is_active = False
+                # Route through the subscription index to matching connections only
+                payload = self._fan_out(notification, self.subscriptions.route(notification))
                 
                 # Store in Redis for persistence (optional)
                 if self.redis_client:
                     try:
-                        await self._store_notification_redis(notification)
+                        await self._store_notification_redis(notification, payload)
                     except Exception as e:
                         logger.error(f"Failed to store notification in Redis: {e}")
-                
+            
             except Exception as e:
                 logger.error(f"Error processing notifications: {e}")
                 await asyncio.sleep(1)
     
-    async def _cleanup_connections(self):
-        """Background task to cleanup inactive connections"""
+    async def _drain_connection(self, connection_id: str, connection: WebSocketConnection):
+        """Per-connection sender: writes queued payloads until a send fails"""
         while True:
+            payload = await connection.next_payload()
             try:
-                await asyncio.sleep(30)  # Check every 30 seconds
-                
-                now = datetime.utcnow()
-                inactive_connections = []
-                
-                for connection_id, connection in self.connections.items():
-                    # Remove connections inactive for more than 5 minutes
-                    if (
-                        not connection.is_active or 
-                        now - connection.last_ping > timedelta(minutes=5)
-                    ):
-                        inactive_connections.append(connection_id)
-                
-                for connection_id in inactive_connections:
-                    await self.remove_connection(connection_id)
-                
-                if inactive_connections:
-                    logger.info(f"Cleaned up {len(inactive_connections)} inactive connections")
-                
+                await connection.send_payload(payload)
+                self.stats['notifications_sent'] += 1
             except Exception as e:
-                logger.error(f"Error in cleanup task: {e}")
+                self.stats['failed_sends'] += 1
+                logger.error(f"Failed to send notification to {connection_id}: {e}")
+                # Removed on the next liveness tick
+                self.liveness.schedule(connection_id, 0)
+                return
     
-    async def _ping_connections(self):
-        """Background task to ping connections"""
+    async def _run_liveness_wheel(self):
+        """Background task: ping or expire only the connections whose deadline came due"""
         while True:
             try:
-                await asyncio.sleep(60)  # Ping every minute
-                
-                for connection in list(self.connections.values()):
-                    if connection.is_active:
-                        try:
-                            await connection.ping()
-                        except:
-                            connection.is_active = False
+                await asyncio.sleep(self.liveness.tick_seconds)
                 
+                for connection_id in self.liveness.advance():
+                    await self._check_liveness(connection_id)
+            
             except Exception as e:
-                logger.error(f"Error in ping task: {e}")
+                logger.error(f"Error in liveness task: {e}")
     
-    async def _store_notification_redis(self, notification: NotificationMessage):
+    async def _check_liveness(self, connection_id: str):
+        connection = self.connections.get(connection_id)
+        if connection is None:
+            return
+        
+        # Remove connections that failed or have not answered for too long
+        if not connection.is_active or datetime.utcnow() - connection.last_ping > self.stale_after:
+            await self.remove_connection(connection_id)
+            logger.info(f"Cleaned up inactive connection: {connection_id}")
+            return
+        
+        try:
+            await connection.ping()
+        except:
+            await self.remove_connection(connection_id)
+            return
+        self.liveness.schedule(connection_id, self.ping_interval_seconds)
+    
+    async def _store_notification_redis(self, notification: NotificationMessage, payload: Optional[str] = None):
         """Store notification in Redis for persistence"""
         try:
             key = f"notification:{notification.id}"
-            data = notification.to_dict()
+            if payload is None:
+                payload = json.dumps(notification.to_dict())
             
             # Store with TTL of 24 hours
-            self.redis_client.setex(key, 86400, json.dumps(data))
+            self.redis_client.setex(key, 86400, payload)
             
             # Add to user-specific notifications if user_id exists
             if notification.user_id:
@@ -377,7 +695,7 @@ class RealtimeNotificationService:
                 self.redis_client.lpush(user_key, notification.id)
                 self.redis_client.ltrim(user_key, 0, 99)  # Keep last 100 notifications
                 self.redis_client.expire(user_key, 86400)  # 24 hour TTL
-            
+        
         except Exception as e:
             logger.error(f"Failed to store notification in Redis: {e}")
     
@@ -391,6 +709,7 @@ class RealtimeNotificationService:
                     'user_id': conn.user_id,
                     'connected_at': conn.connected_at.isoformat(),
                     'message_count': conn.message_count,
+                    'pending_messages': len(conn.send_queue),
                     'is_active': conn.is_active
                 }
                 for conn_id, conn in self.connections.items()
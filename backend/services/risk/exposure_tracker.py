@@ -5,17 +5,55 @@ Tracks user exposure across players, prop types, and correlation clusters.
 Enforces exposure limits and provides risk analysis.
 """
 
+import atexit
 import logging
+import os
+import threading
 from dataclasses import dataclass
-from datetime import datetime, timezone, date
-from typing import Dict, Any, Optional, List
+from datetime import datetime, timezone, date, timedelta
+from typing import Dict, Any, Callable, Iterable, Optional, List, Set, Tuple
 from decimal import Decimal
 
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.orm import Session
+
 from backend.models.risk_personalization import ExposureSnapshot, BankrollProfile
 from backend.services.unified_config import unified_config
 
 logger = logging.getLogger(__name__)
 
+# Ledger dimensions, one per exposure_snapshots filter column (DAILY has none)
+DAILY = "daily"
+PLAYER = "player"
+PROP_TYPE = "prop_type"
+CLUSTER = "cluster"
+
+# (user_id, day, dimension, value)
+LedgerKey = Tuple[str, date, str, Any]
+
+# Ledger dimension -> proposed addition / ticket leg field
+LEG_DIMENSIONS = (
+    (PLAYER, "player_id"),
+    (PROP_TYPE, "prop_type"),
+    (CLUSTER, "correlation_cluster_id"),
+)
+
+# Ledger dimension -> type of the matching exposure_snapshots column
+_DIMENSION_TYPES = {PLAYER: str, PROP_TYPE: str, CLUSTER: int}
+
+
+def ledger_key(user_id: Any, day: date, dimension: str = DAILY, value: Any = None) -> Optional[LedgerKey]:
+    """
+    Build a ledger key with values typed like their exposure_snapshots columns,
+    so keys applied in-process match the ones rebuilt from the table.
+    Returns None when there is no user to attribute the exposure to.
+    """
+    if user_id is None:
+        return None
+    if value is not None:
+        value = _DIMENSION_TYPES[dimension](value)
+    return (str(user_id), day, dimension, value)
+
 
 @dataclass
 class ExposureDecision:
@@ -29,11 +67,253 @@ class ExposureDecision:
     reason: Optional[str] = None
 
 
+def _default_session() -> Session:
+    from backend.database import sync_engine
+    return Session(sync_engine)
+
+
+class ExposureLedger:
+    """
+    In-memory daily exposure totals keyed by (user, day, dimension, value).
+    
+    Each ticket's deltas are applied together under one short lock, so limit
+    checks never see half a ticket and never wait on the database. Touched
+    keys are written behind to exposure_snapshots in batches by a background
+    thread, and the ledger is rebuilt from that table when it is created.
+    """
+    
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        flush_batch_size: Optional[int] = None,
+        flush_interval_sec: Optional[float] = None,
+        rebuild: bool = True
+    ):
+        self._session_factory = session_factory or _default_session
+        self.flush_batch_size = flush_batch_size or int(os.getenv("A1_EXPOSURE_FLUSH_BATCH", "100"))
+        self.flush_interval_sec = (
+            flush_interval_sec if flush_interval_sec is not None
+            else float(os.getenv("A1_EXPOSURE_FLUSH_INTERVAL_SEC", "5"))
+        )
+        
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._totals: Dict[LedgerKey, List[float]] = {}  # key -> [total_staked, tickets_count]
+        self._dirty: Set[LedgerKey] = set()
+        self._quarantined: Set[LedgerKey] = set()  # keys the database rejected
+        self._wake = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        
+        if rebuild:
+            self.rebuild()
+            
+    def apply(self, deltas: Iterable[Tuple[LedgerKey, float, int]]) -> None:
+        """Atomically add (key, stake, tickets) deltas; keys without a user are dropped"""
+        with self._lock:
+            for key, stake, tickets in deltas:
+                if key is None or key[0] is None:
+                    logger.warning("Dropping exposure delta without a user: key=%s", key)
+                    continue
+                totals = self._totals.get(key)
+                if totals is None:
+                    self._totals[key] = [stake, tickets]
+                else:
+                    totals[0] += stake
+                    totals[1] += tickets
+                self._dirty.add(key)
+            
+            if len(self._dirty) >= self.flush_batch_size:
+                self._wake.set()
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._write_behind, name="exposure-ledger-writer", daemon=True
+                )
+                self._writer.start()
+                
+    def get(self, key: LedgerKey) -> float:
+        """Total staked for one key"""
+        totals = self._totals.get(key)
+        return totals[0] if totals else 0.0
+        
+    def get_many(self, keys: List[LedgerKey]) -> List[float]:
+        """Total staked for several keys, read consistently"""
+        with self._lock:
+            return [self.get(key) for key in keys]
+            
+    def rebuild(self, since: Optional[date] = None) -> None:
+        """Reload totals from exposure_snapshots (default: yesterday onwards)"""
+        since = since or date.today() - timedelta(days=1)
+        session = self._session_factory()
+        try:
+            rows = session.query(ExposureSnapshot).filter(ExposureSnapshot.date >= since).all()
+        except Exception as e:
+            logger.warning("Exposure ledger rebuild failed, starting empty: %s", e)
+            return
+        finally:
+            session.close()
+            
+        totals: Dict[LedgerKey, List[float]] = {}
+        for row in rows:
+            key = self._key_for_snapshot(row)
+            if key is not None:
+                totals[key] = [row.total_staked or 0.0, row.tickets_count or 0]
+                
+        with self._lock:
+            self._totals = totals
+            self._dirty.clear()
+            
+        logger.info("Exposure ledger rebuilt: snapshots=%s, keys=%s", len(rows), len(totals))
+        
+    def flush(self) -> int:
+        """
+        Upsert dirty keys into exposure_snapshots in one batch; returns rows written
+        
+        If the batch is rejected by a constraint, each key is retried in its own
+        transaction and keys that still fail are quarantined (kept in memory but
+        no longer written), so one bad row cannot hold back the rest.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = {
+                    key: tuple(self._totals[key])
+                    for key in self._dirty if key not in self._quarantined
+                }
+                self._dirty.clear()
+            if not batch:
+                return 0
+                
+            try:
+                self._write_batch(batch)
+                written = len(batch)
+            except (IntegrityError, DataError) as e:
+                logger.warning(
+                    "Exposure ledger batch rejected, writing keys one by one: keys=%s, error=%s",
+                    len(batch), e
+                )
+                written = self._write_keys(batch)
+            except Exception as e:
+                with self._lock:
+                    self._dirty.update(batch)
+                logger.error("Exposure ledger flush failed, will retry: keys=%s, error=%s", len(batch), e)
+                return 0
+                
+            self._prune(date.today() - timedelta(days=1))
+            logger.debug("Flushed exposure ledger: keys=%s", written)
+            return written
+            
+    def _write_keys(self, batch: Dict[LedgerKey, Tuple[float, int]]) -> int:
+        """Write each key in its own transaction, quarantining constraint failures"""
+        written = 0
+        for key, totals in batch.items():
+            try:
+                self._write_batch({key: totals})
+                written += 1
+            except (IntegrityError, DataError) as e:
+                with self._lock:
+                    self._quarantined.add(key)
+                logger.error("Exposure snapshot rejected, key quarantined: key=%s, error=%s", key, e)
+            except Exception as e:
+                with self._lock:
+                    self._dirty.add(key)
+                logger.error("Exposure ledger flush failed, will retry: key=%s, error=%s", key, e)
+        return written
+        
+    def _write_batch(self, batch: Dict[LedgerKey, Tuple[float, int]]) -> None:
+        """Upsert ``batch`` in one transaction; rolls back and re-raises on failure"""
+        session = self._session_factory()
+        try:
+            # One query for every (user, day) in the batch
+            users = {key[0] for key in batch}
+            days = {key[1] for key in batch}
+            existing = {
+                self._key_for_snapshot(row): row
+                for row in session.query(ExposureSnapshot).filter(
+                    ExposureSnapshot.user_id.in_(users),
+                    ExposureSnapshot.date.in_(days)
+                )
+            }
+            
+            for key, (total_staked, tickets_count) in batch.items():
+                row = existing.get(key)
+                if row is None:
+                    user_id, day, dimension, value = key
+                    row = ExposureSnapshot(
+                        user_id=user_id,
+                        date=day,
+                        player_id=value if dimension == PLAYER else None,
+                        prop_type=value if dimension == PROP_TYPE else None,
+                        correlation_cluster_id=value if dimension == CLUSTER else None
+                    )
+                    session.add(row)
+                row.total_staked = total_staked
+                row.tickets_count = tickets_count
+                
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+            
+    def _write_behind(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval_sec)
+            self._wake.clear()
+            if self._dirty:
+                self.flush()
+                
+    def _prune(self, before: date) -> None:
+        """Drop flushed keys for days before ``before``"""
+        with self._lock:
+            for key in [k for k in self._totals if k[1] < before and k not in self._dirty]:
+                del self._totals[key]
+                
+    @staticmethod
+    def _key_for_snapshot(row: ExposureSnapshot) -> Optional[LedgerKey]:
+        filters = [
+            (dimension, value)
+            for dimension, value in (
+                (PLAYER, row.player_id),
+                (PROP_TYPE, row.prop_type),
+                (CLUSTER, row.correlation_cluster_id),
+            )
+            if value is not None
+        ]
+        if not filters:
+            return ledger_key(row.user_id, row.date)
+        if len(filters) == 1:
+            return ledger_key(row.user_id, row.date, *filters[0])
+        return None  # Multi-filter snapshots are not tracked by the ledger
+
+
+_exposure_ledger: Optional[ExposureLedger] = None
+_exposure_ledger_lock = threading.Lock()
+
+
+def get_exposure_ledger() -> ExposureLedger:
+    """Process-wide exposure ledger, rebuilt from the database on first use"""
+    global _exposure_ledger
+    if _exposure_ledger is None:
+        with _exposure_ledger_lock:
+            if _exposure_ledger is None:
+                _exposure_ledger = ExposureLedger()
+                atexit.register(_exposure_ledger.flush)
+    return _exposure_ledger
+
+
 class ExposureTrackerService:
     """Service for tracking and limiting user exposure"""
     
-    def __init__(self):
+    def __init__(self, ledger: Optional[ExposureLedger] = None):
         self.config = unified_config
+        self._ledger = ledger
+        
+    @property
+    def ledger(self) -> ExposureLedger:
+        """Exposure ledger, resolved on first use so importing stays side-effect free"""
+        if self._ledger is None:
+            self._ledger = get_exposure_ledger()
+        return self._ledger
         
     def update_exposure_on_ticket_submit(
         self,
@@ -58,58 +338,19 @@ class ExposureTrackerService:
             user_id, ticket_id, stake, len(legs)
         )
         
-        # Update overall exposure for the day
-        self._update_snapshot(
-            user_id=user_id,
-            date=current_date,
-            player_id=None,
-            prop_type=None,
-            correlation_cluster_id=None,
-            stake_to_add=stake,
-            tickets_to_add=1
-        )
-        
-        # Update exposure for each leg
-        for leg in legs:
-            player_id = leg.get("player_id")
-            prop_type = leg.get("prop_type")
-            cluster_id = leg.get("correlation_cluster_id")
+        if user_id is None:
+            logger.warning("Skipping exposure update for ticket without a user: ticket_id=%s", ticket_id)
+            return
             
-            # Individual player exposure
-            if player_id:
-                self._update_snapshot(
-                    user_id=user_id,
-                    date=current_date,
-                    player_id=player_id,
-                    prop_type=None,
-                    correlation_cluster_id=None,
-                    stake_to_add=stake,
-                    tickets_to_add=1
-                )
-                
-            # Prop type exposure
-            if prop_type:
-                self._update_snapshot(
-                    user_id=user_id,
-                    date=current_date,
-                    player_id=None,
-                    prop_type=prop_type,
-                    correlation_cluster_id=None,
-                    stake_to_add=stake,
-                    tickets_to_add=1
-                )
-                
-            # Correlation cluster exposure
-            if cluster_id:
-                self._update_snapshot(
-                    user_id=user_id,
-                    date=current_date,
-                    player_id=None,
-                    prop_type=None,
-                    correlation_cluster_id=cluster_id,
-                    stake_to_add=stake,
-                    tickets_to_add=1
-                )
+        # Overall exposure for the day, then each leg's player, prop type and cluster
+        deltas = [(ledger_key(user_id, current_date), stake, 1)]
+        for leg in legs:
+            for dimension, field in LEG_DIMENSIONS:
+                value = leg.get(field)
+                if value:
+                    deltas.append((ledger_key(user_id, current_date, dimension, value), stake, 1))
+                    
+        self.ledger.apply(deltas)
                 
     def get_current_exposure(
         self,
@@ -132,24 +373,16 @@ class ExposureTrackerService:
         """
         current_date = date.today()
         
-        # This would query the database - for now return mock data
-        # In real implementation: query ExposureSnapshot with filters
-        
-        if player_id and prop_type and cluster_id:
-            # Very specific exposure
-            return 50.0
-        elif player_id:
-            # Player-specific exposure
-            return 150.0
+        # Single-dimension ledger lookup, most specific filter first
+        if player_id:
+            key = ledger_key(user_id, current_date, PLAYER, player_id)
         elif prop_type:
-            # Prop type exposure
-            return 200.0
+            key = ledger_key(user_id, current_date, PROP_TYPE, prop_type)
         elif cluster_id:
-            # Cluster exposure
-            return 300.0
+            key = ledger_key(user_id, current_date, CLUSTER, cluster_id)
         else:
-            # Total daily exposure
-            return 500.0
+            key = ledger_key(user_id, current_date)
+        return self.ledger.get_many([key])[0]
             
     def is_exceeding_limits(
         self,
@@ -181,6 +414,16 @@ class ExposureTrackerService:
             user_id, bankroll, len(proposed_additions)
         )
         
+        # Current exposure for every dimension involved, read from the ledger at once
+        current_date = date.today()
+        keys = [ledger_key(user_id, current_date)]
+        for addition in proposed_additions:
+            for dimension, field in LEG_DIMENSIONS:
+                value = addition.get(field)
+                if value:
+                    keys.append(ledger_key(user_id, current_date, dimension, value))
+        current = dict(zip(keys, self.ledger.get_many(keys)))
+        
         # Check each proposed addition
         for addition in proposed_additions:
             player_id = addition.get("player_id")
@@ -190,9 +433,7 @@ class ExposureTrackerService:
             
             # Check player exposure limit
             if player_id:
-                current_exposure = self.get_current_exposure(
-                    user_id, player_id=player_id
-                )
+                current_exposure = current[ledger_key(user_id, current_date, PLAYER, player_id)]
                 new_exposure = current_exposure + stake
                 exposure_pct = new_exposure / bankroll
                 
@@ -209,9 +450,7 @@ class ExposureTrackerService:
                 
             # Check prop type exposure limit
             if prop_type:
-                current_exposure = self.get_current_exposure(
-                    user_id, prop_type=prop_type
-                )
+                current_exposure = current[ledger_key(user_id, current_date, PROP_TYPE, prop_type)]
                 new_exposure = current_exposure + stake
                 exposure_pct = new_exposure / bankroll
                 
@@ -228,9 +467,7 @@ class ExposureTrackerService:
                 
             # Check cluster exposure limit
             if cluster_id:
-                current_exposure = self.get_current_exposure(
-                    user_id, cluster_id=cluster_id
-                )
+                current_exposure = current[ledger_key(user_id, current_date, CLUSTER, cluster_id)]
                 new_exposure = current_exposure + stake
                 exposure_pct = new_exposure / bankroll
                 
@@ -246,7 +483,7 @@ class ExposureTrackerService:
                 decisions.append(decision)
                 
         # Check total daily exposure
-        current_daily = self.get_current_exposure(user_id)
+        current_daily = current[ledger_key(user_id, current_date)]
         total_new_stake = sum(add.get("stake", 0) for add in proposed_additions)
         new_daily_exposure = current_daily + total_new_stake
         daily_exposure_pct = new_daily_exposure / bankroll
@@ -313,40 +550,6 @@ class ExposureTrackerService:
             }
             
         return summary
-        
-    def _update_snapshot(
-        self,
-        user_id: str,
-        date: date,
-        player_id: Optional[str],
-        prop_type: Optional[str],
-        correlation_cluster_id: Optional[int],
-        stake_to_add: float,
-        tickets_to_add: int = 1
-    ) -> None:
-        """
-        Update or create an exposure snapshot
-        
-        In real implementation, this would:
-        1. Query for existing snapshot with matching filters
-        2. Create new snapshot if not found
-        3. Update totals (total_staked, tickets_count)
-        4. Save to database
-        """
-        
-        logger.debug(
-            "Updating exposure snapshot: user_id=%s, date=%s, player_id=%s, prop_type=%s, cluster_id=%s, stake=%s",
-            user_id, date, player_id, prop_type, correlation_cluster_id, stake_to_add
-        )
-        
-        # This would be a database operation in real implementation
-        # For now, just log the operation
-        snapshot_key = f"{user_id}_{date}_{player_id or 'null'}_{prop_type or 'null'}_{correlation_cluster_id or 'null'}"
-        
-        logger.info(
-            "Updated exposure snapshot %s: added stake=%s, tickets=%s",
-            snapshot_key, stake_to_add, tickets_to_add
-        )
 
 
 # Singleton instance
@@ -9,8 +9,9 @@ import asyncio
 import json
 import logging
 import pickle
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -18,6 +19,11 @@ import numpy as np
 import pandas as pd
 import pybaseball as pyb
 
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pq = None
+
 # Import the player ID mapping service
 from .player_id_mapping_service import PlayerIDMappingService
 
@@ -25,6 +31,11 @@ from .player_id_mapping_service import PlayerIDMappingService
 logger = logging.getLogger("statcast_pipeline")
 
 
+def _rate(hits: pd.Series, eligible: pd.Series, keys: pd.Series) -> pd.Series:
+    """Per-group share of ``eligible`` rows where ``hits`` is true (NaN if none)"""
+    return hits.astype(float).where(eligible).groupby(keys).mean()
+
+
 @dataclass
 class StatcastConfig:
     """Configuration for Statcast data pipeline"""
@@ -35,18 +46,62 @@ class StatcastConfig:
     training_years: int = 3  # Years of historical data
     cache_ttl_hours: int = 24  # Cache time-to-live
     feature_cache_dir: str = "data/statcast_features"
+    # Days fetched this long after they ended are final and never refetched
+    partition_settle_days: int = 2
 
 
 class StatcastDataPipeline:
     """
     Advanced pipeline for processing Baseball Savant Statcast data into
     features suitable for ML-based player projection models.
+
+    Raw pitch-level data is cached as one columnar partition per game day
+    (Parquet when pyarrow is available), so extending or shifting a date range
+    only downloads the days that are not cached yet.
     """
 
+    # Raw Statcast columns read by the feature builders
+    BATTING_FEATURE_COLUMNS = [
+        "batter",
+        "player_name",
+        "events",
+        "type",
+        "description",
+        "launch_speed",
+        "launch_angle",
+        "launch_speed_angle",
+        "estimated_ba_using_speedangle",
+        "estimated_woba_using_speedangle",
+        "plate_x",
+        "plate_z",
+    ]
+    PITCHING_FEATURE_COLUMNS = [
+        "pitcher",
+        "player_name",
+        "events",
+        "type",
+        "description",
+        "release_speed",
+        "release_spin",
+        "pfx_x",
+        "pfx_z",
+        "pitch_number",
+        "launch_speed",
+        "plate_x",
+        "plate_z",
+    ]
+
     def __init__(self, config: Optional[StatcastConfig] = None):
         self.config = config or StatcastConfig()
         self.cache_dir = Path(self.config.feature_cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.partition_dir = self.cache_dir / "statcast_days"
+        self.partition_dir.mkdir(parents=True, exist_ok=True)
+        self._manifest_path = self.partition_dir / "manifest.json"
+        self._manifest: Dict[str, Dict[str, Union[str, int, float]]] = (
+            self._load_manifest()
+        )
+        self._fetch_lock = asyncio.Lock()
 
         # Initialize player ID mapping service
         self.player_mapping = PlayerIDMappingService()
@@ -78,36 +133,55 @@ class StatcastDataPipeline:
         )
 
     async def fetch_historical_statcast_data(
-        self, start_date: str, end_date: str, min_results: int = 100
+        self,
+        start_date: Union[str, date],
+        end_date: Union[str, date],
+        min_results: int = 100,
+        columns: Optional[List[str]] = None,
     ) -> pd.DataFrame:
         """
         Fetch historical Statcast data for training models
 
+        Only days missing from the partition cache (or still inside their
+        settle window and older than ``cache_ttl_hours``) are downloaded.
+
         Args:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
             min_results: Minimum number of results required
+            columns: Raw columns to read; all columns when omitted
 
         Returns:
             DataFrame with pitch-by-pitch Statcast data
         """
-        cache_key = f"statcast_{start_date}_{end_date}.pkl"
-        cache_path = self.cache_dir / cache_key
-
-        # Check cache first
-        if cache_path.exists():
-            cache_age = datetime.now() - datetime.fromtimestamp(
-                cache_path.stat().st_mtime
-            )
-            if cache_age.total_seconds() < self.config.cache_ttl_hours * 3600:
-                logger.info(f"📁 Loading cached Statcast data: {cache_key}")
-                return pd.read_pickle(cache_path)
-
-        logger.info(f"🔄 Fetching fresh Statcast data: {start_date} to {end_date}")
+        days = pd.date_range(
+            pd.Timestamp(start_date).normalize(), pd.Timestamp(end_date).normalize()
+        )
+        day_keys = [day.strftime("%Y-%m-%d") for day in days]
 
         try:
-            # Fetch data using pybaseball
-            data = pyb.statcast(start_dt=start_date, end_dt=end_date)
+            async with self._fetch_lock:
+                missing = [day for day in day_keys if not self._partition_is_fresh(day)]
+                if missing:
+                    logger.info(
+                        f"🔄 Fetching {len(missing)}/{len(day_keys)} uncached Statcast days: "
+                        f"{day_keys[0]} to {day_keys[-1]}"
+                    )
+                    for range_start, range_end in self._contiguous_ranges(missing):
+                        fetched = pyb.statcast(start_dt=range_start, end_dt=range_end)
+                        self._write_partitions(
+                            fetched, self._days_between(range_start, range_end)
+                        )
+                    self._save_manifest()
+                else:
+                    logger.info(
+                        f"📁 Loading cached Statcast data: {day_keys[0]} to {day_keys[-1]}"
+                    )
+
+            if columns is not None:
+                # The ID columns are needed for player ID normalization
+                columns = list(dict.fromkeys([*columns, "batter", "pitcher"]))
+            data = self._read_partitions(day_keys, columns)
 
             if len(data) < min_results:
                 logger.warning(
@@ -116,20 +190,117 @@ class StatcastDataPipeline:
 
             # Normalize player IDs for ML pipeline compatibility
             logger.info("🔄 Normalizing player IDs for ML pipeline")
-            data = self.player_mapping.normalize_statcast_data(data)
-
-            # Cache the results
-            data.to_pickle(cache_path)
-            logger.info(
-                f"✅ Cached {len(data)} Statcast records with normalized player IDs"
-            )
-
-            return data
+            return self.player_mapping.normalize_statcast_data(data)
 
         except Exception as e:
             logger.error(f"❌ Error fetching Statcast data: {e}")
             raise
 
+    def _load_manifest(self) -> Dict[str, Dict[str, Union[str, int, float]]]:
+        """Read the day -> partition record index"""
+        try:
+            with open(self._manifest_path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        tmp_path = self._manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(self._manifest, handle)
+        tmp_path.replace(self._manifest_path)
+
+    def _partition_is_fresh(self, day: str) -> bool:
+        """A cached day is final once fetched after its settle window"""
+        entry = self._manifest.get(day)
+        if entry is None:
+            return False
+        if entry.get("file") and not (self.partition_dir / entry["file"]).exists():
+            return False
+        settled_at = (
+            pd.Timestamp(day) + timedelta(days=self.config.partition_settle_days + 1)
+        ).timestamp()
+        fetched_at = float(entry["fetched_at"])
+        if fetched_at >= settled_at:
+            return True
+        return time.time() - fetched_at < self.config.cache_ttl_hours * 3600
+
+    @staticmethod
+    def _contiguous_ranges(days: List[str]) -> List[Tuple[str, str]]:
+        """Collapse sorted day keys into (start, end) runs of consecutive days"""
+        ranges: List[Tuple[str, str]] = []
+        for day in days:
+            if ranges and pd.Timestamp(day) - pd.Timestamp(ranges[-1][1]) == timedelta(days=1):
+                ranges[-1] = (ranges[-1][0], day)
+            else:
+                ranges.append((day, day))
+        return ranges
+
+    @staticmethod
+    def _days_between(start: str, end: str) -> List[str]:
+        return [day.strftime("%Y-%m-%d") for day in pd.date_range(start, end)]
+
+    def _write_partitions(self, data: pd.DataFrame, days: List[str]) -> None:
+        """Split a fetched range by game_date and write one file per day"""
+        fetched_at = time.time()
+        if data is None or data.empty or "game_date" not in data.columns:
+            by_day = {}
+        else:
+            game_days = pd.to_datetime(data["game_date"]).dt.strftime("%Y-%m-%d")
+            by_day = {
+                day: frame.reset_index(drop=True)
+                for day, frame in data.groupby(game_days.to_numpy(), sort=False)
+            }
+
+        for day in days:
+            frame = by_day.get(day)
+            entry: Dict[str, Union[str, int, float]] = {
+                "rows": 0 if frame is None else len(frame),
+                "fetched_at": fetched_at,
+            }
+            if frame is not None and len(frame):
+                entry["file"] = self._write_partition(day, frame)
+            self._manifest[day] = entry
+
+    def _write_partition(self, day: str, frame: pd.DataFrame) -> str:
+        if pq is not None:
+            file_name = f"{day}.parquet"
+            try:
+                frame.to_parquet(self.partition_dir / file_name, index=False)
+                return file_name
+            except Exception as e:
+                # Mixed-type object columns can fail Arrow conversion
+                logger.warning(f"⚠️ Parquet write failed for {day}, using pickle: {e}")
+        file_name = f"{day}.pkl"
+        frame.to_pickle(self.partition_dir / file_name)
+        return file_name
+
+    def _read_partitions(
+        self, days: List[str], columns: Optional[List[str]]
+    ) -> pd.DataFrame:
+        """Concatenate cached days, reading only the requested columns"""
+        frames = []
+        for day in days:
+            file_name = self._manifest.get(day, {}).get("file")
+            if not file_name:
+                continue
+            path = self.partition_dir / file_name
+            if path.suffix == ".parquet":
+                available = pq.read_schema(path).names
+                wanted = (
+                    None if columns is None else [c for c in columns if c in available]
+                )
+                frames.append(pq.read_table(path, columns=wanted).to_pandas())
+            else:
+                frame = pd.read_pickle(path)
+                if columns is not None:
+                    frame = frame[[c for c in columns if c in frame.columns]]
+                frames.append(frame)
+
+        if not frames:
+            return pd.DataFrame(columns=columns or [])
+        return pd.concat(frames, ignore_index=True)
+
     def create_batting_features(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Engineer batting features from raw Statcast data
@@ -140,92 +311,77 @@ class StatcastDataPipeline:
         - Contact quality metrics
         - Plate discipline metrics
         - Expected statistics
+
+        All per-batter features come from grouped aggregations over masked
+        columns; rates over a subset (e.g. batted balls) are means of a
+        mask that is NaN outside the subset.
         """
         logger.info("🔧 Engineering batting features from Statcast data")
 
         # Filter to batting events only
-        batting_data = data[data["events"].notna()].copy()
-
-        # Group by batter
-        batter_features = []
-
-        for batter_id, batter_data in batting_data.groupby("batter"):
-            if len(batter_data) < self.config.min_plate_appearances:
-                continue
-
-            features = {
-                "player_id": batter_id,
-                "player_name": batter_data["player_name"].iloc[0],
-                "plate_appearances": len(batter_data),
-            }
-
+        batting_data = data[data["events"].notna()]
+        plate_appearances = batting_data.groupby("batter").size()
+        qualified = plate_appearances.index[
+            plate_appearances >= self.config.min_plate_appearances
+        ]
+        if len(qualified) == 0:
+            logger.info("✅ Created 0 batter feature records")
+            return pd.DataFrame()
+
+        batting_data = batting_data[batting_data["batter"].isin(qualified)]
+        batter = batting_data["batter"]
+        exit_velo = batting_data["launch_speed"]
+        launch_angle = batting_data["launch_angle"]
+        is_batted_ball = batting_data["type"] == "X"
+        speed_angle = batting_data["launch_speed_angle"]
+
+        grouped_velo = exit_velo.groupby(batter)
+        features = {
+            "player_name": batting_data.drop_duplicates("batter").set_index("batter")[
+                "player_name"
+            ],
+            "plate_appearances": plate_appearances,
             # Exit velocity features
-            exit_velo = batter_data["launch_speed"].dropna()
-            if len(exit_velo) > 0:
-                features.update(
-                    {
-                        "avg_exit_velocity": exit_velo.mean(),
-                        "max_exit_velocity": exit_velo.max(),
-                        "ev_50": exit_velo.quantile(0.5),
-                        "ev_90": exit_velo.quantile(0.9),
-                        "hard_hit_rate": (exit_velo >= 95).mean(),
-                    }
-                )
-
+            "avg_exit_velocity": grouped_velo.mean(),
+            "max_exit_velocity": grouped_velo.max(),
+            "ev_50": grouped_velo.quantile(0.5),
+            "ev_90": grouped_velo.quantile(0.9),
+            "hard_hit_rate": _rate(exit_velo >= 95, exit_velo.notna(), batter),
             # Launch angle features
-            launch_angles = batter_data["launch_angle"].dropna()
-            if len(launch_angles) > 0:
-                features.update(
-                    {
-                        "avg_launch_angle": launch_angles.mean(),
-                        "sweet_spot_rate": (
-                            (launch_angles >= 8) & (launch_angles <= 32)
-                        ).mean(),
-                        "ground_ball_rate": (launch_angles < 10).mean(),
-                        "fly_ball_rate": (launch_angles > 25).mean(),
-                    }
-                )
-
+            "avg_launch_angle": launch_angle.groupby(batter).mean(),
+            "sweet_spot_rate": _rate(
+                (launch_angle >= 8) & (launch_angle <= 32), launch_angle.notna(), batter
+            ),
+            "ground_ball_rate": _rate(launch_angle < 10, launch_angle.notna(), batter),
+            "fly_ball_rate": _rate(launch_angle > 25, launch_angle.notna(), batter),
             # Contact quality
-            batted_balls = batter_data[batter_data["type"] == "X"]
-            if len(batted_balls) > 0:
-                features.update(
-                    {
-                        "barrel_rate": (batted_balls["launch_speed_angle"] == 6).mean(),
-                        "solid_contact_rate": (
-                            batted_balls["launch_speed_angle"] == 5
-                        ).mean(),
-                    }
-                )
-
-            # Expected statistics
-            if "estimated_ba_using_speedangle" in batter_data.columns:
-                features["expected_ba"] = batter_data[
-                    "estimated_ba_using_speedangle"
-                ].mean()
-            if "estimated_woba_using_speedangle" in batter_data.columns:
-                features["expected_woba"] = batter_data[
-                    "estimated_woba_using_speedangle"
-                ].mean()
-
-            # Plate discipline
-            all_pitches = data[data["batter"] == batter_id]
-            if len(all_pitches) > 0:
-                features.update(
-                    {
-                        "swing_rate": (
-                            all_pitches["description"].str.contains(
-                                "swing|foul", case=False, na=False
-                            )
-                        ).mean(),
-                        "contact_rate": (all_pitches["type"] == "X").mean(),
-                        "chase_rate": self._calculate_chase_rate(all_pitches),
-                    }
-                )
+            "barrel_rate": _rate(speed_angle == 6, is_batted_ball, batter),
+            "solid_contact_rate": _rate(speed_angle == 5, is_batted_ball, batter),
+        }
+
+        # Expected statistics
+        if "estimated_ba_using_speedangle" in batting_data.columns:
+            features["expected_ba"] = (
+                batting_data["estimated_ba_using_speedangle"].groupby(batter).mean()
+            )
+        if "estimated_woba_using_speedangle" in batting_data.columns:
+            features["expected_woba"] = (
+                batting_data["estimated_woba_using_speedangle"].groupby(batter).mean()
+            )
 
-            batter_features.append(features)
+        # Plate discipline, over every pitch seen
+        all_pitches = data[data["batter"].isin(qualified)]
+        pitch_batter = all_pitches["batter"]
+        features["swing_rate"] = (
+            all_pitches["description"]
+            .str.contains("swing|foul", case=False, na=False)
+            .groupby(pitch_batter)
+            .mean()
+        )
+        features["contact_rate"] = (all_pitches["type"] == "X").groupby(pitch_batter).mean()
+        features["chase_rate"] = self._grouped_chase_rate(all_pitches, pitch_batter)
 
-        features_df = pd.DataFrame(batter_features)
+        features_df = self._assemble_features(qualified, features)
         logger.info(f"✅ Created {len(features_df)} batter feature records")
 
         return features_df
@@ -242,94 +398,110 @@ class StatcastDataPipeline:
         """
         logger.info("🔧 Engineering pitching features from Statcast data")
 
-        # Group by pitcher
-        pitcher_features = []
-
-        for pitcher_id, pitcher_data in data.groupby("pitcher"):
-            innings_pitched = len(pitcher_data[pitcher_data["events"].notna()]) / 3
-            if innings_pitched < self.config.min_innings_pitched:
-                continue
-
-            features = {
-                "player_id": pitcher_id,
-                "player_name": (
-                    pitcher_data["player_name"].iloc[0]
-                    if "player_name" in pitcher_data.columns
-                    else "Unknown"
-                ),
-                "pitches_thrown": len(pitcher_data),
-                "estimated_innings": innings_pitched,
-            }
+        innings_pitched = data["events"].notna().groupby(data["pitcher"]).sum() / 3
+        qualified = innings_pitched.index[
+            innings_pitched >= self.config.min_innings_pitched
+        ]
+        if len(qualified) == 0:
+            logger.info("✅ Created 0 pitcher feature records")
+            return pd.DataFrame()
+
+        pitcher_data = data[data["pitcher"].isin(qualified)]
+        pitcher = pitcher_data["pitcher"]
+        velocity = pitcher_data["release_speed"].groupby(pitcher)
+        spin_rate = pitcher_data["release_spin"].groupby(pitcher)
+
+        if "player_name" in pitcher_data.columns:
+            player_name = pitcher_data.drop_duplicates("pitcher").set_index("pitcher")[
+                "player_name"
+            ]
+        else:
+            player_name = pd.Series("Unknown", index=qualified)
 
+        features = {
+            "player_name": player_name,
+            "pitches_thrown": pitcher.groupby(pitcher).size(),
+            "estimated_innings": innings_pitched,
             # Velocity features
-            velocity = pitcher_data["release_speed"].dropna()
-            if len(velocity) > 0:
-                features.update(
-                    {
-                        "avg_velocity": velocity.mean(),
-                        "max_velocity": velocity.max(),
-                        "velocity_std": velocity.std(),
-                    }
-                )
-
+            "avg_velocity": velocity.mean(),
+            "max_velocity": velocity.max(),
+            "velocity_std": velocity.std(),
             # Spin rate features
-            spin_rate = pitcher_data["release_spin"].dropna()
-            if len(spin_rate) > 0:
-                features.update(
-                    {
-                        "avg_spin_rate": spin_rate.mean(),
-                        "spin_rate_std": spin_rate.std(),
-                    }
-                )
-
-            # Movement features
-            if "pfx_x" in pitcher_data.columns and "pfx_z" in pitcher_data.columns:
-                features.update(
-                    {
-                        "avg_horizontal_movement": pitcher_data["pfx_x"].mean(),
-                        "avg_vertical_movement": pitcher_data["pfx_z"].mean(),
-                    }
-                )
+            "avg_spin_rate": spin_rate.mean(),
+            "spin_rate_std": spin_rate.std(),
+        }
+
+        # Movement features
+        if "pfx_x" in pitcher_data.columns and "pfx_z" in pitcher_data.columns:
+            features["avg_horizontal_movement"] = pitcher_data["pfx_x"].groupby(pitcher).mean()
+            features["avg_vertical_movement"] = pitcher_data["pfx_z"].groupby(pitcher).mean()
+
+        # Command metrics
+        is_strike = pitcher_data["type"].isin(["S", "X"])
+        features["strike_rate"] = is_strike.groupby(pitcher).mean()
+        if "pitch_number" in pitcher_data.columns:
+            features["first_pitch_strike_rate"] = _rate(
+                is_strike, pitcher_data["pitch_number"] == 1, pitcher
+            ).fillna(0.0)
+        else:
+            features["first_pitch_strike_rate"] = 0.0
+        features["zone_rate"] = self._grouped_zone_rate(pitcher_data, pitcher)
+
+        # Contact management
+        contact_velo = pitcher_data["launch_speed"].where(pitcher_data["type"] == "X")
+        features["avg_exit_velo_allowed"] = contact_velo.groupby(pitcher).mean()
+        features["hard_contact_rate_allowed"] = _rate(
+            contact_velo >= 95, contact_velo.notna(), pitcher
+        )
 
-            # Command metrics
-            features.update(
-                {
-                    "strike_rate": (pitcher_data["type"].isin(["S", "X"])).mean(),
-                    "first_pitch_strike_rate": self._calculate_first_pitch_strikes(
-                        pitcher_data
-                    ),
-                    "zone_rate": self._calculate_zone_rate(pitcher_data),
-                }
-            )
+        # Whiff rate
+        description = pitcher_data["description"]
+        swings = description.str.contains("swing", case=False, na=False)
+        whiffs = description.str.contains("miss", case=False, na=False)
+        features["whiff_rate"] = _rate(whiffs, swings, pitcher)
 
-            # Contact management
-            contact_pitches = pitcher_data[pitcher_data["type"] == "X"]
-            if len(contact_pitches) > 0:
-                exit_velo = contact_pitches["launch_speed"].dropna()
-                if len(exit_velo) > 0:
-                    features.update(
-                        {
-                            "avg_exit_velo_allowed": exit_velo.mean(),
-                            "hard_contact_rate_allowed": (exit_velo >= 95).mean(),
-                        }
-                    )
+        features_df = self._assemble_features(qualified, features)
+        logger.info(f"✅ Created {len(features_df)} pitcher feature records")
 
-            # Whiff rate
-            swings = pitcher_data[
-                pitcher_data["description"].str.contains("swing", case=False, na=False)
-            ]
-            if len(swings) > 0:
-                whiffs = swings[
-                    swings["description"].str.contains("miss", case=False, na=False)
-                ]
-                features["whiff_rate"] = len(whiffs) / len(swings)
+        return features_df
 
-            pitcher_features.append(features)
+    @staticmethod
+    def _assemble_features(
+        player_ids: pd.Index, features: Dict[str, Union[pd.Series, float]]
+    ) -> pd.DataFrame:
+        """One row per player, columns in feature order, rows sorted by ID"""
+        frame = pd.DataFrame({"player_id": player_ids}, index=player_ids)
+        for name, values in features.items():
+            frame[name] = values
+        return frame.reset_index(drop=True)
+
+    @staticmethod
+    def _outside_zone(pitches: pd.DataFrame) -> pd.Series:
+        return (
+            (pitches["plate_x"].abs() > 0.83)
+            | (pitches["plate_z"] < 1.5)
+            | (pitches["plate_z"] > 3.5)
+        )
 
-        features_df = pd.DataFrame(pitcher_features)
-        logger.info(f"✅ Created {len(features_df)} pitcher feature records")
+    def _grouped_chase_rate(self, pitches: pd.DataFrame, keys: pd.Series) -> pd.Series:
+        """Per-player chase rate (swings at pitches outside the zone)"""
+        try:
+            swings = pitches["description"].str.contains("swing", case=False, na=False)
+            return _rate(swings, self._outside_zone(pitches), keys).fillna(0.0)
+        except KeyError:
+            return pd.Series(0.0, index=keys.unique())
 
-        return features_df
+    def _grouped_zone_rate(self, pitches: pd.DataFrame, keys: pd.Series) -> pd.Series:
+        """Per-player zone rate (pitches in the strike zone)"""
+        try:
+            in_zone = (
+                (pitches["plate_x"].abs() <= 0.83)
+                & (pitches["plate_z"] >= 1.5)
+                & (pitches["plate_z"] <= 3.5)
+            )
+            return in_zone.groupby(keys).mean()
+        except KeyError:
+            return pd.Series(0.0, index=keys.unique())
 
     def _calculate_chase_rate(self, pitcher_data: pd.DataFrame) -> float:
         """Calculate chase rate (swings at pitches outside the zone)"""
@@ -466,9 +638,15 @@ class StatcastDataPipeline:
             start_date = f"{year}-03-01"
             end_date = f"{year}-10-31"
 
-            # Fetch Statcast data
+            # Fetch Statcast data, reading only the columns the features use
             statcast_data = await self.fetch_historical_statcast_data(
-                start_date, end_date
+                start_date,
+                end_date,
+                columns=list(
+                    dict.fromkeys(
+                        self.BATTING_FEATURE_COLUMNS + self.PITCHING_FEATURE_COLUMNS
+                    )
+                ),
             )
 
             # Create features
@@ -7,10 +7,17 @@ Implements:
 - Task status tracking and retry logic
 - Background processing for optimization workflows
 - Task registration and execution management
+
+Scheduled tasks sit in a min-heap keyed on their next fire time; the
+scheduler loop sleeps exactly until the earliest deadline and is woken
+early when something new is scheduled.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
+import random
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
@@ -23,6 +30,13 @@ from backend.services.unified_logging import get_logger
 logger = get_logger("task_scheduler")
 
 
+class CatchUpPolicy(Enum):
+    """How a periodic task handles runs missed while the scheduler lagged"""
+    ONCE = "once"  # collapse missed runs into one run now, keep the original phase
+    SKIP = "skip"  # drop runs later than misfire_grace_sec, keep the original phase
+    RESCHEDULE = "reschedule"  # run once now, next run is a full interval from now
+
+
 class TaskStatus(Enum):
     """Task execution status"""
     PENDING = "pending"
@@ -44,6 +58,8 @@ class TaskExecution:
     result: Optional[Any] = None
     retry_count: int = 0
     max_retries: int = 3
+    # Task name while a scheduled run is queued or running (deduplication)
+    dedupe_key: Optional[str] = None
 
 
 @dataclass
@@ -68,6 +84,10 @@ class ScheduledTask:
     last_run: Optional[datetime] = None
     enabled: bool = True
     kwargs: Dict[str, Any] = field(default_factory=dict)
+    catch_up: CatchUpPolicy = CatchUpPolicy.ONCE
+    misfire_grace_sec: Optional[float] = None  # SKIP threshold, defaults to interval
+    missed_runs: int = 0
+    coalesced_runs: int = 0
 
 
 class TaskScheduler:
@@ -92,14 +112,22 @@ class TaskScheduler:
         self.task_executions: Dict[str, TaskExecution] = {}
         self.task_queue: asyncio.Queue = asyncio.Queue()
         
+        # Timer heap of (fire_ts, seq, task_id, scheduled_task). Entries are
+        # never removed in place: a popped entry is ignored unless it still
+        # matches the live schedule for its task_id.
+        self._timer_heap: List[Any] = []
+        self._timer_seq = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        
         # Scheduler state
         self._running = False
         self._worker_tasks: List[asyncio.Task] = []
         self._scheduler_task: Optional[asyncio.Task] = None
         self._current_tasks: Dict[str, asyncio.Task] = {}
         
-        # Task locks for preventing duplicate executions
-        self._task_locks: Dict[str, asyncio.Lock] = {}
+        # Names of tasks with a scheduled run queued or running; a firing for
+        # a name already in flight is coalesced instead of queued again
+        self._inflight_names: set = set()
 
     def register_task(
         self,
@@ -128,7 +156,6 @@ class TaskScheduler:
         )
         
         self.task_definitions[name] = task_def
-        self._task_locks[name] = asyncio.Lock()
         
         self.logger.info(f"Registered task: {name}")
 
@@ -168,7 +195,7 @@ class TaskScheduler:
             kwargs=kwargs
         )
         
-        self.scheduled_tasks[task_id] = scheduled_task
+        self._add_schedule(task_id, scheduled_task)
         
         self.logger.info(f"Scheduled one-time task: {task_name} (ID: {task_id}) in {delay_sec}s")
         return task_id
@@ -180,6 +207,8 @@ class TaskScheduler:
         jitter_sec: float = 0.0,
         delay_sec: float = 0.0,
         task_id: Optional[str] = None,
+        catch_up: CatchUpPolicy = CatchUpPolicy.ONCE,
+        misfire_grace_sec: Optional[float] = None,
         **kwargs
     ) -> str:
         """
@@ -191,6 +220,8 @@ class TaskScheduler:
             jitter_sec: Random jitter to add to interval
             delay_sec: Initial delay before first execution
             task_id: Optional custom task ID
+            catch_up: Policy for runs missed while the scheduler lagged
+            misfire_grace_sec: Lateness beyond which SKIP drops a run
             **kwargs: Task arguments
             
         Returns:
@@ -212,10 +243,12 @@ class TaskScheduler:
             jitter_sec=jitter_sec,
             delay_sec=delay_sec,
             next_run=next_run,
-            kwargs=kwargs
+            kwargs=kwargs,
+            catch_up=catch_up,
+            misfire_grace_sec=misfire_grace_sec
         )
         
-        self.scheduled_tasks[task_id] = scheduled_task
+        self._add_schedule(task_id, scheduled_task)
         
         self.logger.info(
             f"Scheduled periodic task: {task_name} (ID: {task_id}) "
@@ -223,6 +256,19 @@ class TaskScheduler:
         )
         return task_id
 
+    def _add_schedule(self, task_id: str, scheduled_task: ScheduledTask):
+        """Register a schedule and wake the scheduler loop if it is waiting"""
+        self.scheduled_tasks[task_id] = scheduled_task
+        self._push_timer(task_id, scheduled_task)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _push_timer(self, task_id: str, scheduled_task: ScheduledTask):
+        heapq.heappush(
+            self._timer_heap,
+            (scheduled_task.next_run.timestamp(), next(self._timer_seq), task_id, scheduled_task),
+        )
+
     def cancel_scheduled_task(self, task_id: str) -> bool:
         """Cancel a scheduled task"""
         if task_id in self.scheduled_tasks:
@@ -270,6 +316,7 @@ class TaskScheduler:
             return
         
         self._running = True
+        self._wakeup = asyncio.Event()
         
         # Start worker tasks
         for i in range(self.max_concurrent_tasks):
@@ -311,58 +358,87 @@ class TaskScheduler:
         self.logger.info("Task scheduler stopped")
 
     async def _scheduler_loop(self):
-        """Main scheduler loop for handling scheduled tasks"""
+        """Main scheduler loop: sleep until the earliest deadline, then fire"""
         self.logger.info("Scheduler loop started")
         
         while self._running:
             try:
-                await self._check_scheduled_tasks()
-                await asyncio.sleep(5)  # Check every 5 seconds
+                self._wakeup.clear()
+                delay = await self._check_scheduled_tasks()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error(f"Scheduler loop error: {e}")
-                await asyncio.sleep(10)  # Longer wait on error
+                await asyncio.sleep(1)
 
-    async def _check_scheduled_tasks(self):
-        """Check and queue scheduled tasks that are ready to run"""
-        now = datetime.now(timezone.utc)
-        
-        for task_id, scheduled_task in list(self.scheduled_tasks.items()):
-            if not scheduled_task.enabled:
+    async def _check_scheduled_tasks(self) -> Optional[float]:
+        """Fire every due schedule; returns seconds until the next deadline"""
+        heap = self._timer_heap
+        while heap:
+            fire_ts, _, task_id, scheduled_task = heap[0]
+            if (
+                self.scheduled_tasks.get(task_id) is not scheduled_task
+                or not scheduled_task.enabled
+                or scheduled_task.next_run.timestamp() != fire_ts
+            ):
+                heapq.heappop(heap)  # stale entry
                 continue
-            
-            if now >= scheduled_task.next_run:
-                # Check if task is already running (prevent duplicates)
-                async with self._task_locks.get(scheduled_task.task_name, asyncio.Lock()):
-                    # Create execution ID
-                    execution_id = f"{task_id}_{int(time.time() * 1000)}"
-                    
-                    # Create task execution
-                    execution = TaskExecution(
-                        task_id=execution_id,
-                        task_name=scheduled_task.task_name,
-                        status=TaskStatus.PENDING
-                    )
-                    self.task_executions[execution_id] = execution
-                    
-                    # Queue the task
-                    await self.task_queue.put((execution_id, scheduled_task.kwargs))
-                    
-                    # Update scheduled task
-                    scheduled_task.last_run = now
-                    
-                    if scheduled_task.schedule_type == "once":
-                        # Remove one-time tasks after scheduling
-                        scheduled_task.enabled = False
-                    elif scheduled_task.schedule_type == "periodic":
-                        # Schedule next execution
-                        import random
-                        jitter = random.uniform(-scheduled_task.jitter_sec, scheduled_task.jitter_sec)
-                        next_interval = scheduled_task.interval_sec + jitter
-                        scheduled_task.next_run = now + timedelta(seconds=next_interval)
-                    
-                    self.logger.info(f"Queued scheduled task: {scheduled_task.task_name} (ID: {execution_id})")
+            now = datetime.now(timezone.utc)
+            if fire_ts > now.timestamp():
+                return fire_ts - now.timestamp()
+            heapq.heappop(heap)
+            self._fire(task_id, scheduled_task, now)
+        return None
+
+    def _fire(self, task_id: str, scheduled_task: ScheduledTask, now: datetime):
+        """Queue one run of a due schedule and compute its next fire time"""
+        run = True
+        if scheduled_task.schedule_type == "periodic":
+            interval = scheduled_task.interval_sec
+            lateness = (now - scheduled_task.next_run).total_seconds()
+            missed = int(lateness // interval) if interval else 0
+            scheduled_task.missed_runs += missed
+            policy = scheduled_task.catch_up
+            if policy == CatchUpPolicy.RESCHEDULE:
+                base = now
+            else:
+                # Keep the original phase: jump past every missed slot
+                base = scheduled_task.next_run + timedelta(seconds=interval * missed)
+                if policy == CatchUpPolicy.SKIP:
+                    grace = scheduled_task.misfire_grace_sec
+                    run = lateness <= (interval if grace is None else grace)
+            jitter = random.uniform(-scheduled_task.jitter_sec, scheduled_task.jitter_sec)
+            scheduled_task.next_run = base + timedelta(seconds=interval + jitter)
+            self._push_timer(task_id, scheduled_task)
+        else:
+            # Remove one-time tasks after scheduling
+            scheduled_task.enabled = False
+
+        if not run:
+            self.logger.info(f"Skipped late run of {scheduled_task.task_name} (ID: {task_id})")
+            return
+        if scheduled_task.task_name in self._inflight_names:
+            # Previous run still queued or running: collapse into it
+            scheduled_task.coalesced_runs += 1
+            self.logger.debug(f"Coalesced run of {scheduled_task.task_name}: already in flight")
+            return
+
+        execution_id = f"{task_id}_{int(time.time() * 1000)}"
+        self.task_executions[execution_id] = TaskExecution(
+            task_id=execution_id,
+            task_name=scheduled_task.task_name,
+            status=TaskStatus.PENDING,
+            dedupe_key=scheduled_task.task_name
+        )
+        self._inflight_names.add(scheduled_task.task_name)
+        self.task_queue.put_nowait((execution_id, scheduled_task.kwargs))
+        scheduled_task.last_run = now
+        
+        self.logger.info(f"Queued scheduled task: {scheduled_task.task_name} (ID: {execution_id})")
 
     async def _worker_loop(self, worker_id: str):
         """Worker loop for executing tasks from the queue"""
@@ -370,14 +446,8 @@ class TaskScheduler:
         
         while self._running:
             try:
-                # Get task from queue with timeout
-                try:
-                    task_id, kwargs = await asyncio.wait_for(
-                        self.task_queue.get(), 
-                        timeout=5.0
-                    )
-                except asyncio.TimeoutError:
-                    continue
+                # Idle workers park on the queue; stop() cancels them
+                task_id, kwargs = await self.task_queue.get()
                 
                 # Execute the task
                 await self._execute_task(task_id, kwargs, worker_id)
@@ -400,8 +470,12 @@ class TaskScheduler:
             execution.status = TaskStatus.FAILED
             execution.error_message = f"Task definition not found: {execution.task_name}"
             self.logger.error(execution.error_message)
+            if execution.dedupe_key:
+                self._inflight_names.discard(execution.dedupe_key)
             return
         
+        retrying = False
+        
         # Update execution status
         execution.status = TaskStatus.RUNNING
         execution.started_at = datetime.now(timezone.utc)
@@ -451,17 +525,21 @@ class TaskScheduler:
                     f"attempt {execution.retry_count}/{task_def.max_retries}"
                 )
                 
-                # Schedule retry with delay
-                await asyncio.sleep(task_def.retry_delay_sec)
+                # Schedule retry with delay without holding this worker
                 execution.status = TaskStatus.PENDING
                 execution.started_at = None
                 execution.completed_at = None
-                await self.task_queue.put((task_id, kwargs))
+                retrying = True
+                asyncio.get_running_loop().call_later(
+                    task_def.retry_delay_sec, self.task_queue.put_nowait, (task_id, kwargs)
+                )
         
         finally:
             # Clean up task tracking
             if task_id in self._current_tasks:
                 del self._current_tasks[task_id]
+            if execution.dedupe_key and not retrying:
+                self._inflight_names.discard(execution.dedupe_key)
 
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get task execution status"""
@@ -505,7 +583,10 @@ class TaskScheduler:
                 "interval_sec": scheduled.interval_sec,
                 "next_run": scheduled.next_run.isoformat(),
                 "last_run": scheduled.last_run.isoformat() if scheduled.last_run else None,
-                "enabled": scheduled.enabled
+                "enabled": scheduled.enabled,
+                "catch_up": scheduled.catch_up.value,
+                "missed_runs": scheduled.missed_runs,
+                "coalesced_runs": scheduled.coalesced_runs
             }
             for task_id, scheduled in self.scheduled_tasks.items()
         }
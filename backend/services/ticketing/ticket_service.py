@@ -12,15 +12,18 @@ The ticket service provides the core business logic for multi-leg parlay constru
 and risk management.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
-from sqlalchemy import desc
+import numpy as np
+from sqlalchemy import desc, select
 from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from backend.database import SessionLocal
+from backend.database import SessionLocal, async_engine
 from backend.models.correlation_ticketing import Ticket, TicketLeg, TicketStatus
 from backend.models.modeling import Edge, EdgeStatus, Valuation
 from backend.services.correlation.correlation_engine import correlation_engine
@@ -65,6 +68,11 @@ class TicketService:
     
     Handles ticket creation, validation, submission, and management with
     full integration of correlation analysis and risk constraints.
+    
+    Every operation loads a ticket's edges and valuations with one joined
+    query. The ``*_async`` variants run the same statements on an
+    ``AsyncSession`` and push the CPU-bound pricing and risk checks to a
+    worker thread, so async request handlers do not block the event loop.
     """
 
     def __init__(self):
@@ -91,115 +99,82 @@ class TicketService:
         Raises:
             TicketValidationError: If validation fails
         """
-        session = SessionLocal()
+        # Committed rows stay loaded for the DTO instead of refreshing per leg
+        session = SessionLocal(expire_on_commit=False)
         
         try:
             # Validate inputs
             self._validate_ticket_inputs(stake, edge_ids)
             
-            # Load and validate edges
-            edges = self._load_and_validate_edges(session, edge_ids)
+            # Load and validate edges with their valuations
+            edges, valuations = self._load_and_validate_edges(session, edge_ids)
             
             # Enforce constraints
             self._enforce_ticket_constraints(edges)
             
-            # Build parlay legs
-            legs = self._build_parlay_legs(session, edges)
-            
-            # Compute correlation matrix
-            prop_ids = [edge.prop_id for edge in edges]
-            correlation_matrix = correlation_engine.build_correlation_matrix(prop_ids)
-            
-            # Enforce correlation constraints
-            self._enforce_correlation_constraints(prop_ids, correlation_matrix)
-            
-            # Simulate parlay EV
-            simulation_result = parlay_simulator.estimate_parlay_ev(
-                legs, stake, correlation_matrix
-            )
+            # Correlation constraints and parlay EV
+            simulation_result = self._price_parlay(edges, valuations, stake)
             
             # Create ticket record
-            ticket = Ticket(
-                user_id=user_id,
-                status=TicketStatus.DRAFT,
-                stake=stake,
-                potential_payout=stake * simulation_result.payout_multiplier,
-                estimated_ev=simulation_result.ev_adjusted,
-                legs_count=len(edges)
-            )
+            ticket = self._new_ticket(user_id, stake, edges, simulation_result)
             session.add(ticket)
             session.flush()  # Get ticket ID
             
-            # Create ticket legs
-            ticket_legs = []
-            for edge in edges:
-                # Get latest valuation for snapshot
-                valuation = session.query(Valuation).filter(
-                    Valuation.id == edge.valuation_id
-                ).first()
-                
-                if not valuation:
-                    raise TicketValidationError(
-                        f"Valuation not found for edge {edge.id}",
-                        "VALUATION_NOT_FOUND"
-                    )
-                
-                leg = TicketLeg(
-                    ticket_id=ticket.id,
-                    edge_id=edge.id,
-                    prop_id=edge.prop_id,
-                    offered_line_snapshot=edge.offered_line,
-                    prob_over_snapshot=edge.prob_over,
-                    fair_line_snapshot=edge.fair_line,
-                    valuation_hash_snapshot=valuation.valuation_hash
-                )
-                session.add(leg)
-                ticket_legs.append(leg)
+            # Create ticket legs with valuation snapshots
+            ticket_legs = self._new_ticket_legs(ticket, edges, valuations)
+            session.add_all(ticket_legs)
             
             session.commit()
             
-            # Build DTO
-            ticket_dto = self._build_ticket_dto(ticket, ticket_legs, simulation_result)
-            
-            logger.info(
-                "Created draft ticket",
-                extra={
-                    "ticket_id": ticket.id,
-                    "user_id": user_id,
-                    "legs_count": len(edges),
-                    "stake": stake,
-                    "estimated_ev": simulation_result.ev_adjusted,
-                    "action": "create_draft_ticket"
-                }
-            )
-            
-            # TODO: Schedule LLM prefetch if enabled
-            if self.ticketing_config.llm_prefetch_on_ticket:
-                self._schedule_llm_prefetch(edge_ids)
-            
-            return ticket_dto
+            return self._on_draft_created(ticket, ticket_legs, simulation_result, user_id, stake, edge_ids)
             
         except TicketValidationError:
             session.rollback()
             raise
         except Exception as e:
             session.rollback()
-            logger.error(
-                "Failed to create draft ticket",
-                extra={
-                    "user_id": user_id,
-                    "edge_ids": edge_ids,
-                    "error": str(e),
-                    "action": "create_draft_ticket"
-                }
-            )
-            raise TicketValidationError(
-                f"Failed to create ticket: {str(e)}",
-                "CREATION_FAILED"
-            )
+            raise self._creation_failed(e, user_id, edge_ids)
         finally:
             session.close()
 
+    async def create_draft_ticket_async(
+        self,
+        user_id: Optional[int],
+        stake: float,
+        edge_ids: List[int]
+    ) -> TicketDTO:
+        """Async-session variant of create_draft_ticket"""
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            try:
+                self._validate_ticket_inputs(stake, edge_ids)
+                
+                rows = (await session.execute(self._edges_with_valuations(edge_ids))).all()
+                edges, valuations = self._validate_edge_rows(edge_ids, rows)
+                
+                self._enforce_ticket_constraints(edges)
+                
+                simulation_result = await asyncio.to_thread(
+                    self._price_parlay, edges, valuations, stake
+                )
+                
+                ticket = self._new_ticket(user_id, stake, edges, simulation_result)
+                session.add(ticket)
+                await session.flush()
+                
+                ticket_legs = self._new_ticket_legs(ticket, edges, valuations)
+                session.add_all(ticket_legs)
+                
+                await session.commit()
+                
+                return self._on_draft_created(ticket, ticket_legs, simulation_result, user_id, stake, edge_ids)
+                
+            except TicketValidationError:
+                await session.rollback()
+                raise
+            except Exception as e:
+                await session.rollback()
+                raise self._creation_failed(e, user_id, edge_ids)
+
     def submit_ticket(self, ticket_id: int) -> TicketDTO:
         """
         Submit a draft ticket for execution.
@@ -213,56 +188,578 @@ class TicketService:
         Raises:
             TicketValidationError: If submission validation fails
         """
+        session = SessionLocal(expire_on_commit=False)
+
+        try:
+            ticket = self._require_draft(
+                session.query(Ticket).filter(Ticket.id == ticket_id).first(),
+                ticket_id
+            )
+
+            # Legs, edges and current valuations in one query
+            rows = session.execute(self._legs_with_edges(ticket_id)).all()
+            legs = self._validate_submission_rows(rows)
+
+            self._run_risk_checks(ticket, ticket_id, legs)
+
+            # Update ticket status
+            self._mark_submitted(ticket)
+            session.commit()
+
+            return self._on_submitted(ticket, legs)
+
+        except TicketValidationError:
+            session.rollback()
+            raise
+        except Exception as e:
+            session.rollback()
+            raise self._submission_failed(e, ticket_id)
+        finally:
+            session.close()
+
+    async def submit_ticket_async(self, ticket_id: int) -> TicketDTO:
+        """Async-session variant of submit_ticket"""
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            try:
+                ticket = self._require_draft(await session.get(Ticket, ticket_id), ticket_id)
+
+                rows = (await session.execute(self._legs_with_edges(ticket_id))).all()
+                legs = self._validate_submission_rows(rows)
+
+                await asyncio.to_thread(self._run_risk_checks, ticket, ticket_id, legs)
+
+                self._mark_submitted(ticket)
+                await session.commit()
+
+                return self._on_submitted(ticket, legs)
+
+            except TicketValidationError:
+                await session.rollback()
+                raise
+            except Exception as e:
+                await session.rollback()
+                raise self._submission_failed(e, ticket_id)
+
+    def get_ticket(self, ticket_id: int) -> TicketDTO:
+        """
+        Get ticket information.
+        
+        Args:
+            ticket_id: ID of ticket to retrieve
+            
+        Returns:
+            TicketDTO with ticket information
+            
+        Raises:
+            TicketValidationError: If ticket not found
+        """
         session = SessionLocal()
+        
+        try:
+            ticket = self._require_ticket(
+                session.query(Ticket).filter(Ticket.id == ticket_id).first(),
+                ticket_id
+            )
+            
+            legs = session.execute(self._ticket_legs(ticket_id)).scalars().all()
+            
+            return self._build_ticket_dto(ticket, legs, None)
+            
+        finally:
+            session.close()
 
-        # Load ticket
-        ticket = session.query(Ticket).filter(
-            Ticket.id == ticket_id
-        ).first()
+    async def get_ticket_async(self, ticket_id: int) -> TicketDTO:
+        """Async-session variant of get_ticket"""
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            ticket = self._require_ticket(await session.get(Ticket, ticket_id), ticket_id)
+            legs = (await session.execute(self._ticket_legs(ticket_id))).scalars().all()
+            return self._build_ticket_dto(ticket, legs, None)
 
-        if not ticket:
-            raise TicketValidationError(
-                f"Ticket {ticket_id} not found",
-                "TICKET_NOT_FOUND"
+    def recalc_ticket(self, ticket_id: int) -> TicketDTO:
+        """
+        Recalculate ticket EV with current market conditions.
+        
+        Args:
+            ticket_id: ID of ticket to recalculate
+            
+        Returns:
+            Updated TicketDTO with new EV calculation
+            
+        TODO: Add partial cash-out and dynamic hedging capabilities
+        """
+        session = SessionLocal(expire_on_commit=False)
+        
+        try:
+            ticket = self._require_ticket(
+                session.query(Ticket).filter(Ticket.id == ticket_id).first(),
+                ticket_id
             )
+            
+            if ticket.status != TicketStatus.DRAFT:
+                # Only recalc draft tickets
+                return self.get_ticket(ticket_id)
+            
+            # Rebuild parlay legs with current data
+            rows = session.execute(self._legs_with_edges(ticket_id)).all()
+            legs, edges, valuations = self._active_leg_rows(rows)
+            
+            if not edges:
+                logger.warning(
+                    "No active edges for ticket recalculation",
+                    extra={"ticket_id": ticket_id, "action": "recalc_ticket"}
+                )
+                return self.get_ticket(ticket_id)
+            
+            simulation_result = self._simulate_parlay(edges, valuations, ticket.stake)
+            self._apply_simulation(ticket, simulation_result)
+            
+            session.commit()
+            
+            return self._on_recalculated(ticket, legs, simulation_result, ticket_id)
+            
+        except Exception as e:
+            session.rollback()
+            raise self._recalc_failed(e, ticket_id)
+        finally:
+            session.close()
 
-        if ticket.status != TicketStatus.DRAFT:
+    async def recalc_ticket_async(self, ticket_id: int) -> TicketDTO:
+        """Async-session variant of recalc_ticket"""
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            try:
+                ticket = self._require_ticket(await session.get(Ticket, ticket_id), ticket_id)
+                
+                if ticket.status != TicketStatus.DRAFT:
+                    return await self.get_ticket_async(ticket_id)
+                
+                rows = (await session.execute(self._legs_with_edges(ticket_id))).all()
+                legs, edges, valuations = self._active_leg_rows(rows)
+                
+                if not edges:
+                    logger.warning(
+                        "No active edges for ticket recalculation",
+                        extra={"ticket_id": ticket_id, "action": "recalc_ticket"}
+                    )
+                    return await self.get_ticket_async(ticket_id)
+                
+                simulation_result = await asyncio.to_thread(
+                    self._simulate_parlay, edges, valuations, ticket.stake
+                )
+                self._apply_simulation(ticket, simulation_result)
+                
+                await session.commit()
+                
+                return self._on_recalculated(ticket, legs, simulation_result, ticket_id)
+                
+            except Exception as e:
+                await session.rollback()
+                raise self._recalc_failed(e, ticket_id)
+
+    # --- Set-based queries -------------------------------------------------
+
+    @staticmethod
+    def _edges_with_valuations(edge_ids: List[int]):
+        """Edges and their (possibly missing) valuations in one statement"""
+        return (
+            select(Edge, Valuation)
+            .outerjoin(Valuation, Valuation.id == Edge.valuation_id)
+            .where(Edge.id.in_(edge_ids))
+        )
+
+    @staticmethod
+    def _legs_with_edges(ticket_id: int):
+        """A ticket's legs with their current edges and valuations"""
+        return (
+            select(TicketLeg, Edge, Valuation)
+            .outerjoin(Edge, Edge.id == TicketLeg.edge_id)
+            .outerjoin(Valuation, Valuation.id == Edge.valuation_id)
+            .where(TicketLeg.ticket_id == ticket_id)
+            .order_by(TicketLeg.id)
+        )
+
+    @staticmethod
+    def _ticket_legs(ticket_id: int):
+        return select(TicketLeg).where(TicketLeg.ticket_id == ticket_id).order_by(TicketLeg.id)
+
+    # --- Validation ----------------------------------------------------------
+
+    def _validate_ticket_inputs(self, stake: float, edge_ids: List[int]):
+        """Validate basic ticket inputs"""
+        if stake <= 0:
+            raise TicketValidationError("Stake must be positive", "INVALID_STAKE")
+        
+        if not edge_ids:
+            raise TicketValidationError("At least one edge required", "NO_EDGES")
+        
+        if len(edge_ids) > self.ticketing_config.max_legs:
             raise TicketValidationError(
-                f"Ticket {ticket_id} is not in DRAFT status",
-                "INVALID_STATUS"
+                f"Maximum {self.ticketing_config.max_legs} legs allowed",
+                "TOO_MANY_LEGS"
+            )
+        
+        if len(edge_ids) < self.ticketing_config.min_legs:
+            raise TicketValidationError(
+                f"Minimum {self.ticketing_config.min_legs} legs required",
+                "TOO_FEW_LEGS"
             )
 
-        # Load ticket legs
-        legs = session.query(TicketLeg).filter(
-            TicketLeg.ticket_id == ticket_id
-        ).all()
-
-        # Validate edges are still active and valuations unchanged
-        for leg in legs:
-            edge = session.query(Edge).filter(Edge.id == leg.edge_id).first()
+    def _load_and_validate_edges(
+        self, session: Session, edge_ids: List[int]
+    ) -> Tuple[List[Edge], Dict[int, Optional[Valuation]]]:
+        """Load and validate edges together with their valuations"""
+        rows = session.execute(self._edges_with_valuations(edge_ids)).all()
+        return self._validate_edge_rows(edge_ids, rows)
+
+    @staticmethod
+    def _validate_edge_rows(
+        edge_ids: List[int], rows: List[Any]
+    ) -> Tuple[List[Edge], Dict[int, Optional[Valuation]]]:
+        """Check (edge, valuation) rows; edges come back in edge_ids order"""
+        by_id = {edge.id: (edge, valuation) for edge, valuation in rows}
+        
+        missing_ids = set(edge_ids) - set(by_id)
+        if missing_ids:
+            raise TicketValidationError(
+                f"Edges not found: {missing_ids}",
+                "EDGES_NOT_FOUND"
+            )
+        
+        # Each edge may back only one leg
+        if len(by_id) != len(edge_ids):
+            duplicate_ids = {edge_id for edge_id in edge_ids if edge_ids.count(edge_id) > 1}
+            raise TicketValidationError(
+                f"Duplicate edges: {duplicate_ids}",
+                "EDGES_NOT_FOUND"
+            )
+        
+        edges = [by_id[edge_id][0] for edge_id in edge_ids]
+        
+        # Validate all edges are active
+        inactive_edges = [edge.id for edge in edges if edge.status != EdgeStatus.ACTIVE]
+        if inactive_edges:
+            raise TicketValidationError(
+                f"Inactive edges: {inactive_edges}",
+                "INACTIVE_EDGES"
+            )
+        
+        return edges, {edge_id: by_id[edge_id][1] for edge_id in edge_ids}
 
-            if not edge:
+    @staticmethod
+    def _validate_submission_rows(rows: List[Any]) -> List[TicketLeg]:
+        """
+        Check every leg's edge is still active and its valuation hash unchanged.
+        
+        The first failing leg (in leg order) decides the error.
+        """
+        for leg, edge, valuation in rows:
+            if edge is None:
                 raise TicketValidationError(
                     f"Edge {leg.edge_id} not found",
                     "EDGE_NOT_FOUND"
                 )
-
+            
             if edge.status != EdgeStatus.ACTIVE:
                 raise TicketValidationError(
                     f"Edge {leg.edge_id} is no longer active",
                     "EDGE_STATE_CHANGED"
                 )
-
-            # Check valuation hash stability
-            current_valuation = session.query(Valuation).filter(
-                Valuation.id == edge.valuation_id
-            ).first()
-
-            if not current_valuation or current_valuation.valuation_hash != leg.valuation_hash_snapshot:
+            
+            if valuation is None or valuation.valuation_hash != leg.valuation_hash_snapshot:
                 raise TicketValidationError(
                     f"Valuation changed for edge {leg.edge_id}",
                     "EDGE_STATE_CHANGED"
                 )
+        
+        return [leg for leg, _, _ in rows]
+
+    @staticmethod
+    def _active_leg_rows(
+        rows: List[Any]
+    ) -> Tuple[List[TicketLeg], List[Edge], Dict[int, Optional[Valuation]]]:
+        """Split leg rows into all legs and the still-active edges"""
+        legs = [leg for leg, _, _ in rows]
+        active = [
+            (edge, valuation) for _, edge, valuation in rows
+            if edge is not None and edge.status == EdgeStatus.ACTIVE
+        ]
+        return legs, [edge for edge, _ in active], {edge.id: valuation for edge, valuation in active}
+
+    @staticmethod
+    def _require_ticket(ticket: Optional[Ticket], ticket_id: int) -> Ticket:
+        if not ticket:
+            raise TicketValidationError(
+                f"Ticket {ticket_id} not found",
+                "TICKET_NOT_FOUND"
+            )
+        return ticket
+
+    def _require_draft(self, ticket: Optional[Ticket], ticket_id: int) -> Ticket:
+        ticket = self._require_ticket(ticket, ticket_id)
+        if ticket.status != TicketStatus.DRAFT:
+            raise TicketValidationError(
+                f"Ticket {ticket_id} is not in DRAFT status",
+                "INVALID_STATUS"
+            )
+        return ticket
+
+    def _enforce_ticket_constraints(self, edges: List[Edge]):
+        """Enforce ticket business constraints"""
+        # Additional constraints can be added here
+        # e.g., same game restrictions, player prop limits, etc.
+        pass
+
+    def _enforce_correlation_constraints(
+        self,
+        prop_ids: List[int],
+        correlation_matrix: Dict[int, Dict[int, float]]
+    ):
+        """Enforce correlation constraints"""
+        if len(prop_ids) <= 1:
+            return
+        
+        # Average absolute correlation over all leg pairs
+        lookup = self._correlation_lookup(prop_ids, correlation_matrix)
+        avg_correlation = float(lookup[np.triu_indices(len(prop_ids), k=1)].mean())
+        
+        if avg_correlation > self.ticketing_config.max_avg_correlation:
+            raise TicketValidationError(
+                f"Average correlation {avg_correlation:.3f} exceeds limit {self.ticketing_config.max_avg_correlation}",
+                "CORRELATION_TOO_HIGH"
+            )
+
+    @staticmethod
+    def _correlation_lookup(
+        prop_ids: List[int],
+        correlation_matrix: Dict[int, Dict[int, float]]
+    ) -> np.ndarray:
+        """Leg-by-leg |correlation| array; pairs missing from the matrix are 0.0"""
+        unique_ids, positions = np.unique(np.asarray(prop_ids), return_inverse=True)
+        index = {prop_id: i for i, prop_id in enumerate(unique_ids.tolist())}
+        lookup = np.zeros((len(unique_ids), len(unique_ids)))
+        for prop_a, row in correlation_matrix.items():
+            i = index.get(prop_a)
+            if i is None:
+                continue
+            for prop_b, corr in row.items():
+                j = index.get(prop_b)
+                if j is not None:
+                    lookup[i, j] = abs(corr)
+        return lookup[np.ix_(positions, positions)]
+
+    # --- Pricing and records -------------------------------------------------
+
+    def _price_parlay(
+        self,
+        edges: List[Edge],
+        valuations: Dict[int, Optional[Valuation]],
+        stake: float
+    ) -> ParlaySimulationResult:
+        """Check correlation limits and simulate a new ticket's EV"""
+        for edge in edges:
+            if valuations.get(edge.id) is None:
+                raise TicketValidationError(
+                    f"Valuation not found for edge {edge.id}",
+                    "VALUATION_NOT_FOUND"
+                )
+        return self._simulate_parlay(edges, valuations, stake, enforce_correlation=True)
+
+    def _simulate_parlay(
+        self,
+        edges: List[Edge],
+        valuations: Dict[int, Optional[Valuation]],
+        stake: float,
+        enforce_correlation: bool = False
+    ) -> ParlaySimulationResult:
+        legs = self._build_parlay_legs(edges, valuations)
+        prop_ids = [edge.prop_id for edge in edges]
+        correlation_matrix = correlation_engine.build_correlation_matrix(prop_ids)
+        
+        if enforce_correlation:
+            self._enforce_correlation_constraints(prop_ids, correlation_matrix)
+        
+        return parlay_simulator.estimate_parlay_ev(legs, stake, correlation_matrix)
+
+    def _build_parlay_legs(
+        self,
+        edges: List[Edge],
+        valuations: Dict[int, Optional[Valuation]]
+    ) -> List[LegInput]:
+        """Build LegInput objects from edges that have a valuation"""
+        return [
+            LegInput(
+                prop_id=edge.prop_id,
+                prob_success=edge.prob_over,  # Assuming we're betting the over
+                offered_odds=edge.offered_line,
+                fair_odds=edge.fair_line
+            )
+            for edge in edges
+            if valuations.get(edge.id) is not None
+        ]
+
+    @staticmethod
+    def _new_ticket(
+        user_id: Optional[int],
+        stake: float,
+        edges: List[Edge],
+        simulation_result: ParlaySimulationResult
+    ) -> Ticket:
+        return Ticket(
+            user_id=user_id,
+            status=TicketStatus.DRAFT,
+            stake=stake,
+            potential_payout=stake * simulation_result.payout_multiplier,
+            estimated_ev=simulation_result.ev_adjusted,
+            legs_count=len(edges),
+        )
+
+    @staticmethod
+    def _new_ticket_legs(
+        ticket: Ticket,
+        edges: List[Edge],
+        valuations: Dict[int, Optional[Valuation]]
+    ) -> List[TicketLeg]:
+        return [
+            TicketLeg(
+                ticket_id=ticket.id,
+                edge_id=edge.id,
+                prop_id=edge.prop_id,
+                offered_line_snapshot=edge.offered_line,
+                prob_over_snapshot=edge.prob_over,
+                fair_line_snapshot=edge.fair_line,
+                valuation_hash_snapshot=valuations[edge.id].valuation_hash
+            )
+            for edge in edges
+        ]
+
+    @staticmethod
+    def _mark_submitted(ticket: Ticket) -> None:
+        ticket.status = TicketStatus.SUBMITTED
+        ticket.submitted_at = datetime.now(timezone.utc)
+
+    @staticmethod
+    def _apply_simulation(ticket: Ticket, simulation_result: ParlaySimulationResult) -> None:
+        ticket.potential_payout = ticket.stake * simulation_result.payout_multiplier
+        ticket.estimated_ev = simulation_result.ev_adjusted
+
+    # --- Outcomes ------------------------------------------------------------
+
+    def _on_draft_created(
+        self,
+        ticket: Ticket,
+        ticket_legs: List[TicketLeg],
+        simulation_result: ParlaySimulationResult,
+        user_id: Optional[int],
+        stake: float,
+        edge_ids: List[int]
+    ) -> TicketDTO:
+        ticket_dto = self._build_ticket_dto(ticket, ticket_legs, simulation_result)
+        
+        logger.info(
+            "Created draft ticket",
+            extra={
+                "ticket_id": ticket.id,
+                "user_id": user_id,
+                "legs_count": len(ticket_legs),
+                "stake": stake,
+                "estimated_ev": simulation_result.ev_adjusted,
+                "action": "create_draft_ticket"
+            }
+        )
+        
+        # TODO: Schedule LLM prefetch if enabled
+        if self.ticketing_config.llm_prefetch_on_ticket:
+            self._schedule_llm_prefetch(edge_ids)
+        
+        return ticket_dto
+
+    def _on_submitted(self, ticket: Ticket, legs: List[TicketLeg]) -> TicketDTO:
+        ticket_dto = self._build_ticket_dto(ticket, legs, None)
+
+        logger.info(
+            "Submitted ticket",
+            extra={
+                "ticket_id": ticket.id,
+                "user_id": ticket.user_id,
+                "legs_count": len(legs),
+                "action": "submit_ticket"
+            }
+        )
+
+        return ticket_dto
+
+    def _on_recalculated(
+        self,
+        ticket: Ticket,
+        legs: List[TicketLeg],
+        simulation_result: ParlaySimulationResult,
+        ticket_id: int
+    ) -> TicketDTO:
+        ticket_dto = self._build_ticket_dto(ticket, legs, simulation_result)
+        
+        logger.info(
+            "Recalculated ticket EV",
+            extra={
+                "ticket_id": ticket_id,
+                "new_ev": simulation_result.ev_adjusted,
+                "action": "recalc_ticket"
+            }
+        )
+        
+        return ticket_dto
+
+    @staticmethod
+    def _creation_failed(error: Exception, user_id: Optional[int], edge_ids: List[int]) -> TicketValidationError:
+        logger.error(
+            "Failed to create draft ticket",
+            extra={
+                "user_id": user_id,
+                "edge_ids": edge_ids,
+                "error": str(error),
+                "action": "create_draft_ticket"
+            }
+        )
+        return TicketValidationError(
+            f"Failed to create ticket: {str(error)}",
+            "CREATION_FAILED"
+        )
+
+    @staticmethod
+    def _submission_failed(error: Exception, ticket_id: int) -> TicketValidationError:
+        logger.error(
+            "Failed to submit ticket",
+            extra={
+                "ticket_id": ticket_id,
+                "error": str(error),
+                "action": "submit_ticket"
+            }
+        )
+        return TicketValidationError(
+            f"Failed to submit ticket: {str(error)}",
+            "SUBMISSION_FAILED"
+        )
+
+    @staticmethod
+    def _recalc_failed(error: Exception, ticket_id: int) -> TicketValidationError:
+        logger.error(
+            "Failed to recalculate ticket",
+            extra={
+                "ticket_id": ticket_id,
+                "error": str(error),
+                "action": "recalc_ticket"
+            }
+        )
+        return TicketValidationError(
+            f"Failed to recalculate ticket: {str(error)}",
+            "RECALC_FAILED"
+        )
+
+    def _run_risk_checks(self, ticket: Ticket, ticket_id: int, legs: List[TicketLeg]) -> bool:
+        """
+        Risk constraint and exposure checks before submission.
+        
+        Raises TicketValidationError on critical findings or exposure limit
+        violations; returns False when the risk services are unavailable.
+        """
         # --- RISK MANAGEMENT INTEGRATION ---
         # Perform comprehensive risk checks before ticket submission
         risk_check_success = True
@@ -382,7 +879,6 @@ class TicketService:
             )
             risk_check_success = False
         except TicketValidationError:
-            session.rollback()
             raise
         except Exception as e:
             logger.error(
@@ -397,272 +893,7 @@ class TicketService:
             )
             risk_check_success = False
 
-        # --- END RISK MANAGEMENT INTEGRATION ---
-
-        # Update ticket status
-        try:
-            ticket.status = TicketStatus.SUBMITTED
-            ticket.submitted_at = datetime.now(timezone.utc)
-
-            session.commit()
-
-            # Build updated DTO
-            ticket_dto = self._build_ticket_dto(ticket, legs, None)
-
-            logger.info(
-                "Submitted ticket",
-                extra={
-                    "ticket_id": ticket_id,
-                    "user_id": ticket.user_id,
-                    "legs_count": len(legs),
-                    "action": "submit_ticket"
-                }
-            )
-
-            return ticket_dto
-
-        except TicketValidationError:
-            session.rollback()
-            raise
-        except Exception as e:
-            session.rollback()
-            logger.error(
-                "Failed to submit ticket",
-                extra={
-                    "ticket_id": ticket_id,
-                    "error": str(e),
-                    "action": "submit_ticket"
-                }
-            )
-            raise TicketValidationError(
-                f"Failed to submit ticket: {str(e)}",
-                "SUBMISSION_FAILED"
-            )
-        finally:
-            session.close()
-
-    def get_ticket(self, ticket_id: int) -> TicketDTO:
-        """
-        Get ticket information.
-        
-        Args:
-            ticket_id: ID of ticket to retrieve
-            
-        Returns:
-            TicketDTO with ticket information
-            
-        Raises:
-            TicketValidationError: If ticket not found
-        """
-        session = SessionLocal()
-        
-        try:
-            ticket = session.query(Ticket).filter(
-                Ticket.id == ticket_id
-            ).first()
-            
-            if not ticket:
-                raise TicketValidationError(
-                    f"Ticket {ticket_id} not found",
-                    "TICKET_NOT_FOUND"
-                )
-            
-            legs = session.query(TicketLeg).filter(
-                TicketLeg.ticket_id == ticket_id
-            ).all()
-            
-            return self._build_ticket_dto(ticket, legs, None)
-            
-        finally:
-            session.close()
-
-    def recalc_ticket(self, ticket_id: int) -> TicketDTO:
-        """
-        Recalculate ticket EV with current market conditions.
-        
-        Args:
-            ticket_id: ID of ticket to recalculate
-            
-        Returns:
-            Updated TicketDTO with new EV calculation
-            
-        TODO: Add partial cash-out and dynamic hedging capabilities
-        """
-        session = SessionLocal()
-        
-        try:
-            ticket = session.query(Ticket).filter(
-                Ticket.id == ticket_id
-            ).first()
-            
-            if not ticket:
-                raise TicketValidationError(
-                    f"Ticket {ticket_id} not found",
-                    "TICKET_NOT_FOUND"
-                )
-            
-            if ticket.status != TicketStatus.DRAFT:
-                # Only recalc draft tickets
-                return self.get_ticket(ticket_id)
-            
-            legs = session.query(TicketLeg).filter(
-                TicketLeg.ticket_id == ticket_id
-            ).all()
-            
-            # Rebuild parlay legs with current data
-            edges = []
-            for leg in legs:
-                edge = session.query(Edge).filter(Edge.id == leg.edge_id).first()
-                if edge and edge.status == EdgeStatus.ACTIVE:
-                    edges.append(edge)
-            
-            if not edges:
-                logger.warning(
-                    "No active edges for ticket recalculation",
-                    extra={"ticket_id": ticket_id, "action": "recalc_ticket"}
-                )
-                return self.get_ticket(ticket_id)
-            
-            # Rebuild simulation
-            parlay_legs = self._build_parlay_legs(session, edges)
-            prop_ids = [edge.prop_id for edge in edges]
-            correlation_matrix = correlation_engine.build_correlation_matrix(prop_ids)
-            
-            simulation_result = parlay_simulator.estimate_parlay_ev(
-                parlay_legs, ticket.stake, correlation_matrix
-            )
-            
-            # Update ticket with new EV
-            ticket.potential_payout = ticket.stake * simulation_result.payout_multiplier
-            ticket.estimated_ev = simulation_result.ev_adjusted
-            
-            session.commit()
-            
-            ticket_dto = self._build_ticket_dto(ticket, legs, simulation_result)
-            
-            logger.info(
-                "Recalculated ticket EV",
-                extra={
-                    "ticket_id": ticket_id,
-                    "new_ev": simulation_result.ev_adjusted,
-                    "action": "recalc_ticket"
-                }
-            )
-            
-            return ticket_dto
-            
-        except Exception as e:
-            session.rollback()
-            logger.error(
-                "Failed to recalculate ticket",
-                extra={
-                    "ticket_id": ticket_id,
-                    "error": str(e),
-                    "action": "recalc_ticket"
-                }
-            )
-            raise TicketValidationError(
-                f"Failed to recalculate ticket: {str(e)}",
-                "RECALC_FAILED"
-            )
-        finally:
-            session.close()
-
-    def _validate_ticket_inputs(self, stake: float, edge_ids: List[int]):
-        """Validate basic ticket inputs"""
-        if stake <= 0:
-            raise TicketValidationError("Stake must be positive", "INVALID_STAKE")
-        
-        if not edge_ids:
-            raise TicketValidationError("At least one edge required", "NO_EDGES")
-        
-        if len(edge_ids) > self.ticketing_config.max_legs:
-            raise TicketValidationError(
-                f"Maximum {self.ticketing_config.max_legs} legs allowed",
-                "TOO_MANY_LEGS"
-            )
-        
-        if len(edge_ids) < self.ticketing_config.min_legs:
-            raise TicketValidationError(
-                f"Minimum {self.ticketing_config.min_legs} legs required",
-                "TOO_FEW_LEGS"
-            )
-
-    def _load_and_validate_edges(self, session: Session, edge_ids: List[int]) -> List[Edge]:
-        """Load and validate edges"""
-        edges = session.query(Edge).filter(Edge.id.in_(edge_ids)).all()
-        
-        if len(edges) != len(edge_ids):
-            found_ids = {edge.id for edge in edges}
-            missing_ids = set(edge_ids) - found_ids
-            raise TicketValidationError(
-                f"Edges not found: {missing_ids}",
-                "EDGES_NOT_FOUND"
-            )
-        
-        # Validate all edges are active
-        inactive_edges = [edge.id for edge in edges if edge.status != EdgeStatus.ACTIVE]
-        if inactive_edges:
-            raise TicketValidationError(
-                f"Inactive edges: {inactive_edges}",
-                "INACTIVE_EDGES"
-            )
-        
-        return edges
-
-    def _enforce_ticket_constraints(self, edges: List[Edge]):
-        """Enforce ticket business constraints"""
-        # Additional constraints can be added here
-        # e.g., same game restrictions, player prop limits, etc.
-        pass
-
-    def _enforce_correlation_constraints(
-        self,
-        prop_ids: List[int],
-        correlation_matrix: Dict[int, Dict[int, float]]
-    ):
-        """Enforce correlation constraints"""
-        if len(prop_ids) <= 1:
-            return
-        
-        # Calculate average absolute correlation
-        correlations = []
-        for i, prop_a in enumerate(prop_ids):
-            for j in range(i + 1, len(prop_ids)):
-                prop_b = prop_ids[j]
-                corr = correlation_matrix.get(prop_a, {}).get(prop_b, 0.0)
-                correlations.append(abs(corr))
-        
-        avg_correlation = sum(correlations) / len(correlations) if correlations else 0.0
-        
-        if avg_correlation > self.ticketing_config.max_avg_correlation:
-            raise TicketValidationError(
-                f"Average correlation {avg_correlation:.3f} exceeds limit {self.ticketing_config.max_avg_correlation}",
-                "CORRELATION_TOO_HIGH"
-            )
-
-    def _build_parlay_legs(self, session: Session, edges: List[Edge]) -> List[LegInput]:
-        """Build LegInput objects from edges"""
-        legs = []
-        
-        for edge in edges:
-            # Load valuation for odds information
-            valuation = session.query(Valuation).filter(
-                Valuation.id == edge.valuation_id
-            ).first()
-            
-            if not valuation:
-                continue
-            
-            leg = LegInput(
-                prop_id=edge.prop_id,
-                prob_success=edge.prob_over,  # Assuming we're betting the over
-                offered_odds=edge.offered_line,
-                fair_odds=edge.fair_line
-            )
-            legs.append(leg)
-        
-        return legs
+        return risk_check_success
 
     def _build_ticket_dto(
         self,
@@ -6,6 +6,8 @@ import math
 import logging
 from typing import Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Try to import scipy for better accuracy, fall back to manual implementations
@@ -237,4 +239,46 @@ def prob_over_line(line: float, mean: float, variance: float, distribution_famil
             
     except Exception as e:
         logger.error(f"Error calculating prob_over_line: {e}")
-        return 0.5  # Neutral fallback
\ No newline at end of file
+        return 0.5  # Neutral fallback
+
+
+def prob_over_lines(
+    lines: np.ndarray,
+    means: np.ndarray,
+    variances: np.ndarray,
+    distribution_family: str
+) -> np.ndarray:
+    """
+    Vectorized ``prob_over_line`` for a whole slate of one distribution family.
+    
+    Args:
+        lines: Betting line thresholds
+        means: Distribution means
+        variances: Distribution variances
+        distribution_family: Type of distribution shared by every row
+        
+    Returns:
+        np.ndarray: Probabilities P(X > line), 0.5 where inputs are invalid
+    """
+    lines = np.asarray(lines, dtype=float)
+    means = np.asarray(means, dtype=float)
+    variances = np.asarray(variances, dtype=float)
+    distribution_family = distribution_family.upper()
+    
+    if not SCIPY_AVAILABLE:
+        return np.array([
+            prob_over_line(float(line), float(mean), float(variance), distribution_family)
+            for line, mean, variance in zip(lines, means, variances)
+        ])
+    
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if distribution_family == "POISSON":
+            probs = poisson.sf(np.floor(lines), means)
+        elif distribution_family in ("NORMAL", "NEG_BINOMIAL"):
+            # NEG_BINOMIAL uses the same normal approximation as prob_over_line
+            probs = norm.sf(lines, loc=means, scale=np.sqrt(variances))
+        else:
+            logger.error(f"Unsupported distribution: {distribution_family}")
+            probs = np.full(lines.shape, 0.5)
+    
+    return np.where(np.isfinite(probs), probs, 0.5)
@@ -9,7 +9,7 @@ from unittest.mock import Mock, AsyncMock, patch, MagicMock
 import asyncio
 from datetime import datetime
 
-from backend.services.llm.explanation_service import ExplanationService
+from backend.services.llm.explanation_service import ExplanationService, SingleFlight
 from backend.services.llm.prompt_templates import EdgeContext
 from backend.services.llm.llm_cache import ExplanationRecord
 
@@ -278,5 +278,28 @@ class TestExplanationService:
         assert health["status"] in ["healthy", "degraded", "unhealthy"]
 
 
+
+class TestSingleFlight:
+    """Test the single-flight generation table"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_run(self):
+        """Concurrent calls for one key run the factory once and then expire"""
+        flight = SingleFlight()
+        calls = []
+        
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "done"
+        
+        results = await asyncio.gather(*[flight.do(123, work) for _ in range(5)])
+        
+        assert results == ["done"] * 5
+        assert len(calls) == 1
+        # Finished keys do not linger in the table
+        assert len(flight) == 0
+        assert 123 not in flight
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -94,6 +94,20 @@ class TestLLMCache:
         # Newest key should be present
         assert cache.get_cached_explanation("key_3") is not None
         
+    def test_get_many_bulk_lookup(self, cache):
+        """Test bulk lookup serves memory hits and counts the rest as misses"""
+        cache.set_cached_explanation("key_a", "content_a", "provider", 100)
+        cache.set_cached_explanation("key_b", "content_b", "provider", 50)
+        
+        found = cache.get_many(["key_a", "key_b", "key_c", "key_a"])
+        
+        assert set(found) == {"key_a", "key_b"}
+        assert found["key_b"].content == "content_b"
+        # Hits are refreshed in LRU order
+        assert list(cache._memory_cache)[-1] == "key_b"
+        assert cache.stats.hits == 2
+        assert cache.stats.misses == 1
+        
     def test_cache_ttl_expiration(self):
         """Test TTL expiration"""
         # Create cache with very short TTL
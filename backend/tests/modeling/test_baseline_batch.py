@@ -0,0 +1,116 @@
+"""
+Tests for baseline model batch prediction and grouped history fetch
+"""
+
+import pytest
+
+from backend.services.modeling.baseline_models import (
+    NegativeBinomialModel,
+    NormalModel,
+    PoissonLikeModel,
+    StatHistoryMatrix,
+)
+from backend.services.modeling.historical_stats_provider import historical_stats_provider
+from backend.services.valuation.distributions import prob_over_line
+
+
+@pytest.fixture
+def seeded_histories():
+    saved = dict(historical_stats_provider.cache)
+    historical_stats_provider.cache.update({
+        "1_POINTS_5": [10.0, 20.0, 30.0],
+        "2_POINTS_5": [7.0],
+        "3_ASSISTS_5": [1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+    yield [(1, "POINTS"), (2, "POINTS"), (3, "ASSISTS"), (1, "POINTS")]
+    historical_stats_provider.cache.clear()
+    historical_stats_provider.cache.update(saved)
+
+
+def test_history_matrix_moments():
+    matrix = StatHistoryMatrix.from_histories([[1.0, 2.0, 3.0], [4.0], []])
+    assert matrix.values.shape == (3, 3)
+    assert matrix.counts.tolist() == [3, 1, 0]
+    assert matrix.mean.tolist() == [2.0, 4.0, 0.0]
+    variance = matrix.sample_variance()
+    assert variance[0] == 1.0
+    assert variance[1] != variance[1] and variance[2] != variance[2]  # NaN
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("model_cls", [PoissonLikeModel, NormalModel, NegativeBinomialModel])
+async def test_predict_batch_matches_single_predictions(model_cls, seeded_histories):
+    model = model_cls()
+    batch = await model.predict_batch(requests=seeded_histories, context={})
+    assert len(batch) == len(seeded_histories)
+    for (player_id, prop_type), prediction in zip(seeded_histories, batch):
+        single = await model.predict(player_id=player_id, prop_type=prop_type, context={})
+        assert single == prediction
+    assert batch[0]["features_hash"] == batch[3]["features_hash"]
+
+
+@pytest.mark.asyncio
+async def test_normal_batch_moments_and_tail_probabilities(seeded_histories):
+    model = NormalModel()
+    lines = [15.5, None, 2.5, 25.5]
+    batch = await model.predict_batch(requests=seeded_histories, context={}, lines=lines)
+
+    assert batch[0]["mean"] == 20.0 and batch[0]["variance"] == 100.0
+    assert batch[0]["dispersion"] == 5.0
+    # Single game: 30% coefficient of variation heuristic
+    assert batch[1]["variance"] == pytest.approx((7.0 * 0.3) ** 2)
+    assert batch[1]["dispersion"] is None
+    assert "prob_over" not in batch[1]
+    for line, prediction in zip(lines, batch):
+        if line is not None:
+            assert prediction["prob_over"] == pytest.approx(
+                prob_over_line(line, prediction["mean"], prediction["variance"], "NORMAL")
+            )
+
+
+@pytest.mark.asyncio
+async def test_grouped_history_fetch_runs_fallback_chain_once(monkeypatch):
+    calls = []
+
+    async def fake_bulk(keys, lookback_games):
+        calls.append(list(keys))
+        return {(10, "REBOUNDS"): [5.0, 7.0]}
+
+    async def no_single(*args, **kwargs):
+        raise AssertionError("per-player fetch should not be used")
+
+    monkeypatch.setattr(historical_stats_provider, "cache", {})
+    monkeypatch.setattr(historical_stats_provider, "_fetch_historical_stats_bulk", fake_bulk)
+    monkeypatch.setattr(historical_stats_provider, "_fetch_historical_stats", no_single)
+
+    keys = [(10, "REBOUNDS"), (11, "REBOUNDS"), (10, "REBOUNDS")]
+    histories = await historical_stats_provider.get_player_stat_histories(keys)
+    assert calls == [[(10, "REBOUNDS"), (11, "REBOUNDS")]]
+    assert histories[(10, "REBOUNDS")] == [5.0, 7.0]
+    assert len(histories[(11, "REBOUNDS")]) == 5  # heuristic baseline
+
+    # Served from cache on the next call
+    await historical_stats_provider.get_player_stat_histories(keys)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_grouped_history_fetch_reuses_per_player_sources(monkeypatch):
+    async def historical(player_id, prop_type, lookback_games):
+        if player_id == 12:
+            raise RuntimeError("warehouse down")
+        return [9.0] if player_id == 10 else None
+
+    async def offered_lines(player_id, prop_type, lookback_games):
+        return [4.0, 6.0] if player_id == 11 else None
+
+    monkeypatch.setattr(historical_stats_provider, "cache", {})
+    monkeypatch.setattr(historical_stats_provider, "_fetch_historical_stats", historical)
+    monkeypatch.setattr(historical_stats_provider, "_fetch_from_offered_lines", offered_lines)
+
+    histories = await historical_stats_provider.get_player_stat_histories(
+        [(10, "POINTS"), (11, "POINTS"), (12, "POINTS")]
+    )
+    assert histories[(10, "POINTS")] == [9.0]
+    assert histories[(11, "POINTS")] == [4.0, 6.0]
+    assert len(histories[(12, "POINTS")]) == 5  # heuristic baseline
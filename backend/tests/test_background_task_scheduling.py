@@ -0,0 +1,129 @@
+"""
+Tests for the BackgroundTaskManager ready heap and timer wheel.
+"""
+
+import asyncio
+import math
+import random
+
+import pytest
+
+import backend.services.background_task_manager as btm
+from backend.services.background_task_manager import (
+    BackgroundTask,
+    BackgroundTaskManager,
+    TaskConfig,
+    TaskPriority,
+    TaskQueue,
+    TaskStatus,
+    TimerWheel,
+)
+
+
+def _task(task_id, priority, deadline=None):
+    return BackgroundTask(
+        id=task_id,
+        name=task_id,
+        func=lambda: None,
+        config=TaskConfig(priority=priority, deadline=deadline),
+    )
+
+
+def test_timer_wheel_fires_each_timer_on_its_tick():
+    wheel = TimerWheel(tick=1.0, slots=4, levels=2)  # overflow beyond 16 ticks
+    origin = wheel._origin
+    rng = random.Random(7)
+    delays = {f"t{i}": rng.uniform(0, 40) for i in range(200)}
+    for key, delay in delays.items():
+        wheel.schedule(key, key, delay, now=origin)
+    assert wheel.cancel("t0")
+
+    fired = {}
+    for second in range(45):
+        for key in wheel.advance(now=origin + second + 0.5):
+            fired[key] = second
+
+    assert "t0" not in fired
+    assert len(fired) == len(delays) - 1
+    assert all(fired[k] == math.ceil(delays[k]) for k in fired)
+    assert len(wheel) == 0
+
+
+def test_task_queue_priority_aging_and_deadline(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(btm.time, "monotonic", lambda: clock[0])
+    queue = TaskQueue(aging_seconds=5.0)
+    queue.put_nowait(_task("low", TaskPriority.LOW))
+    queue.put_nowait(_task("normal", TaskPriority.NORMAL))
+    queue.put_nowait(_task("critical", TaskPriority.CRITICAL))
+    queue.put_nowait(_task("urgent-low", TaskPriority.LOW, deadline=-30.0))
+    assert [queue.get_nowait().id for _ in range(4)] == [
+        "urgent-low",
+        "critical",
+        "normal",
+        "low",
+    ]
+
+    # A LOW task that has waited past the aging window beats new CRITICAL work
+    queue.put_nowait(_task("old-low", TaskPriority.LOW))
+    clock[0] += 20.0
+    queue.put_nowait(_task("new-critical", TaskPriority.CRITICAL))
+    assert queue.get_nowait().id == "old-low"
+    assert queue.latency_stats()["LOW"]["max"] == pytest.approx(20.0)
+    assert queue.priority_sizes()[TaskPriority.CRITICAL] == 1
+
+
+def test_task_queue_positive_deadline_promotes(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(btm.time, "monotonic", lambda: clock[0])
+    queue = TaskQueue(aging_seconds=5.0)
+    queue.put_nowait(_task("queued-critical", TaskPriority.CRITICAL))
+    queue.put_nowait(_task("high", TaskPriority.HIGH))
+    queue.put_nowait(_task("due-low", TaskPriority.LOW, deadline=2.0))
+    queue.put_nowait(_task("plain-low", TaskPriority.LOW))
+    # CRITICAL work arriving after the deadline no longer jumps ahead
+    clock[0] += 3.0
+    queue.put_nowait(_task("late-critical", TaskPriority.CRITICAL))
+
+    assert [queue.get_nowait().id for _ in range(5)] == [
+        "queued-critical",
+        "due-low",
+        "late-critical",
+        "high",
+        "plain-low",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_manager_runs_delayed_tasks_and_retries_via_timer_wheel():
+    manager = BackgroundTaskManager(worker_pool_size=1, timer_tick=0.01)
+    ran = []
+    attempts = {"n": 0}
+
+    async def job(label):
+        ran.append(label)
+
+    async def flaky():
+        attempts["n"] += 1
+        if attempts["n"] < 2:
+            raise RuntimeError("transient")
+        ran.append("flaky")
+
+    manager.add_task(job, "delayed", delay=0.03)
+    cancelled = manager.add_task(job, "cancelled", delay=0.03)
+    assert manager.cancel_task(cancelled)
+    retried = manager.add_task(flaky, config=TaskConfig(retry_delay=0.02))
+
+    await manager.start()
+    try:
+        for _ in range(100):
+            if len(ran) == 2:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await manager.stop()
+
+    assert sorted(ran) == ["delayed", "flaky"]
+    assert manager.get_task_status(retried).retry_count == 1
+    assert manager.get_task_status(cancelled).status == TaskStatus.CANCELLED
+    assert manager.get_queue_status()["scheduled_tasks"] == 0
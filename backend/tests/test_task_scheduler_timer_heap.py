@@ -0,0 +1,75 @@
+"""
+Tests for the TaskScheduler timer heap, catch-up policies and run deduplication.
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from backend.services.tasks.task_scheduler import CatchUpPolicy, TaskScheduler
+
+
+async def _noop():
+    return None
+
+
+def _scheduler():
+    scheduler = TaskScheduler(max_concurrent_tasks=1)
+    scheduler.register_task("job", _noop)
+    return scheduler
+
+
+@pytest.mark.parametrize(
+    "policy, queued, phase_kept",
+    [
+        (CatchUpPolicy.ONCE, 1, True),
+        (CatchUpPolicy.SKIP, 0, True),
+        (CatchUpPolicy.RESCHEDULE, 1, False),
+    ],
+)
+def test_catch_up_policies_collapse_missed_runs(policy, queued, phase_kept):
+    scheduler = _scheduler()
+    task_id = scheduler.schedule_periodic(10.0, "job", catch_up=policy)
+    scheduled = scheduler.scheduled_tasks[task_id]
+    first = scheduled.next_run
+    now = first + timedelta(seconds=35.0)  # three missed slots
+
+    scheduler._fire(task_id, scheduled, now)
+
+    assert scheduler.task_queue.qsize() == queued
+    assert scheduled.missed_runs == 3
+    if phase_kept:
+        assert scheduled.next_run == first + timedelta(seconds=40.0)
+    else:
+        assert scheduled.next_run == now + timedelta(seconds=10.0)
+
+
+def test_in_flight_runs_are_coalesced():
+    scheduler = _scheduler()
+    task_id = scheduler.schedule_periodic(1.0, "job")
+    scheduled = scheduler.scheduled_tasks[task_id]
+
+    scheduler._fire(task_id, scheduled, scheduled.next_run)
+    scheduler._fire(task_id, scheduled, scheduled.next_run)
+
+    assert scheduler.task_queue.qsize() == 1
+    assert scheduled.coalesced_runs == 1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wakes_for_new_registrations():
+    scheduler = _scheduler()
+    ran = asyncio.Event()
+
+    async def job():
+        ran.set()
+
+    scheduler.register_task("fast", job)
+    await scheduler.start()
+    try:
+        await asyncio.sleep(0.05)  # loop is idle with an empty heap
+        scheduler.schedule_once(0.01, "fast")
+        await asyncio.wait_for(ran.wait(), timeout=1.0)
+    finally:
+        await scheduler.stop()
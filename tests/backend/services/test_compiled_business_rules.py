@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+
+from backend.services.compiled_business_rules import CompiledBusinessRules
+
+RULES = {
+    "forbidden_combos": [["LeBron James", "points", "under"], ["foo", "bar"]],
+    "allowed_stat_types": ["points", "rebounds"],
+    "rules": [
+        {
+            "id": "nba-ev-boost",
+            "applies_to": {"sport": "nba"},
+            "type": "expected_value_min",
+            "value": 0.10,
+            "time_window": {
+                "start": "2025-07-27T00:00:00Z",
+                "end": "2025-08-01T00:00:00Z",
+            },
+        },
+        {
+            "id": "global-max-risk",
+            "type": "risk_score_max",
+            "value": 0.25,
+            "applies_to": {"sport": "all"},
+            "time_window": None,
+        },
+        {
+            "id": "bad-window",
+            "type": "risk_score_max",
+            "value": 0.01,
+            "time_window": {"start": "not-a-date", "end": "2025-08-01T00:00:00Z"},
+        },
+    ],
+    "user_overrides": {
+        "user_123": {
+            "allowed_stat_types": ["assists"],
+            "rules": [
+                {
+                    "id": "user-window",
+                    "type": "expected_value_min",
+                    "value": 0.5,
+                    "time_window": {
+                        "start": "2025-07-30T00:00:00Z",
+                        "end": "2025-07-31T00:00:00Z",
+                    },
+                }
+            ],
+        }
+    },
+}
+
+INSIDE = datetime(2025, 7, 30, 12, tzinfo=timezone.utc)
+OUTSIDE = datetime(2025, 9, 1, tzinfo=timezone.utc)
+
+
+def _ids(rules):
+    return [r["id"] for r in rules]
+
+
+def test_interval_index_active_rules():
+    compiled = CompiledBusinessRules.compile(RULES)
+    assert _ids(compiled.active_rules(now=INSIDE)) == [
+        "nba-ev-boost",
+        "global-max-risk",
+    ]
+    assert _ids(compiled.active_rules(now=OUTSIDE)) == ["global-max-risk"]
+    # Window boundaries are inclusive
+    end = datetime(2025, 8, 1, tzinfo=timezone.utc)
+    assert "nba-ev-boost" in _ids(compiled.active_rules(now=end))
+
+
+def test_user_rules_override_and_fall_back_to_globals():
+    compiled = CompiledBusinessRules.compile(RULES)
+    assert _ids(compiled.active_rules(now=INSIDE, user_id="user_123")) == [
+        "user-window"
+    ]
+    assert _ids(compiled.active_rules(now=OUTSIDE, user_id="user_123")) == [
+        "global-max-risk"
+    ]
+    assert _ids(compiled.active_rules(now=OUTSIDE, user_id="unknown")) == [
+        "global-max-risk"
+    ]
+
+
+def test_evaluate_static_rules():
+    compiled = CompiledBusinessRules.compile(RULES)
+    reasons = compiled.evaluate(
+        {"features": ["LEBRON JAMES", "points", "under", "x"], "stat_type": "points"},
+        now=OUTSIDE,
+    )
+    assert reasons == ["Forbidden combo: ['LeBron James', 'points', 'under']"]
+    reasons = compiled.evaluate(
+        {"features": ["baz"], "stat_type": "blocks"}, now=OUTSIDE
+    )
+    assert reasons == ["Stat type 'blocks' not allowed"]
+    # User allowed stat types replace the global list, combos fall back to it
+    reasons = compiled.evaluate(
+        {"features": ["foo", "bar"], "stat_type": "assists"},
+        now=OUTSIDE,
+        user_id="user_123",
+    )
+    assert reasons == ["Forbidden combo: ['foo', 'bar']"]
+
+
+def test_filter_allowed_bulk():
+    compiled = CompiledBusinessRules.compile(RULES)
+    bets = [
+        {"id": "ok", "stat_type": "points", "features": ["a"], "risk_score": 0.1},
+        {"id": "risky", "stat_type": "points", "features": ["a"], "risk_score": 0.9},
+        {"id": "combo", "stat_type": "points", "features": ["foo", "bar"]},
+    ]
+    allowed, rejected = compiled.filter_allowed(bets, now=OUTSIDE)
+    assert [b["id"] for b in allowed] == ["ok"]
+    assert {b["id"]: reasons for b, reasons in rejected} == {
+        "risky": ["Risk score 0.9 above max 0.25 (rule global-max-risk)"],
+        "combo": ["Forbidden combo: ['foo', 'bar']"],
+    }
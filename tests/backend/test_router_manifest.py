@@ -0,0 +1,74 @@
+import sys
+import types
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from backend.core.router_manifest import RouterManifest
+
+
+def _router_module(name, path):
+    module = types.ModuleType(name)
+    router = APIRouter()
+
+    @router.get(path)
+    async def handler():
+        return {"module": name}
+
+    module.router = router
+    return module
+
+
+def _manifest(lazy, monkeypatch):
+    for name, path in (("fake_alpha_routes", "/alpha/ping"), ("fake_beta_routes", "/beta/ping")):
+        monkeypatch.setitem(sys.modules, name, _router_module(name, path))
+    app = FastAPI()
+    manifest = RouterManifest(app, lazy=lazy, budget_ms=60_000)
+
+    @app.middleware("http")
+    async def _loader(request, call_next):
+        manifest.ensure_routed(request.scope)
+        return await call_next(request)
+
+    manifest.register("alpha", "fake_alpha_routes", paths=("/alpha",))
+    manifest.register("beta", "fake_beta_routes")  # no prefix hint
+    manifest.register("missing", "fake_missing_routes_module", prefix="/missing")
+    return app, manifest
+
+
+def test_eager_manifest_loads_and_records(monkeypatch):
+    app, manifest = _manifest(lazy=False, monkeypatch=monkeypatch)
+    assert manifest.pending == []
+    assert manifest.records["alpha"].status == "loaded"
+    assert manifest.records["alpha"].trigger == "eager"
+    assert manifest.records["alpha"].routes_added == 1
+    assert manifest.records["missing"].status == "failed"
+    assert TestClient(app).get("/beta/ping").json() == {"module": "fake_beta_routes"}
+
+
+def test_lazy_manifest_loads_on_first_hit(monkeypatch):
+    app, manifest = _manifest(lazy=True, monkeypatch=monkeypatch)
+    assert manifest.pending == ["alpha", "beta", "missing"]
+    client = TestClient(app)
+
+    assert client.get("/alpha/ping").status_code == 200
+    assert manifest.records["alpha"].trigger == "request"
+    assert manifest.pending == ["beta", "missing"]
+
+    # Unhinted path: nothing matches, so every pending router is loaded
+    assert client.get("/beta/ping").status_code == 200
+    assert manifest.pending == []
+    assert manifest.records["missing"].status == "failed"
+
+
+async def test_warmup_and_budget(monkeypatch):
+    app, manifest = _manifest(lazy=True, monkeypatch=monkeypatch)
+    await manifest.warmup()
+    assert manifest.pending == []
+    assert manifest.loaded_count == 2
+    assert manifest.record_startup(10.0) is True
+    manifest.budget_ms = 1.0
+    assert manifest.record_startup(10.0) is False
+    report = manifest.report()
+    assert report["within_budget"] is False
+    assert {r["name"] for r in report["routers"]} == {"alpha", "beta", "missing"}
@@ -0,0 +1,79 @@
+"""Import helper for tests of backend.ensemble_engine
+
+The engine imports a few things that are not available in every test
+environment: ``cachetools``, ``backend.feature_engineering`` (which needs
+statsmodels) and a ``config_manager`` object. Only the pieces that fail to
+import are replaced, and only while the engine module is being imported;
+the module is then cached so its Prometheus metrics register once.
+
+It also imports the top-level ``database`` and ``utils`` modules from
+``backend/``. Under ``pytest tests`` other packages with those names (such as
+``tests/utils``) may already be imported or earlier on ``sys.path``, so
+``backend/`` goes first and conflicting modules are set aside for the import.
+"""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = str(Path(__file__).resolve().parent.parent / "backend")
+
+# Top-level modules the engine imports from backend/
+BACKEND_TOP_LEVEL = ("database", "utils")
+
+
+class _TTLCache(dict):
+    def __init__(self, maxsize, ttl):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+
+class _ConfigManager:
+    config = types.SimpleNamespace(model_path="models", metrics_enabled=False, redis_url=None)
+
+    def get(self, key, default=None):
+        return default
+
+
+def _importable(name):
+    try:
+        importlib.import_module(name)
+        return True
+    except ImportError:
+        return False
+
+
+def _from_backend(module):
+    location = getattr(module, "__file__", None) or next(iter(getattr(module, "__path__", [])), "")
+    return str(Path(location).resolve()).startswith(BACKEND_DIR)
+
+
+def load_ensemble_engine():
+    """Return the ``backend.ensemble_engine`` module, importing it once"""
+    module = sys.modules.get("backend.ensemble_engine")
+    if module is not None:
+        return module
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sys, "path", [BACKEND_DIR] + [p for p in sys.path if p != BACKEND_DIR])
+        for name in BACKEND_TOP_LEVEL:
+            module = sys.modules.get(name)
+            if module is not None and not _from_backend(module):
+                for key in [k for k in sys.modules if k == name or k.startswith(name + ".")]:
+                    mp.delitem(sys.modules, key)
+        if not _importable("cachetools"):
+            mp.setitem(sys.modules, "cachetools", types.SimpleNamespace(TTLCache=_TTLCache))
+        if not _importable("backend.feature_engineering"):
+            mp.setitem(
+                sys.modules,
+                "backend.feature_engineering",
+                types.SimpleNamespace(FeatureEngineering=object),
+            )
+        config_module = importlib.import_module("backend.config_manager")
+        if not hasattr(config_module, "config_manager"):
+            mp.setattr(config_module, "config_manager", _ConfigManager(), raising=False)
+        return importlib.import_module("backend.ensemble_engine")
@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from backend.services.advanced_kelly_engine import (
+    AdvancedKellyEngine,
+    BettingOpportunity,
+    BetType,
+)
+
+
+def _opportunities(count, seed=3, prefix="o"):
+    rng = np.random.default_rng(seed)
+    expires = datetime.now() + timedelta(hours=1)
+    opportunities = []
+    for i in range(count):
+        probability = float(rng.uniform(0.3, 0.7))
+        opportunities.append(BettingOpportunity(
+            opportunity_id=f"{prefix}{i}",
+            description="",
+            sport=("NBA", "MLB")[i % 2],
+            market_type=(BetType.SPREAD, BetType.PROP)[i % 2],
+            offered_odds=float(rng.uniform(1.6, 2.6)),
+            true_probability=probability,
+            confidence_interval=(probability - 0.05, probability + 0.05),
+            max_bet_limit=float(rng.choice([50.0, 500.0, 5000.0])),
+            sportsbook="dk",
+            expires_at=expires,
+            metadata={"game_id": i // 4},
+        ))
+    return opportunities
+
+
+def _fractions(engine, opportunities):
+    result = engine.calculate_portfolio_kelly(opportunities)
+    return np.array([result[opp.opportunity_id] for opp in opportunities])
+
+
+def test_portfolio_respects_caps_and_skips_negative_ev():
+    engine = AdvancedKellyEngine(initial_bankroll=10000.0)
+    opportunities = _opportunities(200)
+    fractions = _fractions(engine, opportunities)
+
+    settings = engine.risk_settings
+    limits = np.array([opp.max_bet_limit / engine.current_bankroll for opp in opportunities])
+    expected_values = np.array([opp.true_probability * opp.offered_odds - 1 for opp in opportunities])
+
+    assert fractions.min() >= 0.0
+    assert fractions.sum() <= settings.max_portfolio_kelly + 1e-9
+    assert np.all(fractions <= settings.max_bet_percentage + 1e-12)
+    assert np.all(fractions <= limits + 1e-12)
+    assert np.all(fractions[expected_values < 0] == 0.0)
+    assert np.count_nonzero(fractions) > 0
+
+
+def test_projection_onto_capped_simplex():
+    rng = np.random.default_rng(11)
+    values = rng.normal(0.05, 0.1, 50)
+    caps = rng.uniform(0.0, 0.08, 50)
+    project = AdvancedKellyEngine._project_capped_simplex
+
+    projected = project(values, caps, 0.3)
+    assert projected.min() >= 0.0
+    assert np.all(projected <= caps)
+    assert projected.sum() == pytest.approx(0.3, abs=1e-9)  # total binds here
+    # Common shift: every interior coordinate moved by the same amount
+    interior = (projected > 0) & (projected < caps)
+    shifts = values[interior] - projected[interior]
+    assert np.ptp(shifts) < 1e-9
+
+    loose = project(values, caps, 10.0)
+    assert np.array_equal(loose, np.clip(values, 0.0, caps))
+
+
+def test_non_positive_definite_correlation_is_repaired():
+    matrix = np.array([
+        [1.0, 0.9, -0.9],
+        [0.9, 1.0, 0.9],
+        [-0.9, 0.9, 1.0],
+    ])
+    assert np.linalg.eigvalsh(matrix).min() < 0
+
+    factor = AdvancedKellyEngine._cholesky_with_jitter(matrix)
+    repaired = factor @ factor.T
+    assert np.linalg.eigvalsh(repaired).min() > 0
+    assert np.allclose(np.diag(repaired), 1.0, atol=1e-6)
+
+    # The portfolio solve uses the repaired matrix instead of falling back
+    # to independent adaptive Kelly (which leaves no warm-start state)
+    engine = AdvancedKellyEngine()
+    engine.correlation_matrix = matrix
+    opportunities = _opportunities(3)
+    result = engine.calculate_portfolio_kelly(opportunities)
+    assert engine._portfolio_warm_start == result
+    assert sum(result.values()) <= engine.risk_settings.max_portfolio_kelly + 1e-9
+
+
+def test_warm_start_reused_for_current_opportunities(monkeypatch):
+    engine = AdvancedKellyEngine()
+    opportunities = _opportunities(20)
+    first = engine.calculate_portfolio_kelly(opportunities)
+
+    seen = {}
+    solve = engine._solve_log_utility
+
+    def spy(scenario_returns, initial, caps, max_total, **kwargs):
+        seen["initial"] = initial.copy()
+        return solve(scenario_returns, initial, caps, max_total, **kwargs)
+
+    monkeypatch.setattr(engine, "_solve_log_utility", spy)
+    # Drop five legs and add three new ones
+    changed = opportunities[5:] + _opportunities(3, seed=9, prefix="new")
+    second = engine.calculate_portfolio_kelly(changed)
+
+    kept = [opp.opportunity_id for opp in opportunities[5:]]
+    assert seen["initial"][:len(kept)] == pytest.approx([first[i] for i in kept], abs=1e-12)
+    assert set(engine._portfolio_warm_start) == {opp.opportunity_id for opp in changed}
+    assert engine._portfolio_warm_start == second
+
+
+def test_fixed_scenario_seed_is_deterministic():
+    opportunities = _opportunities(40)
+    runs = [_fractions(AdvancedKellyEngine(), opportunities) for _ in range(2)]
+    assert np.array_equal(runs[0], runs[1])
+
+    reseeded = AdvancedKellyEngine()
+    reseeded.risk_settings.portfolio_scenario_seed = 8
+    assert not np.array_equal(_fractions(reseeded, opportunities), runs[0])
@@ -0,0 +1,84 @@
+import numpy as np
+
+from backend.services.comprehensive_feature_engine import (
+    ComprehensiveFeatureEngine,
+    FeatureCategory,
+    PropFeatureRequest,
+)
+
+
+def _slate():
+    game_a = {"game_id": "A", "team": "LAL", "venue": "Crypto.com Arena"}
+    game_b = {"game_id": "B", "team": "BOS", "venue": "TD Garden"}
+    return [
+        PropFeatureRequest("LeBron James", "nba", "points", dict(game_a, line=25.5)),
+        PropFeatureRequest("LeBron James", "nba", "assists", dict(game_a, line=7.5)),
+        PropFeatureRequest("Anthony Davis", "nba", "points", dict(game_a, line=24.5)),
+        PropFeatureRequest("Jayson Tatum", "nba", "points", dict(game_b, line=27.5)),
+    ]
+
+
+async def test_batch_shares_game_team_and_venue_families(monkeypatch):
+    engine = ComprehensiveFeatureEngine()
+    weather_calls = []
+    original = engine.create_weather_impact_features
+
+    async def counting_weather(sport, raw_data):
+        weather_calls.append(raw_data["game_id"])
+        return await original(sport, raw_data)
+
+    monkeypatch.setattr(engine, "create_weather_impact_features", counting_weather)
+    batch = await engine.engineer_features_batch(_slate())
+
+    assert sorted(weather_calls) == ["A", "B"]
+    lebron_pts, lebron_ast, davis, tatum = batch.feature_sets
+    venue = FeatureCategory.VENUE_EFFECTS
+    shared = ["home_court_advantage", "venue_age"]
+    player = ["venue_performance", "games_at_venue"]
+
+    def values(feature_set, category, names):
+        return [feature_set.feature_categories[category][name] for name in names]
+
+    assert values(lebron_pts, venue, shared) == values(davis, venue, shared)
+    assert values(lebron_pts, venue, shared) != values(tatum, venue, shared)
+    # Player history at the venue is per player, shared across that player's props
+    assert values(lebron_pts, venue, player) == values(lebron_ast, venue, player)
+    assert values(lebron_pts, venue, player) != values(davis, venue, player)
+    referee = FeatureCategory.REFEREE_IMPACT
+    assert values(lebron_pts, referee, ["ref_foul_rate"]) == values(davis, referee, ["ref_foul_rate"])
+    assert values(lebron_pts, referee, ["avg_with_ref"]) != values(davis, referee, ["avg_with_ref"])
+    injury = FeatureCategory.INJURY_SENTIMENT
+    assert lebron_pts.feature_categories[injury] is lebron_ast.feature_categories[injury]
+
+    assert batch.matrix.shape == (4, len(batch.columns))
+    assert batch.columns.index("avg_points_3g") < batch.columns.index("venue_age")
+    column = batch.columns.index("home_court_advantage")
+    assert batch.matrix[0, column] == batch.matrix[2, column]
+    # assists-only columns are NaN for the points props
+    assert np.isnan(batch.matrix[0, batch.columns.index("avg_assists_3g")])
+
+    pinned = await engine.engineer_features_batch(_slate(), columns=["venue_age", "missing"])
+    assert pinned.matrix.shape == (4, 2)
+    assert np.isnan(pinned.matrix[:, 1]).all()
+
+
+async def test_feature_cache_keyed_by_input_version_with_bounds():
+    engine = ComprehensiveFeatureEngine(max_cached_feature_sets=3)
+    slate = _slate()
+    first = await engine.engineer_features_batch(slate[:2])
+    again = await engine.engineer_features_batch(slate[:2])
+    assert again.metadata["cached"] == 2
+    assert again.feature_sets[0] is first.feature_sets[0]
+
+    # A changed line is a new input version
+    moved = PropFeatureRequest("LeBron James", "nba", "points", dict(slate[0].raw_data, line=26.5))
+    result = await engine.engineer_features_batch([moved])
+    assert result.metadata["cached"] == 0
+    assert len(engine.feature_cache) == 3
+
+    await engine.engineer_features_batch(slate[2:])
+    assert len(engine.feature_cache) == 3
+
+    expired = ComprehensiveFeatureEngine(cache_ttl_sec=0)
+    await expired.engineer_features_batch(slate[:1])
+    assert (await expired.engineer_features_batch(slate[:1])).metadata["cached"] == 0
@@ -0,0 +1,125 @@
+from backend.services.provider_resilience_manager import (
+    _WAL_HEADER,
+    DependencyIndex,
+    _file_sequence,
+)
+
+
+def _index(path):
+    return DependencyIndex(persist_dir=str(path), recover_on_start=False)
+
+
+async def _recovered(path):
+    index = _index(path)
+    assert await index.load_snapshot()
+    return index
+
+
+async def _build_graph(index):
+    for prop_id in (1, 2):
+        await index.update_prop(prop_id)
+    await index.update_edge(10, 1)
+    await index.update_edge(11, 2)
+    await index.update_ticket(100, [10, 11])
+
+
+async def test_checkpoint_plus_wal_tail_replays_to_same_graph(tmp_path):
+    index = _index(tmp_path)
+    await _build_graph(index)
+    checkpoint = await index._create_snapshot()
+    assert _file_sequence(tmp_path / checkpoint) == index._lsn == 5
+
+    # Mutations after the checkpoint live only in the WAL tail
+    await index.update_ticket(100, [10])
+    await index.update_prop(2, "suspended")
+    async with index.node_lock:
+        index._delete_node(("edge", 11))
+    await index.update_edge(12, 1, "stale")
+    await index.close()
+
+    recovered = await _recovered(tmp_path)
+    assert recovered.nodes == index.nodes
+    assert recovered.last_checkpoint_lsn == 5
+    assert recovered._lsn == index._lsn == 9
+    assert recovered.nodes[("prop", 1)].dependents == {("edge", 10), ("edge", 12)}
+    assert ("edge", 11) not in recovered.nodes
+    assert recovered.nodes[("ticket", 100)].dependencies == {("edge", 10)}
+    await recovered.close()
+
+
+async def _single_segment(tmp_path, props):
+    index = _index(tmp_path)
+    for prop_id in props:
+        await index.update_prop(prop_id)
+    await index.close()
+    (segment,) = index._wal_segments()
+    data = segment.read_bytes()
+    record_size = len(data) // len(props)
+    assert record_size * len(props) == len(data)
+    return segment, data, record_size
+
+
+async def test_replay_stops_at_torn_tail(tmp_path):
+    segment, data, record_size = await _single_segment(tmp_path, range(1, 6))
+    segment.write_bytes(data[:-3])
+
+    recovered = await _recovered(tmp_path)
+    assert set(recovered.nodes) == {("prop", i) for i in range(1, 5)}
+
+    # New records go to a fresh segment after the last good LSN
+    await recovered.update_prop(9)
+    await recovered.close()
+    assert recovered._lsn == 5
+    assert [_file_sequence(path) for path in recovered._wal_segments()] == [1, 5]
+    again = await _recovered(tmp_path)
+    assert set(again.nodes) == {("prop", i) for i in (1, 2, 3, 4, 9)}
+
+
+async def test_replay_stops_at_corrupt_crc(tmp_path):
+    segment, data, record_size = await _single_segment(tmp_path, range(1, 6))
+    corrupted = bytearray(data)
+    corrupted[2 * record_size + _WAL_HEADER.size + 1] ^= 0xFF  # payload of the third record
+    segment.write_bytes(bytes(corrupted))
+
+    recovered = await _recovered(tmp_path)
+    assert set(recovered.nodes) == {("prop", 1), ("prop", 2)}
+    assert recovered._lsn == 2
+
+
+async def test_lsn_resumes_after_checkpoints_and_segments(tmp_path):
+    first = _index(tmp_path)
+    await _build_graph(first)
+    await first._create_snapshot()  # checkpoint at LSN 5
+    await first.update_prop(3)
+    await first.close()
+
+    # A fresh writer continues after the WAL tail, not the checkpoint
+    second = _index(tmp_path)
+    await second.update_prop(4)
+    await second.close()
+    assert second._lsn == 7
+    assert [_file_sequence(path) for path in second._wal_segments()] == [6, 7]
+
+    loaded = await _recovered(tmp_path)
+    assert {("prop", 3), ("prop", 4), ("ticket", 100)} <= set(loaded.nodes)
+    checkpoint = await loaded._create_snapshot()
+    assert _file_sequence(tmp_path / checkpoint) == 7
+    assert loaded._wal_segments() == []
+    await loaded.close()
+
+    # Only a checkpoint on disk: numbering continues after its LSN
+    third = _index(tmp_path)
+    await third.update_prop(5)
+    await third.close()
+    assert third._lsn == 8
+    final = await _recovered(tmp_path)
+    assert final.last_checkpoint_lsn == 7
+    assert set(final.nodes) == set(loaded.nodes) | {("prop", 5)}
+
+
+async def test_wal_disabled_writes_nothing(tmp_path):
+    index = DependencyIndex(persist_dir=str(tmp_path), wal_enabled=False, recover_on_start=False)
+    await _build_graph(index)
+    await index.close()
+    assert index._wal_segments() == []
+    assert index._lsn == 0
@@ -0,0 +1,77 @@
+import pytest
+
+from backend.services.provider_resilience_manager import EdgeChangeAggregator
+
+
+async def _aggregator(correlations, edges):
+    aggregator = EdgeChangeAggregator(correlation_threshold=0.4)
+    await aggregator.update_correlation_matrix(correlations)
+    for edge_id in edges:
+        await aggregator.record_edge_change(edge_id, "line_move", 0.1)
+    return aggregator
+
+
+def _groups(aggregator):
+    """Cluster membership as a set of frozensets, independent of cluster ids"""
+    by_cluster = {}
+    for edge_id, cluster_id in aggregator.edge_to_cluster.items():
+        by_cluster.setdefault(cluster_id, set()).add(edge_id)
+    for cluster_id, members in by_cluster.items():
+        assert aggregator.impacted_clusters[cluster_id].edge_ids == members
+    assert set(by_cluster) == set(aggregator.impacted_clusters)
+    return {frozenset(members) for members in by_cluster.values()}
+
+
+async def test_new_edges_join_correlated_clusters():
+    aggregator = await _aggregator({(1, 2): 0.8, (2, 3): 0.3}, [1, 2, 3])
+    assert _groups(aggregator) == {frozenset({1, 2}), frozenset({3})}
+    cluster = aggregator.impacted_clusters[aggregator.get_cluster_id(1)]
+    assert cluster.correlation_strength == pytest.approx(0.8)
+
+
+async def test_link_merges_clusters_single_linkage():
+    aggregator = await _aggregator({(1, 2): 0.8, (3, 4): 0.9}, [1, 2, 3, 4])
+    assert _groups(aggregator) == {frozenset({1, 2}), frozenset({3, 4})}
+
+    # One link above the threshold is enough to merge whole clusters
+    await aggregator.update_correlation_matrix({(2, 3): -0.5})
+    assert _groups(aggregator) == {frozenset({1, 2, 3, 4})}
+    cluster = aggregator.impacted_clusters[aggregator.get_cluster_id(1)]
+    assert cluster.correlation_strength == pytest.approx((0.8 + 0.9 + 0.5) / 3)
+    assert aggregator.clusters_merged == 1
+
+
+async def test_unlink_keeps_cluster_while_connected():
+    aggregator = await _aggregator({(1, 2): 0.8, (2, 3): 0.7, (1, 3): 0.6}, [1, 2, 3])
+    await aggregator.update_correlation_matrix({(1, 3): None})
+    assert _groups(aggregator) == {frozenset({1, 2, 3})}
+    assert aggregator.clusters_split == 0
+
+    # Dropping below the threshold unlinks just like removing the pair
+    await aggregator.update_correlation_matrix({(1, 2): 0.1})
+    assert _groups(aggregator) == {frozenset({1}), frozenset({2, 3})}
+    assert aggregator.clusters_split == 1
+
+
+async def test_split_keeps_id_on_largest_component():
+    aggregator = await _aggregator({(1, 2): 0.8, (2, 3): 0.7, (3, 4): 0.9}, [1, 2, 3, 4])
+    cluster_id = aggregator.get_cluster_id(1)
+
+    await aggregator.update_correlation_matrix({(1, 2): None})
+    assert _groups(aggregator) == {frozenset({1}), frozenset({2, 3, 4})}
+    assert aggregator.get_cluster_id(3) == cluster_id
+    assert aggregator.get_cluster_id(1) != cluster_id
+    assert aggregator.impacted_clusters[cluster_id].correlation_strength == pytest.approx(0.8)
+
+
+async def test_merge_and_unlink_in_one_delta():
+    aggregator = await _aggregator({(1, 2): 0.8, (3, 4): 0.9, (4, 5): 0.9}, [1, 2, 3, 4, 5])
+
+    # The {1, 2} cluster is absorbed by {3, 4, 5} after losing its only link
+    await aggregator.update_correlation_matrix({(1, 2): None, (2, 3): 0.9})
+    assert _groups(aggregator) == {frozenset({1}), frozenset({2, 3, 4, 5})}
+    assert aggregator.neighbors[1] == set()
+
+    # Merge listed before the unlink that disconnects the merged edge
+    await aggregator.update_correlation_matrix({(1, 5): 0.9, (2, 3): None})
+    assert _groups(aggregator) == {frozenset({1, 3, 4, 5}), frozenset({2})}
@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from ensemble_engine_support import load_ensemble_engine
+
+ensemble_engine = load_ensemble_engine()
+ModelRegistry = ensemble_engine.ModelRegistry
+ModelType = ensemble_engine.ModelType
+PredictionContext = ensemble_engine.PredictionContext
+
+RAW_WEIGHTS = {"linear": 1.0, "quadratic": 3.0, "broken": 2.0}
+ROWS = [{"x": float(i), "y": float(i % 3), "unused": 9.0} for i in range(6)]
+
+
+class FakeModel:
+    """sklearn-like regressor that records every predict call"""
+
+    def __init__(self, fn, fail=False):
+        self.fn = fn
+        self.fail = fail
+        self.calls = []
+
+    def predict(self, X):
+        self.calls.append(np.asarray(X).shape)
+        if self.fail:
+            raise RuntimeError("model crashed")
+        return np.array([self.fn(row) for row in np.asarray(X)])
+
+
+class PassThroughFeatures:
+    def preprocess_features(self, features):
+        return {"features": features}
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    async def idle(self):
+        return None
+
+    monkeypatch.setattr(ModelRegistry, "_hyperparameter_tuning_loop", idle)
+    engine = ensemble_engine.UltraAdvancedEnsembleEngine()
+    engine.feature_engineer = PassThroughFeatures()
+
+    engine.models = {
+        "linear": FakeModel(lambda row: 2.0 * row[0] + row[1]),
+        "quadratic": FakeModel(lambda row: row[0] ** 2 - row[1]),
+        "broken": FakeModel(lambda row: 0.0, fail=True),
+    }
+    for name, model in engine.models.items():
+        engine.model_registry.models[name] = {
+            "type": ModelType.XGBOOST, "feature_names": ["x", "y"], "version": "1", "path": name,
+        }
+        engine.model_registry._admit(name, model, 1)
+
+    async def select_models(context, features, config):
+        return ["linear", "quadratic"]
+
+    async def calculate_weights(models, context, recent):
+        total = sum(RAW_WEIGHTS[m] for m in models)
+        return {m: RAW_WEIGHTS[m] / total for m in models}
+
+    monkeypatch.setattr(engine.model_selector, "select_models", select_models)
+    monkeypatch.setattr(engine.weighting_engine, "calculate_weights", calculate_weights)
+
+    engine.shap_calls = []
+
+    async def shap_values(model, X, feature_names):
+        engine.shap_calls.append(tuple(X[0]))
+        return {name: float(value) for name, value in zip(feature_names, X[0])}
+
+    async def lime_values(model, X, feature_names):
+        return {name: -float(value) for name, value in zip(feature_names, X[0])}
+
+    monkeypatch.setattr(engine, "_calculate_shap_values", shap_values)
+    monkeypatch.setattr(engine, "_calculate_lime_values", lime_values)
+    return engine
+
+
+async def test_batch_matches_single_row_ensemble(engine):
+    outputs = await engine.predict_batch(ROWS)
+
+    # One predict per model for the whole slate
+    assert engine.models["linear"].calls == [(len(ROWS), 2)]
+    assert engine.models["quadratic"].calls == [(len(ROWS), 2)]
+
+    names = ["linear", "quadratic"]
+    for features, output in zip(ROWS, outputs):
+        singles = await engine._generate_model_predictions(
+            names, features, PredictionContext.PRE_GAME
+        )
+        weights = output.metadata["model_weights"]
+        expected = await engine._calculate_ensemble_prediction(
+            singles, weights, engine.default_config
+        )
+        assert output.predicted_value == pytest.approx(expected["final_prediction"])
+        assert output.metadata["model_predictions"] == {
+            single.model_name: pytest.approx(single.predicted_value) for single in singles
+        }
+        assert output.prediction_probability == pytest.approx(0.8)
+
+
+async def test_explanations_only_for_requested_rows(engine):
+    outputs = await engine.predict_batch(ROWS, explain_rows=[1, 4])
+
+    explained = [row for row, output in enumerate(outputs) if output.shap_values]
+    assert explained == [1, 4]
+    assert outputs[1].shap_values == pytest.approx({"x": 1.0, "y": 1.0})  # weights sum to 1
+    assert outputs[4].lime_values == pytest.approx({"x": -4.0, "y": -1.0})
+    assert len(engine.shap_calls) == 4  # two models x two rows
+
+    # Later requests for any row are answered from the explanation cache
+    key = outputs[4].metadata["explanation_key"]
+    again = await engine.explain(key)
+    assert again["shap_values"] == pytest.approx(outputs[4].shap_values)
+    assert set(again["models"]) == {"linear", "quadratic"}
+    assert len(engine.shap_calls) == 4
+
+    await engine.explain(outputs[0].metadata["explanation_key"])
+    assert len(engine.shap_calls) == 6
+    assert await engine.explain("unknown") is None
+
+
+async def test_failing_model_is_dropped(engine, monkeypatch):
+    async def select_models(context, features, config):
+        return ["linear", "broken", "quadratic"]
+
+    monkeypatch.setattr(engine.model_selector, "select_models", select_models)
+    outputs = await engine.predict_batch(ROWS[:3])
+
+    assert engine.models["broken"].calls == [(3, 2)]
+    for features, output in zip(ROWS, outputs):
+        assert output.metadata["selected_models"] == ["linear", "quadratic"]
+        linear = 2.0 * features["x"] + features["y"]
+        quadratic = features["x"] ** 2 - features["y"]
+        assert output.predicted_value == pytest.approx(0.25 * linear + 0.75 * quadratic)
+
+
+async def test_all_models_failing_raises(engine, monkeypatch):
+    async def select_models(context, features, config):
+        return ["broken"]
+
+    monkeypatch.setattr(engine.model_selector, "select_models", select_models)
+    with pytest.raises(ValueError, match="All selected models failed"):
+        await engine.predict_batch(ROWS)
+    assert await engine.predict_batch([]) == []
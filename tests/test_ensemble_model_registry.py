@@ -0,0 +1,156 @@
+import asyncio
+import json
+
+import joblib
+import numpy as np
+import pytest
+
+from ensemble_engine_support import load_ensemble_engine
+
+ensemble_engine = load_ensemble_engine()
+ModelRegistry = ensemble_engine.ModelRegistry
+ModelType = ensemble_engine.ModelType
+
+MIB = 1024 * 1024
+
+
+@pytest.fixture(autouse=True)
+def no_tuning_loop(monkeypatch):
+    async def idle(self):
+        return None
+
+    monkeypatch.setattr(ModelRegistry, "_hyperparameter_tuning_loop", idle)
+
+
+@pytest.fixture
+def load_calls(monkeypatch):
+    calls = []
+    real_load = ensemble_engine.joblib.load
+
+    def counting_load(path, mmap_mode=None):
+        calls.append(path)
+        return real_load(path, mmap_mode=mmap_mode)
+
+    monkeypatch.setattr(ensemble_engine.joblib, "load", counting_load)
+    return calls
+
+
+async def _registry(tmp_path, sizes, budget_models, **kwargs):
+    """Registry over joblib dumps of ``sizes`` float arrays; budget in model units"""
+    paths = {}
+    for name, size in sizes.items():
+        path = tmp_path / f"{name}.joblib"
+        joblib.dump({"weights": np.arange(size, dtype=np.float64)}, path)
+        paths[name] = path
+    unit = max(path.stat().st_size for name, path in paths.items() if sizes[name] == 1024)
+    registry = ModelRegistry(str(tmp_path), cache_budget_mb=budget_models * unit / MIB, **kwargs)
+    for name, path in paths.items():
+        await registry.register_model(name, ModelType.RANDOM_FOREST, str(path), {})
+    return registry, {name: path.stat().st_size for name, path in paths.items()}
+
+
+async def test_lru_eviction_within_byte_budget(tmp_path, load_calls):
+    registry, sizes = await _registry(tmp_path, {"a": 1024, "b": 1024, "c": 1024}, 2.5)
+
+    await registry.load_model("a")
+    await registry.load_model("b")
+    await registry.load_model("a")  # cache hit, now most recently used
+    assert len(load_calls) == 2
+
+    await registry.load_model("c")
+    assert list(registry._model_cache) == ["a", "c"]
+    assert registry.cached_bytes == sizes["a"] + sizes["c"]
+    assert registry.cache_evictions == 1
+
+    assert registry.evict_model("a")
+    assert not registry.is_loaded("a")
+    assert registry.cached_bytes == sizes["c"]
+
+
+async def test_concurrent_loads_read_file_once(tmp_path, load_calls):
+    registry, _ = await _registry(tmp_path, {"a": 1024}, 2)
+
+    models = await asyncio.gather(*(registry.load_model("a") for _ in range(8)))
+    assert len(load_calls) == 1
+    assert all(model is models[0] for model in models)
+    assert registry._loading == {}
+
+
+async def test_failed_load_is_not_cached_and_can_retry(tmp_path, load_calls):
+    registry, _ = await _registry(tmp_path, {"a": 1024}, 2)
+    path = tmp_path / "a.joblib"
+    content = path.read_bytes()
+    path.unlink()
+
+    results = await asyncio.gather(*(registry.load_model("a") for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, FileNotFoundError) for result in results)
+    assert registry._loading == {}
+
+    path.write_bytes(content)
+    await registry.load_model("a")
+    assert registry.is_loaded("a")
+
+
+async def test_oversized_model_is_pinned_outside_the_cache(tmp_path, load_calls):
+    registry, sizes = await _registry(tmp_path, {"a": 1024, "huge": 8192, "big": 4096}, 2)
+    await registry.load_model("a")
+
+    model = await registry.load_model("huge")
+    assert model["weights"].shape == (8192,)
+    assert await registry.load_model("huge") is model  # not re-read
+    assert len(load_calls) == 2
+    assert registry.is_loaded("huge")
+    assert list(registry._model_cache) == ["a"]
+    assert registry.cached_bytes == sizes["a"]
+
+    # Only the most recent oversized model stays pinned
+    await registry.load_model("big")
+    assert not registry.is_loaded("huge")
+    assert registry.is_loaded("big")
+    assert registry.evict_model("big")
+    assert not registry.is_loaded("big")
+
+
+async def test_reregistering_evicts_the_stale_copy(tmp_path, load_calls):
+    registry, _ = await _registry(tmp_path, {"a": 1024}, 2)
+    first = await registry.load_model("a")
+
+    joblib.dump({"weights": np.ones(1024)}, tmp_path / "a.joblib")
+    await registry.register_model("a", ModelType.RANDOM_FOREST, str(tmp_path / "a.joblib"), {"version": "2"})
+    assert not registry.is_loaded("a")
+
+    second = await registry.load_model("a")
+    assert len(load_calls) == 2
+    assert second is not first
+    assert second["weights"][0] == 1.0
+
+
+async def test_mmap_switch(tmp_path):
+    registry, _ = await _registry(tmp_path, {"a": 1024, "b": 1024}, 4)
+    registry.models["b"]["mmap"] = False
+
+    assert isinstance((await registry.load_model("a"))["weights"], np.memmap)
+    assert not isinstance((await registry.load_model("b"))["weights"], np.memmap)
+
+    (tmp_path / "eager").mkdir()
+    eager, _ = await _registry(tmp_path / "eager", {"a": 1024}, 4, mmap_models=False)
+    assert not isinstance((await eager.load_model("a"))["weights"], np.memmap)
+
+
+async def test_prewarm_skips_models_that_do_not_fit(tmp_path, load_calls):
+    registry, _ = await _registry(
+        tmp_path, {"a": 1024, "b": 1024, "c": 1024, "huge": 8192}, 2.5
+    )
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"models": ["huge", "a", "missing", "b", "c"]}))
+
+    results = await registry.prewarm(str(manifest))
+    assert results == {"huge": False, "a": True, "missing": False, "b": True, "c": False}
+    # Skipped rather than evicting the higher-priority entries before it
+    assert list(registry._model_cache) == ["a", "b"]
+    assert registry.cache_evictions == 0
+    assert len(load_calls) == 2
+
+    manifest.write_text(json.dumps(["c"]))
+    assert await registry.prewarm(str(manifest)) == {"c": False}
+    assert await registry.prewarm(str(tmp_path / "absent.json")) == {}
@@ -0,0 +1,107 @@
+import asyncio
+import csv
+import io
+import json
+import xml.etree.ElementTree as ET
+
+from backend.services.export_service import DataExportService, ExportField, ExportOptions
+
+FIELDS = [
+    ExportField(key="id", label="Bet ID", type="string"),
+    ExportField(key="amount", label="Amount", type="number"),
+    ExportField(key="sport", label="Sport", type="string"),
+]
+
+RECORDS = [
+    {"id": f"bet_{i}", "amount": i * 1.5, "sport": "NBA" if i % 2 else "MLB"}
+    for i in range(25)
+]
+
+
+def _options(fmt, **kwargs):
+    return ExportOptions(format=fmt, fields=["id", "amount", "sport"], **kwargs)
+
+
+async def _collect(service, data, options):
+    return b"".join([block async for block in service.stream_export(data, FIELDS, options)])
+
+
+async def test_csv_stream_matches_prepared_generation():
+    service = DataExportService(page_size=4)
+    options = _options("csv", filters={"sport": "NBA"}, sorting={"field": "id", "direction": "desc"},
+                       pagination={"limit": 5, "offset": 2})
+
+    streamed = (await _collect(service, RECORDS, options)).decode()
+    prepared = await service._prepare_data(RECORDS, FIELDS, options, "unused")
+    assert streamed == service._generate_csv(prepared, FIELDS, options)
+
+    rows = list(csv.reader(io.StringIO(streamed)))
+    assert rows[0] == ["Bet ID", "Amount", "Sport"]
+    assert len(rows) == 6
+    assert all(row[2] == "NBA" for row in rows[1:])
+
+
+async def test_page_fetcher_receives_pushed_down_query():
+    calls = []
+
+    async def fetch(offset, limit, filters, sorting):
+        calls.append((offset, limit, filters))
+        return RECORDS[offset:offset + limit]
+
+    service = DataExportService(page_size=10)
+    options = _options("ndjson", filters={"sport": "MLB"}, pagination={"limit": 15, "offset": 3})
+    lines = (await _collect(service, fetch, options)).decode().splitlines()
+
+    # The fetcher owns filtering; the service only pages through it
+    assert calls == [(3, 10, {"sport": "MLB"}), (13, 5, {"sport": "MLB"})]
+    assert [json.loads(line)["id"] for line in lines] == [f"bet_{i}" for i in range(3, 18)]
+
+
+
+async def test_zero_limit_means_no_limit_for_every_source():
+    async def fetch(offset, limit, filters, sorting):
+        return RECORDS[offset:offset + limit]
+
+    async def stream():
+        for record in RECORDS:
+            yield record
+
+    service = DataExportService(page_size=10)
+    unsorted = _options("ndjson", pagination={"limit": 0, "offset": 20})
+    ordered = _options("ndjson", sorting={"field": "id"}, pagination={"limit": 0, "offset": 20})
+    for data, options in ((fetch, unsorted), (RECORDS, unsorted), (stream(), unsorted), (RECORDS, ordered)):
+        lines = (await _collect(service, data, options)).decode().splitlines()
+        assert len(lines) == 5
+
+async def test_json_and_xml_are_well_formed_from_async_iterables():
+    async def records():
+        for record in RECORDS:
+            yield record
+
+    service = DataExportService(page_size=7)
+    payload = json.loads(await _collect(service, records(), _options("json", sorting={"field": "none"})))
+    assert len(payload["data"]) == 25
+    assert payload["data"][3] == {"id": "bet_3", "amount": "4.50", "sport": "NBA"}
+    assert payload["metadata"]["total_records"] == 25
+
+    root = ET.fromstring(await _collect(service, RECORDS, _options("xml")))
+    assert len(root.find("data")) == 25
+    assert root.find("metadata/total_records").text == "25"
+
+
+async def test_background_export_writes_file_and_streams_it(tmp_path):
+    service = DataExportService(page_size=5)
+    service.temp_dir = str(tmp_path)
+    export_id = await service.create_export(RECORDS, FIELDS, _options("csv"))
+    for _ in range(100):
+        if service.active_exports[export_id].status == "completed":
+            break
+        await asyncio.sleep(0.01)
+
+    progress = await service.get_export_progress(export_id)
+    assert progress.status == "completed"
+    assert progress.processed_records == 25
+    blocks = await service.iter_export_file(export_id, block_size=64)
+    content = b"".join([block async for block in blocks])
+    assert content == await service.get_export_file(export_id)
+    assert content.count(b"\n") == 26
@@ -0,0 +1,143 @@
+import time
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.models.base import Base
+from backend.models.risk_personalization import ExposureSnapshot
+from backend.services.risk.exposure_tracker import DAILY, ExposureLedger, ExposureTrackerService
+
+LEGS = [
+    {"player_id": "judge", "prop_type": "HR", "correlation_cluster_id": 4},
+    {"player_id": "soto", "prop_type": "HR"},
+]
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'exposure.db'}")
+    Base.metadata.create_all(engine, tables=[ExposureSnapshot.__table__])
+    factory = sessionmaker(bind=engine)
+    factory.opened = 0
+
+    def counting_factory():
+        factory.opened += 1
+        return factory()
+
+    counting_factory.opened = lambda: factory.opened
+    return counting_factory
+
+
+def _ledger(session_factory, **kwargs):
+    kwargs.setdefault("flush_interval_sec", 3600)
+    return ExposureLedger(session_factory=session_factory, **kwargs)
+
+
+def _snapshots(session_factory):
+    session = session_factory()
+    try:
+        return {
+            (row.player_id, row.prop_type, row.correlation_cluster_id): (row.total_staked, row.tickets_count)
+            for row in session.query(ExposureSnapshot).filter(ExposureSnapshot.date == date.today())
+        }
+    finally:
+        session.close()
+
+
+def test_limits_answered_from_ledger_without_queries(session_factory):
+    service = ExposureTrackerService(ledger=_ledger(session_factory))
+    service.update_exposure_on_ticket_submit("u1", 1, 40.0, LEGS)
+    service.update_exposure_on_ticket_submit("u1", 2, 60.0, LEGS[1:])
+    opened = session_factory.opened()
+
+    assert service.get_current_exposure("u1") == 100.0
+    assert service.get_current_exposure("u1", player_id="soto") == 100.0
+    assert service.get_current_exposure("u1", prop_type="HR") == 140.0  # one delta per leg
+    assert service.get_current_exposure("u1", cluster_id=4) == 40.0
+    assert service.get_current_exposure("u2") == 0.0
+
+    decisions = service.is_exceeding_limits(
+        "u1", 1000.0, [{"player_id": "soto", "prop_type": "HR", "stake": 60.0}]
+    )
+    by_type = {decision.limit_type: decision for decision in decisions}
+    assert not by_type["player"].allowed  # (100 + 60) / 1000 > 0.15
+    assert by_type["prop_type"].allowed  # (140 + 60) / 1000 <= 0.25
+    assert by_type["daily"].current_exposure == 100.0
+    assert session_factory.opened() == opened
+
+
+def test_flush_upserts_snapshots_and_rebuild_restores(session_factory):
+    ledger = _ledger(session_factory)
+    service = ExposureTrackerService(ledger=ledger)
+    service.update_exposure_on_ticket_submit("u1", 1, 25.0, LEGS[:1])
+    assert ledger.flush() == 4
+    service.update_exposure_on_ticket_submit("u1", 2, 10.0, LEGS[:1])
+    assert ledger.flush() == 4
+    assert ledger.flush() == 0
+
+    assert _snapshots(session_factory) == {
+        (None, None, None): (35.0, 2),
+        ("judge", None, None): (35.0, 2),
+        (None, "HR", None): (35.0, 2),
+        (None, None, 4): (35.0, 2),
+    }
+
+    restored = ExposureTrackerService(ledger=_ledger(session_factory))
+    assert restored.get_current_exposure("u1") == 35.0
+    assert restored.get_current_exposure("u1", cluster_id=4) == 35.0
+
+
+def test_write_behind_flushes_full_batches(session_factory):
+    service = ExposureTrackerService(ledger=_ledger(session_factory, flush_batch_size=3))
+    service.update_exposure_on_ticket_submit("u1", 1, 5.0, LEGS[1:])
+
+    for _ in range(100):
+        if _snapshots(session_factory):
+            break
+        time.sleep(0.02)
+    assert _snapshots(session_factory)[(None, None, None)] == (5.0, 1)
+
+
+def test_integer_user_ids_survive_flush_and_rebuild(session_factory):
+    ledger = _ledger(session_factory)
+    service = ExposureTrackerService(ledger=ledger)
+    service.update_exposure_on_ticket_submit(7, 1, 20.0, [{"player_id": 99, "correlation_cluster_id": "4"}])
+    service.update_exposure_on_ticket_submit(None, 2, 50.0, LEGS)  # no user: not tracked
+    assert ledger.flush() == 3
+
+    restored = ExposureTrackerService(ledger=_ledger(session_factory))
+    for user_id in (7, "7"):
+        assert restored.get_current_exposure(user_id) == 20.0
+        assert restored.get_current_exposure(user_id, player_id="99") == 20.0
+        assert restored.get_current_exposure(user_id, cluster_id=4) == 20.0
+    assert restored.get_current_exposure(None) == 0.0
+
+
+def test_rejected_key_is_quarantined_without_blocking_batch(session_factory):
+    ledger = _ledger(session_factory)
+    service = ExposureTrackerService(ledger=ledger)
+    session = session_factory()
+    session.execute(text(
+        "CREATE TRIGGER reject_u2 BEFORE INSERT ON exposure_snapshots WHEN NEW.user_id = 'u2' "
+        "BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+    ))
+    session.commit()
+    session.close()
+
+    poisoned = ("u2", date.today(), DAILY, None)
+    ledger.apply([(poisoned, 5.0, 1)])
+    service.update_exposure_on_ticket_submit("u1", 1, 10.0, LEGS[1:])
+
+    assert ledger.flush() == 3
+    assert _snapshots(session_factory) == {
+        (None, None, None): (10.0, 1),
+        ("soto", None, None): (10.0, 1),
+        (None, "HR", None): (10.0, 1),
+    }
+    assert ledger.get(poisoned) == 5.0  # still served from memory
+
+    service.update_exposure_on_ticket_submit("u1", 2, 10.0, LEGS[1:])
+    assert ledger.flush() == 3  # the quarantined key is not retried
+    assert _snapshots(session_factory)[("soto", None, None)] == (20.0, 2)
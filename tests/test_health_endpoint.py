@@ -187,6 +187,110 @@ async def test_health_collector_basic_functionality():
     assert cache_stats.evictions >= 0
 
 
+def _stub_probes(collector, statuses):
+    """Replace the collector's probe checks with counting stubs."""
+    from backend.services.health.health_models import ServiceStatus
+
+    calls = {name: 0 for name in statuses}
+
+    def make_check(name, status):
+        async def check():
+            calls[name] += 1
+            return ServiceStatus(name=name, status=status, latency_ms=1.0)
+        return check
+
+    for name, status in statuses.items():
+        collector._probes[name].check = make_check(name, status)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_health_collector_serves_snapshot():
+    """Concurrent health requests share one probe round, then hit the snapshot."""
+    from backend.services.health.health_collector import HealthCollector
+
+    collector = HealthCollector(auto_start=False)
+    calls = _stub_probes(collector, {
+        "database": "ok", "redis": "degraded", "model_registry": "ok", "websocket_manager": "ok",
+    })
+
+    results = await asyncio.gather(*(collector.collect_health() for _ in range(10)))
+    assert calls == {"database": 1, "redis": 1, "model_registry": 1, "websocket_manager": 1}
+    assert [s.name for s in results[0].services] == ["database", "redis", "model_registry", "websocket_manager"]
+
+    health = await collector.collect_health()
+    assert calls["database"] == 1  # served from the snapshot
+    assert health.snapshot_age_sec is not None and health.snapshot_age_sec >= 0
+    probes = {p.name: p for p in health.probes}
+    assert probes["database"].stale is False
+    assert len(probes["database"].latency_history_ms) == 1
+    assert probes["redis"].consecutive_failures == 1
+    assert probes["redis"].interval_sec > probes["database"].interval_sec
+
+    raw = await collector.collect_health_raw()
+    assert raw["probes"][0]["name"] == "database"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_age_tracks_oldest_probe_and_stop_awaits_probes():
+    """A fresh probe does not reset the snapshot age; stop() waits for in-flight probes."""
+    from backend.services.health.health_collector import HealthCollector
+
+    collector = HealthCollector(auto_start=False)
+    calls = _stub_probes(collector, {
+        "database": "ok", "redis": "ok", "model_registry": "ok", "websocket_manager": "ok",
+    })
+    await collector.refresh()
+    for probe in collector._probes.values():
+        probe.succeeded_mono -= 30.0
+    await collector._run_probes([collector._probes["database"]])
+    assert collector._serve_snapshot().snapshot_age_sec >= 30.0
+
+    # Without a prober, the stale results are refreshed inline
+    health = await collector.collect_health()
+    assert calls["redis"] == 2
+    assert health.snapshot_age_sec < 30.0
+
+    started = asyncio.Event()
+    cancelled = []
+
+    async def hanging_check():
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    collector._probes["redis"].check = hanging_check
+    task = collector._start_probe(collector._probes["redis"])
+    await started.wait()
+    await collector.stop()
+    assert task.done() and cancelled == [True]
+    assert collector._probe_tasks == {}
+
+def test_probe_backoff_while_unhealthy():
+    """Unhealthy probes back off exponentially up to the cap, then reset on recovery."""
+    from backend.services.health.health_collector import ProbeState
+    from backend.services.health.health_models import ServiceStatus
+
+    probe = ProbeState(name="redis", check=None, interval_sec=10.0)
+    down = ServiceStatus(name="redis", status="down")
+    intervals = []
+    for _ in range(6):
+        probe.record(down, 5.0, max_backoff_sec=120.0)
+        intervals.append(probe.current_interval_sec)
+
+    assert 18.0 <= intervals[0] <= 22.0  # 2x with jitter
+    assert intervals[-1] <= 132.0
+    assert probe.consecutive_failures == 6
+
+    probe.record(ServiceStatus(name="redis", status="ok"), 1.0, max_backoff_sec=120.0)
+    assert probe.current_interval_sec == 10.0
+    assert probe.consecutive_failures == 0
+    assert list(probe.latency_history_ms)[-1] == 1.0
+
+
 @pytest.fixture
 def mock_app():
     """Create a test FastAPI app with the diagnostics router."""
@@ -214,6 +214,61 @@ class TestDriftMonitor:
         assert calibration.buckets["lt_0_75"] == 1  # hash1: 0.6
         assert calibration.buckets["gte_0_75"] == 1  # hash3: 0.8
 
+    def test_windows_track_eviction_incrementally(self):
+        """Test rolling window aggregates match a recomputation after eviction."""
+        monitor = DriftMonitor(maxlen=120, large_diff_thresh=0.15)
+        primaries = [0.3 + (i % 17) * 0.03 for i in range(400)]
+        diffs = [(i % 11) * 0.025 for i in range(400)]
+        for primary, diff in zip(primaries, diffs):
+            monitor.record_inference(primary, primary + diff, 50.0, 55.0)
+
+        metrics = monitor.get_drift_metrics()
+        for name, size in [("w50", 50), ("w200", 120), ("wall", 120)]:
+            window = metrics.windows[name]
+            expected_diffs = diffs[-size:]
+            expected_primary = primaries[-size:]
+            mean_primary = sum(expected_primary) / size
+            expected_std = (sum((p - mean_primary) ** 2 for p in expected_primary) / size) ** 0.5
+
+            assert window.sample_count == size
+            assert window.mean_abs_diff == pytest.approx(sum(expected_diffs) / size)
+            assert window.pct_large_diff == pytest.approx(
+                sum(1 for d in expected_diffs if d >= 0.15) / size
+            )
+            assert window.std_dev_primary == pytest.approx(expected_std)
+
+    def test_distribution_shift_from_histograms(self):
+        """Test PSI/KS are zero for matching distributions and grow with shift."""
+        assert self.drift_monitor.get_drift_metrics().distribution is None
+
+        for i in range(100):
+            self.drift_monitor.record_inference(i / 100, i / 100, 50.0, 50.0)
+        matching = self.drift_monitor.get_drift_metrics().distribution
+        assert matching.sample_count == 100
+        assert matching.psi == pytest.approx(0.0)
+        assert matching.ks_statistic == pytest.approx(0.0)
+
+        shifted_monitor = DriftMonitor(maxlen=100)
+        for i in range(100):
+            shifted_monitor.record_inference(i / 200, 0.5 + i / 200, 50.0, 50.0)
+        shifted = shifted_monitor.get_drift_metrics().distribution
+        assert shifted.ks_statistic == pytest.approx(1.0)
+        assert shifted.psi > 1.0
+
+    def test_calibration_updated_on_outcome(self):
+        """Test outcomes for recorded predictions update calibration buckets."""
+        for feature_hash, prediction in [("h1", 0.55), ("h2", 0.35), ("h3", 0.75)]:
+            self.drift_monitor.record_inference(prediction, None, 50.0, None, feature_hash=feature_hash)
+
+        self.drift_monitor.record_outcome("h1", 0.6)
+        self.drift_monitor.record_outcome("h2", 0.3)
+        self.drift_monitor.record_outcome("unknown", 0.9)  # No prediction to match
+
+        calibration = self.drift_monitor.get_calibration_metrics()
+        assert calibration.count == 2
+        assert calibration.mae == pytest.approx(0.05)
+        assert calibration.buckets == {"lt_0_25": 0, "lt_0_5": 1, "lt_0_75": 1, "gte_0_75": 0}
+
     def test_alert_status_tracking(self):
         """Test alert status tracking and earliest detection timestamp."""
         # Start with normal predictions
@@ -411,6 +411,90 @@ class TestInferenceService:
             assert recorded_result.model_version == "test_model_v1"
             assert recorded_result.status == "success"
 
+    @pytest.mark.asyncio
+    async def test_batch_inference_matches_single_row(self, mock_registry, mock_audit):
+        """Test that batch inference returns the single-row result for every row."""
+        with patch('backend.services.inference_service.get_model_registry', return_value=mock_registry), \
+             patch('backend.services.inference_service.get_inference_audit', return_value=mock_audit):
+            
+            service = InferenceService()
+            rows = [{"feature1": 1.0, "feature2": 2.0}, {"feature1": 7.5}, {"feature1": 1.0, "feature2": 2.0}]
+            
+            results = await service.run_inference_batch("test_model_v1", rows)
+            
+            assert len(results) == 3
+            for row, result in zip(rows, results):
+                prediction, confidence = service._run_model_inference({}, row)
+                assert result.prediction == pytest.approx(prediction)
+                assert result.confidence == pytest.approx(confidence)
+                assert result.feature_hash == service._compute_feature_hash(row)
+            # Identical rows share a hash but keep distinct request ids
+            assert results[0].feature_hash == results[2].feature_hash
+            assert results[0].request_id != results[2].request_id
+            assert mock_audit.record_inference.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_submit_inference_coalesces_requests(self, mock_registry, mock_audit):
+        """Test that concurrent submissions are served as one batch."""
+        with patch('backend.services.inference_service.get_model_registry', return_value=mock_registry), \
+             patch('backend.services.inference_service.get_inference_audit', return_value=mock_audit):
+            
+            service = InferenceService()
+            service.batch_max_wait_ms = 5
+            
+            results = await asyncio.gather(
+                *[service.submit_inference("test_model_v1", {"feature1": float(i)}) for i in range(10)]
+            )
+            
+            assert [r.status for r in results] == ["success"] * 10
+            stats = service.get_batching_stats()
+            assert stats["batch_size"]["count"] == 1
+            assert stats["batch_size"]["sum"] == 10
+            assert stats["queue_wait_ms"]["count"] == 10
+
+    @pytest.mark.asyncio
+    async def test_flush_tasks_are_tracked_and_failures_logged(self, mock_registry, mock_audit, caplog):
+        """Test that flush tasks are kept until done and their failures are logged."""
+        with patch('backend.services.inference_service.get_model_registry', return_value=mock_registry), \
+             patch('backend.services.inference_service.get_inference_audit', return_value=mock_audit):
+            
+            service = InferenceService()
+            service.batch_max_size = 2
+            await asyncio.gather(*[service.submit_inference("test_model_v1", {"f": float(i)}) for i in range(2)])
+            await asyncio.sleep(0)
+            assert service._flush_tasks == set()
+            
+            async def broken(model_version, batch):
+                raise RuntimeError("flush exploded")
+            
+            service._process_pending_batch = broken
+            pending = asyncio.ensure_future(service.submit_inference("test_model_v1", {"f": 1.0}))
+            await asyncio.sleep(0)
+            service._flush_pending("test_model_v1")
+            assert len(service._flush_tasks) == 1
+            await asyncio.sleep(0.01)
+            assert service._flush_tasks == set()
+            assert "Micro-batch flush task failed" in caplog.text
+            pending.cancel()
+
+    @pytest.mark.asyncio
+    async def test_batch_inference_runs_shadow_on_same_batch(self, mock_audit):
+        """Test that shadow predictions are attached to every row of a batch."""
+        mock_registry = MagicMock()
+        mock_registry.get_shadow_model_version.return_value = "shadow_v2"
+        mock_registry.is_shadow_mode_enabled.return_value = True
+        mock_registry.load_model.side_effect = lambda v: {"version": v, "model_type": "test"}
+        
+        with patch('backend.services.inference_service.get_model_registry', return_value=mock_registry), \
+             patch('backend.services.inference_service.get_inference_audit', return_value=mock_audit):
+            
+            service = InferenceService()
+            results = await service.run_inference_batch("active_v1", [{"f": 1.0}, {"f": 2.0}])
+            
+            for result in results:
+                assert result.shadow_version == "shadow_v2"
+                assert result.shadow_diff == abs(result.prediction - result.shadow_prediction)
+
 
 class TestFeatureHashDeterminism:
     """Dedicated tests for feature hash determinism requirements."""
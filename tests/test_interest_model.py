@@ -0,0 +1,108 @@
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.models.risk_personalization import InterestSignalType
+from backend.services.personalization.interest_model import (
+    InterestModelService,
+    UserInterestProfile,
+    encode_edge_pool,
+)
+
+PLAYERS = ["lebron_james", "stephen_curry", "giannis_antetokounmpo", "nikola_jokic", None]
+PROP_TYPES = ["POINTS", "ASSISTS", "REBOUNDS", None]
+
+
+def _pool(size=60):
+    return [
+        {
+            "id": i,
+            "ev": round((i * 7 % 13) * 0.05, 2),
+            "player_id": PLAYERS[i % len(PLAYERS)],
+            "prop_type": PROP_TYPES[i % len(PROP_TYPES)],
+        }
+        for i in range(size)
+    ]
+
+
+def _reference_ranking(service, user_id, pool, limit):
+    """The previous per-edge scoring loop, fed the same profile"""
+    profile = service.get_interest_profile(user_id)
+    scored = []
+    for edge in pool:
+        prop_interest = profile["prop_type_scores"].get(edge["prop_type"], 0)
+        player_interest = profile["player_scores"].get(edge["player_id"], 0)
+        final = edge["ev"] + prop_interest * 0.1 + player_interest * 0.15
+        scored.append((final, edge["id"]))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return scored[:limit]
+
+
+@pytest.mark.parametrize("limit", [0, 1, 7, 20, 100])
+def test_vectorized_ranking_matches_reference(limit):
+    service = InterestModelService()
+    service.record_signal("u1", InterestSignalType.TICKET_ADD, 3.0, "nikola_jokic", "REBOUNDS")
+    pool = _pool()
+
+    ranked = service.recommend_edges("u1", pool, limit=limit)
+    expected = _reference_ranking(service, "u1", pool, limit)
+
+    assert [edge["id"] for edge in ranked] == [edge_id for _, edge_id in expected]
+    for edge, (final, _) in zip(ranked, expected):
+        assert edge["final_score"] == pytest.approx(final)
+        assert edge["final_score"] == pytest.approx(edge["base_score"] + edge["interest_boost"])
+
+
+def test_ties_keep_pool_order():
+    service = InterestModelService()
+    pool = [{"id": i, "ev": 1.0 if i % 3 else 2.0} for i in range(12)]
+    ranked = service.recommend_edges("nobody", pool, limit=6)
+    assert [edge["id"] for edge in ranked] == [0, 3, 6, 9, 1, 2]
+
+
+def test_signals_update_profile_incrementally():
+    service = InterestModelService()
+    before = service.get_interest_profile("u2")
+    service.record_signal("u2", InterestSignalType.EDGE_VIEW, 2.0, "nikola_jokic", "POINTS")
+    after = service.get_interest_profile("u2")
+
+    assert after["total_signals"] == before["total_signals"] + 1
+    assert after["player_scores"]["nikola_jokic"] == pytest.approx(2.0, rel=1e-6)
+    assert after["prop_type_scores"]["POINTS"] == pytest.approx(
+        before["prop_type_scores"]["POINTS"] + 2.0, rel=1e-6
+    )
+
+
+def test_profile_decay_and_renormalization():
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    profile = UserInterestProfile(decay_rate=0.1, reference_time=start)
+    profile.add(1.0, "POINTS", None, start)
+    profile.add(1.0, "POINTS", None, start + timedelta(days=10))
+
+    later = start + timedelta(days=12)
+    expected = math.exp(-1.2) + math.exp(-0.2)
+    assert profile.prop_type_scores["POINTS"] * profile.scale(later) == pytest.approx(expected)
+
+    # Far enough ahead to force a rebase; decayed values are unchanged
+    far = start + timedelta(days=400)
+    profile.add(1.0, "ASSISTS", None, far)
+    assert profile.reference_time == far
+    assert profile.prop_type_scores["POINTS"] * profile.scale(far) == pytest.approx(
+        math.exp(-40.0) + math.exp(-39.0)
+    )
+    assert profile.prop_type_scores["ASSISTS"] == pytest.approx(1.0)
+
+
+def test_shared_pool_encoding_across_users():
+    service = InterestModelService()
+    service.record_signal("a", InterestSignalType.TICKET_ADD, 5.0, "nikola_jokic")
+    pool = _pool()
+    encoding = encode_edge_pool(pool)
+
+    by_user = service.recommend_edges_for_users(["a", "b"], pool, limit=5)
+    for user_id, edges_pool in [("a", encoding), ("b", pool)]:
+        ranked = service.recommend_edges(user_id, edges_pool, limit=5)
+        assert [edge["id"] for edge in by_user[user_id]] == [edge["id"] for edge in ranked]
+    assert by_user["a"][0]["player_id"] == "nikola_jokic"
+    assert by_user["b"][0]["player_id"] != "nikola_jokic"
@@ -0,0 +1,127 @@
+import asyncio
+import time
+
+import backend.services.lazy_sport_manager as lsm
+from backend.services.lazy_sport_manager import LazySportManager, SportStatus
+
+MB = 1024 * 1024
+
+
+class FakeService:
+    def __init__(self, sport):
+        self.sport = sport
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _manager(monkeypatch, footprints, **kwargs):
+    """Manager whose initializers grow a fake RSS by ``footprints[sport]``"""
+    rss = {"value": 100 * MB}
+    calls = {sport: 0 for sport in footprints}
+    monkeypatch.setattr(lsm, "_current_rss", lambda: rss["value"])
+
+    def initializer(sport):
+        async def init():
+            calls[sport] += 1
+            await asyncio.sleep(0.01)
+            rss["value"] += footprints[sport]
+            return FakeService(sport)
+
+        return init
+
+    manager = LazySportManager(**kwargs)
+    manager.sport_initializers = {sport: initializer(sport) for sport in footprints}
+    return manager, calls
+
+
+async def test_concurrent_activations_share_one_load(monkeypatch):
+    manager, calls = _manager(monkeypatch, {"MLB": 50 * MB, "NBA": 10 * MB})
+    results = await asyncio.gather(*(manager.activate_sport("mlb") for _ in range(5)))
+
+    assert calls["MLB"] == 1
+    assert [r["status"] for r in results] == ["ready"] * 5
+    assert sum(1 for r in results if r.get("newly_loaded")) == 1
+    assert sum(1 for r in results if r.get("waited")) == 4
+    status = manager.get_sport_status("MLB")
+    assert status["rss_bytes"] == 50 * MB
+    assert status["init_seconds"] > 0
+    assert manager.active_sport == "MLB"
+
+
+async def test_memory_budget_evicts_cheapest_service(monkeypatch):
+    manager, _ = _manager(
+        monkeypatch,
+        {"MLB": 60 * MB, "NBA": 30 * MB, "NFL": 30 * MB},
+        memory_budget_mb=100,
+    )
+    await manager.activate_sport("MLB")
+    await manager.activate_sport("NBA")
+    # NBA is requested again, so MLB (used once, largest) is the one to go
+    await manager.activate_sport("NBA")
+    await manager.activate_sport("NFL")
+
+    assert manager.services["MLB"].status == SportStatus.NOT_LOADED
+    assert manager.services["MLB"].evictions == 1
+    assert manager.services["NBA"].status == SportStatus.READY
+    assert manager.services["NFL"].status == SportStatus.READY
+    assert manager.loaded_bytes <= manager.memory_budget_bytes
+
+
+async def test_game_window_prewarms_and_pins(monkeypatch):
+    manager, calls = _manager(
+        monkeypatch,
+        {"MLB": 60 * MB, "NBA": 60 * MB},
+        memory_budget_mb=100,
+        prewarm_lead_sec=0.05,
+    )
+    manager.schedule_game_window("MLB", time.time() + 0.1, time.time() + 60)
+    await manager.start_cleanup_service()
+    try:
+        for _ in range(50):
+            if manager.services["MLB"].status == SportStatus.READY:
+                break
+            await asyncio.sleep(0.02)
+        assert manager.services["MLB"].status == SportStatus.READY
+        assert manager.active_sport is None  # prewarm does not switch tabs
+
+        # MLB is pinned by its game window, so NBA cannot evict it
+        await manager.activate_sport("NBA")
+        assert manager.services["MLB"].status == SportStatus.READY
+        assert manager.get_sport_status("MLB")["in_game_window"] is True
+    finally:
+        await manager.stop_cleanup_service()
+    assert calls["MLB"] == 1
+
+
+async def test_pending_prewarm_does_not_spin_cleanup_loop(monkeypatch):
+    manager, calls = _manager(monkeypatch, {"MLB": 10 * MB}, prewarm_lead_sec=60)
+    # Hold the sport's init lock so the prewarm waits while still NOT_LOADED
+    lock = manager.initialization_locks["MLB"]
+    await lock.acquire()
+    sweeps = []
+    cleanup = manager._cleanup_inactive_services
+
+    async def counting_cleanup():
+        sweeps.append(time.time())
+        await cleanup()
+
+    monkeypatch.setattr(manager, "_cleanup_inactive_services", counting_cleanup)
+    manager.schedule_game_window("MLB", time.time() + 1, time.time() + 60)
+    await manager.start_cleanup_service()
+    try:
+        await asyncio.sleep(0.3)
+        # One sweep started the prewarm; the loop then waits for it
+        assert len(sweeps) == 1
+        assert manager.services["MLB"].status == SportStatus.NOT_LOADED
+        lock.release()
+        for _ in range(50):
+            if manager.services["MLB"].status == SportStatus.READY:
+                break
+            await asyncio.sleep(0.02)
+        assert manager.services["MLB"].status == SportStatus.READY
+        assert len(sweeps) == 2  # woken by the finished prewarm
+    finally:
+        await manager.stop_cleanup_service()
+    assert calls["MLB"] == 1
@@ -0,0 +1,147 @@
+import sqlite3
+import time
+
+import pytest
+
+from backend.services.offline_event_queue import (
+    EventPriority,
+    EventStatus,
+    OfflineEventQueue,
+    QueuedEvent,
+    RetryPolicy,
+    SQLiteEventStore,
+)
+
+
+class FlakyConnection:
+    """Wraps a sqlite3 connection and fails the next matching statement"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.fail_begin = 0
+        self.fail_executemany = 0
+
+    def execute(self, sql, *args):
+        if sql == "BEGIN" and self.fail_begin:
+            self.fail_begin -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return self._conn.execute(sql, *args)
+
+    def executemany(self, sql, rows):
+        if self.fail_executemany:
+            self.fail_executemany -= 1
+            raise sqlite3.OperationalError("disk I/O error")
+        return self._conn.executemany(sql, rows)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+@pytest.fixture(autouse=True)
+def no_processor(monkeypatch):
+    # Keep events in the queue; these tests drive dequeueing directly
+    monkeypatch.setattr(OfflineEventQueue, "_start_processing", lambda self: None)
+
+
+def _queue(path, **kwargs):
+    return OfflineEventQueue(
+        retry_policy=RetryPolicy(base_delay=60.0, jitter=False),
+        enable_persistence=True,
+        persistence_path=str(path),
+        **kwargs,
+    )
+
+
+def test_recovers_unacknowledged_events_after_restart(tmp_path):
+    path = tmp_path / "events.db"
+    queue = _queue(path)
+    done_id = queue.queue_event("api_call", {"n": 1})
+    retry_id = queue.queue_event("api_call", {"n": 2}, EventPriority.HIGH)
+    pending_id = queue.queue_event("api_call", {"n": 3})
+
+    retry = queue._get_next_event()
+    done = queue._get_next_event()
+    assert (retry.id, done.id) == (retry_id, done_id)
+    queue._schedule_retry(retry, "timeout")
+    done.status = EventStatus.COMPLETED
+    queue._ack(done)
+    queue.store.close()
+
+    restarted = _queue(path)
+    assert [event.id for event in restarted.queues[EventPriority.NORMAL]] == [pending_id]
+    assert [entry[2].id for entry in restarted.retry_heap] == [retry_id]
+    recovered = restarted.retry_heap[0][2]
+    assert recovered.status == EventStatus.RETRYING
+    assert recovered.retry_count == 1
+    assert recovered.next_retry_at == pytest.approx(retry.next_retry_at)
+    assert restarted.get_queue_stats()["queue_size"] == 2
+    restarted.store.close()
+
+
+def test_retry_heap_releases_due_events_in_order():
+    queue = OfflineEventQueue()
+    now = time.time()
+    schedule = [
+        ("normal_late", EventPriority.NORMAL, now - 1),
+        ("future", EventPriority.CRITICAL, now + 60),
+        ("normal_early", EventPriority.NORMAL, now - 3),
+        ("critical", EventPriority.CRITICAL, now - 2),
+    ]
+    for event_id, priority, due in schedule:
+        event = QueuedEvent(event_id, "api_call", {}, priority, EventStatus.RETRYING, next_retry_at=due)
+        queue._push_retry(event)
+    ready_id = queue.queue_event("api_call", {}, EventPriority.NORMAL)
+
+    order = []
+    while (event := queue._get_next_event()) is not None:
+        order.append(event.id)
+
+    # Due retries rejoin their priority deque by due time, behind ready events
+    assert order[0] == "critical"
+    assert order[1:] == [ready_id, "normal_early", "normal_late"]
+    assert [entry[2].id for entry in queue.retry_heap] == ["future"]
+    assert queue.get_queue_stats()["queue_sizes_by_priority"]["critical"] == 1
+
+
+def test_compact_drops_acknowledged_rows(tmp_path):
+    store = SQLiteEventStore(str(tmp_path / "events.db"), compact_after_acks=0)
+    events = [QueuedEvent(f"e{i}", "api_call", {"n": i}) for i in range(4)]
+    for event in events:
+        store.append(event)
+    store.ack("e0")
+    store.ack("e1", "failed")
+    store.ack("e2", "evicted")
+
+    assert [event.id for event in store.load()] == ["e3"]
+    assert store.compact() == 3
+    assert store._conn.execute("SELECT id FROM offline_events").fetchall() == [("e3",)]
+    assert store.stats["compactions"] == 1
+    store.close()
+
+
+def test_failed_group_commit_is_retried(tmp_path):
+    store = SQLiteEventStore(str(tmp_path / "events.db"), group_commit_size=1)
+    store._conn = FlakyConnection(store._conn)
+
+    store._conn.fail_executemany = 1
+    store.append(QueuedEvent("buffered", "api_call", {}))
+    assert not store._conn.in_transaction
+    assert store.stats["commits"] == 0
+
+    store._conn.fail_begin = 1
+    store.append(QueuedEvent("locked", "api_call", {}))  # must not raise
+
+    assert {event.id for event in store.load()} == {"buffered", "locked"}
+    assert store.stats["commits"] == 1
+    store.close()
+
+
+def test_queue_event_survives_locked_store(tmp_path):
+    queue = _queue(tmp_path / "events.db")
+    queue.store.group_commit_size = 1
+    queue.store._conn = FlakyConnection(queue.store._conn)
+    queue.store._conn.fail_begin = 1
+
+    event_id = queue.queue_event("api_call", {"n": 1})
+    assert [event.id for event in queue.store.load()] == [event_id]
+    queue.store.close()
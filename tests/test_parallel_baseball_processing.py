@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from backend.services.parallel_baseball_processing_service import (
+    BatchProcessingConfig,
+    ParallelBaseballProcessingService,
+    SequentialToParallelTransformer,
+)
+
+
+def _row_norms(chunk):
+    return np.sqrt((chunk**2).sum(axis=1))
+
+
+async def test_stats_processing_filters_and_defaults():
+    service = ParallelBaseballProcessingService()
+    batting = pd.DataFrame(
+        {"IDfg": [1, 2, 3], "Name": ["A", "B", "C"], "Team": ["NYY"] * 3,
+         "PA": [400, 50, 51], "HR": [30, 1, 2]}
+    )
+    pitching = pd.DataFrame({"IDfg": [9, 10], "Name": ["P", "Q"], "IP": [20.0, 120.5]})
+
+    batters, pitchers = await service.transform_sequential_stats_processing(batting, pitching)
+
+    assert [b["id"] for b in batters] == [1, 3]
+    assert batters[0]["stats"]["HR"] == 30
+    assert batters[0]["stats"]["AVG"] == 0.250  # column absent -> default
+    assert pitchers == [
+        {
+            "id": 10, "name": "Q", "team": "", "position_type": "pitcher",
+            "active": True, "league": "MLB",
+            "stats": {"IP": 120.5, "ERA": 4.50, "WHIP": 1.30, "K/9": 8.0, "BB/9": 3.0,
+                      "HR/9": 1.2, "W": 0, "L": 0, "SV": 0, "HLD": 0, "FIP": 4.20},
+        }
+    ]
+    assert service.get_performance_metrics()["processing_stats"]["processed_items"] == 5
+
+
+async def test_statcast_groups_from_single_aggregation():
+    data = pd.DataFrame(
+        {
+            "batter": [1, 1, 1, 2, 3, 3],
+            "launch_speed": [100.0, 90.0, np.nan, 99.0, np.nan, np.nan],
+            "launch_angle": [20.0, 40.0, np.nan, 15.0, 10.0, np.nan],
+        }
+    )
+    transformer = SequentialToParallelTransformer()
+    results = await transformer.transform_statcast_groupby_processing(data, "batter", min_group_size=2)
+
+    assert results[0] == {
+        "player_id": 1, "plate_appearances": 3, "avg_exit_velocity": 95.0,
+        "max_exit_velocity": 100.0, "hard_hit_rate": 0.5, "avg_launch_angle": 30.0,
+        "sweet_spot_rate": 0.5,
+    }
+    # No tracked exit velocities: those keys are omitted, as before
+    assert results[1] == {
+        "player_id": 3, "plate_appearances": 2, "avg_launch_angle": 10.0, "sweet_spot_rate": 1.0,
+    }
+
+
+async def test_cpu_bound_function_runs_over_shared_memory():
+    service = ParallelBaseballProcessingService(
+        BatchProcessingConfig(process_workers=2, process_min_rows=10)
+    )
+    frame = pd.DataFrame({"x": np.arange(100.0), "y": np.arange(100.0), "name": ["p"] * 100})
+    try:
+        norms = await service.process_frame_cpu_bound(frame, _row_norms)
+    finally:
+        await service.shutdown()
+
+    assert len(norms) == 100
+    np.testing.assert_allclose(norms.to_numpy(), np.arange(100.0) * np.sqrt(2))
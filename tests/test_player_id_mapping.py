@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+import backend.services.player_id_mapping_service as mapping_module
+from backend.services.player_id_mapping_service import (
+    PlayerIDMappingService,
+    PlayerRegisterIndex,
+)
+
+REGISTER = pd.DataFrame(
+    {
+        "name_last": ["Trout", "Martinez", "Griffey", "Griffey", "Acuña"],
+        "name_first": ["Mike", "J. D.", "Ken", "Ken", "Ronald"],
+        "key_mlbam": [545361, 502110, 115135, 113011, 660670],
+        "mlb_played_first": [2011, 2011, 1989, 1973, 2018],
+        "mlb_played_last": [2024, 2024, 2010, 1990, 2024],
+    }
+)
+
+
+def test_register_index_bulk_resolution():
+    index = PlayerRegisterIndex(REGISTER, aliases={"Big Papi": 120074})
+    names = pd.Series(
+        ["Trout, Mike", "J.D. Martinez", "Ken Griffey Jr.", "Ronald Acuna",
+         "Mkie Trout", "Nobody Here", None, "Big Papi"],
+        index=list("abcdefgh"),
+    )
+    resolved = index.resolve(names)
+    assert list(resolved.index) == list("abcdefgh")
+    assert resolved.tolist()[:6] == [545361, 502110, 115135, 660670, 545361, pd.NA]
+    assert resolved["g"] is pd.NA
+    assert resolved["h"] == 120074
+    # Fuzzy matching can be turned off
+    assert index.resolve(pd.Series(["Mkie Trout"]), fuzzy=False).isna().all()
+
+
+def test_service_persists_register_and_expires_misses(tmp_path, monkeypatch):
+    monkeypatch.setattr(mapping_module.pyb, "chadwick_register", lambda: REGISTER)
+    service = PlayerIDMappingService(
+        register_path=tmp_path / "register.pkl", negative_cache_ttl_sec=0.0
+    )
+    assert service.get_player_id_from_name("Mike Trout") == 545361
+    assert (tmp_path / "register.pkl").exists()
+
+    assert service.get_player_id_from_name("Zed Nobody") is None
+    assert "Zed Nobody" in service.negative_cache
+    # TTL of zero: the miss is retried on the next call
+    service.get_player_id_from_name("Zed Nobody")
+    assert len(service.negative_cache) == 1
+
+    # A second instance loads the persisted register without downloading
+    def offline():
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(mapping_module.pyb, "chadwick_register", offline)
+    reloaded = PlayerIDMappingService(register_path=tmp_path / "register.pkl")
+    ids = reloaded.resolve_player_ids(pd.Series(["Ken Griffey Jr.", "Mike Trout"]))
+    assert ids.tolist() == [115135, 545361]
+
+
+def test_normalize_statcast_data_without_copies():
+    raw = pd.DataFrame(
+        {
+            "batter": [1, 2, np.nan, 4],
+            "pitcher": [10, np.nan, 30, 40],
+            "events": ["a", "b", "c", "d"],
+        }
+    )
+    service = PlayerIDMappingService()
+    normalized = service.normalize_statcast_data(raw)
+    assert normalized["player_id"].tolist() == [1, 2, 4, 10, 30, 40]
+    assert normalized["player_type"].tolist() == ["batter"] * 3 + ["pitcher"] * 3
+    assert normalized["events"].tolist() == ["a", "b", "d", "a", "c", "d"]
+    assert list(normalized.index) == list(range(6))
+    assert "player_id" not in raw.columns
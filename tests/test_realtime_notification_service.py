@@ -0,0 +1,159 @@
+import asyncio
+import itertools
+import json
+
+from backend.services.realtime_notification_service import (
+    NotificationMessage,
+    NotificationPriority,
+    NotificationType,
+    RealtimeNotificationService,
+    SubscriptionFilter,
+    TimerWheel,
+)
+
+
+class FakeWebSocket:
+    def __init__(self, gate=None, fail=False):
+        self.sent = []
+        self.closed = False
+        self.gate = gate
+        self.fail = fail
+
+    async def send_text(self, text):
+        if self.fail:
+            raise ConnectionError("socket closed")
+        if self.gate is not None:
+            await self.gate.wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self):
+        self.closed = True
+
+
+def _odds(sport, player, priority=NotificationPriority.MEDIUM, odds=1.9, tags=None):
+    return NotificationMessage(
+        id=f"{sport}_{player}_{odds}",
+        type=NotificationType.ODDS_CHANGE,
+        priority=priority,
+        title="Odds Changed",
+        message="",
+        data={"sport": sport, "event": "game", "player_name": player, "sportsbook": "dk", "new_odds": odds},
+        tags=tags if tags is not None else ["odds", sport],
+    )
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_index_routes_like_filter_scan():
+    service = RealtimeNotificationService()
+    filters = [
+        [],
+        [SubscriptionFilter({NotificationType.ODDS_CHANGE}, sports={"NBA"})],
+        [SubscriptionFilter({NotificationType.ODDS_CHANGE}, tags={"arbitrage", "MLB"})],
+        [SubscriptionFilter({NotificationType.ODDS_CHANGE}, min_priority=NotificationPriority.HIGH)],
+        [SubscriptionFilter({NotificationType.ODDS_CHANGE}, players={"Judge"}, sports={"MLB"}),
+         SubscriptionFilter({NotificationType.SYSTEM_ALERT})],
+        [SubscriptionFilter({NotificationType.LINE_MOVEMENT})],
+    ]
+    for connection_filters in filters:
+        await service.add_connection(FakeWebSocket(), "user", connection_filters)
+
+    notifications = [
+        _odds(sport, player, priority)
+        for sport, player, priority in itertools.product(
+            ["NBA", "MLB", None], ["Judge", "LeBron"], NotificationPriority
+        )
+    ]
+    for notification in notifications:
+        expected = {cid for cid, conn in service.connections.items() if conn.wants(notification)}
+        assert service.subscriptions.route(notification) == expected
+
+    # Filter changes through the service keep the index in sync
+    nba_id = list(service.connections)[1]
+    service.set_subscription_filters(nba_id, [SubscriptionFilter({NotificationType.LINE_MOVEMENT})])
+    assert nba_id not in service.subscriptions.route(_odds("NBA", "LeBron"))
+    await service.shutdown()
+
+
+async def test_payload_encoded_once_and_delivered():
+    service = RealtimeNotificationService()
+    sockets = [FakeWebSocket() for _ in range(3)]
+    for socket in sockets:
+        await service.add_connection(socket, None, [SubscriptionFilter({NotificationType.ODDS_CHANGE})])
+    service.processing_task = asyncio.create_task(service._process_notifications())
+
+    await service.send_notification(_odds("NBA", "LeBron"))
+    await _settle()
+
+    assert [socket.sent[-1]["id"] for socket in sockets] == ["NBA_LeBron_1.9"] * 3
+    assert service.stats["notifications_sent"] == 3
+    await service.shutdown()
+
+
+async def test_send_queue_coalesces_and_drops():
+    service = RealtimeNotificationService(send_queue_size=3)
+    gate = asyncio.Event()
+    socket = FakeWebSocket(gate=gate)
+    gate.set()  # let the welcome message through
+    connection_id = await service.add_connection(socket, "u1")
+    gate.clear()
+    connection = service.connections[connection_id]
+
+    # The sender takes the first update and blocks on the socket
+    await service.send_targeted_notification(_odds("NBA", "LeBron", odds=1.8), ["u1"])
+    await _settle()
+    for odds in (1.9, 2.0, 2.1):
+        await service.send_targeted_notification(_odds("NBA", "LeBron", odds=odds), ["u1"])
+    assert len(connection.send_queue) == 1
+    assert service.stats["coalesced_messages"] == 2
+
+    critical = _odds("NFL", "Mahomes", NotificationPriority.CRITICAL, tags=[])
+    critical.type = NotificationType.SYSTEM_ALERT
+    await service.send_targeted_notification(critical, ["u1"])
+    for player in ("A", "B"):
+        await service.send_targeted_notification(_odds("MLB", player), ["u1"])
+    # Full queue: the oldest non-critical message (the coalesced LeBron update) is dropped
+    assert service.stats["dropped_messages"] == 1
+
+    gate.set()
+    await _settle()
+    assert [message["id"] for message in socket.sent[1:]] == [
+        "NBA_LeBron_1.8", "NFL_Mahomes_1.9", "MLB_A_1.9", "MLB_B_1.9",
+    ]
+    await service.shutdown()
+
+
+def test_timer_wheel_only_returns_due_keys():
+    wheel = TimerWheel(tick_seconds=1.0, slot_count=4)
+    wheel.schedule("soon", 1)
+    wheel.schedule("later", 6)  # wraps the wheel once
+    wheel.schedule("cancelled", 2)
+    wheel.cancel("cancelled")
+
+    due = [wheel.advance() for _ in range(6)]
+    assert due == [["soon"], [], [], [], [], ["later"]]
+    assert len(wheel) == 0
+
+
+async def test_liveness_pings_and_expires_failed_connections():
+    service = RealtimeNotificationService(
+        ping_interval_seconds=0.02, stale_after_seconds=60, liveness_tick_seconds=0.01
+    )
+    healthy = FakeWebSocket()
+    broken = FakeWebSocket()
+    healthy_id = await service.add_connection(healthy)
+    broken_id = await service.add_connection(broken)
+    broken.fail = True
+
+    service.liveness_task = asyncio.create_task(service._run_liveness_wheel())
+    await asyncio.sleep(0.1)
+
+    assert broken_id not in service.connections
+    assert broken.closed
+    assert healthy_id in service.connections
+    assert any(message.get("type") == "ping" for message in healthy.sent)
+    assert broken_id not in service.subscriptions.route(_odds("NBA", "LeBron"))
+    await service.shutdown()
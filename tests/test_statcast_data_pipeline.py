@@ -0,0 +1,93 @@
+import pandas as pd
+import pytest
+
+import backend.services.statcast_data_pipeline as pipeline_module
+from backend.services.statcast_data_pipeline import StatcastConfig, StatcastDataPipeline
+
+# 2024-04-03 is an off day: no pitches
+GAME_DAYS = ["2024-04-01", "2024-04-02", "2024-04-04", "2024-04-05"]
+
+
+def _fake_statcast(calls):
+    def statcast(start_dt, end_dt):
+        calls.append((start_dt, end_dt))
+        days = [d for d in GAME_DAYS if start_dt <= d <= end_dt]
+        return pd.DataFrame(
+            {
+                "game_date": [d for d in days for _ in range(3)],
+                "batter": [1, 2, 3] * len(days),
+                "pitcher": [10, 10, 11] * len(days),
+                "launch_speed": [95.0, 88.0, None] * len(days),
+                "release_speed": [93.0, 94.0, 90.0] * len(days),
+            }
+        )
+
+    return statcast
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(pipeline_module.pyb, "statcast", _fake_statcast(calls))
+    return calls
+
+
+async def test_only_missing_days_are_fetched(tmp_path, calls):
+    config = StatcastConfig(feature_cache_dir=str(tmp_path))
+    pipeline = StatcastDataPipeline(config)
+
+    first = await pipeline.fetch_historical_statcast_data("2024-04-01", "2024-04-03", min_results=0)
+    assert calls == [("2024-04-01", "2024-04-03")]
+    # Two events per pitch after player ID normalization
+    assert len(first) == 2 * 3 * 2
+
+    extended = await pipeline.fetch_historical_statcast_data(
+        "2024-04-02", "2024-04-05", min_results=0
+    )
+    assert calls[1:] == [("2024-04-04", "2024-04-05")]
+    assert len(extended) == 2 * 3 * 3
+
+    # A fresh instance reads the partitions (and the off day) from disk
+    reloaded = StatcastDataPipeline(config)
+    await reloaded.fetch_historical_statcast_data("2024-04-01", "2024-04-05", min_results=0)
+    assert len(calls) == 2
+
+
+async def test_reads_project_requested_columns(tmp_path, calls):
+    pipeline = StatcastDataPipeline(StatcastConfig(feature_cache_dir=str(tmp_path)))
+    data = await pipeline.fetch_historical_statcast_data(
+        "2024-04-01", "2024-04-02", min_results=0, columns=["launch_speed"]
+    )
+    assert "release_speed" not in data.columns
+    assert {"launch_speed", "batter", "pitcher", "player_id"} <= set(data.columns)
+
+
+def test_batting_features_from_grouped_aggregation(tmp_path):
+    pipeline = StatcastDataPipeline(
+        StatcastConfig(feature_cache_dir=str(tmp_path), min_plate_appearances=2)
+    )
+    data = pd.DataFrame(
+        {
+            "batter": [7, 7, 7, 8],
+            "player_name": ["Seven", "Seven", "Seven", "Eight"],
+            "events": ["single", "field_out", None, "single"],
+            "type": ["X", "X", "S", "X"],
+            "description": ["hit_into_play", "hit_into_play", "swinging_strike", "hit_into_play"],
+            "launch_speed": [100.0, 90.0, None, 99.0],
+            "launch_angle": [20.0, 5.0, None, 15.0],
+            "launch_speed_angle": [6, 2, None, 6],
+            "plate_x": [0.0, 0.1, 1.5, 0.0],
+            "plate_z": [2.5, 2.0, 2.5, 2.5],
+        }
+    )
+    features = pipeline.create_batting_features(data)
+
+    assert features["player_id"].tolist() == [7]
+    row = features.iloc[0]
+    assert row["plate_appearances"] == 2
+    assert row["avg_exit_velocity"] == 95.0
+    assert row["hard_hit_rate"] == 0.5
+    assert row["sweet_spot_rate"] == 0.5
+    assert row["barrel_rate"] == 0.5
+    assert row["chase_rate"] == 1.0
+    assert row["swing_rate"] == pytest.approx(1 / 3)
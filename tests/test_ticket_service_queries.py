@@ -0,0 +1,171 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+import backend.services.risk.exposure_tracker as exposure_module
+import backend.services.ticketing.ticket_service as ticket_module
+from backend.models.base import Base
+from backend.models.correlation_ticketing import Ticket, TicketLeg
+from backend.models.modeling import Edge, EdgeStatus, Valuation
+from backend.models.risk_personalization import ExposureSnapshot
+from backend.services.ticketing.ticket_service import TicketService, TicketValidationError
+
+TABLES = [
+    Valuation.__table__, Edge.__table__, Ticket.__table__, TicketLeg.__table__, ExposureSnapshot.__table__,
+]
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    path = tmp_path / "tickets.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=TABLES)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(ticket_module, "SessionLocal", session_factory)
+    monkeypatch.setattr(ticket_module, "async_engine", create_async_engine(f"sqlite+aiosqlite:///{path}"))
+
+    # No prior exposure for the test users
+    monkeypatch.setattr(
+        exposure_module, "_exposure_ledger", exposure_module.ExposureLedger(session_factory=session_factory)
+    )
+
+    correlations = {}
+    monkeypatch.setattr(
+        ticket_module.correlation_engine, "build_correlation_matrix", lambda prop_ids: correlations
+    )
+
+    session = session_factory()
+    edge_ids = []
+    for prop_id in range(1, 5):
+        valuation = Valuation(
+            model_prediction_id=1, prop_id=prop_id, offered_line=20.5, fair_line=22.0,
+            prob_over=0.55, prob_under=0.45, expected_value=0.05, payout_schema={},
+            volatility_score=0.2, valuation_hash=f"hash-{prop_id}",
+        )
+        session.add(valuation)
+        session.flush()
+        edge = Edge(
+            valuation_id=valuation.id, prop_id=prop_id, model_version_id=1, edge_score=1.0,
+            ev=0.05, prob_over=0.55, offered_line=1.9, fair_line=1.8, status=EdgeStatus.ACTIVE,
+        )
+        session.add(edge)
+        session.flush()
+        edge_ids.append(edge.id)
+    session.commit()
+    session.close()
+    return engine, session_factory, edge_ids, correlations
+
+
+def _count_selects(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+def test_sync_paths_use_constant_queries_per_ticket(db):
+    engine, _, edge_ids, _ = db
+    service = TicketService()
+    selects = _count_selects(engine)
+
+    draft = service.create_draft_ticket(None, 10.0, edge_ids)
+    assert draft.legs_count == 4
+    assert [leg["edge_id"] for leg in draft.legs] == edge_ids
+    assert draft.legs[0]["valuation_hash"] == "hash-1"
+    # One joined edge/valuation load, regardless of leg count
+    assert len(selects) == 1
+
+    selects.clear()
+    submitted = service.submit_ticket(draft.ticket_id)
+    assert submitted.status == "SUBMITTED"
+    assert submitted.submitted_at is not None
+    # Ticket row plus one legs/edges/valuations join
+    assert len(selects) == 2
+
+
+def test_submit_rejects_changed_valuation(db):
+    _, session_factory, edge_ids, _ = db
+    service = TicketService()
+    draft = service.create_draft_ticket(None, 10.0, edge_ids[:2])
+
+    session = session_factory()
+    session.query(Valuation).filter(Valuation.prop_id == 2).update({"valuation_hash": "moved"})
+    session.commit()
+    session.close()
+
+    with pytest.raises(TicketValidationError) as exc:
+        service.submit_ticket(draft.ticket_id)
+    assert exc.value.error_code == "EDGE_STATE_CHANGED"
+
+
+def test_duplicate_edges_are_rejected(db):
+    _, _, edge_ids, _ = db
+
+    with pytest.raises(TicketValidationError) as exc:
+        TicketService().create_draft_ticket(None, 10.0, [edge_ids[0], edge_ids[1], edge_ids[0]])
+    assert exc.value.error_code == "EDGES_NOT_FOUND"
+    assert str(edge_ids[0]) in str(exc.value)
+
+def test_correlation_limit_uses_pairwise_lookup(db):
+    _, _, edge_ids, correlations = db
+    correlations.update({1: {2: 0.9, 3: -0.9}, 2: {1: 0.9, 3: 0.9}, 3: {1: -0.9, 2: 0.9}})
+
+    with pytest.raises(TicketValidationError) as exc:
+        TicketService().create_draft_ticket(None, 10.0, edge_ids[:3])
+    assert exc.value.error_code == "CORRELATION_TOO_HIGH"
+
+    # The fourth leg is uncorrelated: average |corr| is 0.9 * 3 / 6
+    draft = TicketService().create_draft_ticket(None, 10.0, edge_ids)
+    assert draft.legs_count == 4
+
+
+async def test_async_variants_round_trip(db):
+    _, _, edge_ids, _ = db
+    service = TicketService()
+
+    draft = await service.create_draft_ticket_async(7, 5.0, edge_ids[:3])
+    assert draft.user_id == 7
+    assert draft.created_at
+    assert [leg["prop_id"] for leg in draft.legs] == [1, 2, 3]
+
+    recalculated = await service.recalc_ticket_async(draft.ticket_id)
+    assert recalculated.estimated_ev == pytest.approx(draft.estimated_ev)
+
+    submitted = await service.submit_ticket_async(draft.ticket_id)
+    assert submitted.status == "SUBMITTED"
+
+    fetched = await service.get_ticket_async(draft.ticket_id)
+    assert fetched.status == "SUBMITTED"
+    assert len(fetched.legs) == 3
+
+    with pytest.raises(TicketValidationError) as exc:
+        await service.get_ticket_async(9999)
+    assert exc.value.error_code == "TICKET_NOT_FOUND"
+
+
+def test_submitted_exposure_is_flushed_under_string_user_id(db):
+    _, session_factory, edge_ids, _ = db
+    service = TicketService()
+    ledger = exposure_module._exposure_ledger
+
+    for user_id in (7, None):
+        draft = service.create_draft_ticket(user_id, 10.0, edge_ids[:2])
+        service.submit_ticket(draft.ticket_id)
+    assert ledger.flush() >= 1
+
+    session = session_factory()
+    try:
+        users = {row.user_id for row in session.query(ExposureSnapshot)}
+    finally:
+        session.close()
+    assert users == {"7"}
+
+    restored = exposure_module.ExposureTrackerService(
+        ledger=exposure_module.ExposureLedger(session_factory=session_factory)
+    )
+    assert restored.get_current_exposure(7) == 10.0